@@ -8,7 +8,11 @@ bl_info = {
     "category": "Interface",
 }
 
-import bpy
+try:
+    import bpy
+except ImportError:
+    # Imported outside Blender for the bpy-free core subpackage
+    bpy = None
 
 def unregister():
     try:
@@ -21,6 +25,30 @@ def unregister():
         except (AttributeError, ValueError) as e:
             print(f"[Addon] Could not remove on_load_post: {e}")
         
+        # Remove save_pre handler
+        try:
+            if hasattr(handlers, 'on_save_pre'):
+                if handlers.on_save_pre in bpy.app.handlers.save_pre:
+                    bpy.app.handlers.save_pre.remove(handlers.on_save_pre)
+        except (AttributeError, ValueError) as e:
+            print(f"[Addon] Could not remove on_save_pre: {e}")
+        
+        # Remove depsgraph_update_pre handler
+        try:
+            if hasattr(handlers, 'on_depsgraph_update_pre'):
+                if handlers.on_depsgraph_update_pre in bpy.app.handlers.depsgraph_update_pre:
+                    bpy.app.handlers.depsgraph_update_pre.remove(handlers.on_depsgraph_update_pre)
+        except (AttributeError, ValueError) as e:
+            print(f"[Addon] Could not remove on_depsgraph_update_pre: {e}")
+        
+        # Remove frame_change_pre handler
+        try:
+            if hasattr(handlers, 'on_frame_change_pre'):
+                if handlers.on_frame_change_pre in bpy.app.handlers.frame_change_pre:
+                    bpy.app.handlers.frame_change_pre.remove(handlers.on_frame_change_pre)
+        except (AttributeError, ValueError) as e:
+            print(f"[Addon] Could not remove on_frame_change_pre: {e}")
+        
         # Remove depsgraph_update_post handler (may not exist in old versions)
         try:
             if hasattr(handlers, 'on_depsgraph_update'):
@@ -28,10 +56,38 @@ def unregister():
                     bpy.app.handlers.depsgraph_update_post.remove(handlers.on_depsgraph_update)
         except (AttributeError, ValueError) as e:
             print(f"[Addon] Could not remove on_depsgraph_update: {e}")
+        
+        # Cancel deferred setup if it has not run yet
+        try:
+            if bpy.app.timers.is_registered(handlers.deferred_setup):
+                bpy.app.timers.unregister(handlers.deferred_setup)
+        except Exception as e:
+            print(f"[Addon] Could not cancel deferred setup: {e}")
+        
+        # Drop the auto-bind msgbus subscription
+        try:
+            handlers.unsubscribe_auto_bind()
+        except Exception as e:
+            print(f"[Addon] Could not unsubscribe auto-bind: {e}")
             
     except Exception as e:
         print(f"[Addon] Warning: Could not import handlers: {e}")
     
+    try:
+        from . import preview_quality, profiler
+        from .lazy_loader import loaded_module
+        preview_quality.reset()
+        profiler.enable(False)
+        # Modules that were never imported hold no state
+        lod_manager = loaded_module(".lod_manager", __name__)
+        if lod_manager is not None:
+            lod_manager.stop()
+        vertex_cache = loaded_module(".core.vertex_cache", __name__)
+        if vertex_cache is not None:
+            vertex_cache.forget()
+    except Exception as e:
+        print(f"[Addon] Warning: Could not reset preview quality / LOD / vertex cache / profiler: {e}")
+    
     # Unregister modules
     try:
         from . import panels, ui_lists, operators, properties
@@ -58,12 +114,6 @@ def register():
     ui_lists.register()
     panels.register()
 
-    try:
-        for scene in bpy.data.scenes:
-            handlers.init_scene_items(scene)
-    except Exception as e:
-        print(f"[Addon] Warning: Could not init scenes: {e}")
-    
     # Register handlers
     try:
         bpy.app.handlers.load_post.append(handlers.on_load_post)
@@ -76,6 +126,38 @@ def register():
         print("[Addon] Registered on_depsgraph_update handler")
     except Exception as e:
         print(f"[Addon] Failed to register on_depsgraph_update: {e}")
+    
+    try:
+        bpy.app.handlers.save_pre.append(handlers.on_save_pre)
+        print("[Addon] Registered on_save_pre handler")
+    except Exception as e:
+        print(f"[Addon] Failed to register on_save_pre: {e}")
+    
+    try:
+        bpy.app.handlers.depsgraph_update_pre.append(handlers.on_depsgraph_update_pre)
+        print("[Addon] Registered on_depsgraph_update_pre handler")
+    except Exception as e:
+        print(f"[Addon] Failed to register on_depsgraph_update_pre: {e}")
+    
+    try:
+        bpy.app.handlers.frame_change_pre.append(handlers.on_frame_change_pre)
+        print("[Addon] Registered on_frame_change_pre handler")
+    except Exception as e:
+        print(f"[Addon] Failed to register on_frame_change_pre: {e}")
+    
+    try:
+        handlers.subscribe_auto_bind()
+        print("[Addon] Subscribed auto-bind to active object changes")
+    except Exception as e:
+        print(f"[Addon] Failed to subscribe auto-bind: {e}")
+    
+    # Scene seeding and object-state restore touch bpy.data (restricted while
+    # add-ons are enabled at startup) and may import NumPy, so run them later
+    try:
+        if not bpy.app.timers.is_registered(handlers.deferred_setup):
+            bpy.app.timers.register(handlers.deferred_setup, first_interval=0.0)
+    except Exception as e:
+        print(f"[Addon] Warning: Could not schedule deferred setup: {e}")
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,1822 @@
+"""
+Geometry Vector API
+Function-level entry points for scripts, background workers and the
+add-on's own operators, which are thin wrappers over these functions.
+Calling them directly skips operator lookup, context polling, undo pushes
+and report handling.
+
+Every function that touches the scene takes an optional `context`
+(default: bpy.context) and an optional `report` callable with the
+signature of bpy.types.Operator.report (default: print).
+
+    from <addon package> import api
+    vec = api.interpolate(api.encode_preset('SPRING'), api.encode_preset('BOMBER'), 0.3)
+    api.decode(vec)
+    api.export_gvec("/tmp/shape.gvec")
+"""
+
+import bpy
+import fnmatch
+import math
+import os
+import zlib
+import numpy as np
+from mathutils import Matrix
+from .geometry_encoder import (
+    GeometryVector, GeometryEncoder, GeometryDecoder,
+    has_object_vector, get_object_vector, set_object_vector
+)
+from .geometry_file_format import GeometryFileFormat
+from . import datablock_registry, preview_quality, source_mesh_cache
+from .core import mesh_builder, procedural_generators, decode_cache, dataset_shards, point_sampling, design_space
+from .profiler import profiled
+
+__all__ = [
+    "encode_preset", "encode_object", "interpolate", "blend",
+    "decode", "decode_and_render", "build_preset", "build_shape", "apply_preset_values",
+    "apply_vector_transform", "apply_vector_modifiers",
+    "export_gvec", "import_gvec", "export_dataset", "generate_dataset", "ingest_blend",
+    "list_blend_objects", "match_object_names", "load_from_blend",
+]
+
+
+def _log(level, message):
+    """Default report callable: print like Blender's info log"""
+    print(f"[GVEC {next(iter(level), 'INFO')}] {message}")
+
+
+# ---------------------------------------------------------------------------
+# Vectors
+
+def encode_preset(preset, scene=None) -> GeometryVector:
+    """Vector of a named preset with the scene's current shape settings"""
+    return GeometryEncoder.encode_preset(preset, scene or bpy.context.scene)
+
+
+def encode_object(obj) -> GeometryVector:
+    """Vector of an existing mesh object"""
+    return GeometryEncoder.encode_object(obj)
+
+
+def interpolate(vec_a, vec_b, t: float) -> GeometryVector:
+    """Linear interpolation between two vectors (t=0 -> a, t=1 -> b)"""
+    return vec_a.interpolate(vec_b, t)
+
+
+def blend(vectors, weights) -> GeometryVector:
+    """Weighted average of vectors (weights are normalized; all-zero weights give the zero vector)"""
+    if len(vectors) != len(weights):
+        raise ValueError("blend needs one weight per vector")
+    weights = np.asarray(weights, dtype=np.float32)
+    total = weights.sum()
+    if total < 1e-6:
+        return GeometryVector()
+    stacked = np.stack([v.vector for v in vectors])
+    return GeometryVector((weights / total) @ stacked)
+
+
+# ---------------------------------------------------------------------------
+# Scene building
+
+@profiled("api.build_preset")
+def build_preset(preset, context=None, report=None):
+    """
+    Apply a preset's parameters and build it
+
+    Returns:
+        the built object
+    """
+    context = context or bpy.context
+    report = report or _log
+    context.scene.my_shape_preset = preset
+    apply_preset_values(context.scene, preset, report)
+    return build_shape(context, report)
+
+
+@profiled("api.decode")
+def decode(vec, context=None, report=None):
+    """
+    Decode a vector into the scene's shape settings and rebuild the shape,
+    served from the decode cache when enabled
+
+    On a miss the shape is built normally and its evaluated mesh is cached;
+    either way the result is applied as plain mesh data (modifiers baked) so
+    hits and misses leave the object in the same state. Only the
+    MyShapeObject output is cached: other vector-based targets keep their
+    own mesh data and live modifiers.
+
+    Returns:
+        True on a cache hit
+    """
+    context = context or bpy.context
+    report = report or _log
+    scene = context.scene
+    GeometryDecoder.decode_to_scene(vec, scene)
+    
+    target = _shape_target(context)
+    if not scene.decode_cache_enabled or (target is not None and target.name != "MyShapeObject"):
+        build_shape(context, report)
+        return False
+    
+    cache = _configure_decode_cache(scene)
+    key = _decode_cache_key(scene, vec)
+    result = cache.get(key)
+    hit = result is not None
+    
+    if hit and target is None:
+        target = _new_shape_object(context)
+    
+    if result is None:
+        build_shape(context, report)
+        target = _shape_target(context)
+        if target is None or target.type != 'MESH':
+            return False
+        
+        depsgraph = context.evaluated_depsgraph_get()
+        eval_obj = target.evaluated_get(depsgraph)
+        eval_mesh = eval_obj.to_mesh()
+        try:
+            result = decode_cache.DecodedResult(mesh_builder.read_mesh(eval_mesh), np.array(target.matrix_world),
+                                                [mat.name if mat else "" for mat in eval_mesh.materials])
+        finally:
+            eval_obj.to_mesh_clear()
+        cache.put(key, result)
+    
+    _apply_decoded_result(context, target, result)
+    return hit
+
+
+@profiled("api.apply_preset_values")
+def apply_preset_values(scene, preset, report=None):
+    """
+    Write a preset's parameters into the scene's shape settings
+
+    Staircase and character presets keep the current scene values.
+    """
+    report = report or _log
+    
+    if preset == 'SPIRAL_CORRIDOR':
+        # Spiral Corridor preset
+        scene.my_shape_dimensions = (0.5, 0.5, 1.0)
+        scene.my_shape_helix_turns = 5
+        scene.my_shape_helix_radius = 3.0
+        scene.my_shape_helix_height = 20.0
+        scene.my_shape_sphericity = 0.3
+        scene.my_shape_taper = 0.0
+        scene.my_shape_twist = 0.0
+        scene.my_shape_bend = 0.0
+        scene.my_shape_inflate = 0.0
+        scene.my_shape_wave_amplitude = 0.0
+        scene.my_shape_noise_strength = 0.0
+        report({'INFO'}, "Applied Spiral Corridor preset")
+        
+    elif preset == 'DNA_HELIX':
+        # DNA Double Helix preset
+        scene.my_shape_dimensions = (0.2, 0.2, 0.5)
+        scene.my_shape_helix_turns = 8
+        scene.my_shape_helix_radius = 1.5
+        scene.my_shape_helix_height = 15.0
+        scene.my_shape_sphericity = 1.0
+        scene.my_shape_taper = 0.0
+        scene.my_shape_twist = 0.0
+        scene.my_shape_bend = 0.0
+        scene.my_shape_inflate = 0.0
+        scene.my_shape_wave_amplitude = 0.0
+        scene.my_shape_noise_strength = 0.0
+        report({'INFO'}, "Applied DNA Helix preset")
+        
+    elif preset == 'SPRING':
+        # Spring Coil preset
+        scene.my_shape_dimensions = (0.3, 0.3, 0.3)
+        scene.my_shape_helix_turns = 10
+        scene.my_shape_helix_radius = 2.0
+        scene.my_shape_helix_height = 12.0
+        scene.my_shape_sphericity = 1.0
+        scene.my_shape_taper = 0.0
+        scene.my_shape_twist = 0.0
+        scene.my_shape_bend = 0.0
+        scene.my_shape_inflate = 0.0
+        scene.my_shape_wave_amplitude = 0.0
+        scene.my_shape_noise_strength = 0.0
+        report({'INFO'}, "Applied Spring Coil preset")
+        
+    elif preset == 'TWISTED_TOWER':
+        # Twisted Tower preset
+        scene.my_shape_dimensions = (1.5, 1.5, 8.0)
+        scene.my_shape_helix_turns = 0
+        scene.my_shape_helix_radius = 2.0
+        scene.my_shape_helix_height = 10.0
+        scene.my_shape_sphericity = 0.0
+        scene.my_shape_taper = 0.2
+        scene.my_shape_twist = 1.57
+        scene.my_shape_bend = 0.0
+        scene.my_shape_inflate = 0.0
+        scene.my_shape_wave_amplitude = 0.0
+        scene.my_shape_noise_strength = 0.0
+        report({'INFO'}, "Applied Twisted Tower preset")
+        
+    elif preset == 'FIGHTER_JET':
+        # Fighter Jet preset
+        scene.my_aircraft_fuselage_length = 12.0
+        scene.my_aircraft_wing_span = 10.0
+        scene.my_aircraft_wing_sweep = 0.785  # 45 degrees
+        scene.my_aircraft_tail_size = 3.0
+        scene.my_aircraft_engine_count = 2
+        scene.my_shape_helix_turns = 0
+        report({'INFO'}, "Applied Fighter Jet preset")
+        
+    elif preset == 'BOMBER':
+        # Bomber Aircraft preset
+        scene.my_aircraft_fuselage_length = 20.0
+        scene.my_aircraft_wing_span = 30.0
+        scene.my_aircraft_wing_sweep = 0.2  # Slight sweep
+        scene.my_aircraft_tail_size = 5.0
+        scene.my_aircraft_engine_count = 4
+        scene.my_shape_helix_turns = 0
+        report({'INFO'}, "Applied Bomber preset")
+        
+    elif preset == 'HELICOPTER':
+        # Helicopter preset
+        scene.my_aircraft_fuselage_length = 10.0
+        scene.my_aircraft_wing_span = 12.0  # Main rotor diameter
+        scene.my_aircraft_wing_sweep = 0.0
+        scene.my_aircraft_tail_size = 6.0  # Tail boom
+        scene.my_aircraft_engine_count = 1
+        scene.my_shape_helix_turns = 0
+        report({'INFO'}, "Applied Helicopter preset")
+        
+    elif preset == 'STAIRCASE':
+        # Staircase preset - default values already set
+        report({'INFO'}, "Applied Staircase preset")
+        
+    elif preset == 'CHARACTER':
+        # Character preset - default values already set
+        report({'INFO'}, "Applied Character preset")
+
+
+@profiled("api.build_shape")
+def build_shape(context=None, report=None):
+    """
+    Build the scene's current shape settings into geometry
+
+    Complex presets (aircraft, staircase, character) and helices replace
+    the MyShapeObject output; parametric shapes rebuild the modifier stack
+    of the active vector-based object or MyShapeObject.
+
+    Returns:
+        the built object
+    """
+    context = context or bpy.context
+    report = report or _log
+    scene = context.scene
+    
+    # Clear vector editor binding when creating preset from Shape Transformer
+    # This prevents conflict between Shape Transformer workflow and Geometry Vectors workflow
+    scene.vector_source_preset = "NONE"
+    
+    dims = scene.my_shape_dimensions
+    sphericity = scene.my_shape_sphericity
+    taper = scene.my_shape_taper
+    twist = scene.my_shape_twist
+    bend = scene.my_shape_bend
+    inflate = scene.my_shape_inflate
+    wave_amp = scene.my_shape_wave_amplitude
+    wave_freq = scene.my_shape_wave_frequency
+    noise_str = scene.my_shape_noise_strength
+    noise_scale = scene.my_shape_noise_scale
+    helix_turns = scene.my_shape_helix_turns
+    helix_radius = scene.my_shape_helix_radius
+    helix_height = scene.my_shape_helix_height
+    preset = scene.my_shape_preset
+
+    # Check if we need to create aircraft structure
+    if preset in ['FIGHTER_JET', 'BOMBER', 'HELICOPTER']:
+        return _create_aircraft(context, report, preset)
+    
+    # Check if we need to create staircase
+    if preset == 'STAIRCASE':
+        return _create_staircase(context, report)
+    
+    # Check if we need to create character
+    if preset == 'CHARACTER':
+        return _create_character(context, report)
+
+    # Check if we need to create helix structure
+    if helix_turns > 0:
+        return _create_helix_structure(context, report, dims, helix_turns, helix_radius,
+                                       helix_height, sphericity)
+
+    # Otherwise create standard transformed shape
+    # Try to use currently selected object if it's a vector-based mesh
+    obj = None
+    active_obj = context.active_object
+    if active_obj and active_obj.type == 'MESH':
+        # Check if this is a vector-based object or the default MyShapeObject
+        has_vector_data = has_object_vector(active_obj)
+        if has_vector_data or active_obj.name == "MyShapeObject":
+            obj = active_obj
+            print(f"[UpdateShape] Using selected object: {obj.name}")
+    
+    # Fallback to MyShapeObject or create new
+    if obj is None:
+        obj = bpy.data.objects.get("MyShapeObject")
+    if obj is None:
+        obj = _new_shape_object(context)
+
+    # Rebuild on the object's own base mesh, never on baked decode-cache output
+    _restore_base_mesh(context, obj)
+
+    # Clear all existing modifiers to rebuild from scratch
+    obj.modifiers.clear()
+
+    # Determine if we need subdivision (for smooth deformations)
+    needs_subdivision = (sphericity > 0.0 or inflate != 0.0 or 
+                       wave_amp > 0.0 or noise_str > 0.0)
+
+    if needs_subdivision:
+        subsurf = obj.modifiers.new(name="Subdivision", type='SUBSURF')
+        subsurf.levels = 3
+        subsurf.render_levels = 3
+
+    # 1. Sphericity (Cast to Sphere)
+    if sphericity > 0.0:
+        cast_mod = obj.modifiers.new(name="CastToSphere", type='CAST')
+        cast_mod.cast_type = 'SPHERE'
+        cast_mod.factor = sphericity
+
+    # 2. Taper (Simple Deform)
+    if taper != 0.0:
+        taper_mod = obj.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
+        taper_mod.deform_method = 'TAPER'
+        taper_mod.factor = taper
+        taper_mod.deform_axis = 'Z'
+
+    # 3. Twist (Simple Deform)
+    if twist != 0.0:
+        twist_mod = obj.modifiers.new(name="Twist", type='SIMPLE_DEFORM')
+        twist_mod.deform_method = 'TWIST'
+        twist_mod.angle = twist
+        twist_mod.deform_axis = 'Z'
+
+    # 4. Bend (Simple Deform)
+    if bend != 0.0:
+        bend_mod = obj.modifiers.new(name="Bend", type='SIMPLE_DEFORM')
+        bend_mod.deform_method = 'BEND'
+        bend_mod.angle = bend
+        bend_mod.deform_axis = 'Z'
+
+    # 5. Inflate/Deflate (Displace with spherical gradient)
+    if inflate != 0.0:
+        displace_mod = obj.modifiers.new(name="Inflate", type='DISPLACE')
+        displace_mod.strength = inflate * 0.5
+        displace_mod.mid_level = 0.5
+        displace_mod.direction = 'NORMAL'
+
+    # 6. Wave deformation
+    if wave_amp > 0.0:
+        wave_mod = obj.modifiers.new(name="Wave", type='WAVE')
+        wave_mod.use_cyclic = False
+        wave_mod.height = wave_amp
+        wave_mod.width = 1.0 / wave_freq if wave_freq > 0 else 1.0
+        wave_mod.time_offset = 0.0
+
+    # 7. Noise displacement
+    if noise_str > 0.0:
+        tex_name = "NoiseTexture_Shape"
+        tex = bpy.data.textures.get(tex_name)
+        if tex is None:
+            tex = bpy.data.textures.new(tex_name, 'CLOUDS')
+            tex.noise_scale = noise_scale
+        else:
+            tex.noise_scale = noise_scale
+        datablock_registry.track(scene, datablock_registry.GENERATOR_SHAPE, tex)
+        
+        noise_mod = obj.modifiers.new(name="Noise", type='DISPLACE')
+        noise_mod.texture = tex
+        noise_mod.strength = noise_str
+        noise_mod.direction = 'NORMAL'
+
+    # Set dimensions via scale
+    obj.scale = (dims[0] / 2.0, dims[1] / 2.0, dims[2] / 2.0)
+    obj.location = (0, 0, 0)
+    
+    # Keep the preview tier while sliders are still being edited
+    if preview_quality.is_previewing(scene):
+        preview_quality.mark_interaction(scene, obj)
+    
+    report({'INFO'}, f"Shape updated with {len(obj.modifiers)} modifiers")
+    return obj
+
+
+@profiled("api.create_helix_structure")
+def _create_helix_structure(context, report, dims, turns, radius, height, sphericity):
+    """Create helix/spiral structure by sweeping the cross-section along the helix in one build"""
+    import time
+    
+    scene = context.scene
+    start_time = time.perf_counter()
+    
+    _clear_generated_output(context)
+    
+    segments_per_turn = scene.my_shape_helix_segments
+    if segments_per_turn <= 0:
+        segments_per_turn = procedural_generators.helix_segments_per_turn(radius)
+    
+    # 1. Sweep the base cross-section (round or box, based on sphericity)
+    round_profile = sphericity > 0.5
+    buffers = procedural_generators.build_helix(
+        turns, radius, height,
+        width=dims[0], depth=dims[1],
+        round_profile=round_profile,
+        segments_per_turn=segments_per_turn
+    )
+    
+    mesh = bpy.data.meshes.new("MyShapeObject")
+    mesh_builder.write_mesh(mesh, buffers)
+    if round_profile:
+        mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
+    base_obj = _link_generated_object(context, "MyShapeObject", mesh,
+                                      datablock_registry.GENERATOR_HELIX)
+    
+    # 2. Optional path curve for downstream use (not driving any modifiers)
+    if scene.my_shape_helix_curve:
+        points, _, _ = procedural_generators.helix_path(turns, radius, height, segments_per_turn)
+        
+        curve_data = bpy.data.curves.get("HelixCurvePath")
+        if curve_data is None:
+            curve_data = bpy.data.curves.new(name="HelixCurvePath", type='CURVE')
+        curve_data.splines.clear()
+        curve_data.dimensions = '3D'
+        spline = curve_data.splines.new(type='NURBS')
+        spline.points.add(len(points) - 1)  # Already has 1 point
+        
+        coords = np.ones((len(points), 4), dtype=np.float32)
+        coords[:, :3] = points
+        spline.points.foreach_set("co", coords.ravel())
+        
+        curve_obj = bpy.data.objects.new("HelixCurve", curve_data)
+        context.collection.objects.link(curve_obj)
+        curve_obj.hide_set(True)
+        curve_obj.hide_render = True
+        datablock_registry.track_object(scene, datablock_registry.GENERATOR_HELIX, curve_obj)
+    
+    context.view_layer.objects.active = base_obj
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    report({'INFO'}, f"Helix structure created: {turns} turns, radius {radius}, height {height} "
+                     f"({segments_per_turn} segments/turn, {elapsed_ms:.1f} ms)")
+    return base_obj
+
+
+@profiled("api.create_aircraft")
+def _create_aircraft(context, report, aircraft_type):
+    """Create aircraft structure with fuselage, wings, tail as one procedural mesh"""
+    import time
+    
+    scene = context.scene
+    start_time = time.perf_counter()
+    
+    _clear_generated_output(context)
+    
+    buffers, material_names = procedural_generators.build_aircraft(
+        aircraft_type,
+        fuselage_len=scene.my_aircraft_fuselage_length,
+        wing_span=scene.my_aircraft_wing_span,
+        wing_sweep=scene.my_aircraft_wing_sweep,
+        tail_size=scene.my_aircraft_tail_size,
+        engine_count=scene.my_aircraft_engine_count
+    )
+    final_obj = _link_assembled_mesh(context, buffers, material_names,
+                                     datablock_registry.GENERATOR_AIRCRAFT)
+    
+    # Jets are smoothed as a whole (previously inherited from the fuselage on join)
+    if aircraft_type in ('FIGHTER_JET', 'BOMBER'):
+        subsurf = final_obj.modifiers.new(name="Subdivision", type='SUBSURF')
+        subsurf.levels = 2
+    
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    report({'INFO'}, f"{aircraft_type} created successfully ({elapsed_ms:.1f} ms)")
+    return final_obj
+
+
+def _link_assembled_mesh(context, buffers, material_names, generator):
+    """Write assembled generator buffers into a new MyShapeObject"""
+    mesh = bpy.data.meshes.new("MyShapeObject")
+    
+    if context.scene.my_generator_part_materials:
+        # One shared material per part group, reused across rebuilds
+        for name in material_names:
+            mat_name = f"GVEC_{name}"
+            mat = bpy.data.materials.get(mat_name)
+            if mat is None:
+                mat = bpy.data.materials.new(name=mat_name)
+            mesh.materials.append(mat)
+    else:
+        buffers.material_ids = None
+    
+    mesh_builder.write_mesh(mesh, buffers)
+    return _link_generated_object(context, "MyShapeObject", mesh, generator)
+
+
+@profiled("api.create_staircase")
+def _create_staircase(context, report):
+    """Create staircase structure as a single procedural mesh (no bpy.ops)"""
+    import time
+    
+    scene = context.scene
+    steps = scene.my_stair_steps
+    step_width = scene.my_stair_step_width
+    step_height = scene.my_stair_step_height
+    step_depth = scene.my_stair_step_depth
+    stair_type = scene.my_stair_type
+    build_mode = scene.my_stair_build_mode
+    
+    start_time = time.perf_counter()
+    
+    _clear_generated_output(context)
+    
+    # Per-step box placement (centres, full extents, Z rotation)
+    centers, sizes, angles, extra_parts = procedural_generators.staircase_layout(
+        steps, step_width, step_height, step_depth, stair_type
+    )
+    
+    mesh = bpy.data.meshes.new("MyShapeObject")
+    
+    if build_mode == 'INSTANCES':
+        # One vertex per step; a Geometry Nodes modifier instances a single
+        # step cube on them, so step count does not grow the mesh data
+        points = mesh_builder.MeshBuffers(centers, np.zeros(0), np.zeros(0))
+        base = mesh_builder.concatenate([points] + extra_parts)
+        mesh_builder.write_mesh(mesh, base)
+        
+        is_step = np.zeros(base.vertex_count, dtype=bool)
+        is_step[:len(centers)] = True
+        rotations = np.zeros((base.vertex_count, 3), dtype=np.float32)
+        rotations[:len(centers), 2] = angles
+        scales = np.ones((base.vertex_count, 3), dtype=np.float32)
+        scales[:len(centers)] = sizes
+        
+        mesh_builder.write_point_attribute(mesh, "stair_step", 'BOOLEAN', is_step)
+        mesh_builder.write_point_attribute(mesh, "step_rotation", 'FLOAT_VECTOR', rotations)
+        mesh_builder.write_point_attribute(mesh, "step_scale", 'FLOAT_VECTOR', scales)
+    else:
+        buffers = mesh_builder.concatenate(
+            [mesh_builder.box_buffers(centers, sizes, angles)] + extra_parts
+        )
+        mesh_builder.write_mesh(mesh, buffers)
+    
+    final_obj = _link_generated_object(context, "MyShapeObject", mesh,
+                                       datablock_registry.GENERATOR_STAIRCASE)
+    
+    if build_mode == 'INSTANCES':
+        nodes_mod = final_obj.modifiers.new(name="StairInstances", type='NODES')
+        nodes_mod.node_group = _get_stair_instance_node_group()
+        datablock_registry.track(scene, datablock_registry.GENERATOR_STAIRCASE, nodes_mod.node_group)
+    
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    report({'INFO'}, f"{stair_type} staircase created with {steps} steps ({elapsed_ms:.1f} ms)")
+    return final_obj
+
+
+@profiled("api.create_character")
+def _create_character(context, report):
+    """Create basic character model as one procedural mesh"""
+    import time
+    
+    scene = context.scene
+    gender = scene.my_character_gender
+    age = scene.my_character_age
+    start_time = time.perf_counter()
+    
+    _clear_generated_output(context)
+    
+    buffers, material_names = procedural_generators.build_character(
+        gender, age,
+        height=scene.my_character_height,
+        build=scene.my_character_build
+    )
+    final_obj = _link_assembled_mesh(context, buffers, material_names, datablock_registry.GENERATOR_CHARACTER)
+    
+    adjusted_height = scene.my_character_height * procedural_generators.AGE_SCALE[age]
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    report({'INFO'}, f"{age} {gender} character created (height: {adjusted_height:.2f}m, {elapsed_ms:.1f} ms)")
+    return final_obj
+
+
+# ---------------------------------------------------------------------------
+# Decode & Render
+
+@profiled("api.decode_and_render")
+def decode_and_render(geom_vec, context=None, report=None):
+    """
+    Decode a vector into an object (Decode & Render)
+
+    Updates the active vector-based object in place when there is one;
+    otherwise rebuilds the scene's source preset with the vector's
+    modifications on top, or creates DecodedGeometry from the vector's
+    parameters.
+
+    Returns:
+        the updated or created object
+    """
+    context = context or bpy.context
+    report = report or _log
+    scene = context.scene
+    result = None
+    
+    # Check if user wants to update an existing object
+    active_obj = context.active_object
+    update_existing = False
+    
+    if active_obj and active_obj.type == 'MESH':
+        # Check if this object has vector data (was created/imported with vectors)
+        has_vector_data = has_object_vector(active_obj)
+        source = active_obj.get("geometry_vector_source", "unknown")
+        
+        # Allow updating for all vector-based objects
+        # Only exclude "unknown" source (objects without proper vector metadata)
+        if has_vector_data and source != "unknown":
+            # This is a vector-based object, update it instead of creating new one
+            update_existing = True
+            print(f"[Decode&Render] Updating existing object: {active_obj.name} (source: {source})")
+    
+    if update_existing:
+        # Update existing object with new vector parameters
+        result = _update_object_with_vector(context, report, active_obj, geom_vec, scene)
+        report({'INFO'}, f"Updated {active_obj.name} with new vector parameters")
+    else:
+        # Create new object from vector
+        # Decode to scene parameters first
+        GeometryDecoder.decode_to_scene(geom_vec, scene)
+        
+        # Check if this vector came from a preset
+        if scene.vector_source_preset and scene.vector_source_preset != "NONE":
+            # Vector from preset - use preset-based workflow
+            target_preset = scene.vector_source_preset
+            scene.my_shape_preset = target_preset
+            
+            # First decode vector to scene parameters (for parameters-based presets)
+            GeometryDecoder.decode_to_scene(geom_vec, scene)
+            
+            # Apply the preset to set parameters
+            apply_preset_values(scene, target_preset, report)
+            
+            # Create the actual geometry from the preset
+            # This will call create_aircraft/create_staircase/create_character for complex presets
+            # or create standard shape with modifiers for parametric presets
+            preset_obj = build_shape(context, report)
+            result = preset_obj
+            
+            if preset_obj:
+                # Now apply vector modifications on top of preset
+                apply_vector_modifiers(preset_obj, geom_vec)
+                
+                # Store vector data
+                set_object_vector(preset_obj, geom_vec)
+                
+                preset_obj["geometry_vector_source"] = "preset"
+                preset_obj["geometry_vector_version"] = "1.0"
+                preset_obj["geometry_vector_preset_name"] = target_preset  # Save preset name!
+                preset_obj["geometry_vector_mesh_verts"] = len(preset_obj.data.vertices)
+                preset_obj["geometry_vector_mesh_faces"] = len(preset_obj.data.polygons)
+            
+            report({'INFO'}, f"Decoded and rendered as {target_preset} with vector modifications")
+        else:
+            # Vector from external file or custom object - generate directly from parameters
+            # Create a parametric object based on decoded parameters
+            result = _create_geometry_from_vector(context, geom_vec, scene)
+            
+            report({'INFO'}, "Decoded and rendered from vector parameters")
+    
+    return result
+
+
+def _update_object_with_vector(context, report, obj, vec, scene):
+    """Update existing object with new vector parameters"""
+    # Remove all existing modifiers
+    obj.modifiers.clear()
+    
+    # Get the base mesh (before any modifications)
+    # If object was manually edited, we can't safely update it
+    source = obj.get("geometry_vector_source", "unknown")
+    
+    if source == "manual_edit":
+        # Object was manually edited - warn user
+        report({'WARNING'}, 
+               "Object was manually edited. Creating new object to preserve edits.")
+        # Create new object instead
+        return _create_geometry_from_vector(context, vec, scene)
+    
+    # Update transformations
+    apply_vector_transform(obj, vec)
+    
+    # Reapply modifiers from vector
+    apply_vector_modifiers(obj, vec)
+    
+    # Update stored vector data
+    set_object_vector(obj, vec)
+    
+    # Update mesh fingerprint
+    obj["geometry_vector_mesh_verts"] = len(obj.data.vertices)
+    obj["geometry_vector_mesh_faces"] = len(obj.data.polygons)
+    
+    print("[Decode&Render] Updated object with new parameters")
+    return obj
+
+
+def apply_vector_transform(obj, vec):
+    """Set object scale, location and rotation from vector parameters"""
+    obj.scale = (
+        vec.vector[GeometryVector.IDX_SCALE_X],
+        vec.vector[GeometryVector.IDX_SCALE_Y],
+        vec.vector[GeometryVector.IDX_SCALE_Z]
+    )
+    obj.location = (
+        vec.vector[GeometryVector.IDX_LOC_X],
+        vec.vector[GeometryVector.IDX_LOC_Y],
+        vec.vector[GeometryVector.IDX_LOC_Z]
+    )
+    obj.rotation_euler = (
+        vec.vector[GeometryVector.IDX_ROT_X],
+        vec.vector[GeometryVector.IDX_ROT_Y],
+        vec.vector[GeometryVector.IDX_ROT_Z]
+    )
+
+
+def apply_vector_modifiers(obj, vec):
+    """Apply modifiers based on vector parameters"""
+    import math
+    
+    # Apply sphericity
+    sphericity = vec.vector[GeometryVector.IDX_SPHERICITY]
+    if abs(sphericity) > 0.01:
+        mod = obj.modifiers.new(name="Sphericity", type='CAST')
+        mod.factor = sphericity
+        mod.cast_type = 'SPHERE'
+    
+    # Apply taper
+    taper = vec.vector[GeometryVector.IDX_TAPER]
+    if abs(taper) > 0.01:
+        mod = obj.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
+        mod.deform_method = 'TAPER'
+        mod.factor = taper
+    
+    # Apply twist
+    twist = vec.vector[GeometryVector.IDX_TWIST] * 2 * 3.14159
+    if abs(twist) > 0.01:
+        mod = obj.modifiers.new(name="Twist", type='SIMPLE_DEFORM')
+        mod.deform_method = 'TWIST'
+        mod.angle = twist
+    
+    # Apply bend
+    bend = vec.vector[GeometryVector.IDX_BEND] * 2 * 3.14159
+    if abs(bend) > 0.01:
+        mod = obj.modifiers.new(name="Bend", type='SIMPLE_DEFORM')
+        mod.deform_method = 'BEND'
+        mod.angle = bend
+    
+    # Apply elongation
+    elongation = vec.vector[GeometryVector.IDX_ELONGATION]
+    if abs(elongation - 0.33) > 0.05:
+        mod = obj.modifiers.new(name="Elongation", type='SIMPLE_DEFORM')
+        mod.deform_method = 'STRETCH'
+        mod.factor = (elongation - 0.33) * 3.0
+    
+    # Apply wave
+    wave_amplitude = vec.vector[GeometryVector.IDX_WAVE_AMP]
+    if abs(wave_amplitude) > 0.01:
+        mod = obj.modifiers.new(name="Wave", type='WAVE')
+        mod.height = wave_amplitude
+        mod.width = vec.vector[GeometryVector.IDX_WAVE_FREQ] * 2.0 if vec.vector[GeometryVector.IDX_WAVE_FREQ] > 0.01 else 1.0
+    
+    # Apply noise
+    noise_strength = vec.vector[GeometryVector.IDX_NOISE_STRENGTH]
+    if abs(noise_strength) > 0.01:
+        mod = obj.modifiers.new(name="Noise", type='DISPLACE')
+        mod.strength = noise_strength
+        # Reuse one texture per object so repeated decodes don't pile up textures
+        tex_name = f"NoiseTex_{obj.name}"
+        tex = bpy.data.textures.get(tex_name)
+        if not tex:
+            tex = bpy.data.textures.new(tex_name, type='CLOUDS')
+        tex.noise_scale = vec.vector[GeometryVector.IDX_NOISE_SCALE] * 2.0 if vec.vector[GeometryVector.IDX_NOISE_SCALE] > 0.01 else 1.0
+        mod.texture = tex
+    
+    # Apply subdivision
+    curvature = vec.vector[GeometryVector.IDX_CURVATURE]
+    if curvature > 0.1:
+        mod = obj.modifiers.new(name="Subdivision", type='SUBSURF')
+        mod.levels = max(1, min(3, int(curvature * 5)))
+        mod.render_levels = mod.levels
+    
+    # Apply smoothness
+    smoothness = vec.vector[GeometryVector.IDX_SMOOTHNESS]
+    if smoothness > 0.1:
+        has_subsurf = any(m.type == 'SUBSURF' for m in obj.modifiers)
+        if not has_subsurf:
+            mod = obj.modifiers.new(name="Smoothness", type='SUBSURF')
+            mod.levels = max(1, min(3, int(smoothness * 3)))
+            mod.render_levels = mod.levels
+    
+    # Apply edge sharpness
+    edge_sharpness = vec.vector[GeometryVector.IDX_EDGE_SHARPNESS]
+    if edge_sharpness > 0.1:
+        mod = obj.modifiers.new(name="EdgeSharp", type='EDGE_SPLIT')
+        mod.split_angle = math.radians(180 * (1 - edge_sharpness))
+        mod.use_edge_angle = True
+    
+    # Apply inflation
+    inflation = vec.vector[GeometryVector.IDX_INFLATION]
+    if abs(inflation) > 0.01:
+        mod = obj.modifiers.new(name="Inflate", type='DISPLACE')
+        mod.strength = inflation * 0.5
+        mod.direction = 'NORMAL'
+    
+    # Apply randomness
+    randomness = vec.vector[GeometryVector.IDX_RANDOMNESS]
+    if randomness > 0.01:
+        mod = obj.modifiers.new(name="Random", type='DISPLACE')
+        mod.strength = randomness * 0.1
+        tex_name = f"RandomTex_{obj.name}"
+        tex = bpy.data.textures.get(tex_name)
+        if not tex:
+            tex = bpy.data.textures.new(tex_name, type='CLOUDS')
+            tex.noise_scale = 5.0
+        mod.texture = tex
+
+
+def _create_geometry_from_vector(context, vec, scene):
+    """Create geometry directly from vector parameters without using presets"""
+    import bmesh
+    
+    # Use the original imported mesh as base (copied, or reloaded if offloaded to disk)
+    mesh = source_mesh_cache.build_source_mesh(scene, "DecodedGeometry")
+    has_source_mesh = mesh is not None
+    
+    if not has_source_mesh:
+        # No source mesh - create parametric geometry from scratch
+        # Create base mesh - start with a subdivided cube for flexibility
+        bm = bmesh.new()
+        bmesh.ops.create_cube(bm, size=1.0)
+        
+        # Subdivide for more detail
+        bmesh.ops.subdivide_edges(bm, edges=bm.edges, cuts=2, use_grid_fill=True)
+        
+        # Create mesh
+        mesh = bpy.data.meshes.new("DecodedGeometry")
+        bm.to_mesh(mesh)
+        bm.free()
+    
+    # Remove old decoded object if exists
+    old_obj = bpy.data.objects.get("DecodedGeometry")
+    if old_obj:
+        bpy.data.objects.remove(old_obj, do_unlink=True)
+    
+    # Create new object
+    obj = bpy.data.objects.new("DecodedGeometry", mesh)
+    context.scene.collection.objects.link(obj)
+    
+    # Get scale from vector
+    scale_x = vec.vector[GeometryVector.IDX_SCALE_X]
+    scale_y = vec.vector[GeometryVector.IDX_SCALE_Y]
+    scale_z = vec.vector[GeometryVector.IDX_SCALE_Z]
+    
+    # Apply scale
+    obj.scale = (scale_x, scale_y, scale_z)
+    
+    # Get location from vector
+    loc_x = vec.vector[GeometryVector.IDX_LOC_X]
+    loc_y = vec.vector[GeometryVector.IDX_LOC_Y]
+    loc_z = vec.vector[GeometryVector.IDX_LOC_Z]
+    
+    # Apply location
+    obj.location = (loc_x, loc_y, loc_z)
+    
+    # Get rotation from vector
+    rot_x = vec.vector[GeometryVector.IDX_ROT_X]
+    rot_y = vec.vector[GeometryVector.IDX_ROT_Y]
+    rot_z = vec.vector[GeometryVector.IDX_ROT_Z]
+    
+    # Apply rotation (rotation is stored in radians in the vector)
+    obj.rotation_euler = (rot_x, rot_y, rot_z)
+    
+    # If this is from a cached source mesh (imported file), 
+    # DO NOT apply parametric modifiers - the geometry is already complete
+    # Only apply basic transforms (scale, rotation) that were encoded
+    if not has_source_mesh:
+        # Only apply parametric modifiers for generated geometry (not imported)
+        # Apply topology transforms through modifiers
+        sphericity = vec.vector[GeometryVector.IDX_SPHERICITY]
+        if abs(sphericity) > 0.01:
+            mod = obj.modifiers.new(name="Sphericity", type='CAST')
+            mod.factor = sphericity
+            mod.cast_type = 'SPHERE'
+        
+        taper = vec.vector[GeometryVector.IDX_TAPER]
+        if abs(taper) > 0.01:
+            mod = obj.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
+            mod.deform_method = 'TAPER'
+            mod.factor = taper
+        
+        twist = vec.vector[GeometryVector.IDX_TWIST] * 2 * 3.14159
+        if abs(twist) > 0.01:
+            mod = obj.modifiers.new(name="Twist", type='SIMPLE_DEFORM')
+            mod.deform_method = 'TWIST'
+            mod.angle = twist
+        
+        bend = vec.vector[GeometryVector.IDX_BEND] * 2 * 3.14159
+        if abs(bend) > 0.01:
+            mod = obj.modifiers.new(name="Bend", type='SIMPLE_DEFORM')
+            mod.deform_method = 'BEND'
+            mod.angle = bend
+        
+        # Apply elongation as stretch deformation
+        elongation = vec.vector[GeometryVector.IDX_ELONGATION]
+        if abs(elongation - 0.33) > 0.05:  # 0.33 is neutral elongation
+            mod = obj.modifiers.new(name="Elongation", type='SIMPLE_DEFORM')
+            mod.deform_method = 'STRETCH'
+            mod.factor = (elongation - 0.33) * 3.0
+        
+        # Apply wave deformation
+        wave_amplitude = vec.vector[GeometryVector.IDX_WAVE_AMP]
+        if abs(wave_amplitude) > 0.01:
+            mod = obj.modifiers.new(name="Wave", type='WAVE')
+            mod.height = wave_amplitude
+            mod.width = vec.vector[GeometryVector.IDX_WAVE_FREQ] * 2.0 if vec.vector[GeometryVector.IDX_WAVE_FREQ] > 0.01 else 1.0
+        
+        # Apply noise displacement
+        noise_strength = vec.vector[GeometryVector.IDX_NOISE_STRENGTH]
+        if abs(noise_strength) > 0.01:
+            mod = obj.modifiers.new(name="Noise", type='DISPLACE')
+            mod.strength = noise_strength
+            # Create texture for noise
+            tex = bpy.data.textures.new("NoiseTexture", type='CLOUDS')
+            tex.noise_scale = vec.vector[GeometryVector.IDX_NOISE_SCALE] * 2.0 if vec.vector[GeometryVector.IDX_NOISE_SCALE] > 0.01 else 1.0
+            mod.texture = tex
+        
+        # Add subdivision surface for smoothness (from old curvature)
+        curvature = vec.vector[GeometryVector.IDX_CURVATURE]
+        if curvature > 0.1:
+            mod = obj.modifiers.new(name="Subdivision", type='SUBSURF')
+            mod.levels = max(1, min(3, int(curvature * 5)))
+            mod.render_levels = mod.levels
+    
+    # ========== Universal Appearance Parameters ==========
+    # These apply to BOTH Preset and Import modes
+    
+    # 1. Smoothness (Subdivision Surface)
+    smoothness = vec.vector[GeometryVector.IDX_SMOOTHNESS]
+    if smoothness > 0.1:
+        # Check if already has subdivision from curvature
+        has_subsurf = any(m.type == 'SUBSURF' for m in obj.modifiers)
+        if not has_subsurf:
+            mod = obj.modifiers.new(name="Smoothness", type='SUBSURF')
+            mod.levels = max(1, min(3, int(smoothness * 3)))
+            mod.render_levels = mod.levels
+    
+    # 2. Edge Sharpness
+    edge_sharpness = vec.vector[GeometryVector.IDX_EDGE_SHARPNESS]
+    if edge_sharpness > 0.1:
+        mod = obj.modifiers.new(name="EdgeSharp", type='EDGE_SPLIT')
+        mod.split_angle = math.radians(180 * (1 - edge_sharpness))
+        mod.use_edge_angle = True
+    
+    # 3. Inflation (along normals)
+    inflation = vec.vector[GeometryVector.IDX_INFLATION]
+    if abs(inflation) > 0.01:
+        mod = obj.modifiers.new(name="Inflate", type='DISPLACE')
+        mod.strength = inflation * 0.5
+        mod.direction = 'NORMAL'
+    
+    # 4. Randomness (surface perturbation)
+    randomness = vec.vector[GeometryVector.IDX_RANDOMNESS]
+    if randomness > 0.01:
+        mod = obj.modifiers.new(name="Random", type='DISPLACE')
+        mod.strength = randomness * 0.1
+        # Create unique texture for this object
+        tex_name = f"RandomTex_{obj.name}"
+        tex = bpy.data.textures.get(tex_name)
+        if not tex:
+            tex = bpy.data.textures.new(tex_name, type='CLOUDS')
+            tex.noise_scale = 5.0
+        mod.texture = tex
+    
+    # ========== CRITICAL: Save vector data to object ==========
+    # Store the vector that was used to create this geometry
+    # This ensures Export will save the correct vector, not re-encoded one
+    set_object_vector(obj, vec)
+    
+    # Store metadata
+    obj["geometry_vector_source"] = "decode_render"
+    obj["geometry_vector_version"] = "1.0"
+    
+    # Store mesh "fingerprint" to detect manual edits later
+    # This allows us to determine if object is still "pure vector"
+    obj["geometry_vector_mesh_verts"] = len(obj.data.vertices)
+    obj["geometry_vector_mesh_faces"] = len(obj.data.polygons)
+    
+    # Set as active and select
+    context.view_layer.objects.active = obj
+    obj.select_set(True)
+    
+    return obj
+
+
+# ---------------------------------------------------------------------------
+# .gvec files
+
+@profiled("api.export_gvec")
+def export_gvec(filepath, obj=None, include_mesh=True, context=None, report=None, point_count=0, point_seed=0):
+    """
+    Export an object's geometry vector (and mesh data when needed) to .gvec
+
+    Pure vector objects are written vector-only; manually edited or
+    imported objects keep their mesh, with modifiers applied for edits.
+
+    Args:
+        filepath:     destination .gvec path
+        obj:          mesh object to export (defaults to the active object)
+        include_mesh: allow mesh data in the file
+        point_count:  also store this many surface samples (with normals) of
+                      the evaluated mesh as a point_cloud section
+        point_seed:   RNG seed of the samples
+
+    Returns:
+        True on success
+    """
+    context = context or bpy.context
+    report = report or _log
+    obj = obj or context.active_object
+    if not obj or obj.type != 'MESH':
+        report({'ERROR'}, "No active mesh object selected")
+        return False
+    
+    # Try to get stored vector first (from Decode&Render or Import)
+    geom_vec = get_object_vector(obj)
+    
+    if geom_vec is not None:
+        # Use stored vector (modified vector that created this object)
+        report({'INFO'}, "Using stored vector from object")
+    else:
+        # Re-encode from geometry (fallback)
+        geom_vec = GeometryEncoder.encode_object(obj)
+        report({'INFO'}, "Re-encoding vector from geometry")
+    
+    # Prepare metadata
+    metadata = {
+        "name": obj.name,
+        "source": obj.get("geometry_vector_source", "unknown"),
+        "version": obj.get("geometry_vector_version", "1.0")
+    }
+    
+    # For preset objects, try to identify and save the preset name
+    # This allows correct reconstruction on import
+    if metadata["source"] == "preset":
+        # Try to get preset name from various sources
+        preset_name = None
+        
+        # Method 1: Check if stored as custom property
+        if "geometry_vector_preset_name" in obj:
+            preset_name = obj["geometry_vector_preset_name"]
+            
+        # Method 2: Try to identify from current vector in scene
+        elif context.scene.vector_source_preset and context.scene.vector_source_preset != "NONE":
+            preset_name = context.scene.vector_source_preset
+            
+        # Method 3: Try to match vector to known presets
+        if not preset_name:
+            preset_name = _identify_preset_from_object(obj, context.scene)
+        
+        if preset_name:
+            metadata["preset_name"] = preset_name
+            print(f"[Export] Identified preset: {preset_name}")
+    
+    
+    # Determine if we should include mesh
+    # Strategy with comprehensive edit detection:
+    # 1. If user disabled mesh (include_mesh=False), respect that
+    # 2. Check if decode_render object has been manually edited (topology change)
+    # 3. Check if object has multiple mesh data users (merged/joined objects)
+    # 4. If object was IMPORTED with mesh data, preserve mesh+vector mode
+    # 5. Only use vector-only if object is unmodified decode_render with modifiers
+    
+    source = obj.get("geometry_vector_source", "unknown")
+    has_source_mesh = obj.get("geometry_vector_source_mesh") is not None
+    include_mesh_data = include_mesh
+    
+    # === Detection 1: Check mesh topology changes ===
+    mesh_manually_edited = False
+    if source == "decode_render":
+        original_verts = obj.get("geometry_vector_mesh_verts", -1)
+        original_faces = obj.get("geometry_vector_mesh_faces", -1)
+        current_verts = len(obj.data.vertices)
+        current_faces = len(obj.data.polygons)
+        
+        # If mesh topology changed, it's been manually edited
+        if original_verts != -1 and (current_verts != original_verts or current_faces != original_faces):
+            mesh_manually_edited = True
+            print(f"[Export] Mesh topology changed: verts {original_verts}->{current_verts}, faces {original_faces}->{current_faces}")
+    
+    # === Detection 2: Check if mesh data is shared (joined objects) ===
+    # If mesh data has multiple users, it might be a result of join operation
+    # OR if the object has been duplicated and the mesh is linked
+    mesh_is_shared = obj.data.users > 1
+    if mesh_is_shared and source == "decode_render":
+        print(f"[Export] Mesh data has {obj.data.users} users, may be joined/linked")
+    
+    # === Detection 3: Check for vertex groups (often added in manual editing) ===
+    has_vertex_groups = len(obj.vertex_groups) > 0
+    if has_vertex_groups and source == "decode_render":
+        print(f"[Export] Object has {len(obj.vertex_groups)} vertex groups (manual edit indicator)")
+        mesh_manually_edited = True
+    
+    # === Detection 4: Check for shape keys (animation/morphing) ===
+    has_shape_keys = obj.data.shape_keys is not None and len(obj.data.shape_keys.key_blocks) > 1
+    if has_shape_keys and source == "decode_render":
+        print("[Export] Object has shape keys (manual edit indicator)")
+        mesh_manually_edited = True
+    
+    # === Determine export mode ===
+    obj_to_export = None  # Will hold the object/mesh to export
+    needs_modifier_apply = False
+    
+    if mesh_manually_edited:
+        # Mesh has been manually edited - MUST include mesh data
+        include_mesh_data = True
+        needs_modifier_apply = True  # Apply modifiers to get complete geometry
+        report({'INFO'}, "Mesh manually edited, using mesh+vector mode with modifiers applied")
+        # Update source flag to reflect manual editing
+        obj["geometry_vector_source"] = "manual_edit"
+    elif source in ["decode_render", "preset"] and len(obj.modifiers) > 0 and not has_source_mesh and not mesh_is_shared:
+        # Pure vector object (from decode_render or preset) with modifiers - use vector only
+        # (base mesh + modifiers can be fully reconstructed from vector)
+        include_mesh_data = False
+        report({'INFO'}, f"Pure vector object detected ({source}), using vector-only mode")
+    elif has_source_mesh:
+        # Imported object with original mesh - preserve mesh+vector mode
+        include_mesh_data = True
+        report({'INFO'}, "Using mesh+vector mode (preserving imported mesh)")
+    else:
+        # Fallback: include mesh if in doubt
+        include_mesh_data = True
+        report({'INFO'}, "Using mesh+vector mode (safety fallback)")
+    
+    # === Apply modifiers if needed ===
+    if include_mesh_data and needs_modifier_apply and len(obj.modifiers) > 0:
+        # Create a temporary evaluated mesh with all modifiers applied
+        print(f"[Export] Applying {len(obj.modifiers)} modifiers to get final geometry...")
+        
+        # Use depsgraph to get evaluated object with modifiers applied
+        depsgraph = context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        
+        # Create a new mesh from the evaluated object
+        temp_mesh = bpy.data.meshes.new_from_object(obj_eval)
+        temp_obj = bpy.data.objects.new("TempExport", temp_mesh)
+        
+        # Copy custom properties to temp object
+        for key in obj.keys():
+            temp_obj[key] = obj[key]
+        
+        obj_to_export = temp_obj
+        print(f"[Export] Modifiers applied: {len(temp_mesh.vertices)} vertices (was {len(obj.data.vertices)})")
+    else:
+        obj_to_export = obj
+    
+    # Point cloud of the visible geometry, independent of the mesh mode
+    point_cloud = None
+    if point_count > 0:
+        point_cloud = GeometryFileFormat.sample_point_cloud(obj, point_count, point_seed,
+                                                            depsgraph=context.evaluated_depsgraph_get())
+    
+    # Export to file
+    success = GeometryFileFormat.export_to_file(
+        filepath,
+        geom_vec,
+        obj_to_export if include_mesh_data else None,
+        metadata,
+        point_cloud
+    )
+    
+    # Clean up temporary object if created
+    if obj_to_export != obj:
+        bpy.data.meshes.remove(obj_to_export.data)
+        # temp_obj will be removed automatically when mesh is removed
+    
+    if success:
+        mode = "vector+mesh" if include_mesh_data else "vector-only"
+        report({'INFO'}, f"Exported to {filepath} ({mode})")
+    else:
+        report({'ERROR'}, "Export failed")
+    return success
+
+
+def _identify_preset_from_object(obj, scene):
+    """Try to identify which preset the object was created from"""
+    try:
+        from .geometry_encoder import match_preset
+        
+        vec = get_object_vector(obj)
+        if vec is None:
+            return None
+        
+        return match_preset(vec.vector, threshold=0.5)
+    except Exception as e:
+        print(f"[Export] Failed to identify preset: {e}")
+        return None
+
+@profiled("api.import_gvec")
+def import_gvec(filepath, context=None, report=None):
+    """
+    Import a .gvec file as an object
+
+    Vector-only files (and pure vector sources) are reconstructed through
+    decode_and_render; files carrying mesh data are used as-is. The result
+    becomes the active object and its vector is loaded into the editor.
+
+    Returns:
+        the imported object, or None on failure
+    """
+    context = context or bpy.context
+    report = report or _log
+    scene = context.scene
+    
+    obj = GeometryFileFormat.restore_object_from_file(filepath, context)
+    if not obj:
+        report({'ERROR'}, "Failed to restore object")
+        return None
+    
+    # Determine if object needs reconstruction from vector
+    # Cases:
+    # 1. Empty mesh (no vertices) - always reconstruct
+    # 2. Pure vector sources (decode_render, preset) WITHOUT source_mesh - reconstruct
+    #    (this is a pure-vector export that needs reconstruction)
+    # 3. Objects WITH source_mesh marker - DON'T reconstruct
+    #    (this is an imported object with original mesh, use as-is)
+    
+    source = obj.get("geometry_vector_source", "unknown")
+    has_source_mesh = obj.get("geometry_vector_source_mesh") is not None
+    
+    needs_reconstruction = (
+        len(obj.data.vertices) == 0 or 
+        (source in ["decode_render", "preset"] and not has_source_mesh)
+    )
+    
+    if needs_reconstruction:
+        print(f"[Import] Object needs reconstruction from vector (source: {source}, has_mesh: {has_source_mesh})...")
+        
+        vec = get_object_vector(obj) or GeometryVector(np.array(scene.geom_vector_current, dtype=np.float32))
+        
+        # Restore preset name if this was a preset object
+        if source == "preset":
+            preset_name = obj.get("geometry_vector_preset_name", "NONE")
+            scene.vector_source_preset = preset_name
+            print(f"[Import] Restored preset source: {preset_name}")
+        else:
+            scene.vector_source_preset = "NONE"
+        
+        # Delete the imported object
+        old_name = obj.name
+        bpy.data.objects.remove(obj, do_unlink=True)
+        
+        # Reconstruct through Decode & Render
+        obj = decode_and_render(vec, context, report)
+        if obj:
+            obj.name = old_name
+            print(f"[Import] Successfully reconstructed {obj.name} from vector")
+        else:
+            report({'ERROR'}, "Failed to reconstruct geometry from vector")
+            return None
+    else:
+        print(f"[Import] Using imported mesh as-is (source: {source}, vertices: {len(obj.data.vertices)})")
+    
+    # Select the new object
+    for selected in context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+    
+    # Load vector into editor
+    vec = get_object_vector(obj)
+    if vec is not None:
+        scene.geom_vector_current = vec.vector.tolist()
+    
+    scene.show_vector_editor = True
+    
+    report({'INFO'}, f"Imported {obj.name} from .gvec file")
+    return obj
+
+
+@profiled("api.export_dataset")
+def export_dataset(directory, objects=None, shard_size=1024, include_mesh=True, apply_modifiers=True,
+                   resume=True, context=None, report=None, point_count=0, point_normals=True, point_seed=0,
+                   label=None):
+    """
+    Stream mesh objects into a sharded, memory-mappable ML dataset
+
+    Each shard holds up to `shard_size` objects: their vectors (filled by
+    the batched encoder straight into the shard's memmap), label ids and,
+    optionally, concatenated mesh buffers and fixed-size point clouds. See core.dataset_shards for the
+    layout and core.dataset_shards.ShardedDataset for reading it back.
+
+    Objects are written in name order. With `resume`, objects already in
+    completed shards of an existing export are skipped, so an interrupted
+    export continues after its last completed shard.
+
+    Args:
+        directory:       dataset directory (created if missing)
+        objects:         objects to export (defaults to all mesh objects in the scene)
+        shard_size:      objects per shard
+        include_mesh:    also write mesh buffers (object space)
+        apply_modifiers: mesh buffers from the evaluated mesh instead of the base mesh
+        resume:          continue an existing export; False starts over
+        point_count:     also write this many surface samples per object
+        point_normals:   store the normal of every sample
+        point_seed:      base seed; each object's cloud depends only on it and the object name
+        label:           label of every row (default: each object's preset name or vector source)
+
+    Returns:
+        number of objects written by this call, or None on failure
+    """
+    context = context or bpy.context
+    report = report or _log
+    if objects is None:
+        objects = context.scene.objects
+    objects = sorted((obj for obj in objects if obj.type == 'MESH'), key=lambda obj: obj.name)
+
+    try:
+        writer = dataset_shards.ShardWriter(
+            directory, shard_size=shard_size, include_mesh=include_mesh,
+            point_count=point_count, point_normals=point_normals, resume=resume,
+            info={"blender": bpy.app.version_string, "apply_modifiers": bool(apply_modifiers)})
+    except (OSError, ValueError) as e:
+        report({'ERROR'}, f"Dataset export failed: {e}")
+        return None
+
+    done = writer.completed_names()
+    pending = [obj for obj in objects if obj.name not in done]
+    if done:
+        report({'INFO'}, f"Resuming after {writer.shard_count} shard(s), {len(objects) - len(pending)} object(s) done")
+
+    read_buffers = include_mesh or writer.point_count > 0
+    depsgraph = context.evaluated_depsgraph_get() if read_buffers and apply_modifiers else None
+    written = 0
+    for start in range(0, len(pending), writer.shard_size):
+        chunk = pending[start:start + writer.shard_size]
+        shard = writer.begin_shard(len(chunk))
+        try:
+            GeometryEncoder.encode_objects(chunk, out=shard.vectors)
+            for row, obj in enumerate(chunk if read_buffers else ()):
+                buffers = _read_object_buffers(obj, depsgraph)
+                if include_mesh:
+                    shard.add_mesh(buffers)
+                if shard.points is not None:
+                    seed = [point_seed, zlib.crc32(obj.name.encode("utf-8"))]
+                    points, normals = point_sampling.sample_points(buffers, writer.point_count, seed,
+                                                                   shard.point_normals is not None)
+                    shard.points[row] = points
+                    if normals is not None:
+                        shard.point_normals[row] = normals
+            labels = label if label is not None else [
+                obj.get("geometry_vector_preset_name") or obj.get("geometry_vector_source", "unknown")
+                for obj in chunk]
+            metadata = [{"source": obj.get("geometry_vector_source", "unknown"),
+                         "version": obj.get("geometry_vector_version", "1.0")} for obj in chunk]
+            writer.commit_shard(shard, [obj.name for obj in chunk], labels, metadata)
+        except Exception as e:
+            writer.abort_shard(shard)
+            report({'ERROR'}, f"Dataset export stopped at shard {shard.index}: {e}")
+            return written if written else None
+        written += len(chunk)
+
+    report({'INFO'}, f"Exported {written} object(s); dataset has {writer.count} in {writer.shard_count} shard(s)")
+    return written
+
+
+@profiled("api.generate_dataset")
+def generate_dataset(directory, count, method="random", seed=0, space=None, shard_size=65536,
+                     resume=True, report=None, progress=None):
+    """
+    Sample `count` random design vectors into one sharded dataset
+
+    The whole design is drawn in one vectorized pass (see
+    core.design_space) and written as vectors-only shards; no objects are
+    created. The draw is seeded, so an interrupted run resumes by
+    regenerating the design and writing only the missing shards.
+
+    Args:
+        directory:  dataset directory
+        count:      number of vectors
+        method:     'random', 'latin_hypercube' or 'sobol'
+        seed:       RNG seed (also the Sobol digital shift)
+        space:      core.design_space.DesignSpace (defaults to its default ranges)
+        shard_size: vectors per shard
+        progress:   optional callable(rows_done, count)
+
+    Returns:
+        number of vectors written by this call, or None on failure
+    """
+    report = report or _log
+    try:
+        written = design_space.write_dataset(directory, count, space, method, seed, shard_size,
+                                             resume=resume, progress=progress)
+    except (OSError, ValueError) as e:
+        report({'ERROR'}, f"Dataset generation failed: {e}")
+        return None
+    if written:
+        report({'INFO'}, f"Generated {written} {method} vector(s) in {directory}")
+    else:
+        report({'INFO'}, f"Dataset in {directory} already holds {count} vector(s)")
+    return written
+
+
+# ID collections a .blend append can add to; freed again by ingest_blend
+_APPENDED_ID_COLLECTIONS = (
+    "objects", "meshes", "materials", "textures", "images", "node_groups", "curves", "lights",
+    "cameras", "armatures", "lattices", "metaballs", "fonts", "actions", "grease_pencils",
+    "collections", "worlds", "particles",
+)
+
+
+def _id_snapshot():
+    return {name: set(getattr(bpy.data, name, ())) for name in _APPENDED_ID_COLLECTIONS}
+
+
+def _ids_added_since(snapshot):
+    return [datablock for name, before in snapshot.items()
+            for datablock in getattr(bpy.data, name, ()) if datablock not in before]
+
+
+@profiled("api.ingest_blend")
+def ingest_blend(filepath, directory, shard_size=1024, include_mesh=True, apply_modifiers=True,
+                 context=None, report=None, point_count=0, point_normals=True, point_seed=0, label=None):
+    """
+    Encode every mesh object of a .blend file into a dataset, then free it
+
+    The file's objects are appended (types are only known once loaded),
+    everything but meshes is dropped, and the meshes are linked into a
+    temporary collection just long enough for the depsgraph to evaluate
+    them, encoded in bulk and written with export_dataset. Every datablock
+    the append brought in is removed again before returning, so the
+    session holds at most one file at a time.
+
+    Args:
+        filepath:  .blend file to read
+        directory: dataset directory for this file (rewritten from scratch)
+        label:     label of every row (default: the file name)
+        remaining arguments as for export_dataset
+
+    Returns:
+        number of mesh objects written, or None on failure
+    """
+    context = context or bpy.context
+    report = report or _log
+    snapshot = _id_snapshot()
+    try:
+        with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+            data_to.objects = list(data_from.objects)
+    except (OSError, RuntimeError) as e:
+        report({'ERROR'}, f"Cannot read {filepath}: {e}")
+        return None
+
+    meshes = [obj for obj in data_to.objects if obj is not None and obj.type == 'MESH']
+    collection = bpy.data.collections.new("__gvec_ingest")
+    context.scene.collection.children.link(collection)
+    try:
+        for obj in meshes:
+            collection.objects.link(obj)
+        written = export_dataset(directory, meshes, shard_size=shard_size, include_mesh=include_mesh,
+                                 apply_modifiers=apply_modifiers, resume=False, context=context,
+                                 report=report, point_count=point_count, point_normals=point_normals,
+                                 point_seed=point_seed,
+                                 label=label or os.path.splitext(os.path.basename(filepath))[0])
+    finally:
+        bpy.data.batch_remove(_ids_added_since(snapshot))
+    if written is None:
+        return None
+    report({'INFO'}, f"Ingested {len(meshes)} mesh object(s) from {os.path.basename(filepath)}")
+    return len(meshes)
+
+
+def list_blend_objects(filepath):
+    """Object names in a .blend file, read from its ID directory without loading any data"""
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        return list(data_from.objects)
+
+
+def match_object_names(names, patterns):
+    """
+    Names matching comma-separated exact names or wildcard patterns, in `names` order
+
+    An empty pattern string matches every name.
+    """
+    terms = [term.strip() for term in patterns.split(",") if term.strip()]
+    if not terms:
+        return list(names)
+    return [name for name in names if any(fnmatch.fnmatchcase(name, term) for term in terms)]
+
+
+def _free_added_ids(snapshot, keep=()):
+    """Remove appended objects, then whatever they alone used, except the IDs in `keep`"""
+    bpy.data.batch_remove([datablock for datablock in _ids_added_since(snapshot)
+                           if isinstance(datablock, bpy.types.Object)])
+    while True:
+        orphans = [datablock for datablock in _ids_added_since(snapshot)
+                   if datablock.users == 0 and datablock not in keep]
+        if not orphans:
+            return
+        bpy.data.batch_remove(orphans)
+
+
+@profiled("api.load_from_blend")
+def load_from_blend(filepath, names, link=True, context=None, report=None):
+    """
+    Append selected objects of a .blend file and load the first mesh's vector
+
+    Only the named objects (and the data they use) are appended. With
+    `link`, they are linked into the scene and the first mesh object
+    becomes the active one, as before. Without it nothing is linked: the
+    first mesh is encoded from a temporary collection, its mesh is kept
+    as the source mesh for decoding, and everything else the append
+    brought in is freed again right away.
+
+    Args:
+        filepath: .blend file
+        names:    object names to append (see list_blend_objects / match_object_names)
+        link:     link the appended objects into the scene
+
+    Returns:
+        the encoded GeometryVector, or None if no mesh object was loaded
+    """
+    context = context or bpy.context
+    report = report or _log
+    scene = context.scene
+
+    snapshot = _id_snapshot()
+    with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+        available = set(data_from.objects)
+        data_to.objects = [name for name in names if name in available]
+    appended = [obj for obj in data_to.objects if obj is not None]
+    meshes = [obj for obj in appended if obj.type == 'MESH']
+    filename = os.path.basename(filepath)
+
+    if not meshes:
+        _free_added_ids(snapshot)
+        report({'WARNING'}, f"No mesh objects among the {len(appended)} selected in {filename}")
+        return None
+
+    target = meshes[0]
+    target_name = target.name
+    if link:
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        for obj in appended:
+            scene.collection.objects.link(obj)
+            obj.select_set(obj.type == 'MESH')
+        context.view_layer.objects.active = target
+        geom_vec = GeometryEncoder.encode_object(target)
+        source_mesh_cache.acquire(scene, target.data)
+    else:
+        collection = bpy.data.collections.new("__gvec_load")
+        scene.collection.children.link(collection)
+        try:
+            collection.objects.link(target)
+            context.evaluated_depsgraph_get()
+            geom_vec = GeometryEncoder.encode_object(target)
+        finally:
+            scene.collection.children.unlink(collection)
+            bpy.data.collections.remove(collection)
+        source_mesh = target.data
+        _free_added_ids(snapshot, keep={source_mesh})
+        source_mesh_cache.acquire(scene, source_mesh, copy=False)
+
+    scene.geom_vector_current = geom_vec.vector.tolist()
+    scene.vector_source_preset = "NONE"
+    scene.show_vector_editor = True
+
+    if link:
+        report({'INFO'}, f"Loaded vector from {target_name} ({filename}), "
+                         f"appended {len(appended)} object(s)")
+    else:
+        report({'INFO'}, f"Loaded vector from {target_name} ({filename}) without linking; "
+                         f"kept only its mesh")
+    return geom_vec
+
+
+def _read_object_buffers(obj, depsgraph=None):
+    """Object-space MeshBuffers of an object (evaluated when a depsgraph is given)"""
+    if depsgraph is None:
+        return mesh_builder.read_mesh(obj.data)
+    eval_obj = obj.evaluated_get(depsgraph)
+    eval_mesh = eval_obj.to_mesh()
+    try:
+        return mesh_builder.read_mesh(eval_mesh)
+    finally:
+        eval_obj.to_mesh_clear()
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers shared with the operators
+
+def _link_generated_object(context, name, mesh, generator=None):
+    """Link a new object for generated mesh data and make it the sole active selection"""
+    for selected in context.selected_objects:
+        selected.select_set(False)
+    
+    obj = bpy.data.objects.new(name, mesh)
+    context.collection.objects.link(obj)
+    context.view_layer.objects.active = obj
+    obj.select_set(True)
+    
+    if generator is not None:
+        datablock_registry.track_object(context.scene, generator, obj)
+    return obj
+
+
+# Output names used before generated datablocks were tracked in the registry
+_LEGACY_GENERATED_OBJECTS = ("MyShapeObject", "HelixCurve", "HelixArray")
+
+
+def _clear_generated_output(context):
+    """Remove the previous preset generator output (registry entries only, no bpy.data scan)"""
+    # Hand the base mesh back first so no decode-cache display mesh outlives the object
+    shape_obj = bpy.data.objects.get("MyShapeObject")
+    if shape_obj is not None:
+        _restore_base_mesh(context, shape_obj)
+    
+    datablock_registry.release(context.scene, datablock_registry.PRESET_GENERATORS)
+    
+    # Untracked output from older files or the modifier-based shape path
+    for name in _LEGACY_GENERATED_OBJECTS:
+        obj = bpy.data.objects.get(name)
+        if obj:
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+
+# Scene settings, besides the ones decode_to_scene writes, that change what update_shape builds
+_DECODE_CONTEXT_PROPS = (
+    "my_shape_preset", "my_shape_helix_turns", "my_shape_helix_radius", "my_shape_helix_height",
+    "my_shape_helix_segments",
+    "my_aircraft_fuselage_length", "my_aircraft_wing_span", "my_aircraft_wing_sweep",
+    "my_aircraft_tail_size", "my_aircraft_engine_count",
+    "my_stair_steps", "my_stair_step_width", "my_stair_step_height", "my_stair_step_depth",
+    "my_stair_type", "my_stair_build_mode",
+    "my_character_gender", "my_character_age", "my_character_height", "my_character_build",
+    "my_shape_inflate", "my_generator_part_materials",
+)
+
+
+def _configure_decode_cache(scene):
+    """Apply the scene's decode cache budget and disk tier settings"""
+    disk_dir = None
+    if scene.decode_cache_use_disk:
+        disk_dir = bpy.path.abspath(scene.decode_cache_dir) if scene.decode_cache_dir else \
+            os.path.join(bpy.app.tempdir, "gvec_decode_cache")
+    cache = decode_cache.get_cache()
+    cache.configure(int(scene.decode_cache_budget_mb * 1024 * 1024), disk_dir)
+    return cache
+
+
+def _decode_cache_key(scene, vec):
+    """Cache key for decoding `vec` with the scene's current generator settings"""
+    source_id = ""
+    source_mesh = bpy.data.meshes.get(scene.vector_source_mesh) if scene.vector_source_mesh else None
+    if source_mesh_cache.is_handle(scene.vector_source_mesh):
+        # Handles name the mesh content, which is all the key needs
+        source_id = scene.vector_source_mesh
+    elif source_mesh is not None:
+        source_id = f"{source_mesh.name}:{len(source_mesh.vertices)}:{len(source_mesh.polygons)}"
+    
+    settings = []
+    for name in _DECODE_CONTEXT_PROPS:
+        value = getattr(scene, name, None)
+        if hasattr(value, "__len__") and not isinstance(value, str):
+            value = tuple(value)
+        settings.append(f"{name}={value}")
+    return decode_cache.cache_key(vec.vector, source_id, "|".join(settings))
+
+
+def _shape_target(context):
+    """Object update_shape builds into (mirrors its selection rule)"""
+    active_obj = context.active_object
+    if active_obj and active_obj.type == 'MESH':
+        has_vector_data = has_object_vector(active_obj)
+        if has_vector_data or active_obj.name == "MyShapeObject":
+            return active_obj
+    return bpy.data.objects.get("MyShapeObject")
+
+
+# Object property pointing at the base mesh swapped out for a decode-cache display mesh;
+# as an ID property it is a real user, so the base goes away together with the object
+_BASE_MESH_KEY = "gvec_base_mesh"
+
+
+def _base_mesh(obj):
+    base = obj.get(_BASE_MESH_KEY)
+    return base if isinstance(base, bpy.types.Mesh) else None
+
+
+def _new_shape_object(context):
+    """Link a fresh MyShapeObject on the default cube base mesh"""
+    mesh = bpy.data.meshes.new("MyShapeObject")
+    mesh_builder.write_mesh(mesh, mesh_builder.box_buffers(np.zeros(3), (2.0, 2.0, 2.0)))
+    return _link_generated_object(context, "MyShapeObject", mesh, datablock_registry.GENERATOR_SHAPE)
+
+
+def _apply_decoded_result(context, obj, result):
+    """
+    Show a cached decode result on a separate display mesh
+
+    The object's base mesh stays referenced by its gvec_base_mesh
+    property, so build_shape can swap it back before it rebuilds the
+    modifier stack. The display mesh is tracked under the generator that
+    owns the object and is released with it.
+    """
+    mesh = obj.data
+    if not mesh.get("gvec_decode_cache"):
+        obj[_BASE_MESH_KEY] = mesh
+        mesh = bpy.data.meshes.new(f"{obj.name}_Decoded")
+        mesh["gvec_decode_cache"] = True
+        obj.data = mesh
+        generator = datablock_registry.generator_of(context.scene, obj) or datablock_registry.GENERATOR_SHAPE
+        datablock_registry.track(context.scene, generator, mesh)
+    
+    mesh_builder.write_mesh(mesh, result.buffers)
+    
+    # Material slots: the base mesh's own, else the ones recorded with the result
+    base = _base_mesh(obj)
+    if base is not None and len(base.materials):
+        materials = list(base.materials)
+    else:
+        materials = [bpy.data.materials.get(name) if name else None for name in result.material_names]
+    mesh.materials.clear()
+    for material in materials:
+        mesh.materials.append(material)
+    
+    obj.modifiers.clear()
+    obj.matrix_world = Matrix(result.matrix.tolist())
+
+
+def _restore_base_mesh(context, obj):
+    """Swap a decode-cache display mesh back for the object's base mesh"""
+    display = obj.data
+    if display is None or not display.get("gvec_decode_cache"):
+        return
+    base = _base_mesh(obj)
+    if base is None:
+        # Base lost (property removed by hand); fall back to the default cube
+        base = bpy.data.meshes.new("MyShapeObject")
+        mesh_builder.write_mesh(base, mesh_builder.box_buffers(np.zeros(3), (2.0, 2.0, 2.0)))
+        generator = datablock_registry.generator_of(context.scene, obj) or datablock_registry.GENERATOR_SHAPE
+        datablock_registry.track(context.scene, generator, base)
+    obj.data = base
+    if _BASE_MESH_KEY in obj:
+        del obj[_BASE_MESH_KEY]
+    if display.users == 0:
+        bpy.data.meshes.remove(display)
+
+
+STAIR_INSTANCE_GROUP = "GVEC_StairInstances"
+
+
+def _get_stair_instance_node_group():
+    """Get (or build once) the node group that instances one step cube per marked vertex"""
+    node_group = bpy.data.node_groups.get(STAIR_INSTANCE_GROUP)
+    if node_group is not None:
+        return node_group
+    
+    node_group = bpy.data.node_groups.new(STAIR_INSTANCE_GROUP, 'GeometryNodeTree')
+    if hasattr(node_group, "interface"):
+        # Blender 4.0+
+        node_group.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        node_group.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    else:
+        node_group.inputs.new('NodeSocketGeometry', "Geometry")
+        node_group.outputs.new('NodeSocketGeometry', "Geometry")
+    
+    nodes = node_group.nodes
+    links = node_group.links
+    
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    step_cube = nodes.new('GeometryNodeMeshCube')
+    step_cube.inputs["Size"].default_value = (1.0, 1.0, 1.0)
+    instancer = nodes.new('GeometryNodeInstanceOnPoints')
+    join = nodes.new('GeometryNodeJoinGeometry')
+    
+    def named_attribute(name, data_type):
+        node = nodes.new('GeometryNodeInputNamedAttribute')
+        node.data_type = data_type
+        node.inputs["Name"].default_value = name
+        # Pre-4.0 versions expose one output per data type; pick the live one
+        return next(s for s in node.outputs if s.enabled and s.name == "Attribute")
+    
+    links.new(group_in.outputs[0], instancer.inputs["Points"])
+    links.new(named_attribute("stair_step", 'BOOLEAN'), instancer.inputs["Selection"])
+    links.new(step_cube.outputs["Mesh"], instancer.inputs["Instance"])
+    links.new(named_attribute("step_rotation", 'FLOAT_VECTOR'), instancer.inputs["Rotation"])
+    links.new(named_attribute("step_scale", 'FLOAT_VECTOR'), instancer.inputs["Scale"])
+    links.new(instancer.outputs["Instances"], join.inputs["Geometry"])
+    links.new(group_in.outputs[0], join.inputs["Geometry"])
+    links.new(join.outputs["Geometry"], group_out.inputs[0])
+    
+    return node_group
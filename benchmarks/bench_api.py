@@ -0,0 +1,108 @@
+"""
+API Benchmark - function-level API vs. operator dispatch
+
+Runs the same scripted workloads (interpolate + decode, decode & render,
+preset builds) through the api module and through bpy.ops, and reports
+calls per second for each path.
+
+Run headless:
+    blender -b --factory-startup --python benchmarks/bench_api.py
+"""
+
+import bpy
+import importlib
+import os
+import sys
+import time
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(ADDON_DIR))
+addon = importlib.import_module(os.path.basename(ADDON_DIR))
+addon.register()
+api = importlib.import_module(addon.__name__ + ".api")
+
+CALLS = 50
+PRESETS = ('SPIRAL_CORRIDOR', 'DNA_HELIX', 'TWISTED_TOWER', 'FIGHTER_JET')
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    bpy.context.scene.my_generated_datablocks.clear()
+
+
+def quiet(level, message):
+    pass
+
+
+def interpolate_api(i):
+    t = (i % 10) / 10.0
+    vec_a = api.encode_preset('SPIRAL_CORRIDOR')
+    vec_b = api.encode_preset('TWISTED_TOWER')
+    api.decode(api.interpolate(vec_a, vec_b, t), report=quiet)
+
+
+def interpolate_ops(i):
+    t = (i % 10) / 10.0
+    bpy.ops.myaddon.interpolate_geometry(preset_a='SPIRAL_CORRIDOR', preset_b='TWISTED_TOWER',
+                                         interpolation_factor=t)
+
+
+def build_preset_api(i):
+    api.build_preset(PRESETS[i % len(PRESETS)], report=quiet)
+
+
+def build_preset_ops(i):
+    bpy.context.scene.my_shape_preset = PRESETS[i % len(PRESETS)]
+    bpy.ops.myaddon.apply_preset()
+    bpy.ops.myaddon.update_shape()
+
+
+def decode_render_api(i):
+    scene = bpy.context.scene
+    vec = api.encode_preset(PRESETS[i % len(PRESETS)])
+    scene.vector_source_preset = "NONE"
+    api.decode_and_render(vec, report=quiet)
+
+
+def decode_render_ops(i):
+    scene = bpy.context.scene
+    vec = api.encode_preset(PRESETS[i % len(PRESETS)])
+    scene.vector_source_preset = "NONE"
+    for j in range(32):
+        scene.geom_vector_current[j] = float(vec.vector[j])
+    bpy.ops.myaddon.vector_decode_and_render()
+
+
+CASES = [
+    ("Interpolate + decode", interpolate_api, interpolate_ops),
+    ("Build preset", build_preset_api, build_preset_ops),
+    ("Decode & Render", decode_render_api, decode_render_ops),
+]
+
+
+def calls_per_second(workload):
+    clear_scene()
+    # Decode cache off so both paths do the same work on every call
+    bpy.context.scene.decode_cache_enabled = False
+    start = time.perf_counter()
+    for i in range(CALLS):
+        workload(i)
+    elapsed = time.perf_counter() - start
+    return CALLS / elapsed if elapsed > 0 else float('inf')
+
+
+def main():
+    print(f"{'Workload':<22}{'API (calls/s)':>15}{'bpy.ops (calls/s)':>19}{'Speed-up':>11}")
+    for name, via_api, via_ops in CASES:
+        api_rate = calls_per_second(via_api)
+        ops_rate = calls_per_second(via_ops)
+        speedup = api_rate / ops_rate if ops_rate > 0 else float('inf')
+        print(f"{name:<22}{api_rate:>15.1f}{ops_rate:>19.1f}{speedup:>10.1f}x")
+    clear_scene()
+
+
+if __name__ == "__main__":
+    main()
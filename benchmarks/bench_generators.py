@@ -0,0 +1,126 @@
+"""
+Generator Benchmark - procedural assembly vs. bpy.ops
+
+Builds every preset generator twice: once through the NumPy assembly path
+(procedural_generators + a single foreach_set write) and once by replaying
+the same part list through bpy.ops primitives and object.join, the way the
+generators used to work.
+
+Run headless:
+    blender -b --factory-startup --python benchmarks/bench_generators.py
+"""
+
+import bpy
+import importlib
+import os
+import statistics
+import sys
+import time
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(ADDON_DIR))
+addon = importlib.import_module(os.path.basename(ADDON_DIR))
+mesh_builder = importlib.import_module(addon.__name__ + ".core.mesh_builder")
+procedural_generators = importlib.import_module(addon.__name__ + ".core.procedural_generators")
+
+REPEATS = 5
+
+CASES = [
+    ("FIGHTER_JET", lambda: procedural_generators.aircraft_parts('FIGHTER_JET', 12.0, 10.0, 0.785, 3.0, 2)),
+    ("BOMBER", lambda: procedural_generators.aircraft_parts('BOMBER', 20.0, 30.0, 0.2, 5.0, 4)),
+    ("HELICOPTER", lambda: procedural_generators.aircraft_parts('HELICOPTER', 10.0, 12.0, 0.0, 6.0, 1)),
+    ("CHARACTER", lambda: procedural_generators.character_parts('MALE', 'ADULT', 1.75, 1.0)),
+]
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+
+def build_with_assembly(parts):
+    buffers, _ = procedural_generators.assemble(parts)
+    mesh = bpy.data.meshes.new("Bench")
+    mesh_builder.write_mesh(mesh, buffers)
+    obj = bpy.data.objects.new("Bench", mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def _add_primitive_with_ops(part, mirrored):
+    location = list(part.location)
+    if mirrored:
+        location[part.mirror_axis] = -location[part.mirror_axis]
+    params = part.params
+
+    if part.primitive == 'BOX':
+        bpy.ops.mesh.primitive_cube_add(size=1.0, location=location, rotation=part.rotation)
+        obj = bpy.context.active_object
+        obj.scale = params.get("size", (1.0, 1.0, 1.0))
+        return obj
+    if part.primitive == 'CYLINDER':
+        bpy.ops.mesh.primitive_cylinder_add(radius=params["radius"], depth=params["depth"],
+                                            location=location, rotation=part.rotation)
+    elif part.primitive == 'CONE':
+        bpy.ops.mesh.primitive_cone_add(radius1=params["radius"], depth=params["depth"],
+                                        location=location, rotation=part.rotation)
+    elif part.primitive == 'UV_SPHERE':
+        bpy.ops.mesh.primitive_uv_sphere_add(radius=params["radius"], location=location)
+    obj = bpy.context.active_object
+    obj.scale = part.scale
+    return obj
+
+
+def build_with_ops(parts):
+    created = []
+    for part in parts:
+        created.append(_add_primitive_with_ops(part, False))
+        if part.mirror_axis is not None:
+            created.append(_add_primitive_with_ops(part, True))
+
+    bpy.context.view_layer.objects.active = created[0]
+    for obj in created:
+        obj.select_set(True)
+    bpy.ops.object.join()
+    return bpy.context.active_object
+
+
+def time_builder(builder, parts):
+    samples = []
+    for _ in range(REPEATS):
+        clear_scene()
+        start = time.perf_counter()
+        builder(parts)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def main():
+    print(f"{'Generator':<14}{'Parts':>7}{'Assembly (ms)':>16}{'bpy.ops (ms)':>15}{'Speed-up':>11}")
+    for name, make_parts in CASES:
+        parts = make_parts()
+        assembly_ms = time_builder(build_with_assembly, parts)
+        ops_ms = time_builder(build_with_ops, parts)
+        speedup = ops_ms / assembly_ms if assembly_ms > 0 else float('inf')
+        print(f"{name:<14}{len(parts):>7}{assembly_ms:>16.2f}{ops_ms:>15.2f}{speedup:>10.1f}x")
+
+    for steps in (10, 100, 1000):
+        start = time.perf_counter()
+        buffers = procedural_generators.build_staircase(steps, stair_type='SPIRAL')
+        mesh = bpy.data.meshes.new("BenchStairs")
+        mesh_builder.write_mesh(mesh, buffers)
+        print(f"Staircase {steps:>5} steps: {(time.perf_counter() - start) * 1000.0:.2f} ms")
+
+    for turns in (5, 20, 50, 100):
+        start = time.perf_counter()
+        buffers = procedural_generators.build_helix(turns, radius=2.0, height=turns * 2.0)
+        mesh = bpy.data.meshes.new("BenchHelix")
+        mesh_builder.write_mesh(mesh, buffers)
+        print(f"Helix {turns:>9} turns: {(time.perf_counter() - start) * 1000.0:.2f} ms")
+    clear_scene()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Startup Benchmark - import cost of register() vs. first use
+
+Starts a fresh Blender with Python's import-time profiler enabled
+(PYTHONPROFILEIMPORTTIME, the environment form of -X importtime) and
+measures two phases:
+
+    register   importing the add-on and running register(), i.e. what
+               every Blender start and add-on toggle pays
+    first use  the modules the first operator execution pulls in (api,
+               encoder, file format, generators, NumPy)
+
+With eager registration both phases were paid at startup; the "eager"
+line is their sum, the "lazy" line what register() costs now.
+
+Run headless:
+    blender -b --factory-startup --python benchmarks/bench_startup.py -- [--runs N] [--top N] [--output PATH]
+"""
+
+import bpy
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+# Runs in the child Blender; phase markers go to stderr so they interleave with the import-time lines
+CHILD_SCRIPT = f"""
+import importlib, sys, time
+sys.path.insert(0, {os.path.dirname(ADDON_DIR)!r})
+
+def phase(name, start):
+    print(f"@@phase {{name}} {{(time.perf_counter() - start) * 1000.0:.3f}}", file=sys.stderr, flush=True)
+
+print("@@begin register", file=sys.stderr, flush=True)
+start = time.perf_counter()
+addon = importlib.import_module({ADDON_NAME!r})
+addon.register()
+phase("register", start)
+
+print("@@begin first_use", file=sys.stderr, flush=True)
+start = time.perf_counter()
+for name in (".api", ".geometry_encoder", ".geometry_file_format", ".core.vertex_cache", ".lod_manager"):
+    importlib.import_module({ADDON_NAME!r} + name)
+phase("first_use", start)
+"""
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_startup.py")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", default=None)
+    return parser.parse_args(argv)
+
+
+def run_child():
+    """One fresh Blender: {phase: {"ms": wall time, "imports": [(module, self us, cumulative us, depth)]}}"""
+    env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+    proc = subprocess.run(
+        [bpy.app.binary_path, "-b", "--factory-startup", "--python-use-system-env",
+         "--python-expr", CHILD_SCRIPT],
+        env=env, capture_output=True, text=True)
+
+    phases = {}
+    current = None
+    for line in proc.stderr.splitlines():
+        if line.startswith("@@begin "):
+            current = line.split()[1]
+            phases[current] = {"ms": None, "imports": []}
+        elif line.startswith("@@phase "):
+            _, name, ms = line.split()
+            phases[name]["ms"] = float(ms)
+            current = None
+        elif current is not None:
+            match = _IMPORT_LINE.match(line)
+            if match:
+                self_us, cumulative_us, indent, module = match.groups()
+                phases[current]["imports"].append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    if any(phase["ms"] is None for phase in phases.values()) or len(phases) < 2:
+        raise RuntimeError(f"Child Blender failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    return phases
+
+
+def summarize(runs, top: int):
+    summary = {}
+    for name in ("register", "first_use"):
+        times = [run[name]["ms"] for run in runs]
+        imports = runs[-1][name]["imports"]
+        # Top-level entries of the breakdown (depth 0 after the common indent)
+        min_depth = min((depth for _, _, _, depth in imports), default=0)
+        heaviest = sorted(((module, cumulative) for module, _, cumulative, depth in imports if depth == min_depth),
+                          key=lambda item: item[1], reverse=True)[:top]
+        summary[name] = {
+            "median_ms": statistics.median(times),
+            "samples_ms": times,
+            "modules": len(imports),
+            "import_self_ms": sum(self_us for _, self_us, _, _ in imports) / 1000.0,
+            "heaviest": [{"module": module, "cumulative_ms": cumulative / 1000.0} for module, cumulative in heaviest],
+        }
+    return summary
+
+
+def main():
+    args = parse_args()
+    runs = [run_child() for _ in range(args.runs)]
+    summary = summarize(runs, args.top)
+
+    for name, label in (("register", "register()"), ("first_use", "First operator use")):
+        entry = summary[name]
+        print(f"\n{label}: {entry['median_ms']:.1f} ms median over {args.runs} runs, "
+              f"{entry['modules']} modules imported ({entry['import_self_ms']:.1f} ms in imports)")
+        for item in entry["heaviest"]:
+            print(f"    {item['module']:<48}{item['cumulative_ms']:>9.2f} ms")
+
+    lazy_ms = summary["register"]["median_ms"]
+    eager_ms = lazy_ms + summary["first_use"]["median_ms"]
+    print(f"\nStartup cost  eager (register + first use at startup): {eager_ms:.1f} ms")
+    print(f"              lazy (register only):                     {lazy_ms:.1f} ms")
+    print(f"              saved at startup:                         {eager_ms - lazy_ms:.1f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"blender": bpy.app.version_string, "runs": args.runs, "phases": summary,
+                       "eager_ms": eager_ms, "lazy_ms": lazy_ms}, f, indent=2)
+        print(f"[Bench] Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Benchmark Suite - encode, decode and I/O at scale
+
+Times the .gvec serializer, file export/import, batch round trips, the
+encoder and point-cloud sampling on synthetic grid meshes from 1k to 1M
+vertices, plus decode & render, the preset generators and latent-space
+queries over 1k to 1M stored vectors. Results are written as JSON together with environment
+info and compared against a stored baseline; cases slower than the
+baseline by more than the tolerance are flagged and make the run exit
+with status 1.
+
+Run headless:
+    blender -b --factory-startup --python benchmarks/bench_suite.py -- [options]
+
+Options:
+    --quick                 sizes up to 10k only
+    --sizes 1000,100000     explicit mesh / vector counts
+    --repeats N             samples per case (default 5; 1 above 100k)
+    --output PATH           results file (default benchmarks/results.json)
+    --baseline PATH         baseline to compare with (default benchmarks/baseline.json)
+    --save-baseline         also write the results as the new baseline
+    --tolerance F           allowed slowdown before flagging (default 0.20 = +20%)
+"""
+
+import bpy
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(ADDON_DIR))
+addon = importlib.import_module(os.path.basename(ADDON_DIR))
+addon.register()
+api = importlib.import_module(addon.__name__ + ".api")
+mesh_builder = importlib.import_module(addon.__name__ + ".core.mesh_builder")
+geometry_encoder = importlib.import_module(addon.__name__ + ".geometry_encoder")
+geometry_file_format = importlib.import_module(addon.__name__ + ".geometry_file_format")
+point_sampling = importlib.import_module(addon.__name__ + ".core.point_sampling")
+
+GeometryEncoder = geometry_encoder.GeometryEncoder
+GeometryVector = geometry_encoder.GeometryVector
+GeometryLatentSpace = geometry_encoder.GeometryLatentSpace
+GeometryFileFormat = geometry_file_format.GeometryFileFormat
+GeometryBatchExporter = geometry_file_format.GeometryBatchExporter
+
+SIZES = (1000, 10000, 100000, 1000000)
+QUICK_SIZES = (1000, 10000)
+BATCH_OBJECTS = 10
+NEIGHBOR_QUERIES = 10
+POINT_SAMPLES = 100000
+PRESETS = ('SPIRAL_CORRIDOR', 'DNA_HELIX', 'SPRING', 'TWISTED_TOWER',
+           'FIGHTER_JET', 'BOMBER', 'HELICOPTER', 'STAIRCASE', 'CHARACTER')
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_suite.py")
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--sizes", type=lambda s: tuple(int(v) for v in s.split(",")), default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=os.path.join(BENCH_DIR, "results.json"))
+    parser.add_argument("--baseline", default=os.path.join(BENCH_DIR, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.20)
+    return parser.parse_args(argv)
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    bpy.context.scene.my_generated_datablocks.clear()
+
+
+def quiet(level, message):
+    pass
+
+
+def grid_buffers(vertex_count: int) -> "mesh_builder.MeshBuffers":
+    """Wavy quad grid with about `vertex_count` vertices"""
+    side = max(2, int(round(vertex_count ** 0.5)))
+    u, v = np.meshgrid(np.linspace(-1.0, 1.0, side, dtype=np.float32),
+                       np.linspace(-1.0, 1.0, side, dtype=np.float32))
+    vertices = np.stack([u.ravel(), v.ravel(), 0.1 * np.sin(4.0 * u.ravel()) * np.cos(4.0 * v.ravel())], axis=1)
+    index = np.arange(side * side, dtype=np.int32).reshape(side, side)
+    quads = np.stack([index[:-1, :-1], index[:-1, 1:], index[1:, 1:], index[1:, :-1]], axis=-1).reshape(-1)
+    return mesh_builder.MeshBuffers(vertices, quads, np.full(len(quads) // 4, 4, dtype=np.int32))
+
+
+def grid_object(name: str, vertex_count: int):
+    mesh = bpy.data.meshes.new(name)
+    mesh_builder.write_mesh(mesh, grid_buffers(vertex_count))
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def measure(workload, repeats: int, teardown=None):
+    """Median and samples (ms) of `workload`; teardown gets its result outside the timing"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = workload()
+        samples.append((time.perf_counter() - start) * 1000.0)
+        if teardown:
+            teardown(result)
+    return statistics.median(samples), samples
+
+
+def remove_mesh(mesh):
+    if mesh is not None:
+        bpy.data.meshes.remove(mesh)
+
+
+def remove_objects(objects):
+    for obj in objects or ():
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def mesh_cases(size: int, repeats: int, workdir: str):
+    """Serializer, file I/O, batch round trip and encoder on one grid size"""
+    clear_scene()
+    obj = grid_object("BenchGrid", size)
+    vec = GeometryEncoder.encode_object(obj)
+    data = GeometryFileFormat.serialize_mesh(obj)
+    path = os.path.join(workdir, f"grid_{size}.gvec")
+    GeometryFileFormat.export_to_file(path, vec, obj)
+
+    yield "serialize_mesh", measure(lambda: GeometryFileFormat.serialize_mesh(obj), repeats)
+    yield "deserialize_mesh", measure(lambda: GeometryFileFormat.deserialize_mesh(data), repeats,
+                                      teardown=remove_mesh)
+    yield "export_to_file", measure(lambda: GeometryFileFormat.export_to_file(path, vec, obj), repeats)
+    yield "import_from_file", measure(lambda: GeometryFileFormat.import_from_file(path), repeats)
+    yield "encode_object", measure(lambda: GeometryEncoder.encode_object(obj), repeats)
+    buffers = mesh_builder.read_mesh(obj.data)
+    yield f"sample_points_{POINT_SAMPLES}", measure(
+        lambda: point_sampling.sample_points(buffers, POINT_SAMPLES, seed=0, with_normals=True), repeats)
+
+    # Batch: the same total vertex count spread over several objects
+    clear_scene()
+    parts = [grid_object(f"BenchBatch{i}", max(4, size // BATCH_OBJECTS)) for i in range(BATCH_OBJECTS)]
+    batch_path = os.path.join(workdir, f"batch_{size}.gvec_batch")
+
+    def batch_round_trip():
+        GeometryBatchExporter.export_batch(batch_path, parts)
+        return GeometryBatchExporter.import_batch(batch_path, bpy.context)
+    yield "batch_round_trip", measure(batch_round_trip, repeats, teardown=remove_objects)
+    clear_scene()
+
+
+def latent_cases(count: int, repeats: int):
+    """Latent space fill, nearest-neighbour and blend queries over `count` stored vectors"""
+    rng = np.random.default_rng(count)
+    vectors = rng.random((count, 32), dtype=np.float32)
+    names = [f"v{i}" for i in range(count)]
+
+    def fill():
+        space = GeometryLatentSpace()
+        for name, row in zip(names, vectors):
+            space.add_geometry(name, GeometryVector(row))
+        return space
+    yield "latent_add", measure(fill, repeats)
+
+    space = fill()
+    queries = [GeometryVector(row) for row in rng.random((NEIGHBOR_QUERIES, 32), dtype=np.float32)]
+
+    def neighbors():
+        for query in queries:
+            space.get_neighbors(query, k=5)
+    yield f"latent_neighbors_x{NEIGHBOR_QUERIES}", measure(neighbors, repeats)
+    yield "latent_blend_8", measure(lambda: space.blend_geometries(names[:8], [1.0] * 8), repeats)
+
+
+def scene_cases(repeats: int):
+    """Size-independent cases: preset generators and decode & render"""
+    scene = bpy.context.scene
+    scene.decode_cache_enabled = False
+    for preset in PRESETS:
+        clear_scene()
+        yield f"build_preset[{preset}]", measure(lambda: api.build_preset(preset, report=quiet), repeats)
+    for preset in PRESETS:
+        clear_scene()
+        vec = api.encode_preset(preset)
+
+        def decode_render():
+            scene.vector_source_preset = "NONE"
+            api.decode_and_render(vec, report=quiet)
+        yield f"decode_and_render[{preset}]", measure(decode_render, repeats)
+    clear_scene()
+
+
+def environment():
+    return {
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "background": bpy.app.background,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def run(args):
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="gvec_bench_")
+
+    def record(key, size, timing):
+        median_ms, samples = timing
+        results[key] = {"size": size, "median_ms": median_ms, "samples_ms": samples}
+        print(f"{key:<44}{median_ms:>12.2f} ms")
+
+    try:
+        for size in sizes:
+            repeats = args.repeats if size <= 100000 else 1
+            for name, timing in mesh_cases(size, repeats, workdir):
+                record(f"{name}@{size}", size, timing)
+            for name, timing in latent_cases(size, repeats):
+                record(f"{name}@{size}", size, timing)
+        for name, timing in scene_cases(args.repeats):
+            record(name, None, timing)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        clear_scene()
+    return results
+
+
+def compare(results, baseline, tolerance: float):
+    """Cases slower than baseline * (1 + tolerance), as (key, baseline ms, current ms)"""
+    regressions = []
+    for key, entry in results.items():
+        reference = baseline.get(key)
+        if reference is None or reference["median_ms"] <= 0:
+            continue
+        if entry["median_ms"] > reference["median_ms"] * (1.0 + tolerance):
+            regressions.append((key, reference["median_ms"], entry["median_ms"]))
+    return regressions
+
+
+def write_json(path, payload):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
+def main():
+    args = parse_args()
+    results = run(args)
+    payload = {"environment": environment(), "tolerance": args.tolerance, "results": results}
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("environment", {}).get("blender") != payload["environment"]["blender"]:
+            print(f"[Bench] Baseline was recorded with Blender {baseline.get('environment', {}).get('blender')}")
+        regressions = compare(results, baseline.get("results", {}), args.tolerance)
+        payload["baseline"] = args.baseline
+        payload["regressions"] = [{"case": key, "baseline_ms": old, "current_ms": new}
+                                  for key, old, new in regressions]
+        print(f"\n{len(regressions)} regression(s) beyond +{args.tolerance * 100:.0f}% of {args.baseline}")
+        for key, old, new in regressions:
+            print(f"  {key:<42}{old:>10.2f} -> {new:.2f} ms ({new / old:.2f}x)")
+    else:
+        print(f"\n[Bench] No baseline at {args.baseline}; run with --save-baseline to create one")
+
+    write_json(args.output, payload)
+    print(f"[Bench] Results written to {args.output}")
+    if args.save_baseline:
+        write_json(args.baseline, payload)
+        print(f"[Bench] Baseline saved to {args.baseline}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
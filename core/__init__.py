@@ -0,0 +1,24 @@
+"""
+Blender-independent core
+Vector math, preset table and latent space (vectors), NumPy mesh buffers
+and generators (mesh_builder, procedural_generators), the .gvec codec
+(gvec_codec), surface point sampling (point_sampling), the decode result
+cache (decode_cache), the binary vertex animation cache (vertex_cache),
+the content-addressed offload store for source meshes (mesh_store),
+sharded ML dataset files (dataset_shards), design-space sampling
+(design_space), the headless Blender worker farm (worker_farm) and
+incremental .blend library ingestion on top of it (library_ingest).
+Nothing in this package imports bpy or mathutils, so
+worker processes, CLI tools and tests can use it from plain CPython; the
+add-on modules one level up are the Blender adapters.
+
+    import sys; sys.path.insert(0, "<directory containing the add-on>")
+    from <addon package>.core import GeometryVector, preset_vector
+"""
+
+from .vectors import (
+    GeometryVector, GeometryLatentSpace, get_latent_space,
+    KNOWN_PRESETS, preset_vector, preset_table, match_preset,
+    modifier_tracks, transform_tracks
+)
+from .mesh_builder import MeshBuffers
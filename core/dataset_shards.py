@@ -0,0 +1,336 @@
+"""
+Sharded Dataset Files
+Fixed-size shards of geometry vectors, labels and mesh buffers for ML
+training. Every array is a plain .npy file, so training code can map a
+shard with np.load(path, mmap_mode="r") and slice it without copying.
+Nothing here touches bpy.
+
+Directory layout:
+    manifest.json               format, shard_size, label vocabulary, completed shards
+    shard_00000/vectors.npy     (count, 32) float32
+    shard_00000/labels.npy      (count,) int32 indices into manifest["labels"]
+    shard_00000/vertices.npy    (V, 3) float32, all objects of the shard concatenated
+    shard_00000/loops.npy       (L,) int32, vertex indices local to each object
+    shard_00000/face_sizes.npy  (F,) int32
+    shard_00000/material_ids.npy (F,) int32
+    shard_00000/*_offsets.npy   (count + 1,) int64 row ranges per object
+                                (vertex_offsets, loop_offsets, face_offsets)
+    shard_00000/points.npy      (count, point_count, 3) float32 surface samples (optional)
+    shard_00000/point_normals.npy  (count, point_count, 3) float32 (optional)
+
+A shard is written into a temporary directory, renamed into place and only
+then listed in the manifest (which is itself replaced atomically), so an
+interrupted export leaves every listed shard complete and a new export
+into the same directory resumes after the last one.
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .mesh_builder import MeshBuffers
+
+DATASET_FORMAT = "gvec_dataset"
+DATASET_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+VECTOR_DIM = 32
+
+_OFFSET_ARRAYS = ("vertex_offsets", "loop_offsets", "face_offsets")
+
+# Settings added after the first release, with the value older manifests imply
+_SETTING_DEFAULTS = {"point_count": 0, "point_normals": False}
+
+
+def shard_name(index: int) -> str:
+    return f"shard_{index:05d}"
+
+
+def read_manifest(directory: str) -> Optional[Dict]:
+    """Parsed manifest of a dataset directory, or None if there is none"""
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != DATASET_FORMAT:
+        raise ValueError(f"{path} is not a {DATASET_FORMAT} manifest")
+    return manifest
+
+
+def write_manifest(directory: str, manifest: Dict):
+    path = os.path.join(directory, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class PendingShard:
+    """
+    One shard being filled: a (count, 32) vectors memmap plus mesh buffers
+
+    Fill `vectors` in place (e.g. GeometryEncoder.encode_objects(objs,
+    out=shard.vectors)) and add one mesh per row with add_mesh(). With
+    point clouds enabled, `points` (and `point_normals`) are
+    (count, point_count, 3) memmaps to fill per row the same way.
+    """
+
+    def __init__(self, index: int, path: str, count: int, include_mesh: bool,
+                 point_count: int = 0, point_normals: bool = False):
+        self.index = index
+        self.count = count
+        self.include_mesh = include_mesh
+        self._path = path
+        self.vectors = self._open("vectors", (count, VECTOR_DIM))
+        self.points = self._open("points", (count, point_count, 3)) if point_count else None
+        self.point_normals = self._open("point_normals", (count, point_count, 3)) \
+            if point_count and point_normals else None
+        self._meshes: List[MeshBuffers] = []
+
+    def _open(self, name: str, shape) -> np.memmap:
+        return np.lib.format.open_memmap(os.path.join(self._path, name + ".npy"), mode="w+",
+                                         dtype=np.float32, shape=shape)
+
+    def add_mesh(self, buffers: MeshBuffers):
+        if len(self._meshes) >= self.count:
+            raise ValueError(f"Shard {self.index} already holds {self.count} meshes")
+        self._meshes.append(buffers)
+
+    def _write_meshes(self):
+        if len(self._meshes) != self.count:
+            raise ValueError(f"Shard {self.index} has {len(self._meshes)} meshes for {self.count} rows")
+        meshes = self._meshes
+        sizes = {
+            "vertex_offsets": [m.vertex_count for m in meshes],
+            "loop_offsets": [len(m.loops) for m in meshes],
+            "face_offsets": [m.face_count for m in meshes],
+        }
+        for name, counts in sizes.items():
+            offsets = np.zeros(self.count + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            np.save(os.path.join(self._path, name + ".npy"), offsets)
+
+        arrays = {
+            "vertices": [m.vertices for m in meshes],
+            "loops": [m.loops for m in meshes],
+            "face_sizes": [m.face_sizes for m in meshes],
+            "material_ids": [m.material_ids if m.material_ids is not None
+                             else np.zeros(m.face_count, dtype=np.int32) for m in meshes],
+        }
+        empty = {"vertices": np.zeros((0, 3), dtype=np.float32)}
+        for name, parts in arrays.items():
+            data = np.concatenate(parts) if parts else empty.get(name, np.zeros(0, dtype=np.int32))
+            np.save(os.path.join(self._path, name + ".npy"), data)
+
+    def _release(self):
+        for name in ("vectors", "points", "point_normals"):
+            array = getattr(self, name, None)
+            if array is not None:
+                array.flush()
+            setattr(self, name, None)
+
+    def _finish(self):
+        self._release()
+        if self.include_mesh:
+            self._write_meshes()
+        self._meshes = []
+
+
+class ShardWriter:
+    """
+    Writes a dataset directory shard by shard
+
+        writer = ShardWriter(directory, shard_size=1024)
+        for names, labels in chunks:            # at most shard_size per chunk
+            shard = writer.begin_shard(len(names))
+            ...fill shard.vectors, shard.add_mesh(...)
+            writer.commit_shard(shard, names, labels)
+
+    With resume=True an existing manifest written with the same settings is
+    kept and completed_names() tells the caller which objects to skip; with
+    resume=False existing shards are removed first.
+    """
+
+    def __init__(self, directory: str, shard_size: int = 1024, include_mesh: bool = True,
+                 point_count: int = 0, point_normals: bool = False,
+                 resume: bool = True, info: Optional[Dict] = None):
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        settings = {"shard_size": int(shard_size), "include_mesh": bool(include_mesh),
+                    "vector_dim": VECTOR_DIM, "point_count": max(0, int(point_count)),
+                    "point_normals": bool(point_count) and bool(point_normals)}
+        manifest = read_manifest(directory)
+        if manifest is not None and resume:
+            existing = {key: manifest.get(key, _SETTING_DEFAULTS.get(key)) for key in settings}
+            if existing != settings:
+                raise ValueError(f"Dataset in {directory} was written with {existing}; "
+                                 f"cannot resume with {settings}")
+        elif manifest is not None:
+            self._remove_shards(manifest)
+            manifest = None
+
+        if manifest is None:
+            manifest = {"format": DATASET_FORMAT, "version": DATASET_VERSION, **settings,
+                        "count": 0, "labels": [], "info": info or {}, "shards": []}
+            write_manifest(directory, manifest)
+        self.manifest = manifest
+        self.shard_size = settings["shard_size"]
+        self.include_mesh = settings["include_mesh"]
+        self.point_count = settings["point_count"]
+        self.point_normals = settings["point_normals"]
+        self._label_index = {label: i for i, label in enumerate(manifest["labels"])}
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.manifest["shards"])
+
+    @property
+    def count(self) -> int:
+        return self.manifest["count"]
+
+    def completed_names(self) -> set:
+        """Names of the objects in completed shards"""
+        return {name for shard in self.manifest["shards"] for name in shard.get("names", ())}
+
+    def begin_shard(self, count: int) -> PendingShard:
+        if not 0 < count <= self.shard_size:
+            raise ValueError(f"Shard row count {count} outside 1..{self.shard_size}")
+        index = self.shard_count
+        path = os.path.join(self.directory, shard_name(index) + ".tmp")
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+        return PendingShard(index, path, count, self.include_mesh, self.point_count, self.point_normals)
+
+    def commit_shard(self, shard: PendingShard, names: Optional[Sequence[str]], labels,
+                     metadata: Optional[List[Dict]] = None) -> Dict:
+        """
+        Finish the shard files, move them into place and record the shard in the manifest
+
+        `labels` is one label per row or a single label for the whole shard.
+        Unnamed rows (names=None, e.g. generated samples) are addressed by
+        their running row number, recorded as the shard's "start".
+        """
+        if isinstance(labels, str):
+            labels = [labels] * shard.count
+        if (names is not None and len(names) != shard.count) or len(labels) != shard.count:
+            raise ValueError(f"Shard {shard.index} needs {shard.count} names and labels")
+        label_ids = np.empty(shard.count, dtype=np.int32)
+        for row, label in enumerate(labels):
+            index = self._label_index.get(label)
+            if index is None:
+                index = self._label_index[label] = len(self.manifest["labels"])
+                self.manifest["labels"].append(label)
+            label_ids[row] = index
+        np.save(os.path.join(shard._path, "labels.npy"), label_ids)
+        shard._finish()
+
+        name = shard_name(shard.index)
+        final_path = os.path.join(self.directory, name)
+        shutil.rmtree(final_path, ignore_errors=True)
+        os.replace(shard._path, final_path)
+
+        entry = {"index": shard.index, "path": name, "count": shard.count, "start": self.count}
+        if names is not None:
+            entry["names"] = list(names)
+        if metadata is not None:
+            entry["metadata"] = metadata
+        self.manifest["shards"].append(entry)
+        self.manifest["count"] += shard.count
+        write_manifest(self.directory, self.manifest)
+        return entry
+
+    def abort_shard(self, shard: PendingShard):
+        """Drop a shard that will not be committed"""
+        shard._release()
+        shutil.rmtree(shard._path, ignore_errors=True)
+
+    def _remove_shards(self, manifest: Dict):
+        for entry in manifest.get("shards", ()):
+            shutil.rmtree(os.path.join(self.directory, entry["path"]), ignore_errors=True)
+        os.remove(os.path.join(self.directory, MANIFEST_NAME))
+
+
+class ShardedDataset:
+    """
+    Read side: memory-mapped access to a dataset directory
+
+        data = ShardedDataset("/data/gvec")
+        for vectors, labels in data.iter_shards():   # read-only memmaps
+            ...
+        mesh = data.mesh(0, 5)                        # MeshBuffers views, no copy
+    """
+
+    def __init__(self, directory: str):
+        manifest = read_manifest(directory)
+        if manifest is None:
+            raise FileNotFoundError(f"No {MANIFEST_NAME} in {directory}")
+        self.directory = directory
+        self.manifest = manifest
+        self.labels = list(manifest["labels"])
+        self._arrays = {}
+
+    def __len__(self) -> int:
+        return self.manifest["count"]
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.manifest["shards"])
+
+    def names(self, shard: int) -> List[str]:
+        """Object names of a shard (empty for unnamed, generated rows)"""
+        return self.manifest["shards"][shard].get("names", [])
+
+    def array(self, shard: int, name: str) -> np.ndarray:
+        """One .npy array of a shard, memory-mapped read-only"""
+        key = (shard, name)
+        array = self._arrays.get(key)
+        if array is None:
+            path = os.path.join(self.directory, self.manifest["shards"][shard]["path"], name + ".npy")
+            array = self._arrays[key] = np.load(path, mmap_mode="r")
+        return array
+
+    def vectors(self, shard: int) -> np.ndarray:
+        return self.array(shard, "vectors")
+
+    def label_ids(self, shard: int) -> np.ndarray:
+        return self.array(shard, "labels")
+
+    def points(self, shard: int) -> np.ndarray:
+        """(count, point_count, 3) surface samples of a shard"""
+        if not self.manifest.get("point_count"):
+            raise ValueError("Dataset was exported without point clouds")
+        return self.array(shard, "points")
+
+    def point_normals(self, shard: int) -> np.ndarray:
+        if not self.manifest.get("point_normals"):
+            raise ValueError("Dataset was exported without point normals")
+        return self.array(shard, "point_normals")
+
+    def iter_shards(self) -> Iterator:
+        """(vectors, label ids) memmaps per shard"""
+        for shard in range(self.shard_count):
+            yield self.vectors(shard), self.label_ids(shard)
+
+    def mesh(self, shard: int, row: int) -> MeshBuffers:
+        """Mesh buffers of one object as views into the shard's memmaps"""
+        if not self.manifest.get("include_mesh"):
+            raise ValueError("Dataset was exported without mesh buffers")
+        ranges = []
+        for name in _OFFSET_ARRAYS:
+            offsets = self.array(shard, name)
+            ranges.append(slice(int(offsets[row]), int(offsets[row + 1])))
+        vertex_range, loop_range, face_range = ranges
+        return MeshBuffers(self.array(shard, "vertices")[vertex_range],
+                           self.array(shard, "loops")[loop_range],
+                           self.array(shard, "face_sizes")[face_range],
+                           self.array(shard, "material_ids")[face_range])
+
+    def close(self):
+        """Release the memmaps (required before the files can be replaced on Windows)"""
+        self._arrays.clear()
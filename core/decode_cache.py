@@ -0,0 +1,209 @@
+"""
+Decode Cache
+Caches evaluated decode results (vertex and face buffers) keyed by a
+quantized hash of the 32D vector, the decoder version and the identity
+of any source mesh. Results live in a byte-budgeted in-memory LRU with an
+optional on-disk tier of .npz files. Nothing here touches bpy.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from .mesh_builder import MeshBuffers
+
+# Bump whenever the decode pipeline changes what a vector produces
+DECODER_VERSION = "1"
+
+# Vector components closer than this hash to the same key
+DEFAULT_QUANTUM = 1e-4
+
+
+def cache_key(vector, source_id: str = "", context: str = "", quantum: float = DEFAULT_QUANTUM) -> str:
+    """
+    Stable key for a decode request
+
+    Args:
+        vector:    32 floats
+        source_id: identity of the source mesh the decode starts from ("" for none)
+        context:   any other settings that change the decoded geometry
+        quantum:   quantization step applied to the vector before hashing
+    """
+    quantized = np.round(np.asarray(vector, dtype=np.float64) / quantum).astype(np.int64)
+    digest = hashlib.sha1()
+    digest.update(DECODER_VERSION.encode())
+    digest.update(quantized.tobytes())
+    digest.update(source_id.encode())
+    digest.update(context.encode())
+    return digest.hexdigest()
+
+
+class DecodedResult:
+    """Evaluated decode output: local-space mesh buffers, the object matrix and material slot names"""
+
+    def __init__(self, buffers: MeshBuffers, matrix=None, material_names=()):
+        self.buffers = buffers
+        self.matrix = np.eye(4, dtype=np.float32) if matrix is None else \
+            np.asarray(matrix, dtype=np.float32).reshape(4, 4)
+        self.material_names = [str(name) for name in material_names]
+
+    @property
+    def nbytes(self) -> int:
+        size = (self.buffers.vertices.nbytes + self.buffers.loops.nbytes +
+                self.buffers.face_sizes.nbytes + self.matrix.nbytes)
+        if self.buffers.material_ids is not None:
+            size += self.buffers.material_ids.nbytes
+        return size
+
+    def save(self, filepath: str):
+        arrays = {
+            "vertices": self.buffers.vertices,
+            "loops": self.buffers.loops,
+            "face_sizes": self.buffers.face_sizes,
+            "matrix": self.matrix,
+        }
+        if self.buffers.material_ids is not None:
+            arrays["material_ids"] = self.buffers.material_ids
+        if self.material_names:
+            arrays["material_names"] = np.array(self.material_names, dtype=str)
+        # Write to a temporary name first so a crash never leaves a truncated entry
+        tmp_path = filepath + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, filepath)
+
+    @staticmethod
+    def load(filepath: str) -> 'DecodedResult':
+        with np.load(filepath) as data:
+            buffers = MeshBuffers(
+                data["vertices"], data["loops"], data["face_sizes"],
+                data["material_ids"] if "material_ids" in data else None
+            )
+            names = data["material_names"].tolist() if "material_names" in data else ()
+            return DecodedResult(buffers, data["matrix"], names)
+
+
+class DecodeCache:
+    """
+    Two-tier cache of decode results
+
+    Memory tier: LRU bounded by max_bytes. Disk tier (optional): one .npz
+    per key in disk_dir, written when an entry is stored and consulted on
+    memory misses.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, disk_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str):
+        if key in self._entries:
+            return True
+        path = self._disk_path(key)
+        return path is not None and os.path.exists(path)
+
+    def configure(self, max_bytes: int, disk_dir: Optional[str] = None):
+        """Apply new limits, evicting immediately if the budget shrank"""
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._evict()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def get(self, key: str) -> Optional[DecodedResult]:
+        """Look up a result, promoting disk hits into memory"""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+        path = self._disk_path(key)
+        if path is not None and os.path.exists(path):
+            try:
+                result = DecodedResult.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[DecodeCache] Dropping unreadable disk entry {path}: {e}")
+                os.remove(path)
+            else:
+                self.disk_hits += 1
+                self._insert(key, result)
+                return result
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: DecodedResult):
+        """Store a result in memory (and on disk when the disk tier is enabled)"""
+        path = self._disk_path(key)
+        if path is not None and not os.path.exists(path):
+            try:
+                os.makedirs(self.disk_dir, exist_ok=True)
+                result.save(path)
+            except OSError as e:
+                print(f"[DecodeCache] Could not write disk entry: {e}")
+        self._insert(key, result)
+
+    def clear(self, disk: bool = False):
+        """Drop all memory entries and reset stats (and the disk tier if requested)"""
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        if disk and self.disk_dir and os.path.isdir(self.disk_dir):
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def _insert(self, key: str, result: DecodedResult):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old.nbytes
+        self._entries[key] = result
+        self.current_bytes += result.nbytes
+        self._evict()
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, result = self._entries.popitem(last=False)
+            self.current_bytes -= result.nbytes
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        return os.path.join(self.disk_dir, key + ".npz")
+
+
+_cache = DecodeCache()
+
+
+def get_cache() -> DecodeCache:
+    """Process-wide decode cache"""
+    return _cache
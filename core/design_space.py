@@ -0,0 +1,407 @@
+"""
+Design Space Sampling
+Draws large sets of geometry vectors in one vectorized pass: unit samples
+from a random, Latin hypercube or Sobol design are mapped through a
+per-dimension distribution (uniform, log-uniform, truncated normal or
+constant) and filtered by vectorized constraints. write_dataset streams
+the result into a sharded dataset (see dataset_shards), so a million
+samples become a few hundred .npy shards instead of a million files.
+Nothing here touches bpy.
+
+    space = DesignSpace()
+    space.set(GeometryVector.IDX_TWIST, "uniform", -0.25, 0.25)
+    space.add_constraint(max_ratio(GeometryVector.IDX_SCALE_X, GeometryVector.IDX_SCALE_Y, 4.0))
+    vectors = space.sample(1_000_000, method="sobol", seed=1)
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .vectors import GeometryVector
+from . import dataset_shards
+
+UNIFORM = "uniform"
+LOG_UNIFORM = "log_uniform"
+NORMAL = "normal"
+CONSTANT = "constant"
+KINDS = (UNIFORM, LOG_UNIFORM, NORMAL, CONSTANT)
+
+METHODS = ("random", "latin_hypercube", "sobol")
+
+# Rows drawn per sampling pass; bounds peak memory for very large requests
+CHUNK_ROWS = 1 << 18
+
+
+class Dimension:
+    """
+    Distribution of one vector component
+
+    uniform / log_uniform cover [low, high); normal is truncated to
+    [low, high) around mean with standard deviation std; constant is low.
+    """
+
+    __slots__ = ("kind", "low", "high", "mean", "std")
+
+    def __init__(self, kind: str = UNIFORM, low: float = 0.0, high: float = 1.0,
+                 mean: Optional[float] = None, std: Optional[float] = None):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown distribution {kind!r} (expected one of {KINDS})")
+        if kind != CONSTANT and not high > low:
+            raise ValueError(f"Empty range [{low}, {high}) for {kind}")
+        if kind == LOG_UNIFORM and low <= 0.0:
+            raise ValueError("log_uniform needs a positive lower bound")
+        self.kind = kind
+        self.low = float(low)
+        self.high = float(high)
+        self.mean = float(mean) if mean is not None else 0.5 * (self.low + self.high)
+        self.std = float(std) if std is not None else (self.high - self.low) / 4.0
+
+    def __repr__(self):
+        return f"Dimension({self.kind!r}, {self.low}, {self.high})"
+
+    def to_dict(self) -> Dict:
+        return {"kind": self.kind, "low": self.low, "high": self.high, "mean": self.mean, "std": self.std}
+
+
+def default_dimensions() -> Dict[int, Dimension]:
+    """Plausible ranges for every component: positive scales, rotations in [-pi, pi), origin location"""
+    V = GeometryVector
+    dims = {index: Dimension(UNIFORM, 0.0, 1.0) for index in range(V.VECTOR_DIM)}
+    for index in (V.IDX_SCALE_X, V.IDX_SCALE_Y, V.IDX_SCALE_Z,
+                  V.IDX_ASPECT_RATIO_XY, V.IDX_ASPECT_RATIO_XZ, V.IDX_ASPECT_RATIO_YZ):
+        dims[index] = Dimension(LOG_UNIFORM, 0.25, 4.0)
+    dims[V.IDX_ELONGATION] = Dimension(UNIFORM, 1.0 / 3.0, 1.0)
+    dims[V.IDX_TWIST] = Dimension(UNIFORM, -0.5, 0.5)
+    dims[V.IDX_TAPER] = Dimension(UNIFORM, -1.0, 1.0)
+    dims[V.IDX_BEND] = Dimension(UNIFORM, -0.5, 0.5)
+    dims[V.IDX_WAVE_FREQ] = Dimension(UNIFORM, 0.0, 2.0)
+    dims[V.IDX_WAVE_AMP] = Dimension(UNIFORM, 0.0, 0.5)
+    dims[V.IDX_NOISE_SCALE] = Dimension(UNIFORM, 0.1, 2.0)
+    dims[V.IDX_NOISE_STRENGTH] = Dimension(UNIFORM, 0.0, 0.5)
+    for index in (V.IDX_ROT_X, V.IDX_ROT_Y, V.IDX_ROT_Z):
+        dims[index] = Dimension(UNIFORM, -math.pi, math.pi)
+    for index in (V.IDX_LOC_X, V.IDX_LOC_Y, V.IDX_LOC_Z):
+        dims[index] = Dimension(CONSTANT, 0.0, 0.0)
+    dims[V.IDX_INFLATION] = Dimension(UNIFORM, -1.0, 1.0)
+    return dims
+
+
+# ---------------------------------------------------------------------------
+# Constraints: vectorized predicates over an (N, 32) array -> (N,) bool
+# ---------------------------------------------------------------------------
+
+def within(index: int, low: float, high: float) -> Callable:
+    """Component `index` in [low, high]"""
+    def predicate(values):
+        column = values[:, index]
+        return (column >= low) & (column <= high)
+    predicate.__name__ = f"within[{index}]"
+    return predicate
+
+
+def positive(indices: Sequence[int]) -> Callable:
+    """All listed components strictly positive"""
+    indices = list(indices)
+
+    def predicate(values):
+        return np.all(values[:, indices] > 0.0, axis=1)
+    predicate.__name__ = f"positive{indices}"
+    return predicate
+
+
+def max_ratio(a: int, b: int, ratio: float) -> Callable:
+    """max(|a|, |b|) / min(|a|, |b|) at most `ratio`"""
+    def predicate(values):
+        x = np.abs(values[:, a])
+        y = np.abs(values[:, b])
+        return np.maximum(x, y) <= ratio * np.minimum(x, y)
+    predicate.__name__ = f"max_ratio[{a},{b}]"
+    return predicate
+
+
+def sum_at_most(indices: Sequence[int], total: float) -> Callable:
+    """Sum of the listed components at most `total` (e.g. exclusive shape-morph weights)"""
+    indices = list(indices)
+
+    def predicate(values):
+        return values[:, indices].sum(axis=1) <= total
+    predicate.__name__ = f"sum_at_most{indices}"
+    return predicate
+
+
+# ---------------------------------------------------------------------------
+# Unit designs in [0, 1)^d
+# ---------------------------------------------------------------------------
+
+def latin_hypercube(count: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """One point per stratum [k/count, (k+1)/count) in every dimension"""
+    # Row-wise on (dim, count) keeps every sort contiguous
+    strata = np.argsort(rng.random((dim, count)), axis=1)
+    return ((strata + rng.random((dim, count))) / count).T
+
+
+# Joe & Kuo (2008) primitive polynomials (degree s, coefficients a) and
+# initial direction numbers m for Sobol dimensions 2..32
+_SOBOL_PARAMS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+    (7, 7, (1, 1, 3, 13, 7, 35, 63)),
+    (7, 8, (1, 3, 5, 9, 1, 25, 53)),
+    (7, 14, (1, 3, 1, 13, 9, 35, 107)),
+    (7, 19, (1, 3, 1, 5, 27, 61, 31)),
+    (7, 21, (1, 1, 5, 11, 19, 41, 61)),
+    (7, 28, (1, 3, 5, 3, 3, 13, 69)),
+    (7, 31, (1, 1, 7, 13, 1, 19, 1)),
+    (7, 32, (1, 3, 7, 5, 13, 19, 59)),
+    (7, 37, (1, 1, 3, 9, 25, 29, 41)),
+    (7, 41, (1, 3, 5, 13, 23, 1, 55)),
+    (7, 42, (1, 3, 7, 3, 13, 59, 17)),
+)
+SOBOL_MAX_DIM = len(_SOBOL_PARAMS) + 1
+_SOBOL_BITS = 32
+
+
+def _sobol_directions(dim: int) -> np.ndarray:
+    """(32, dim) uint32 direction numbers"""
+    directions = np.zeros((_SOBOL_BITS, dim), dtype=np.uint64)
+    directions[:, 0] = [1 << (_SOBOL_BITS - 1 - bit) for bit in range(_SOBOL_BITS)]
+    for column, (degree, coeffs, initial) in enumerate(_SOBOL_PARAMS[:dim - 1], start=1):
+        v = [0] * _SOBOL_BITS
+        for bit in range(_SOBOL_BITS):
+            if bit < degree:
+                v[bit] = initial[bit] << (_SOBOL_BITS - 1 - bit)
+            else:
+                value = v[bit - degree] ^ (v[bit - degree] >> degree)
+                for k in range(1, degree):
+                    if (coeffs >> (degree - 1 - k)) & 1:
+                        value ^= v[bit - k]
+                v[bit] = value
+        directions[:, column] = v
+    return directions.astype(np.uint32)
+
+
+def sobol(count: int, dim: int, skip: int = 0, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Points skip .. skip + count - 1 of the gray-code Sobol sequence
+
+    With an rng every dimension gets a random digital shift (XOR), which
+    keeps the net structure while decorrelating differently seeded designs.
+    """
+    if dim > SOBOL_MAX_DIM:
+        raise ValueError(f"Sobol sequence supports at most {SOBOL_MAX_DIM} dimensions")
+    directions = _sobol_directions(dim)
+    index = np.arange(skip, skip + count, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    codes = np.zeros((count, dim), dtype=np.uint32)
+    for bit in range(int(gray.max()).bit_length() if count else 0):
+        selected = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        np.bitwise_xor(codes, directions[bit], out=codes, where=selected[:, None])
+    if rng is not None:
+        codes ^= rng.integers(0, 1 << _SOBOL_BITS, size=dim, dtype=np.uint64).astype(np.uint32)
+    return codes * (1.0 / (1 << _SOBOL_BITS))
+
+
+def _norm_ppf(p: np.ndarray) -> np.ndarray:
+    """Inverse standard normal CDF (Acklam's rational approximation, relative error ~1e-9)"""
+    a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+    b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00)
+    p = np.clip(p, 1e-300, 1.0 - 1e-16)
+    x = np.empty_like(p)
+
+    central = (p >= 0.02425) & (p <= 0.97575)
+    q = p[central] - 0.5
+    r = q * q
+    x[central] = ((((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q /
+                  (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0))
+
+    tail = ~central
+    t = np.where(p[tail] < 0.5, p[tail], 1.0 - p[tail])
+    q = np.sqrt(-2.0 * np.log(t))
+    value = ((((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) /
+             ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0))
+    x[tail] = np.where(p[tail] < 0.5, value, -value)
+    return x
+
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+# ---------------------------------------------------------------------------
+# Design space
+# ---------------------------------------------------------------------------
+
+class DesignSpace:
+    """
+    Per-dimension distributions plus constraints over the 32-D vector space
+
+    Unspecified dimensions use default_dimensions(). Constraints are
+    callables taking an (N, 32) array and returning an (N,) bool mask.
+    """
+
+    def __init__(self, dimensions: Optional[Dict[int, Dimension]] = None,
+                 constraints: Optional[List[Callable]] = None):
+        self.dimensions = default_dimensions()
+        for index, dimension in (dimensions or {}).items():
+            self.dimensions[int(index)] = dimension
+        self.constraints = list(constraints or [])
+
+    def set(self, index: int, kind: str, low: float = 0.0, high: float = 1.0,
+            mean: Optional[float] = None, std: Optional[float] = None) -> 'DesignSpace':
+        self.dimensions[index] = Dimension(kind, low, high, mean, std)
+        return self
+
+    def add_constraint(self, predicate: Callable) -> 'DesignSpace':
+        self.constraints.append(predicate)
+        return self
+
+    def to_dict(self) -> Dict:
+        """Description for dataset manifests (constraints by name only)"""
+        return {
+            "dimensions": {str(index): dim.to_dict() for index, dim in sorted(self.dimensions.items())},
+            "constraints": [getattr(c, "__name__", repr(c)) for c in self.constraints],
+        }
+
+    @staticmethod
+    def from_dict(data: Dict, constraints: Optional[List[Callable]] = None) -> 'DesignSpace':
+        dimensions = {int(index): Dimension(d["kind"], d["low"], d["high"], d.get("mean"), d.get("std"))
+                      for index, d in data.get("dimensions", {}).items()}
+        return DesignSpace(dimensions, constraints)
+
+    def transform(self, unit: np.ndarray) -> np.ndarray:
+        """Map unit samples (N, 32) through the per-dimension distributions"""
+        # Work on contiguous per-dimension rows, hand back an (N, 32) view
+        columns = np.ascontiguousarray(unit.T)
+        values = np.empty(columns.shape, dtype=np.float32)
+        for index, dim in self.dimensions.items():
+            u = columns[index]
+            if dim.kind == UNIFORM:
+                values[index] = dim.low + u * (dim.high - dim.low)
+            elif dim.kind == LOG_UNIFORM:
+                log_low = math.log(dim.low)
+                values[index] = np.exp(log_low + u * (math.log(dim.high) - log_low))
+            elif dim.kind == NORMAL:
+                # Inverse CDF restricted to the probability mass inside [low, high)
+                lo = _norm_cdf((dim.low - dim.mean) / dim.std)
+                hi = _norm_cdf((dim.high - dim.mean) / dim.std)
+                column = dim.mean + dim.std * _norm_ppf(lo + u * (hi - lo))
+                values[index] = np.clip(column, dim.low, dim.high)
+            else:
+                values[index] = dim.low
+        return values.T
+
+    def accept(self, values: np.ndarray) -> np.ndarray:
+        mask = np.ones(len(values), dtype=bool)
+        for predicate in self.constraints:
+            mask &= predicate(values)
+        return mask
+
+    def sample(self, count: int, method: str = "random", seed: Optional[int] = None,
+               max_rounds: int = 32) -> np.ndarray:
+        """
+        `count` vectors satisfying every constraint, as (count, 32) float32
+
+        Rejected rows are replaced by further draws sized from the observed
+        acceptance rate; Sobol draws continue the sequence, Latin hypercube
+        top-ups are new hypercubes. The same seed gives the same vectors.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown sampling method {method!r} (expected one of {METHODS})")
+        dim = GeometryVector.VECTOR_DIM
+        rng = np.random.default_rng(seed)
+        # One digital shift for the whole Sobol stream, also when unseeded
+        shift_seed = int(rng.integers(1 << 62))
+        out = np.empty((count, dim), dtype=np.float32)
+        filled = 0
+        drawn = 0
+        request = count
+        for _ in range(max_rounds):
+            if filled >= count:
+                break
+            for start in range(0, request, CHUNK_ROWS):
+                rows = min(CHUNK_ROWS, request - start)
+                if method == "random":
+                    unit = rng.random((rows, dim))
+                elif method == "latin_hypercube":
+                    unit = latin_hypercube(rows, dim, rng)
+                else:
+                    unit = sobol(rows, dim, skip=drawn, rng=np.random.default_rng(shift_seed))
+                drawn += rows
+                values = self.transform(unit)
+                kept = values[self.accept(values)][:count - filled]
+                out[filled:filled + len(kept)] = kept
+                filled += len(kept)
+                if filled >= count:
+                    break
+            rate = filled / drawn
+            if rate == 0.0:
+                raise ValueError(f"No sample satisfied the constraints after {drawn} draws")
+            request = int(math.ceil((count - filled) / rate * 1.1)) + 16
+        if filled < count:
+            raise ValueError(f"Only {filled} of {count} samples satisfied the constraints")
+        return out
+
+
+def write_dataset(directory: str, count: int, space: Optional[DesignSpace] = None,
+                  method: str = "random", seed: Optional[int] = 0, shard_size: int = 65536,
+                  resume: bool = True, label: Optional[str] = None, progress=None) -> int:
+    """
+    Sample `count` vectors and write them to a vectors-only sharded dataset
+
+    The draw is seeded, so a resumed run regenerates the same vectors and
+    writes only the shards that were not completed.
+
+    Args:
+        progress: optional callable(rows_done, count) called after every shard
+
+    Returns:
+        number of rows written by this call
+    """
+    space = space or DesignSpace()
+    label = label or method
+    writer = dataset_shards.ShardWriter(
+        directory, shard_size=shard_size, include_mesh=False, resume=resume,
+        info={"generator": {"count": count, "method": method, "seed": seed, "space": space.to_dict()}})
+    if writer.count >= count:
+        return 0
+
+    vectors = space.sample(count, method, seed)
+    written = 0
+    for start in range(writer.count, count, writer.shard_size):
+        rows = vectors[start:start + writer.shard_size]
+        shard = writer.begin_shard(len(rows))
+        try:
+            shard.vectors[:] = rows
+            writer.commit_shard(shard, None, label)
+        except Exception:
+            writer.abort_shard(shard)
+            raise
+        written += len(rows)
+        if progress is not None:
+            progress(writer.count, count)
+    return written
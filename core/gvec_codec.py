@@ -0,0 +1,145 @@
+"""
+.gvec Codec
+Reads and writes .gvec / .gvec_batch JSON documents and converts between
+their mesh dictionaries and MeshBuffers. The Blender side
+(geometry_file_format) fills the mesh dictionaries from bpy meshes; workers
+can produce the same files from MeshBuffers without Blender.
+
+Document layout:
+    {"version": "1.0", "type": "geometry_vector", "vector": [32 floats],
+     "metadata": {...}, "mesh": {...}, "materials": {...},
+     "point_cloud": {"count", "seed", "points": [[x, y, z], ...], "normals": [...]}}
+    {"version": "1.0", "type": "geometry_batch", "count": N,
+     "objects": [{"name", "vector", "mesh", "transform"}, ...]}
+"""
+
+import json
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from .mesh_builder import MeshBuffers
+from .point_sampling import fan_triangles, triangle_cross
+
+FORMAT_VERSION = "1.0"
+EXTENSION = ".gvec"
+BATCH_EXTENSION = ".gvec_batch"
+
+
+def build_document(vector, metadata: Optional[Dict] = None, mesh: Optional[Dict] = None,
+                   materials: Optional[Dict] = None, point_cloud: Optional[Dict] = None) -> Dict:
+    """Single-object document (mesh, materials and point cloud are optional)"""
+    data = {
+        "version": FORMAT_VERSION,
+        "type": "geometry_vector",
+        "vector": np.asarray(vector, dtype=np.float32).tolist(),
+        "metadata": metadata if metadata is not None else {},
+    }
+    if mesh:
+        data["mesh"] = mesh
+    if materials:
+        data["materials"] = materials
+    if point_cloud:
+        data["point_cloud"] = point_cloud
+    return data
+
+
+def build_point_cloud(points: np.ndarray, normals: Optional[np.ndarray] = None,
+                      seed: Optional[int] = None) -> Dict:
+    """point_cloud section from sampled (N, 3) points and optional normals"""
+    section = {
+        "count": len(points),
+        "seed": seed,
+        "points": np.asarray(points, dtype=np.float32).tolist(),
+    }
+    if normals is not None:
+        section["normals"] = np.asarray(normals, dtype=np.float32).tolist()
+    return section
+
+
+def document_point_cloud(data: Dict) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """(points, normals or None) of a document, or None if it has no point cloud"""
+    section = data.get("point_cloud")
+    if not section:
+        return None
+    points = np.asarray(section["points"], dtype=np.float32).reshape(-1, 3)
+    normals = section.get("normals")
+    if normals is not None:
+        normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+    return points, normals
+
+
+def build_batch(objects: List[Dict]) -> Dict:
+    """Batch document from {"name", "vector", "mesh", "transform"} entries"""
+    return {
+        "version": FORMAT_VERSION,
+        "type": "geometry_batch",
+        "count": len(objects),
+        "objects": objects,
+    }
+
+
+def write_document(filepath: str, data: Dict, ensure_ascii: bool = True):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=ensure_ascii)
+
+
+def read_document(filepath: str) -> Dict:
+    """Parse a .gvec or .gvec_batch file (raises OSError / ValueError)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("version") != FORMAT_VERSION:
+        print(f"Warning: File version {data.get('version')} may not be compatible")
+    return data
+
+
+def document_vector(data: Dict) -> np.ndarray:
+    """The 32-float vector of a document or batch entry"""
+    return np.array(data["vector"], dtype=np.float32)
+
+
+def mesh_data_from_buffers(buffers: MeshBuffers, modifiers: Optional[List[Dict]] = None) -> Dict:
+    """Mesh dictionary (serialize_mesh layout) from MeshBuffers"""
+    starts = np.concatenate(([0], np.cumsum(buffers.face_sizes)[:-1])).astype(np.int64)
+    faces = [buffers.loops[start:start + size].tolist()
+             for start, size in zip(starts, buffers.face_sizes)]
+
+    # Unique undirected edges from consecutive face corners
+    following = np.arange(len(buffers.loops)) + 1
+    ends = starts + buffers.face_sizes
+    following[ends - 1] = starts
+    pairs = np.sort(np.stack([buffers.loops, buffers.loops[following]], axis=1), axis=1)
+    edges = np.unique(pairs, axis=0) if len(pairs) else np.zeros((0, 2), dtype=np.int32)
+
+    mesh_data = {
+        "vertices": buffers.vertices.tolist(),
+        "edges": edges.tolist(),
+        "faces": faces,
+        "normals": _vertex_normals(buffers).tolist(),
+        "vertex_count": buffers.vertex_count,
+        "face_count": buffers.face_count,
+    }
+    if modifiers:
+        mesh_data["modifiers"] = modifiers
+    return mesh_data
+
+
+def buffers_from_mesh_data(mesh_data: Dict) -> MeshBuffers:
+    """MeshBuffers from a mesh dictionary (edges without faces are dropped)"""
+    faces = mesh_data["faces"]
+    loops = [index for face in faces for index in face]
+    return MeshBuffers(np.asarray(mesh_data["vertices"], dtype=np.float32).reshape(-1, 3),
+                       np.asarray(loops, dtype=np.int32),
+                       np.asarray([len(face) for face in faces], dtype=np.int32))
+
+
+def _vertex_normals(buffers: MeshBuffers) -> np.ndarray:
+    """Area-weighted vertex normals from fan-triangulated faces"""
+    normals = np.zeros_like(buffers.vertices)
+    triangles = fan_triangles(buffers)
+    if len(triangles) == 0:
+        return normals
+    face_normals = triangle_cross(buffers.vertices, triangles)
+    for index in triangles.T:
+        np.add.at(normals, index, face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return normals / np.where(lengths > 1e-12, lengths, 1.0)
@@ -0,0 +1,258 @@
+"""
+Library Ingestion
+Turns a directory tree of .blend files into a library store: every mesh
+object of every file is encoded (and optionally its mesh and point cloud
+stored) by headless workers (see worker_farm, kind "ingest"), one
+sharded dataset per source file, with a merged manifest over all of them.
+An mtime manifest remembers which file state each dataset was built from,
+so a rerun only sends new or modified files to the workers and drops the
+datasets of files that were deleted. Nothing here touches bpy.
+
+    python -m <addon package>.core.library_ingest assets/ library_store/ --workers 8
+
+Store layout:
+    ingest_manifest.json        relative .blend path -> mtime, size, dataset, object count
+    files/<key>/                dataset of one .blend file (+ source.json when complete)
+    manifest.json               merged manifest over every file dataset
+    farm/                       worker job files and logs of the last run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import dataset_shards, worker_farm
+
+INGEST_MANIFEST = "ingest_manifest.json"
+FILES_DIR_NAME = "files"
+BLEND_EXTENSION = ".blend"
+
+
+def scan(source_dir: str, recursive: bool = True) -> Dict[str, Dict]:
+    """Relative path -> {"path", "mtime", "size"} of every .blend under `source_dir`"""
+    source_dir = os.path.abspath(source_dir)
+    found = {}
+    for root, dirs, files in os.walk(source_dir):
+        if not recursive:
+            dirs.clear()
+        dirs.sort()
+        for name in sorted(files):
+            # Skips Blender's numbered backups (.blend1, .blend2, ...)
+            if not name.lower().endswith(BLEND_EXTENSION):
+                continue
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, source_dir).replace(os.sep, "/")
+            found[relative] = dict(worker_farm.source_stat(path), path=path)
+    return found
+
+
+def dataset_key(relative: str) -> str:
+    """Stable directory name of a source file's dataset"""
+    return hashlib.sha1(relative.encode("utf-8")).hexdigest()[:16]
+
+
+def read_ingest_manifest(store: str) -> Dict[str, Dict]:
+    path = os.path.join(store, INGEST_MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("files", {})
+
+
+def write_ingest_manifest(store: str, source_dir: str, files: Dict[str, Dict]):
+    path = os.path.join(store, INGEST_MANIFEST)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"source": os.path.abspath(source_dir), "updated": time.time(), "files": files},
+                  f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def plan(source_dir: str, store: str, recursive: bool = True) -> Tuple[Dict[str, Dict], List[str], List[str]]:
+    """
+    Compare the source tree with the store
+
+    Returns:
+        (current scan, relative paths to (re)ingest, relative paths whose
+        source file is gone)
+    """
+    current = scan(source_dir, recursive)
+    known = read_ingest_manifest(store)
+    changed = []
+    for relative, state in current.items():
+        entry = known.get(relative)
+        marker = worker_farm.read_source_marker(os.path.join(store, FILES_DIR_NAME, dataset_key(relative)))
+        if (entry is None or marker is None or entry["mtime"] != state["mtime"]
+                or entry["size"] != state["size"] or marker["mtime"] != state["mtime"]):
+            changed.append(relative)
+    removed = sorted(set(known) - set(current))
+    return current, changed, removed
+
+
+class LibraryIngest:
+    """
+    Incremental ingestion of a .blend directory into a library store
+
+    Same driving interface as worker_farm.WorkerFarm: run() blocks,
+    start() + poll() until True suits a modal operator's timer.
+    """
+
+    def __init__(self, source_dir: str, store: str, workers: Optional[int] = None,
+                 include_mesh: bool = True, apply_modifiers: bool = True, point_count: int = 0,
+                 shard_size: int = 1024, recursive: bool = True, blender: Optional[str] = None,
+                 retries: int = 2, timeout: Optional[float] = None, log=print):
+        self.source_dir = os.path.abspath(source_dir)
+        self.store = os.path.abspath(store)
+        self.workers = workers
+        self.include_mesh = include_mesh
+        self.apply_modifiers = apply_modifiers
+        self.point_count = point_count
+        self.shard_size = shard_size
+        self.recursive = recursive
+        self.blender = blender
+        self.retries = retries
+        self.timeout = timeout
+        self.log = log
+
+        self.current: Dict[str, Dict] = {}
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+        self.farm: Optional[worker_farm.WorkerFarm] = None
+        self.merged = None
+        self._finished = False
+
+    def _dataset_dir(self, relative: str) -> str:
+        return os.path.join(self.store, FILES_DIR_NAME, dataset_key(relative))
+
+    def start(self):
+        """Work out what changed, drop stale datasets and launch workers for the rest"""
+        if not os.path.isdir(self.source_dir):
+            raise FileNotFoundError(f"No such directory: {self.source_dir}")
+        os.makedirs(self.store, exist_ok=True)
+        self.current, self.changed, self.removed = plan(self.source_dir, self.store, self.recursive)
+        self.log(f"[Ingest] {len(self.current)} .blend file(s): {len(self.changed)} to ingest, "
+                 f"{len(self.current) - len(self.changed)} unchanged, {len(self.removed)} removed")
+
+        for relative in self.removed:
+            shutil.rmtree(self._dataset_dir(relative), ignore_errors=True)
+        for relative in self.changed:
+            # A file that was partly ingested before it changed must start over
+            dataset_dir = self._dataset_dir(relative)
+            marker = worker_farm.read_source_marker(dataset_dir)
+            if marker is None or marker["mtime"] != self.current[relative]["mtime"]:
+                shutil.rmtree(dataset_dir, ignore_errors=True)
+
+        if self.changed:
+            self.farm = worker_farm.WorkerFarm(
+                "ingest", self.store, files=[self.current[r]["path"] for r in self.changed],
+                datasets=[self._dataset_dir(r) for r in self.changed], workers=self.workers,
+                chunk_size=1, shard_size=self.shard_size, point_count=self.point_count,
+                apply_modifiers=self.apply_modifiers, include_mesh=self.include_mesh,
+                blender=self.blender, retries=self.retries, timeout=self.timeout,
+                resume=False, log=self.log, merge=False)
+            self.farm.start()
+
+    def poll(self) -> bool:
+        """Advance the workers; True once every file is ingested and the store is updated"""
+        if self._finished:
+            return True
+        if self.farm is not None and not self.farm.poll():
+            return False
+        self._finalize()
+        self._finished = True
+        return True
+
+    def _finalize(self):
+        files = {}
+        dataset_dirs = []
+        for relative in sorted(self.current):
+            dataset_dir = self._dataset_dir(relative)
+            marker = worker_farm.read_source_marker(dataset_dir)
+            if marker is None:
+                continue
+            files[relative] = {"mtime": marker["mtime"], "size": marker["size"], "objects": marker["objects"],
+                               "dataset": os.path.relpath(dataset_dir, self.store).replace(os.sep, "/")}
+            dataset_dirs.append(dataset_dir)
+        write_ingest_manifest(self.store, self.source_dir, files)
+
+        info = {"ingest": {"source": self.source_dir, "files": len(files),
+                           "failed": sorted(set(self.current) - set(files))}}
+        self.merged = worker_farm.merge_manifests(self.store, dataset_dirs, info=info)
+        if self.merged is None:
+            # Nothing left to list; an old merged manifest would point at removed shards
+            manifest_path = os.path.join(self.store, dataset_shards.MANIFEST_NAME)
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+        self.log(f"[Ingest] Store has {self.merged['count'] if self.merged else 0} object(s) "
+                 f"from {len(files)} file(s)")
+
+    def progress(self) -> Dict:
+        if self.farm is None:
+            return {"items": 0, "done": 0, "running": 0, "queued": 0, "failed": 0}
+        return self.farm.progress()
+
+    def failed_files(self) -> List[str]:
+        return sorted(relative for relative in self.changed
+                      if worker_farm.read_source_marker(self._dataset_dir(relative)) is None)
+
+    def cancel(self):
+        """Stop the workers; finished files are kept and skipped by the next run"""
+        if self.farm is not None:
+            self.farm.cancel()
+        self._finalize()
+        self._finished = True
+
+    def run(self, interval: float = 1.0) -> Optional[Dict]:
+        """Ingest and wait, logging progress; returns the merged manifest"""
+        self.start()
+        last = None
+        try:
+            while not self.poll():
+                state = self.progress()
+                if state != last:
+                    self.log(f"[Ingest] {state['done']}/{state['items']} file(s), {state['running']} running, "
+                             f"{state['failed']} failed")
+                    last = state
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.cancel()
+            raise
+        return self.merged
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="library_ingest", description=__doc__.split("\n")[1])
+    parser.add_argument("source", help="directory of .blend files")
+    parser.add_argument("store", help="library store directory")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--shard-size", type=int, default=1024)
+    parser.add_argument("--point-count", type=int, default=0)
+    parser.add_argument("--no-mesh", action="store_true", help="store vectors only")
+    parser.add_argument("--no-modifiers", action="store_true", help="store base meshes instead of evaluated ones")
+    parser.add_argument("--no-recursive", action="store_true", help="only the top level of SOURCE")
+    parser.add_argument("--blender", default=None)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per file attempt")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    ingest = LibraryIngest(args.source, args.store, workers=args.workers, include_mesh=not args.no_mesh,
+                           apply_modifiers=not args.no_modifiers, point_count=args.point_count,
+                           shard_size=args.shard_size, recursive=not args.no_recursive,
+                           blender=args.blender, retries=args.retries, timeout=args.timeout)
+    ingest.run()
+    failed = ingest.failed_files()
+    for relative in failed:
+        print(f"[Ingest] Failed: {relative}", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""
+Procedural Mesh Builder
+Generates mesh geometry as NumPy vertex/loop buffers and writes it into
+Blender meshes in one bulk pass (foreach_set) instead of bpy.ops calls
+"""
+
+import numpy as np
+from typing import List, Optional
+
+
+# Unit cube (edge length 1, centred at origin). Corner index bits: x=1, y=2, z=4
+_CUBE_CORNERS = np.array([
+    [-0.5, -0.5, -0.5],
+    [0.5, -0.5, -0.5],
+    [-0.5, 0.5, -0.5],
+    [0.5, 0.5, -0.5],
+    [-0.5, -0.5, 0.5],
+    [0.5, -0.5, 0.5],
+    [-0.5, 0.5, 0.5],
+    [0.5, 0.5, 0.5],
+], dtype=np.float32)
+
+# Outward-facing quads of the unit cube
+_CUBE_QUADS = np.array([
+    [0, 2, 3, 1],  # -Z
+    [4, 5, 7, 6],  # +Z
+    [0, 1, 5, 4],  # -Y
+    [2, 6, 7, 3],  # +Y
+    [0, 4, 6, 2],  # -X
+    [1, 3, 7, 5],  # +X
+], dtype=np.int32)
+
+
+class MeshBuffers:
+    """
+    Flat mesh representation used by the procedural generators
+
+    vertices:     (V, 3) float32 positions
+    loops:        (L,) int32 vertex index per face corner
+    face_sizes:   (F,) int32 corner count per face
+    material_ids: (F,) int32 material slot per face (optional)
+    """
+
+    def __init__(self, vertices, loops, face_sizes, material_ids=None):
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+        self.loops = np.ascontiguousarray(loops, dtype=np.int32).ravel()
+        self.face_sizes = np.ascontiguousarray(face_sizes, dtype=np.int32).ravel()
+        if material_ids is not None:
+            material_ids = np.ascontiguousarray(material_ids, dtype=np.int32).ravel()
+        self.material_ids = material_ids
+
+    def __repr__(self):
+        return f"MeshBuffers(verts={self.vertex_count}, faces={self.face_count})"
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_sizes)
+
+    def loop_starts(self) -> np.ndarray:
+        """First loop index of every face"""
+        starts = np.zeros(len(self.face_sizes), dtype=np.int32)
+        if len(self.face_sizes) > 1:
+            np.cumsum(self.face_sizes[:-1], out=starts[1:])
+        return starts
+
+
+def concatenate(parts: List[MeshBuffers]) -> MeshBuffers:
+    """Merge several buffers into one, offsetting loop indices per part"""
+    if not parts:
+        return MeshBuffers(np.zeros((0, 3)), np.zeros(0), np.zeros(0))
+
+    vertex_counts = np.array([p.vertex_count for p in parts], dtype=np.int32)
+    offsets = np.zeros(len(parts), dtype=np.int32)
+    np.cumsum(vertex_counts[:-1], out=offsets[1:])
+    loop_counts = [len(p.loops) for p in parts]
+
+    vertices = np.concatenate([p.vertices for p in parts])
+    loops = np.concatenate([p.loops for p in parts]) + np.repeat(offsets, loop_counts)
+    face_sizes = np.concatenate([p.face_sizes for p in parts])
+
+    material_ids = None
+    if any(p.material_ids is not None for p in parts):
+        material_ids = np.concatenate([
+            p.material_ids if p.material_ids is not None
+            else np.zeros(p.face_count, dtype=np.int32)
+            for p in parts
+        ])
+
+    return MeshBuffers(vertices, loops, face_sizes, material_ids)
+
+
+def box_buffers(centers, sizes, angles_z=None) -> MeshBuffers:
+    """
+    Build N axis-aligned (optionally Z-rotated) boxes in one pass
+
+    Args:
+        centers: (N, 3) box centres
+        sizes: (N, 3) or (3,) full box extents
+        angles_z: optional (N,) rotation about Z in radians
+
+    Returns:
+        MeshBuffers with 8 vertices and 6 quads per box
+    """
+    centers = np.asarray(centers, dtype=np.float32).reshape(-1, 3)
+    count = len(centers)
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float32), (count, 3))
+
+    # (N, 8, 3) local corners scaled per box
+    corners = _CUBE_CORNERS[None, :, :] * sizes[:, None, :]
+
+    if angles_z is not None:
+        angles_z = np.asarray(angles_z, dtype=np.float32).reshape(count)
+        cos_a = np.cos(angles_z)[:, None]
+        sin_a = np.sin(angles_z)[:, None]
+        x = corners[:, :, 0].copy()
+        y = corners[:, :, 1]
+        corners[:, :, 0] = x * cos_a - y * sin_a
+        corners[:, :, 1] = x * sin_a + y * cos_a
+
+    vertices = (corners + centers[:, None, :]).reshape(-1, 3)
+    loops = (_CUBE_QUADS[None, :, :] + (np.arange(count, dtype=np.int32) * 8)[:, None, None]).ravel()
+    face_sizes = np.full(count * 6, 4, dtype=np.int32)
+
+    return MeshBuffers(vertices, loops, face_sizes)
+
+
+def tapered_box_buffers(size=(1.0, 1.0, 1.0), taper: float = 0.0,
+                        sweep: float = 0.0) -> MeshBuffers:
+    """
+    Build a single box centred at the origin
+
+    Args:
+        size: full extents (x, y, z)
+        taper: shrink factor of the +Z face in X/Y (0 = plain box)
+        sweep: sweep angle in radians; shears X back in proportion to |Y|
+    """
+    vertices = _CUBE_CORNERS * np.asarray(size, dtype=np.float32)
+    if taper != 0.0:
+        top = vertices[:, 2] > 0.0
+        vertices[top, :2] *= (1.0 - taper)
+    if sweep != 0.0:
+        vertices[:, 0] -= np.abs(vertices[:, 1]) * np.tan(sweep)
+
+    return MeshBuffers(vertices, _CUBE_QUADS.ravel(), np.full(6, 4, dtype=np.int32))
+
+
+def cylinder_buffers(radius: float, depth: float, segments: int = 32,
+                     center=(0.0, 0.0, 0.0), radius_top: Optional[float] = None) -> MeshBuffers:
+    """
+    Build a capped cylinder along Z (same layout as primitive_cylinder_add)
+
+    Args:
+        radius: radius of the bottom (-Z) ring
+        radius_top: radius of the top (+Z) ring; defaults to `radius`
+
+    Returns:
+        MeshBuffers with `segments` side quads and two n-gon caps
+    """
+    if radius_top is None:
+        radius_top = radius
+    angles = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False, dtype=np.float32)
+    ring = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+    vertices = np.empty((segments * 2, 3), dtype=np.float32)
+    vertices[0::2, :2] = ring * radius
+    vertices[0::2, 2] = -depth / 2.0
+    vertices[1::2, :2] = ring * radius_top
+    vertices[1::2, 2] = depth / 2.0
+    vertices += np.asarray(center, dtype=np.float32)
+
+    i = np.arange(segments, dtype=np.int32)
+    j = (i + 1) % segments
+    sides = np.stack([2 * i, 2 * j, 2 * j + 1, 2 * i + 1], axis=1).ravel()
+    top = 2 * i + 1
+    bottom = (2 * i)[::-1]
+
+    loops = np.concatenate([sides, top, bottom])
+    face_sizes = np.concatenate([
+        np.full(segments, 4, dtype=np.int32),
+        np.array([segments, segments], dtype=np.int32),
+    ])
+
+    return MeshBuffers(vertices, loops, face_sizes)
+
+
+def cone_buffers(radius: float, depth: float, segments: int = 32) -> MeshBuffers:
+    """Build a cone along Z with its base at -Z (same layout as primitive_cone_add)"""
+    angles = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False, dtype=np.float32)
+
+    vertices = np.empty((segments + 1, 3), dtype=np.float32)
+    vertices[:segments, 0] = radius * np.cos(angles)
+    vertices[:segments, 1] = radius * np.sin(angles)
+    vertices[:segments, 2] = -depth / 2.0
+    vertices[segments] = (0.0, 0.0, depth / 2.0)
+
+    i = np.arange(segments, dtype=np.int32)
+    sides = np.stack([i, (i + 1) % segments, np.full(segments, segments, dtype=np.int32)], axis=1).ravel()
+    base = i[::-1]
+
+    loops = np.concatenate([sides, base])
+    face_sizes = np.concatenate([np.full(segments, 3, dtype=np.int32), [segments]])
+    return MeshBuffers(vertices, loops, face_sizes)
+
+
+def uv_sphere_buffers(radius: float, segments: int = 32, rings: int = 16) -> MeshBuffers:
+    """Build a UV sphere (same layout as primitive_uv_sphere_add)"""
+    polar = np.linspace(0.0, np.pi, rings + 1, dtype=np.float32)[1:-1]
+    azimuth = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False, dtype=np.float32)
+
+    ring_z = radius * np.cos(polar)
+    ring_r = radius * np.sin(polar)
+    body = np.empty((rings - 1, segments, 3), dtype=np.float32)
+    body[:, :, 0] = ring_r[:, None] * np.cos(azimuth)[None, :]
+    body[:, :, 1] = ring_r[:, None] * np.sin(azimuth)[None, :]
+    body[:, :, 2] = ring_z[:, None]
+
+    top_index = 0
+    bottom_index = 1 + (rings - 1) * segments
+    vertices = np.concatenate([
+        [[0.0, 0.0, radius]],
+        body.reshape(-1, 3),
+        [[0.0, 0.0, -radius]],
+    ]).astype(np.float32)
+
+    j = np.arange(segments, dtype=np.int32)
+    j_next = (j + 1) % segments
+
+    top_fan = np.stack([np.full(segments, top_index, dtype=np.int32), 1 + j, 1 + j_next], axis=1)
+
+    k = np.arange(rings - 2, dtype=np.int32)[:, None]
+    upper = 1 + k * segments
+    lower = 1 + (k + 1) * segments
+    quads = np.stack([upper + j, lower + j, lower + j_next, upper + j_next], axis=2).reshape(-1, 4)
+
+    last = 1 + (rings - 2) * segments
+    bottom_fan = np.stack([np.full(segments, bottom_index, dtype=np.int32), last + j_next, last + j], axis=1)
+
+    loops = np.concatenate([top_fan.ravel(), quads.ravel(), bottom_fan.ravel()])
+    face_sizes = np.concatenate([
+        np.full(segments, 3, dtype=np.int32),
+        np.full(len(quads), 4, dtype=np.int32),
+        np.full(segments, 3, dtype=np.int32),
+    ])
+    return MeshBuffers(vertices, loops, face_sizes)
+
+
+def sweep_buffers(path, normals, binormals, profile, cap: bool = True) -> MeshBuffers:
+    """
+    Sweep a closed 2D profile along a path in one pass
+
+    Args:
+        path:      (N, 3) path points
+        normals:   (N, 3) unit vectors mapped to the profile's first axis
+        binormals: (N, 3) unit vectors mapped to the profile's second axis
+        profile:   (P, 2) closed cross-section, counter-clockwise
+        cap:       close both ends with n-gons
+
+    Returns:
+        MeshBuffers with (N - 1) * P side quads and optional end caps
+    """
+    path = np.asarray(path, dtype=np.float32)
+    profile = np.asarray(profile, dtype=np.float32)
+    rings, count = len(path), len(profile)
+
+    vertices = (path[:, None, :]
+                + profile[None, :, 0, None] * np.asarray(normals, dtype=np.float32)[:, None, :]
+                + profile[None, :, 1, None] * np.asarray(binormals, dtype=np.float32)[:, None, :])
+
+    k = np.arange(rings - 1, dtype=np.int32)[:, None] * count
+    i = np.arange(count, dtype=np.int32)
+    j = (i + 1) % count
+    sides = np.stack([k + i, k + j, k + count + j, k + count + i], axis=2).ravel()
+
+    loops = [sides]
+    face_sizes = [np.full((rings - 1) * count, 4, dtype=np.int32)]
+    if cap:
+        loops += [i[::-1], (rings - 1) * count + i]
+        face_sizes.append(np.array([count, count], dtype=np.int32))
+
+    return MeshBuffers(vertices.reshape(-1, 3), np.concatenate(loops), np.concatenate(face_sizes))
+
+
+def euler_matrix(rotation) -> np.ndarray:
+    """3x3 rotation matrix for a Blender XYZ Euler (radians)"""
+    rx, ry, rz = rotation
+    cx, sx = np.cos(rx), np.sin(rx)
+    cy, sy = np.cos(ry), np.sin(ry)
+    cz, sz = np.cos(rz), np.sin(rz)
+    rot_x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]], dtype=np.float32)
+    rot_y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]], dtype=np.float32)
+    rot_z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]], dtype=np.float32)
+    return rot_z @ rot_y @ rot_x
+
+
+def transform(buffers: MeshBuffers, location=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0),
+              scale=(1.0, 1.0, 1.0)) -> MeshBuffers:
+    """Apply scale, then XYZ Euler rotation, then translation (object transform order)"""
+    vertices = buffers.vertices * np.asarray(scale, dtype=np.float32)
+    if any(rotation):
+        vertices = vertices @ euler_matrix(rotation).T
+    vertices += np.asarray(location, dtype=np.float32)
+    return MeshBuffers(vertices, buffers.loops, buffers.face_sizes, buffers.material_ids)
+
+
+def mirror(buffers: MeshBuffers, axis: int = 0) -> MeshBuffers:
+    """Mirror buffers across a world axis plane, flipping face winding to keep normals outward"""
+    vertices = buffers.vertices.copy()
+    vertices[:, axis] *= -1.0
+
+    # Reverse the corner order of every face in one gather
+    starts = buffers.loop_starts()
+    face_of_loop = np.repeat(np.arange(buffers.face_count), buffers.face_sizes)
+    corner = np.arange(len(buffers.loops)) - starts[face_of_loop]
+    reversed_index = starts[face_of_loop] + buffers.face_sizes[face_of_loop] - 1 - corner
+
+    return MeshBuffers(vertices, buffers.loops[reversed_index], buffers.face_sizes, buffers.material_ids)
+
+
+def write_mesh(mesh, buffers: MeshBuffers):
+    """
+    Replace the geometry of a Blender mesh with the given buffers
+
+    All element data is written with foreach_set, so cost is a handful of
+    C-level copies regardless of element count.
+    """
+    mesh.clear_geometry()
+
+    mesh.vertices.add(buffers.vertex_count)
+    mesh.vertices.foreach_set("co", buffers.vertices.ravel())
+
+    mesh.loops.add(len(buffers.loops))
+    mesh.loops.foreach_set("vertex_index", buffers.loops)
+
+    mesh.polygons.add(buffers.face_count)
+    mesh.polygons.foreach_set("loop_start", buffers.loop_starts())
+    try:
+        mesh.polygons.foreach_set("loop_total", buffers.face_sizes)
+    except (AttributeError, TypeError, RuntimeError):
+        # Read-only (derived from loop_start) in Blender 4.0+
+        pass
+
+    if buffers.material_ids is not None:
+        mesh.polygons.foreach_set("material_index", buffers.material_ids)
+
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def read_mesh(mesh) -> MeshBuffers:
+    """Read a Blender mesh (e.g. an evaluated to_mesh() result) into buffers with foreach_get"""
+    vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    face_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", face_sizes)
+    material_ids = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_ids)
+    return MeshBuffers(vertices, loops, face_sizes, material_ids)
+
+
+def write_point_attribute(mesh, name: str, data_type: str, values: np.ndarray):
+    """Create (or replace) a per-vertex attribute and fill it in bulk"""
+    existing = mesh.attributes.get(name)
+    if existing is not None:
+        mesh.attributes.remove(existing)
+    attr = mesh.attributes.new(name, data_type, 'POINT')
+    field = "vector" if data_type == 'FLOAT_VECTOR' else "value"
+    attr.data.foreach_set(field, np.ascontiguousarray(values).ravel())
+    return attr
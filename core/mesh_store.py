@@ -0,0 +1,198 @@
+"""
+Mesh Store
+Content-addressed directory of meshes in a compact binary format (.gmesh),
+used to keep source meshes out of bpy.data and out of saved .blend
+files. A mesh is stored under the SHA-1 of its buffers, active UVs and
+material slot names; loading recomputes that hash, so a truncated or
+corrupted file is rejected instead of decoded into garbage. Loads touch
+the file's mtime and gc() removes files that are neither kept nor used
+recently. Nothing here touches bpy.
+
+File layout (little endian):
+    header   magic "GMSH", version, vertex, loop and face counts, flags,
+             byte length of the material name list
+    arrays   vertices (V, 3) float32, loops (L,) int32, face sizes (F,) int32,
+             material ids (F,) int32 if flagged, UVs (L, 2) float32 if flagged
+    names    material slot names as a UTF-8 JSON list
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .mesh_builder import MeshBuffers
+
+EXTENSION = ".gmesh"
+MAGIC = b"GMSH"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sIIIIII")
+_FLAG_MATERIAL_IDS = 1
+_FLAG_UVS = 2
+
+# Temp files older than this are leftovers of interrupted writes
+_STALE_TMP_SECONDS = 3600.0
+
+
+def buffers_hash(buffers: MeshBuffers, uvs: Optional[np.ndarray] = None,
+                 material_names: Sequence[str] = ()) -> str:
+    """SHA-1 hex digest identifying a mesh's geometry, UVs and material slots"""
+    digest = hashlib.sha1()
+    for array in (buffers.vertices, buffers.loops, buffers.face_sizes, buffers.material_ids, uvs):
+        if array is not None:
+            digest.update(np.ascontiguousarray(array).tobytes())
+    digest.update("|".join(material_names).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def encode(buffers: MeshBuffers, uvs: Optional[np.ndarray] = None, material_names: Sequence[str] = ()) -> bytes:
+    flags = (_FLAG_MATERIAL_IDS if buffers.material_ids is not None else 0) | (_FLAG_UVS if uvs is not None else 0)
+    names = json.dumps(list(material_names)).encode("utf-8")
+    parts = [_HEADER.pack(MAGIC, VERSION, buffers.vertex_count, len(buffers.loops), buffers.face_count,
+                          flags, len(names)),
+             buffers.vertices.tobytes(), buffers.loops.tobytes(), buffers.face_sizes.tobytes()]
+    if buffers.material_ids is not None:
+        parts.append(buffers.material_ids.tobytes())
+    if uvs is not None:
+        parts.append(np.ascontiguousarray(uvs, dtype=np.float32).tobytes())
+    parts.append(names)
+    return b"".join(parts)
+
+
+def decode(data: bytes) -> Tuple[MeshBuffers, Optional[np.ndarray], List[str]]:
+    """Inverse of encode(); raises ValueError on malformed data"""
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated mesh file")
+    magic, version, vertex_count, loop_count, face_count, flags, names_size = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a version %d mesh file" % VERSION)
+
+    offset = _HEADER.size
+
+    def take(dtype, count):
+        nonlocal offset
+        size = np.dtype(dtype).itemsize * count
+        if offset + size > len(data):
+            raise ValueError("truncated mesh file")
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        offset += size
+        return array
+
+    vertices = take(np.float32, vertex_count * 3).reshape(-1, 3)
+    loops = take(np.int32, loop_count)
+    face_sizes = take(np.int32, face_count)
+    material_ids = take(np.int32, face_count) if flags & _FLAG_MATERIAL_IDS else None
+    uvs = take(np.float32, loop_count * 2).reshape(-1, 2) if flags & _FLAG_UVS else None
+    if offset + names_size != len(data):
+        raise ValueError("truncated mesh file")
+    names = json.loads(data[offset:].decode("utf-8"))
+    return MeshBuffers(vertices, loops, face_sizes, material_ids), uvs, names
+
+
+class MeshStore:
+    """A directory of .gmesh files keyed by buffers_hash()"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + EXTENSION)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def save(self, buffers: MeshBuffers, uvs: Optional[np.ndarray] = None,
+             material_names: Sequence[str] = ()) -> str:
+        """Store a mesh (no-op if already present); returns its key"""
+        key = buffers_hash(buffers, uvs, material_names)
+        path = self.path(key)
+        if os.path.exists(path):
+            os.utime(path)
+            return key
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(encode(buffers, uvs, material_names))
+        os.replace(tmp_path, path)
+        return key
+
+    def load(self, key: str) -> Tuple[MeshBuffers, Optional[np.ndarray], List[str]]:
+        """
+        Read a stored mesh and verify it against its key
+
+        Raises:
+            OSError if the file is missing, ValueError if it is damaged
+            (the damaged file is removed)
+        """
+        path = self.path(key)
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            buffers, uvs, names = decode(data)
+            if buffers_hash(buffers, uvs, names) != key:
+                raise ValueError("content hash mismatch")
+        except ValueError as e:
+            os.remove(path)
+            raise ValueError(f"{os.path.basename(path)}: {e}") from None
+        os.utime(path)
+        return buffers, uvs, names
+
+    def keys(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [name[:-len(EXTENSION)] for name in names if name.endswith(EXTENSION)]
+
+    def stats(self) -> dict:
+        sizes = []
+        for key in self.keys():
+            try:
+                sizes.append(os.path.getsize(self.path(key)))
+            except OSError:
+                pass
+        return {"entries": len(sizes), "bytes": sum(sizes)}
+
+    def gc(self, keep: Iterable[str], max_age: float) -> Tuple[int, int]:
+        """
+        Delete files not in `keep` that were last written or loaded over `max_age` seconds ago
+
+        Age protects meshes that other .blend files still refer to, as long
+        as they are opened now and then.
+
+        Returns:
+            (files removed, bytes freed)
+        """
+        keep = set(keep)
+        now = time.time()
+        removed = 0
+        freed = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0, 0
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if name.endswith(EXTENSION):
+                if name[:-len(EXTENSION)] in keep:
+                    continue
+                limit = max_age
+            elif name.endswith(".tmp"):
+                limit = _STALE_TMP_SECONDS
+            else:
+                continue
+            try:
+                stat = os.stat(path)
+                if now - stat.st_mtime < limit:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            removed += 1
+            freed += stat.st_size
+        return removed, freed
@@ -0,0 +1,439 @@
+"""
+Procedural Generators
+Preset geometry (aircraft, character, staircase, helix) described as lists of
+parametric parts and assembled into a single mesh buffer with NumPy.
+Nothing here touches bpy, so generators can run headlessly.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from . import mesh_builder
+from .mesh_builder import MeshBuffers
+
+
+class Part:
+    """
+    One primitive of a generated assembly
+
+    primitive is one of 'BOX', 'CYLINDER', 'CONE', 'UV_SPHERE'; params are
+    passed to the matching mesh_builder function. Parts with a mirror_axis
+    are emitted twice: as given and mirrored across that axis.
+    """
+
+    def __init__(self, name: str, primitive: str, location=(0.0, 0.0, 0.0),
+                 rotation=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0),
+                 material: str = "Body", mirror_axis: Optional[int] = None, **params):
+        self.name = name
+        self.primitive = primitive
+        self.location = location
+        self.rotation = rotation
+        self.scale = scale
+        self.material = material
+        self.mirror_axis = mirror_axis
+        self.params = params
+
+    def __repr__(self):
+        return f"Part({self.name}, {self.primitive})"
+
+    def build(self) -> MeshBuffers:
+        """Generate this part's local geometry and place it in world space"""
+        if self.primitive == 'BOX':
+            local = mesh_builder.tapered_box_buffers(**self.params)
+        elif self.primitive == 'CYLINDER':
+            local = mesh_builder.cylinder_buffers(**self.params)
+        elif self.primitive == 'CONE':
+            local = mesh_builder.cone_buffers(**self.params)
+        elif self.primitive == 'UV_SPHERE':
+            local = mesh_builder.uv_sphere_buffers(**self.params)
+        else:
+            raise ValueError(f"Unknown primitive: {self.primitive}")
+
+        return mesh_builder.transform(local, self.location, self.rotation, self.scale)
+
+
+def assemble(parts: List[Part]) -> Tuple[MeshBuffers, List[str]]:
+    """
+    Build all parts and concatenate them into one mesh buffer
+
+    Mirrored parts are generated once and reflected. Each face carries the
+    index of its part's material name in the returned list.
+
+    Returns:
+        (MeshBuffers with material_ids, material names in slot order)
+    """
+    material_names: List[str] = []
+    built = []
+
+    for part in parts:
+        if part.material not in material_names:
+            material_names.append(part.material)
+        slot = material_names.index(part.material)
+
+        buffers = part.build()
+        if part.mirror_axis is not None:
+            buffers = mesh_builder.concatenate([buffers, mesh_builder.mirror(buffers, part.mirror_axis)])
+
+        buffers.material_ids = np.full(buffers.face_count, slot, dtype=np.int32)
+        built.append(buffers)
+
+    return mesh_builder.concatenate(built), material_names
+
+
+def _taper_radii(radius: float, depth: float, factor: float) -> Dict[str, float]:
+    """Bottom/top radii matching a SIMPLE_DEFORM taper along Z on a cylinder"""
+    return {
+        "radius": radius * (1.0 - factor * depth / 2.0),
+        "radius_top": radius * (1.0 + factor * depth / 2.0),
+    }
+
+
+# ============================================================================
+# Aircraft
+# ============================================================================
+
+def aircraft_parts(aircraft_type: str, fuselage_len: float, wing_span: float,
+                   wing_sweep: float, tail_size: float, engine_count: int) -> List[Part]:
+    """Describe an aircraft preset as a list of parts"""
+    along_x = (0.0, math.pi / 2, 0.0)
+    parts = []
+
+    if aircraft_type == 'FIGHTER_JET':
+        # Streamlined fuselage, tapered towards the nose
+        parts.append(Part("Fuselage", 'CYLINDER', rotation=along_x, scale=(1.0, 1.0, 1.2),
+                          radius=0.8, radius_top=0.8 * 0.4, depth=fuselage_len))
+
+        # Delta wings with sweep
+        wing_chord = fuselage_len * 0.4
+        parts.append(Part("Wings", 'BOX', location=(0, 0, -0.3), material="Wings",
+                          size=(wing_chord, wing_span / 2, 0.1), sweep=wing_sweep))
+
+        # Tail stabilizers
+        parts.append(Part("VTail", 'BOX', location=(-fuselage_len * 0.45, 0, tail_size * 0.3),
+                          material="Wings", size=(tail_size * 0.5, 0.1, tail_size)))
+        parts.append(Part("HTail", 'BOX', location=(-fuselage_len * 0.45, 0, 0.2),
+                          material="Wings", size=(tail_size * 0.6, tail_size * 1.5, 0.1)))
+
+        # Engines side by side under the fuselage
+        for i in range(engine_count // 2):
+            offset_y = (i - (engine_count - 1) / 2) * 2.0
+            parts.append(Part(f"Engine_{i+1}", 'CYLINDER', location=(-fuselage_len * 0.15, offset_y, -0.5),
+                              rotation=along_x, material="Engines", mirror_axis=1,
+                              radius=0.4, depth=fuselage_len * 0.3))
+        if engine_count % 2:
+            parts.append(Part("Engine_Center", 'CYLINDER', location=(-fuselage_len * 0.15, 0, -0.5),
+                              rotation=along_x, material="Engines",
+                              radius=0.4, depth=fuselage_len * 0.3))
+
+        # Nose cone
+        parts.append(Part("Nose", 'CONE', location=(fuselage_len * 0.55, 0, 0),
+                          rotation=(0, -math.pi / 2, 0), radius=0.8, depth=fuselage_len * 0.15))
+
+    elif aircraft_type == 'BOMBER':
+        # Large cylindrical fuselage
+        parts.append(Part("Fuselage", 'CYLINDER', rotation=along_x,
+                          radius=1.5, depth=fuselage_len))
+
+        # Large straight wings
+        parts.append(Part("Wings", 'BOX', location=(0, 0, -0.5), material="Wings",
+                          size=(fuselage_len * 0.25, wing_span / 2, 0.15)))
+
+        # Tail
+        parts.append(Part("VTail", 'BOX', location=(-fuselage_len * 0.45, 0, tail_size * 0.5),
+                          material="Wings", size=(tail_size * 0.6, 0.15, tail_size)))
+        parts.append(Part("HTail", 'BOX', location=(-fuselage_len * 0.45, 0, 0.5),
+                          material="Wings", size=(tail_size * 0.8, tail_size * 2.0, 0.15)))
+
+        # Engines evenly spaced under the wings
+        spacing = wing_span / (engine_count + 1)
+        for i in range(engine_count // 2):
+            wing_pos = -wing_span / 2 + (i + 1) * spacing
+            parts.append(Part(f"Engine_{i+1}", 'CYLINDER', location=(fuselage_len * 0.1, wing_pos, -1.2),
+                              rotation=along_x, material="Engines", mirror_axis=1,
+                              radius=0.6, depth=fuselage_len * 0.25))
+        if engine_count % 2:
+            parts.append(Part("Engine_Center", 'CYLINDER', location=(fuselage_len * 0.1, 0, -1.2),
+                              rotation=along_x, material="Engines",
+                              radius=0.6, depth=fuselage_len * 0.25))
+
+    elif aircraft_type == 'HELICOPTER':
+        # Rounded body
+        parts.append(Part("Fuselage", 'UV_SPHERE', scale=(fuselage_len * 0.08, 1.0, 0.8), radius=1.2))
+
+        # Tail boom
+        parts.append(Part("TailBoom", 'CYLINDER', location=(-tail_size / 2 - fuselage_len * 0.04, 0, 0.5),
+                          rotation=along_x, radius=0.3, depth=tail_size))
+
+        # Main rotor disk and four blades
+        parts.append(Part("MainRotor", 'CYLINDER', location=(0, 0, 2.0), material="Rotors",
+                          radius=wing_span / 2, depth=0.05))
+        blade_reach = wing_span / 2 - 0.5
+        for i in range(4):
+            angle = i * math.pi / 2
+            parts.append(Part(f"Blade_{i+1}", 'BOX',
+                              location=(blade_reach * math.cos(angle), blade_reach * math.sin(angle), 2.05),
+                              rotation=(0, 0, angle), material="Rotors",
+                              size=(wing_span / 2 - 1, 0.2, 0.02)))
+
+        # Tail rotor
+        parts.append(Part("TailRotor", 'CYLINDER', location=(-tail_size - fuselage_len * 0.04, 0, 1.2),
+                          rotation=(math.pi / 2, 0, 0), material="Rotors",
+                          radius=tail_size * 0.2, depth=0.05))
+
+        # Landing skids (one side, mirrored)
+        parts.append(Part("Skid", 'CYLINDER', location=(0, 1.5, -1.0), rotation=along_x,
+                          material="Skids", mirror_axis=1, radius=0.1, depth=fuselage_len * 0.06))
+
+    return parts
+
+
+def build_aircraft(aircraft_type: str, fuselage_len: float = 10.0, wing_span: float = 12.0,
+                   wing_sweep: float = 0.0, tail_size: float = 3.0,
+                   engine_count: int = 2) -> Tuple[MeshBuffers, List[str]]:
+    """Generate an aircraft preset as one mesh buffer"""
+    return assemble(aircraft_parts(aircraft_type, fuselage_len, wing_span,
+                                   wing_sweep, tail_size, engine_count))
+
+
+# ============================================================================
+# Character
+# ============================================================================
+
+# Scale factors based on age
+AGE_SCALE = {
+    'CHILD': 0.6,
+    'TEEN': 0.85,
+    'ADULT': 1.0,
+    'ELDER': 0.95
+}
+
+
+def character_parts(gender: str, age: str, height: float, build: float) -> List[Part]:
+    """Describe a basic character as a list of parts (left/right limbs are mirrored)"""
+    adjusted_height = height * AGE_SCALE[age]
+
+    # Body proportions (based on adult proportions)
+    head_size = adjusted_height * 0.12
+    torso_height = adjusted_height * 0.35
+    torso_width = head_size * 1.2 * build
+    torso_depth = head_size * 0.8 * build
+    leg_length = adjusted_height * 0.45
+    leg_thickness = head_size * 0.35 * build
+    arm_length = adjusted_height * 0.35
+    arm_thickness = head_size * 0.25 * build
+
+    # Gender-specific adjustments
+    if gender == 'FEMALE':
+        torso_width *= 0.85
+        shoulder_width = torso_width * 1.3
+        hip_width = torso_width * 1.2
+        leg_thickness *= 0.9
+        arm_thickness *= 0.85
+    else:
+        shoulder_width = torso_width * 1.5
+        hip_width = torso_width * 0.95
+
+    # Age-specific adjustments
+    if age == 'CHILD':
+        head_size *= 1.3  # Children have proportionally larger heads
+        leg_thickness *= 1.1
+        arm_thickness *= 1.1
+    elif age == 'ELDER':
+        torso_height *= 0.95  # Slightly shorter torso
+        shoulder_width *= 0.9
+
+    parts = []
+
+    # Head and neck
+    parts.append(Part("Head", 'UV_SPHERE', location=(0, 0, adjusted_height - head_size / 2),
+                      scale=(1.0, 0.9, 1.1), material="Skin", radius=head_size / 2))
+    neck_height = adjusted_height * 0.05
+    parts.append(Part("Neck", 'CYLINDER', location=(0, 0, adjusted_height - head_size - neck_height / 2),
+                      material="Skin", radius=head_size * 0.25, depth=neck_height))
+
+    # Torso: chest narrows into the abdomen
+    chest_z = adjusted_height - head_size - neck_height - torso_height * 0.3
+    parts.append(Part("Chest", 'BOX', location=(0, 0, chest_z), material="Torso",
+                      size=(shoulder_width / 2, torso_depth / 2, torso_height * 0.3)))
+    abdomen_z = chest_z - torso_height * 0.35
+    parts.append(Part("Abdomen", 'BOX', location=(0, 0, abdomen_z), material="Torso",
+                      size=((shoulder_width + hip_width) / 4, torso_depth / 2, torso_height * 0.35)))
+
+    # Legs (right side, mirrored across X)
+    leg_z = abdomen_z - torso_height * 0.35 - leg_length / 2
+    leg_x = hip_width * 0.4
+    thigh_depth = leg_length * 0.55
+    parts.append(Part("Thigh", 'CYLINDER', location=(leg_x, 0, leg_z + leg_length * 0.225),
+                      material="Limbs", mirror_axis=0, depth=thigh_depth,
+                      **_taper_radii(leg_thickness, thigh_depth, -0.3)))
+    calf_depth = leg_length * 0.45
+    parts.append(Part("Calf", 'CYLINDER', location=(leg_x, 0, leg_z - leg_length * 0.275),
+                      material="Limbs", mirror_axis=0, depth=calf_depth,
+                      **_taper_radii(leg_thickness * 0.7, calf_depth, -0.2)))
+    foot_z = leg_z - leg_length / 2 - head_size * 0.15
+    parts.append(Part("Foot", 'BOX', location=(leg_x, head_size * 0.15, foot_z),
+                      material="Feet", mirror_axis=0,
+                      size=(leg_thickness * 0.8, head_size * 0.4, head_size * 0.2)))
+
+    # Arms (right side, mirrored across X)
+    arm_z = chest_z
+    arm_x = shoulder_width * 0.6
+    segment_depth = arm_length * 0.5
+    parts.append(Part("UpperArm", 'CYLINDER', location=(arm_x, 0, arm_z - arm_length * 0.25),
+                      material="Limbs", mirror_axis=0, depth=segment_depth,
+                      **_taper_radii(arm_thickness, segment_depth, -0.25)))
+    parts.append(Part("Forearm", 'CYLINDER', location=(arm_x, 0, arm_z - arm_length * 0.75),
+                      material="Limbs", mirror_axis=0, depth=segment_depth,
+                      **_taper_radii(arm_thickness * 0.8, segment_depth, -0.2)))
+    parts.append(Part("Hand", 'BOX', location=(arm_x, 0, arm_z - arm_length - head_size * 0.1),
+                      material="Skin", mirror_axis=0,
+                      size=(arm_thickness * 0.6, arm_thickness * 0.8, head_size * 0.15)))
+
+    return parts
+
+
+def build_character(gender: str = 'MALE', age: str = 'ADULT', height: float = 1.75,
+                    build: float = 1.0) -> Tuple[MeshBuffers, List[str]]:
+    """Generate a character preset as one mesh buffer"""
+    return assemble(character_parts(gender, age, height, build))
+
+
+# ============================================================================
+# Staircase
+# ============================================================================
+
+def staircase_layout(steps: int, step_width: float, step_height: float, step_depth: float,
+                     stair_type: str):
+    """
+    Compute step boxes for a staircase in world space
+
+    Returns:
+        (centers (N,3), sizes (N,3), angles_z (N,), extra MeshBuffers parts)
+    """
+    i = np.arange(steps, dtype=np.float32)
+    centers = np.zeros((steps, 3), dtype=np.float32)
+    sizes = np.empty((steps, 3), dtype=np.float32)
+    sizes[:] = (step_width / 2, step_depth / 2, step_height / 2)
+    angles = np.zeros(steps, dtype=np.float32)
+    extra_parts = []
+
+    if stair_type == 'STRAIGHT':
+        centers[:, 1] = i * step_depth
+        centers[:, 2] = i * step_height
+
+    elif stair_type == 'SPIRAL':
+        center_radius = step_width * 0.5
+        angle_per_step = (2 * math.pi) / (steps * 0.5)  # Half rotation per full height
+        angles = i * angle_per_step
+        centers[:, 0] = center_radius * np.cos(angles)
+        centers[:, 1] = center_radius * np.sin(angles)
+        centers[:, 2] = i * step_height
+
+        # Center column
+        extra_parts.append(mesh_builder.cylinder_buffers(
+            radius=center_radius * 0.3,
+            depth=steps * step_height,
+            center=(0, 0, steps * step_height / 2)
+        ))
+
+    elif stair_type == 'L_SHAPED':
+        half_steps = steps // 2
+        remaining_steps = steps - half_steps
+        landing_z = half_steps * step_height
+        landing_y = (half_steps - 1) * step_depth + step_width / 2
+
+        # First flight (going forward)
+        centers[:half_steps, 1] = i[:half_steps] * step_depth
+        centers[:half_steps, 2] = i[:half_steps] * step_height
+
+        # Second flight (going right)
+        j = np.arange(remaining_steps, dtype=np.float32)
+        centers[half_steps:, 0] = step_width + j * step_depth
+        centers[half_steps:, 1] = landing_y
+        centers[half_steps:, 2] = landing_z + (j + 1) * step_height
+        sizes[half_steps:] = (step_depth / 2, step_width / 2, step_height / 2)
+
+        # Landing is one more box between the flights
+        centers = np.insert(centers, half_steps, (step_width / 2, landing_y, landing_z), axis=0)
+        sizes = np.insert(sizes, half_steps, (step_width, step_width, step_height / 2), axis=0)
+        angles = np.zeros(len(centers), dtype=np.float32)
+
+    return centers, sizes, angles, extra_parts
+
+
+def build_staircase(steps: int = 10, step_width: float = 2.0, step_height: float = 0.2,
+                    step_depth: float = 0.3, stair_type: str = 'STRAIGHT') -> MeshBuffers:
+    """Generate a staircase as one mesh buffer"""
+    centers, sizes, angles, extra_parts = staircase_layout(
+        steps, step_width, step_height, step_depth, stair_type
+    )
+    return mesh_builder.concatenate([mesh_builder.box_buffers(centers, sizes, angles)] + extra_parts)
+
+
+# ============================================================================
+# Helix
+# ============================================================================
+
+HELIX_MIN_SEGMENTS = 8
+HELIX_MAX_SEGMENTS = 128
+
+
+def helix_segments_per_turn(radius: float, tolerance: float = 0.01) -> int:
+    """
+    Segments per turn needed to keep the chord error of a circle of `radius`
+    below `tolerance`, clamped to a sensible range
+    """
+    if radius <= tolerance:
+        return HELIX_MIN_SEGMENTS
+    segments = math.ceil(math.pi / math.acos(1.0 - tolerance / radius))
+    return int(min(max(segments, HELIX_MIN_SEGMENTS), HELIX_MAX_SEGMENTS))
+
+
+def helix_path(turns: float, radius: float, height: float, segments_per_turn: int):
+    """
+    Sample an analytic helix centred on the origin along Z
+
+    Returns:
+        (points (N,3), normals (N,3), binormals (N,3)); normals point away
+        from the axis, binormals complete the frame with the tangent
+    """
+    samples = max(int(math.ceil(turns * segments_per_turn)), 1) + 1
+    t = np.linspace(0.0, 1.0, samples, dtype=np.float32)
+    angle = t * turns * 2.0 * math.pi
+    cos_a, sin_a = np.cos(angle), np.sin(angle)
+
+    points = np.stack([radius * cos_a, radius * sin_a, t * height - height / 2.0], axis=1)
+
+    # Tangent of (r cos a, r sin a, c a) is (-r sin a, r cos a, c)
+    rise = height / (turns * 2.0 * math.pi) if turns > 0 else 0.0
+    tangents = np.stack([-radius * sin_a, radius * cos_a, np.full_like(t, rise)], axis=1)
+    tangents /= np.linalg.norm(tangents, axis=1, keepdims=True)
+
+    normals = np.stack([cos_a, sin_a, np.zeros_like(t)], axis=1)
+    binormals = np.cross(tangents, normals)
+    return points, normals, binormals
+
+
+def helix_profile(width: float, depth: float, round_profile: bool, segments: int = 16) -> np.ndarray:
+    """Closed cross-section for the helix sweep: an ellipse or a rectangle"""
+    if round_profile:
+        angles = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False, dtype=np.float32)
+        return np.stack([width / 2.0 * np.cos(angles), depth / 2.0 * np.sin(angles)], axis=1)
+    hw, hd = width / 2.0, depth / 2.0
+    return np.array([(-hw, -hd), (hw, -hd), (hw, hd), (-hw, hd)], dtype=np.float32)
+
+
+def build_helix(turns: float = 3.0, radius: float = 2.0, height: float = 10.0,
+                width: float = 1.0, depth: float = 1.0, round_profile: bool = False,
+                segments_per_turn: int = 0) -> MeshBuffers:
+    """
+    Sweep a cross-section along a helix and return the final mesh
+
+    segments_per_turn <= 0 picks a count from the helix radius.
+    """
+    if segments_per_turn <= 0:
+        segments_per_turn = helix_segments_per_turn(radius)
+    points, normals, binormals = helix_path(turns, radius, height, segments_per_turn)
+    profile = helix_profile(width, depth, round_profile)
+    return mesh_builder.sweep_buffers(points, normals, binormals, profile)
@@ -0,0 +1,356 @@
+"""
+Geometry vector core
+The 32-dimensional GeometryVector, the built-in preset table, batch
+decoding of vectors into modifier / transform tracks and the latent space.
+Pure NumPy: importable without Blender.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Tuple, Optional
+
+
+class GeometryVector:
+    """
+    Unified vector representation for all geometric objects
+    Maps any mesh to a standardized N-dimensional parameter space
+    """
+    
+    # Define the unified parameter space dimensions
+    VECTOR_DIM = 32  # Total dimensionality of latent space
+    
+    # Parameter indices in the vector
+    IDX_SHAPE_TYPE = 0          # 0-1: Shape type (continuous encoding)
+    IDX_COMPLEXITY = 1          # Geometric complexity measure
+    IDX_SCALE_X = 2             # Global scale
+    IDX_SCALE_Y = 3
+    IDX_SCALE_Z = 4
+    IDX_SYMMETRY = 5            # Symmetry measure
+    IDX_CURVATURE = 6           # Overall curvature
+    IDX_TOPOLOGY_GENUS = 7      # Topological genus (holes)
+    IDX_ASPECT_RATIO_XY = 8     # Shape ratios
+    IDX_ASPECT_RATIO_XZ = 9
+    IDX_ASPECT_RATIO_YZ = 10
+    IDX_ELONGATION = 11         # Elongation factor
+    IDX_TWIST = 12              # Twist amount
+    IDX_TAPER = 13              # Taper factor
+    IDX_BEND = 14               # Bending
+    IDX_WAVE_FREQ = 15          # Wave parameters
+    IDX_WAVE_AMP = 16
+    IDX_NOISE_SCALE = 17        # Noise parameters
+    IDX_NOISE_STRENGTH = 18
+    IDX_SPHERICITY = 19         # Shape morphing
+    IDX_CUBICITY = 20
+    IDX_CYLINDRICITY = 21
+    IDX_ROT_X = 22              # Rotation angles (radians)
+    IDX_ROT_Y = 23
+    IDX_ROT_Z = 24
+    IDX_LOC_X = 25              # Location (position)
+    IDX_LOC_Y = 26
+    IDX_LOC_Z = 27
+    # Universal appearance parameters (topology-agnostic)
+    IDX_SMOOTHNESS = 28         # Surface smoothness (0-1)
+    IDX_EDGE_SHARPNESS = 29     # Edge sharpness (0-1)
+    IDX_INFLATION = 30          # Inflate/deflate (-1 to 1)
+    IDX_RANDOMNESS = 31         # Random displacement (0-1)
+    
+    def __init__(self, vector: Optional[np.ndarray] = None):
+        """Initialize with vector or create zero vector"""
+        if vector is not None:
+            self.vector = np.array(vector, dtype=np.float32)
+        else:
+            self.vector = np.zeros(self.VECTOR_DIM, dtype=np.float32)
+    
+    def __repr__(self):
+        return f"GeometryVector(dim={self.VECTOR_DIM}, norm={np.linalg.norm(self.vector):.3f})"
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convert vector to named parameters"""
+        return {
+            'shape_type': float(self.vector[self.IDX_SHAPE_TYPE]),
+            'complexity': float(self.vector[self.IDX_COMPLEXITY]),
+            'scale': [float(self.vector[i]) for i in [self.IDX_SCALE_X, self.IDX_SCALE_Y, self.IDX_SCALE_Z]],
+            'symmetry': float(self.vector[self.IDX_SYMMETRY]),
+            'curvature': float(self.vector[self.IDX_CURVATURE]),
+            'topology_genus': float(self.vector[self.IDX_TOPOLOGY_GENUS]),
+            'aspect_ratios': [float(self.vector[i]) for i in [self.IDX_ASPECT_RATIO_XY, self.IDX_ASPECT_RATIO_XZ, self.IDX_ASPECT_RATIO_YZ]],
+            'deformations': {
+                'elongation': float(self.vector[self.IDX_ELONGATION]),
+                'twist': float(self.vector[self.IDX_TWIST]),
+                'taper': float(self.vector[self.IDX_TAPER]),
+                'bend': float(self.vector[self.IDX_BEND]),
+            },
+            'wave': {
+                'frequency': float(self.vector[self.IDX_WAVE_FREQ]),
+                'amplitude': float(self.vector[self.IDX_WAVE_AMP]),
+            },
+            'noise': {
+                'scale': float(self.vector[self.IDX_NOISE_SCALE]),
+                'strength': float(self.vector[self.IDX_NOISE_STRENGTH]),
+            },
+            'shape_morphing': {
+                'sphericity': float(self.vector[self.IDX_SPHERICITY]),
+                'cubicity': float(self.vector[self.IDX_CUBICITY]),
+                'cylindricity': float(self.vector[self.IDX_CYLINDRICITY]),
+            }
+        }
+    
+    def distance_to(self, other: 'GeometryVector') -> float:
+        """Calculate Euclidean distance to another geometry vector"""
+        return float(np.linalg.norm(self.vector - other.vector))
+    
+    def interpolate(self, other: 'GeometryVector', t: float) -> 'GeometryVector':
+        """Linear interpolation between two geometry vectors"""
+        t = np.clip(t, 0.0, 1.0)
+        new_vector = (1 - t) * self.vector + t * other.vector
+        return GeometryVector(new_vector)
+    
+    def add(self, other: 'GeometryVector', weight: float = 1.0) -> 'GeometryVector':
+        """Vector addition in latent space"""
+        new_vector = self.vector + weight * other.vector
+        return GeometryVector(new_vector)
+    
+    def normalize(self) -> 'GeometryVector':
+        """Normalize the vector"""
+        norm = np.linalg.norm(self.vector)
+        if norm > 1e-6:
+            return GeometryVector(self.vector / norm)
+        return GeometryVector(self.vector)
+
+
+def preset_vector(preset_name: str) -> GeometryVector:
+    """Vector of a built-in preset (a pure table: no scene or Blender data involved)"""
+    vec = GeometryVector()
+    
+    if preset_name == 'NONE':
+        # Default cube
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.0
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.1
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [1.0, 1.0, 1.0]
+        vec.vector[GeometryVector.IDX_CUBICITY] = 1.0
+    
+    elif preset_name == 'SPIRAL_CORRIDOR':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.15
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.7
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.5, 0.5, 20.0]
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.8
+        vec.vector[GeometryVector.IDX_TWIST] = 3.14
+        vec.vector[GeometryVector.IDX_SPHERICITY] = 0.3
+        vec.vector[GeometryVector.IDX_TOPOLOGY_GENUS] = 0.5
+    
+    elif preset_name == 'DNA_HELIX':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.2
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.8
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.2, 0.2, 15.0]
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.9
+        vec.vector[GeometryVector.IDX_TWIST] = 6.28
+        vec.vector[GeometryVector.IDX_SPHERICITY] = 1.0
+        vec.vector[GeometryVector.IDX_SYMMETRY] = 0.9
+    
+    elif preset_name == 'SPRING':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.25
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.6
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.3, 0.3, 12.0]
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.85
+        vec.vector[GeometryVector.IDX_TWIST] = 9.42
+        vec.vector[GeometryVector.IDX_SPHERICITY] = 1.0
+        vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.8
+    
+    elif preset_name == 'TWISTED_TOWER':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.3
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.5
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [1.5, 1.5, 8.0]
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.7
+        vec.vector[GeometryVector.IDX_TWIST] = 1.57
+        vec.vector[GeometryVector.IDX_TAPER] = 0.2
+        vec.vector[GeometryVector.IDX_CUBICITY] = 0.8
+    
+    elif preset_name == 'FIGHTER_JET':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.5
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.75
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [12.0, 10.0, 3.0]
+        vec.vector[GeometryVector.IDX_ASPECT_RATIO_XY] = 1.2
+        vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.9
+        vec.vector[GeometryVector.IDX_TAPER] = 0.6
+        vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.7
+    
+    elif preset_name == 'BOMBER':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.55
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.8
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [20.0, 30.0, 5.0]
+        vec.vector[GeometryVector.IDX_ASPECT_RATIO_XY] = 0.67
+        vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.8
+        vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.9
+    
+    elif preset_name == 'HELICOPTER':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.6
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.85
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [10.0, 12.0, 6.0]
+        vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
+        vec.vector[GeometryVector.IDX_SPHERICITY] = 0.6
+        vec.vector[GeometryVector.IDX_TOPOLOGY_GENUS] = 0.3
+    
+    elif preset_name == 'STAIRCASE':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.7
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.4
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [2.0, 3.0, 2.0]
+        vec.vector[GeometryVector.IDX_SYMMETRY] = 0.5
+        vec.vector[GeometryVector.IDX_CUBICITY] = 0.9
+        vec.vector[GeometryVector.IDX_ELONGATION] = 0.6
+    
+    elif preset_name == 'CHARACTER':
+        vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.8
+        vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.9
+        vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.6, 0.4, 1.75]
+        vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
+        vec.vector[GeometryVector.IDX_SPHERICITY] = 0.5
+        vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.6
+        vec.vector[GeometryVector.IDX_TOPOLOGY_GENUS] = 0.7  # Multiple parts
+    
+    return vec
+
+
+def modifier_tracks(vectors: np.ndarray) -> Dict[str, Tuple[np.ndarray, bool]]:
+    """
+    Map a (F, 32) batch of vectors onto the modifier inputs used by
+    Decode & Render, one value per frame
+
+    Returns:
+        {"<modifier name>.<property>": (values (F,), active)} where
+        active tells whether the modifier matters on any frame (same
+        thresholds as the single-vector decode)
+    """
+    v = np.atleast_2d(vectors)
+    G = GeometryVector
+
+    elongation = (v[:, G.IDX_ELONGATION] - 0.33) * 3.0
+    wave_freq = v[:, G.IDX_WAVE_FREQ]
+
+    tracks = {
+        "Sphericity.factor": v[:, G.IDX_SPHERICITY],
+        "Taper.factor": v[:, G.IDX_TAPER],
+        "Twist.angle": v[:, G.IDX_TWIST] * 2 * math.pi,
+        "Bend.angle": v[:, G.IDX_BEND] * 2 * math.pi,
+        "Elongation.factor": elongation,
+        "Wave.height": v[:, G.IDX_WAVE_AMP],
+        "Wave.width": np.where(wave_freq > 0.01, wave_freq * 2.0, 1.0),
+        "Noise.strength": v[:, G.IDX_NOISE_STRENGTH],
+        "EdgeSharp.split_angle": np.radians(180 * (1 - v[:, G.IDX_EDGE_SHARPNESS])),
+        "Inflate.strength": v[:, G.IDX_INFLATION] * 0.5,
+        "Random.strength": v[:, G.IDX_RANDOMNESS] * 0.1,
+    }
+    active = {
+        "Sphericity": np.abs(v[:, G.IDX_SPHERICITY]) > 0.01,
+        "Taper": np.abs(v[:, G.IDX_TAPER]) > 0.01,
+        "Twist": np.abs(tracks["Twist.angle"]) > 0.01,
+        "Bend": np.abs(tracks["Bend.angle"]) > 0.01,
+        "Elongation": np.abs(v[:, G.IDX_ELONGATION] - 0.33) > 0.05,
+        "Wave": np.abs(v[:, G.IDX_WAVE_AMP]) > 0.01,
+        "Noise": np.abs(v[:, G.IDX_NOISE_STRENGTH]) > 0.01,
+        "EdgeSharp": v[:, G.IDX_EDGE_SHARPNESS] > 0.1,
+        "Inflate": np.abs(v[:, G.IDX_INFLATION]) > 0.01,
+        "Random": v[:, G.IDX_RANDOMNESS] > 0.01,
+    }
+    return {path: (values, bool(active[path.split(".")[0]].any()))
+            for path, values in tracks.items()}
+
+def transform_tracks(vectors: np.ndarray) -> Dict[str, np.ndarray]:
+    """Map a (F, 32) batch of vectors onto object scale, location and rotation, each (F, 3)"""
+    v = np.atleast_2d(vectors)
+    G = GeometryVector
+    return {
+        "scale": v[:, G.IDX_SCALE_X:G.IDX_SCALE_Z + 1],
+        "location": v[:, G.IDX_LOC_X:G.IDX_LOC_Z + 1],
+        "rotation_euler": v[:, G.IDX_ROT_X:G.IDX_ROT_Z + 1],
+    }
+
+
+class GeometryLatentSpace:
+    """
+    Manages the latent space of geometry representations
+    Provides operations like interpolation, arithmetic, and clustering
+    """
+    
+    def __init__(self):
+        self.vectors: Dict[str, GeometryVector] = {}
+    
+    def add_geometry(self, name: str, vec: GeometryVector):
+        """Add a geometry vector to the space"""
+        self.vectors[name] = vec
+    
+    def interpolate_path(self, start_name: str, end_name: str, steps: int = 10) -> List[GeometryVector]:
+        """Generate interpolation path between two geometries"""
+        path = self.interpolate_path_array(start_name, end_name, steps)
+        if path is None:
+            return []
+        return [GeometryVector(row) for row in path]
+    
+    def interpolate_path_array(self, start_name: str, end_name: str, steps: int = 10) -> Optional[np.ndarray]:
+        """Interpolation path between two geometries as one (steps, 32) array"""
+        if start_name not in self.vectors or end_name not in self.vectors:
+            return None
+        
+        start_vec = self.vectors[start_name].vector
+        end_vec = self.vectors[end_name].vector
+        
+        t = np.linspace(0.0, 1.0, steps) if steps > 1 else np.zeros(1)
+        return (1 - t)[:, None] * start_vec[None, :] + t[:, None] * end_vec[None, :]
+    
+    def blend_geometries(self, names: List[str], weights: List[float]) -> Optional[GeometryVector]:
+        """Blend multiple geometries with given weights"""
+        if len(names) != len(weights):
+            return None
+        
+        result = GeometryVector()
+        total_weight = sum(weights)
+        
+        if total_weight < 1e-6:
+            return result
+        
+        for name, weight in zip(names, weights):
+            if name in self.vectors:
+                result = result.add(self.vectors[name], weight / total_weight)
+        
+        return result
+    
+    def get_neighbors(self, vec: GeometryVector, k: int = 5) -> List[Tuple[str, float]]:
+        """Find k nearest neighbors in latent space"""
+        distances = []
+        for name, stored_vec in self.vectors.items():
+            dist = vec.distance_to(stored_vec)
+            distances.append((name, dist))
+        
+        distances.sort(key=lambda x: x[1])
+        return distances[:k]
+
+
+# Singleton instance
+_latent_space = GeometryLatentSpace()
+
+def get_latent_space() -> GeometryLatentSpace:
+    """Get the global latent space instance"""
+    return _latent_space
+
+
+# Presets that auto-bind and export recognise from a stored vector
+KNOWN_PRESETS = (
+    'SPIRAL_CORRIDOR', 'DNA_HELIX', 'SPRING', 'TWISTED_TOWER',
+    'FIGHTER_JET', 'BOMBER', 'HELICOPTER', 'STAIRCASE', 'CHARACTER'
+)
+
+_preset_table = None
+
+def preset_table() -> np.ndarray:
+    """(len(KNOWN_PRESETS), 32) preset vectors, built once"""
+    global _preset_table
+    if _preset_table is None:
+        _preset_table = np.stack([preset_vector(name).vector for name in KNOWN_PRESETS])
+    return _preset_table
+
+def match_preset(vector, threshold: float) -> Optional[str]:
+    """Closest known preset within `threshold` (Euclidean), or None"""
+    distances = np.linalg.norm(preset_table() - np.asarray(vector, dtype=np.float32), axis=1)
+    best = int(np.argmin(distances))
+    return KNOWN_PRESETS[best] if distances[best] < threshold else None
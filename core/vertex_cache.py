@@ -0,0 +1,283 @@
+"""
+Vertex Animation Cache
+Flat memory-mapped file of per-frame vertex positions for topology-
+preserving morphs. Playback reads one frame straight from the mapped file
+instead of evaluating the modifier stack. Nothing here touches bpy.
+
+File layout (little endian):
+    header      64 bytes (see _HEADER)
+    keyframes   keyframe_count x (vertex_count * 3) float32   (delta files only)
+    frames      frame_count x (vertex_count * 3) float32 or float16
+
+Plain files store absolute positions per frame. Delta files store each
+frame as the difference to the previous reconstructed frame, with an
+absolute float32 keyframe every keyframe_interval frames for seeking.
+Deltas are small, so half precision keeps its relative accuracy instead of
+rounding absolute coordinates.
+"""
+
+import os
+import struct
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+MAGIC = b"GVAC"
+VERSION = 1
+
+# magic, version, frame_count, vertex_count, flags, keyframe_interval, keyframe_count
+_HEADER = struct.Struct("<4sIIIIII")
+HEADER_SIZE = 64
+
+FLAG_HALF = 1
+FLAG_DELTA = 2
+
+DEFAULT_KEYFRAME_INTERVAL = 32
+
+# Object ID properties binding a playback object to its cache
+CACHE_PATH_KEY = "gvec_vertex_cache"
+CACHE_START_KEY = "gvec_vertex_cache_start"
+
+
+def cache_bytes(frame_count: int, vertex_count: int, half: bool = False, delta: bool = False,
+                keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> int:
+    """Size of a cache file with the given layout"""
+    row = vertex_count * 3
+    keyframe_count = -(-frame_count // keyframe_interval) if delta else 0
+    return HEADER_SIZE + keyframe_count * row * 4 + frame_count * row * (2 if half else 4)
+
+
+class VertexCacheWriter:
+    """
+    Sequential writer: call write() once per frame, then close()
+
+    Data goes to a temporary file that replaces `filepath` on close, so an
+    aborted bake never leaves a truncated cache behind.
+    """
+
+    def __init__(self, filepath: str, frame_count: int, vertex_count: int,
+                 half: bool = False, delta: bool = False,
+                 keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        self.filepath = filepath
+        self.frame_count = frame_count
+        self.vertex_count = vertex_count
+        self.half = half
+        self.delta = delta
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.frames_written = 0
+
+        row = vertex_count * 3
+        keyframe_count = -(-frame_count // self.keyframe_interval) if delta else 0
+        flags = (FLAG_HALF if half else 0) | (FLAG_DELTA if delta else 0)
+        self.nbytes = cache_bytes(frame_count, vertex_count, half, delta, self.keyframe_interval)
+
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._tmp_path = filepath + ".tmp"
+        with open(self._tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, frame_count, vertex_count, flags,
+                                 self.keyframe_interval, keyframe_count).ljust(HEADER_SIZE, b"\0"))
+            f.truncate(self.nbytes)
+
+        self._keyframes = None
+        if keyframe_count:
+            self._keyframes = np.memmap(self._tmp_path, dtype=np.float32, mode="r+",
+                                        offset=HEADER_SIZE, shape=(keyframe_count, row))
+        self._frames = np.memmap(self._tmp_path, dtype=np.float16 if half else np.float32, mode="r+",
+                                 offset=HEADER_SIZE + keyframe_count * row * 4, shape=(frame_count, row))
+        # Reconstruction of the last written frame, exactly as a reader will see it
+        self._previous = np.zeros(row, dtype=np.float32) if delta else None
+
+    def write(self, positions):
+        """Append one frame of flat (vertex_count * 3) positions"""
+        index = self.frames_written
+        if index >= self.frame_count:
+            raise ValueError("Vertex cache is already full")
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1)
+        if len(positions) != self.vertex_count * 3:
+            raise ValueError(f"Expected {self.vertex_count} vertices, got {len(positions) // 3}")
+
+        if not self.delta:
+            self._frames[index] = positions
+        elif index % self.keyframe_interval == 0:
+            self._keyframes[index // self.keyframe_interval] = positions
+            self._previous[:] = positions
+        else:
+            # Encode against the reconstructed previous frame so rounding never accumulates
+            stored = (positions - self._previous).astype(self._frames.dtype)
+            self._frames[index] = stored
+            self._previous += stored.astype(np.float32)
+
+        self.frames_written += 1
+
+    def close(self):
+        """Flush and move the finished cache into place"""
+        for array in (self._keyframes, self._frames):
+            if array is not None:
+                array.flush()
+        self._keyframes = self._frames = None
+        release(self.filepath)
+        os.replace(self._tmp_path, self.filepath)
+
+    def abort(self):
+        """Discard a partially written cache"""
+        self._keyframes = self._frames = None
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class VertexCacheReader:
+    """Random-access reader returning flat float32 positions per frame"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.mtime = os.path.getmtime(filepath)
+        with open(filepath, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"Not a vertex cache: {filepath}")
+        magic, version, frame_count, vertex_count, flags, interval, keyframe_count = \
+            _HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError(f"Not a vertex cache: {filepath}")
+        if version > VERSION:
+            raise ValueError(f"Vertex cache version {version} is newer than supported ({VERSION})")
+
+        self.frame_count = frame_count
+        self.vertex_count = vertex_count
+        self.half = bool(flags & FLAG_HALF)
+        self.delta = bool(flags & FLAG_DELTA)
+        self.keyframe_interval = interval
+        self.nbytes = os.path.getsize(filepath)
+
+        row = vertex_count * 3
+        self._keyframes = None
+        if keyframe_count:
+            self._keyframes = np.memmap(filepath, dtype=np.float32, mode="r",
+                                        offset=HEADER_SIZE, shape=(keyframe_count, row))
+        self._frames = np.memmap(filepath, dtype=np.float16 if self.half else np.float32, mode="r",
+                                 offset=HEADER_SIZE + keyframe_count * row * 4, shape=(frame_count, row))
+        self._current = np.empty(row, dtype=np.float32)
+        self._current_index = None
+
+    def frame(self, index: int) -> np.ndarray:
+        """
+        Positions of a frame (clamped to the cached range)
+
+        The returned buffer is reused by the next call; copy it to keep it.
+        """
+        index = min(max(int(index), 0), self.frame_count - 1)
+        if index == self._current_index:
+            return self._current
+
+        if not self.delta:
+            self._current[:] = self._frames[index]
+        elif self._current_index == index - 1 and index % self.keyframe_interval:
+            # Sequential playback: one delta per frame
+            self._current += self._frames[index]
+        else:
+            # Seek: start from the nearest keyframe at or before the frame
+            key = index // self.keyframe_interval
+            self._current[:] = self._keyframes[key]
+            for i in range(key * self.keyframe_interval + 1, index + 1):
+                self._current += self._frames[i]
+
+        self._current_index = index
+        return self._current
+
+    def close(self):
+        self._keyframes = self._frames = None
+        self._current_index = None
+
+
+# Open readers keyed by absolute path
+_readers = {}
+
+
+def open_cache(filepath: str) -> Optional[VertexCacheReader]:
+    """Shared reader for a cache file, reopened if the file changed (None if unreadable)"""
+    reader = _readers.get(filepath)
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        release(filepath)
+        return None
+    if reader is not None and reader.mtime == mtime:
+        return reader
+    try:
+        reader = VertexCacheReader(filepath)
+    except (OSError, ValueError) as e:
+        print(f"[VertexCache] Could not open {filepath}: {e}")
+        release(filepath)
+        return None
+    _readers[filepath] = reader
+    return reader
+
+
+def release(filepath: str):
+    """Close the shared reader for a file (before it is rewritten or deleted)"""
+    reader = _readers.pop(filepath, None)
+    if reader is not None:
+        reader.close()
+
+
+def close_all():
+    for reader in _readers.values():
+        reader.close()
+    _readers.clear()
+
+
+# Names of objects streamed from a cache
+_bound = set()
+
+
+def bind(name: str):
+    _bound.add(name)
+
+
+def unbind(name: str):
+    _bound.discard(name)
+
+
+def bound_objects():
+    return tuple(_bound)
+
+
+def forget():
+    """Drop bindings, readers and stats (addon unregister / file load)"""
+    _bound.clear()
+    close_all()
+    global _last_stream_ms
+    _playback_times.clear()
+    _last_stream_ms = 0.0
+
+
+# Playback measurement
+_FPS_WINDOW = 1.0
+_playback_times = deque()
+_last_stream_ms = 0.0
+
+
+def record_playback(stream_ms: float):
+    """Note one streamed frame and how long streaming it took"""
+    global _last_stream_ms
+    now = time.perf_counter()
+    _playback_times.append(now)
+    while _playback_times and _playback_times[0] < now - _FPS_WINDOW:
+        _playback_times.popleft()
+    _last_stream_ms = stream_ms
+
+
+def playback_fps() -> float:
+    """Streamed frames per second over the last second"""
+    if _playback_times and _playback_times[-1] < time.perf_counter() - _FPS_WINDOW:
+        return 0.0
+    return len(_playback_times) / _FPS_WINDOW
+
+
+def stream_ms() -> float:
+    """Time spent streaming the last frame (ms)"""
+    return _last_stream_ms
@@ -0,0 +1,405 @@
+"""
+Headless Worker Farm
+Splits a batch of vectors, .gvec files or .blend files into chunks and
+runs each chunk in its own `blender -b --factory-startup` process
+(farm_worker.py one level up), as many at a time as there are cores.
+Every worker writes a sharded dataset (see dataset_shards) into its own
+chunk directory; failed or timed-out chunks are retried and resume after
+their last completed shard, and the chunk manifests are merged into one
+dataset at the end. Ingest jobs (see library_ingest) instead write one
+dataset per .blend file, each finished by a source marker.
+Nothing here touches bpy, so the runner works from plain CPython as well
+as from inside Blender.
+
+    python -m <addon package>.core.worker_farm decode --vectors vectors_dir --output out
+    python -m <addon package>.core.worker_farm export --files shapes/*.gvec --output out --workers 8
+
+Work directory layout (inside the output directory):
+    farm/farm.json              job kind, item count and chunk size (reused on resume)
+    farm/vectors.npy            decode input, (N, 32) float32
+    farm/chunk_00000.json       job description passed to the worker
+    farm/chunk_00000.log        worker stdout / stderr
+    chunk_00000/                chunk dataset written by the worker
+    manifest.json               merged manifest over all chunk shards
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from . import dataset_shards
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_SCRIPT = os.path.join(ADDON_DIR, "farm_worker.py")
+
+JOB_KINDS = ("decode", "export", "ingest")
+WORK_DIR_NAME = "farm"
+SOURCE_MARKER = "source.json"
+
+
+def find_blender(path: Optional[str] = None) -> str:
+    """Blender executable: explicit path, $BLENDER, then `blender` on PATH"""
+    candidate = path or os.environ.get("BLENDER") or shutil.which("blender")
+    if not candidate or not os.path.exists(candidate):
+        raise FileNotFoundError("Blender executable not found; pass --blender or set $BLENDER")
+    return candidate
+
+
+def load_vectors(source: str) -> np.ndarray:
+    """(N, 32) vectors from a .npy file or a sharded dataset directory"""
+    if os.path.isdir(source):
+        dataset = dataset_shards.ShardedDataset(source)
+        parts = [np.asarray(vectors) for vectors, _ in dataset.iter_shards()]
+        dataset.close()
+        return np.concatenate(parts) if parts else np.zeros((0, dataset_shards.VECTOR_DIM), dtype=np.float32)
+    return np.load(source, mmap_mode="r")
+
+
+def source_stat(path: str) -> Dict:
+    """The file state an ingested dataset is tied to"""
+    stat = os.stat(path)
+    return {"mtime": stat.st_mtime, "size": stat.st_size}
+
+
+def read_source_marker(dataset_dir: str) -> Optional[Dict]:
+    """Marker of a finished per-file dataset, None while it is missing or incomplete"""
+    try:
+        with open(os.path.join(dataset_dir, SOURCE_MARKER), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_source_marker(dataset_dir: str, source: str, stat: Dict, objects: int):
+    """Mark the dataset of `source` as complete for the file state `stat`"""
+    os.makedirs(dataset_dir, exist_ok=True)
+    path = os.path.join(dataset_dir, SOURCE_MARKER)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(dict(stat, file=source, objects=objects), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class Chunk:
+    __slots__ = ("index", "name", "job_path", "log_path", "output", "datasets", "size",
+                 "attempts", "process", "started", "done", "failed")
+
+    def __init__(self, index: int, work_dir: str, output_dir: str, size: int,
+                 datasets: Optional[Sequence[str]] = None):
+        self.index = index
+        self.name = f"chunk_{index:05d}"
+        self.job_path = os.path.join(work_dir, self.name + ".json")
+        self.log_path = os.path.join(work_dir, self.name + ".log")
+        self.output = os.path.join(output_dir, self.name)
+        # Ingest chunks write one dataset per file instead of self.output
+        self.datasets = list(datasets) if datasets is not None else None
+        self.size = size
+        self.attempts = 0
+        self.process = None
+        self.started = 0.0
+        self.done = False
+        self.failed = False
+
+    def rows_written(self) -> int:
+        if self.datasets is not None:
+            return sum(read_source_marker(path) is not None for path in self.datasets)
+        try:
+            manifest = dataset_shards.read_manifest(self.output)
+        except (OSError, ValueError):
+            return 0
+        return manifest["count"] if manifest else 0
+
+
+class WorkerFarm:
+    """
+    Pool of headless Blender workers over one job
+
+    Drive it with run() (blocking), or start() followed by poll() until it
+    returns True (e.g. from a modal operator's timer). Items are
+    addressed by their running index, so object names (item_0000042) and
+    resumed chunks stay stable across retries and reruns. Ingest jobs take
+    one output dataset directory per file in `datasets` and are not merged
+    (merge=False); the caller owns their layout.
+    """
+
+    def __init__(self, kind: str, output_dir: str, vectors: Optional[np.ndarray] = None,
+                 files: Optional[Sequence[str]] = None, workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, shard_size: int = 256, point_count: int = 0,
+                 apply_modifiers: bool = True, blender: Optional[str] = None, retries: int = 2,
+                 timeout: Optional[float] = None, resume: bool = True, log=print,
+                 datasets: Optional[Sequence[str]] = None, include_mesh: bool = True,
+                 merge: bool = True):
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r} (expected one of {JOB_KINDS})")
+        if ((kind == "decode") != (vectors is not None) or (kind == "decode") == (files is not None)
+                or (kind == "ingest") != (datasets is not None)):
+            raise ValueError("decode jobs take vectors, export jobs take files, ingest jobs files and datasets")
+        if datasets is not None and len(datasets) != len(files):
+            raise ValueError("ingest jobs need one dataset directory per file")
+        self.kind = kind
+        self.output_dir = os.path.abspath(output_dir)
+        self.work_dir = os.path.join(self.output_dir, WORK_DIR_NAME)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.shard_size = shard_size
+        self.point_count = point_count
+        self.apply_modifiers = apply_modifiers
+        self.include_mesh = include_mesh
+        self.merge = merge
+        self.blender = find_blender(blender)
+        self.retries = retries
+        self.timeout = timeout
+        self.resume = resume
+        self.log = log
+
+        self._vectors = vectors
+        self._files = [os.path.abspath(path) for path in files] if files is not None else None
+        self._datasets = [os.path.abspath(path) for path in datasets] if datasets is not None else None
+        self.total = len(vectors) if vectors is not None else len(self._files)
+        # Enough chunks to keep every worker busy and to make a retry cheap
+        self.chunk_size = chunk_size or max(1, min(16 * shard_size, -(-self.total // (self.workers * 4))))
+        self.chunks: List[Chunk] = []
+        self._queue: List[Chunk] = []
+        self._running: List[Chunk] = []
+        self.merged = None
+
+    # -- setup ---------------------------------------------------------------
+
+    def start(self):
+        """Write the job files and launch the first workers"""
+        if not self.resume and os.path.isdir(self.output_dir):
+            for path in glob.glob(os.path.join(self.output_dir, "chunk_*")):
+                shutil.rmtree(path, ignore_errors=True)
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        os.makedirs(self.work_dir, exist_ok=True)
+
+        # A resumed run must cut the same chunks as the run it continues
+        state_path = os.path.join(self.work_dir, "farm.json")
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("kind") == self.kind and state.get("items") == self.total:
+                self.chunk_size = state["chunk_size"]
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump({"kind": self.kind, "items": self.total, "chunk_size": self.chunk_size}, f)
+
+        inputs = {}
+        if self.kind == "decode":
+            vectors_path = os.path.join(self.work_dir, "vectors.npy")
+            np.save(vectors_path, np.asarray(self._vectors, dtype=np.float32))
+            inputs["vectors"] = vectors_path
+
+        for index, start in enumerate(range(0, self.total, self.chunk_size)):
+            stop = min(start + self.chunk_size, self.total)
+            datasets = self._datasets[start:stop] if self._datasets is not None else None
+            chunk = Chunk(index, self.work_dir, self.output_dir, stop - start, datasets)
+            job = {
+                "kind": self.kind,
+                "start": start,
+                "stop": stop,
+                "output": chunk.output,
+                "shard_size": self.shard_size,
+                "point_count": self.point_count,
+                "apply_modifiers": self.apply_modifiers,
+                "include_mesh": self.include_mesh,
+            }
+            if self.kind == "decode":
+                job["vectors"] = inputs["vectors"]
+            else:
+                job["files"] = self._files[start:stop]
+            if datasets is not None:
+                job["datasets"] = datasets
+            with open(chunk.job_path, "w", encoding="utf-8") as f:
+                json.dump(job, f, indent=2)
+            self.chunks.append(chunk)
+            if chunk.rows_written() >= chunk.size:
+                chunk.done = True
+            else:
+                self._queue.append(chunk)
+        self.log(f"[Farm] {self.total} item(s) in {len(self.chunks)} chunk(s), "
+                 f"{len(self._queue)} to run on {self.workers} worker(s)")
+        self._fill()
+
+    def _launch(self, chunk: Chunk):
+        chunk.attempts += 1
+        env = dict(os.environ, OMP_NUM_THREADS="1", OPENBLAS_NUM_THREADS="1", MKL_NUM_THREADS="1")
+        log_file = open(chunk.log_path, "a", encoding="utf-8")
+        log_file.write(f"\n=== attempt {chunk.attempts} ===\n")
+        log_file.flush()
+        chunk.process = subprocess.Popen(
+            [self.blender, "-b", "--factory-startup", "-t", "1", "--python-exit-code", "1",
+             "--python", WORKER_SCRIPT, "--", chunk.job_path],
+            stdout=log_file, stderr=subprocess.STDOUT, env=env)
+        log_file.close()
+        chunk.started = time.monotonic()
+        self._running.append(chunk)
+
+    def _fill(self):
+        while self._queue and len(self._running) < self.workers:
+            self._launch(self._queue.pop(0))
+
+    # -- progress ------------------------------------------------------------
+
+    def poll(self) -> bool:
+        """Reap finished workers, retry failures, launch queued chunks; True when all are done"""
+        for chunk in list(self._running):
+            code = chunk.process.poll()
+            timed_out = (code is None and self.timeout is not None
+                         and time.monotonic() - chunk.started > self.timeout)
+            if code is None and not timed_out:
+                continue
+            if timed_out:
+                chunk.process.kill()
+                chunk.process.wait()
+            self._running.remove(chunk)
+            chunk.process = None
+
+            if code == 0 and chunk.rows_written() >= chunk.size:
+                chunk.done = True
+            elif chunk.attempts <= self.retries:
+                reason = "timed out" if timed_out else f"exit code {code}"
+                self.log(f"[Farm] {chunk.name} {reason}, retrying (see {chunk.log_path})")
+                self._queue.append(chunk)
+            else:
+                chunk.failed = True
+                self.log(f"[Farm] {chunk.name} failed after {chunk.attempts} attempt(s), see {chunk.log_path}")
+        self._fill()
+
+        finished = not self._running and not self._queue
+        if finished and self.merge and self.merged is None:
+            self.merged = merge_manifests(self.output_dir, [c.output for c in self.chunks],
+                                          info={"farm": {"kind": self.kind, "items": self.total,
+                                                         "failed_chunks": [c.name for c in self.chunks
+                                                                           if c.failed]}})
+        return finished
+
+    def progress(self) -> Dict:
+        done = sum(chunk.size if chunk.done else chunk.rows_written() for chunk in self.chunks)
+        return {"items": self.total, "done": done, "running": len(self._running),
+                "queued": len(self._queue), "failed": sum(chunk.failed for chunk in self.chunks)}
+
+    def cancel(self):
+        """Kill running workers; completed shards are kept for a later resume"""
+        for chunk in self._running:
+            chunk.process.kill()
+            chunk.process.wait()
+        self._running.clear()
+        self._queue.clear()
+
+    def run(self, interval: float = 1.0) -> Dict:
+        """Start and wait for every chunk, logging progress; returns the merged manifest"""
+        self.start()
+        last = None
+        try:
+            while not self.poll():
+                state = self.progress()
+                if state != last:
+                    self.log(f"[Farm] {state['done']}/{state['items']} done, {state['running']} running, "
+                             f"{state['queued']} queued, {state['failed']} failed")
+                    last = state
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.cancel()
+            raise
+        return self.merged
+
+
+def merge_manifests(output_dir: str, chunk_dirs: Sequence[str], info: Optional[Dict] = None) -> Dict:
+    """
+    One manifest in `output_dir` over the shards of every chunk dataset
+
+    Shard paths become relative to `output_dir`; label ids of chunks whose
+    label vocabulary differs from the merged one are rewritten in place.
+    """
+    merged = None
+    label_index = {}
+    for chunk_dir in chunk_dirs:
+        manifest = dataset_shards.read_manifest(chunk_dir)
+        if manifest is None:
+            continue
+        if merged is None:
+            merged = {key: value for key, value in manifest.items() if key not in ("shards", "count", "labels")}
+            merged.update({"count": 0, "labels": [], "shards": []})
+            merged["info"] = dict(manifest.get("info", {}), **(info or {}))
+
+        remap = np.empty(len(manifest["labels"]), dtype=np.int32)
+        for local, label in enumerate(manifest["labels"]):
+            if label not in label_index:
+                label_index[label] = len(merged["labels"])
+                merged["labels"].append(label)
+            remap[local] = label_index[label]
+        identity = np.array_equal(remap, np.arange(len(remap)))
+
+        relative = os.path.relpath(chunk_dir, output_dir)
+        for entry in manifest["shards"]:
+            path = os.path.join(chunk_dir, entry["path"])
+            if not identity:
+                labels_path = os.path.join(path, "labels.npy")
+                np.save(labels_path, remap[np.load(labels_path)])
+            merged_entry = dict(entry, index=len(merged["shards"]), start=merged["count"],
+                                path=os.path.join(relative, entry["path"]).replace(os.sep, "/"))
+            merged["shards"].append(merged_entry)
+            merged["count"] += entry["count"]
+        if not identity:
+            # The chunk's own manifest now matches the rewritten ids
+            manifest["labels"] = list(merged["labels"])
+            dataset_shards.write_manifest(chunk_dir, manifest)
+
+    if merged is None:
+        return None
+    dataset_shards.write_manifest(output_dir, merged)
+    return merged
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="worker_farm", description=__doc__.split("\n")[1])
+    # Ingest runs need the mtime manifest of library_ingest, which has its own entry point
+    parser.add_argument("kind", choices=("decode", "export"))
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--vectors", help="decode: .npy (N, 32) file or sharded dataset directory")
+    source.add_argument("--files", nargs="+", help="export: .gvec files (globs are expanded)")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=256)
+    parser.add_argument("--point-count", type=int, default=0)
+    parser.add_argument("--no-modifiers", action="store_true", help="write base meshes instead of evaluated ones")
+    parser.add_argument("--blender", default=None)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per chunk attempt")
+    parser.add_argument("--restart", action="store_true", help="discard existing chunk output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    vectors = files = None
+    if args.kind == "decode":
+        if args.vectors is None:
+            sys.exit("decode needs --vectors")
+        vectors = load_vectors(args.vectors)
+    else:
+        if args.files is None:
+            sys.exit("export needs --files")
+        files = sorted(path for pattern in args.files for path in (glob.glob(pattern) or [pattern]))
+
+    farm = WorkerFarm(args.kind, args.output, vectors=vectors, files=files, workers=args.workers,
+                      chunk_size=args.chunk_size, shard_size=args.shard_size, point_count=args.point_count,
+                      apply_modifiers=not args.no_modifiers, blender=args.blender, retries=args.retries,
+                      timeout=args.timeout, resume=not args.restart)
+    merged = farm.run()
+    state = farm.progress()
+    print(f"[Farm] Finished: {merged['count'] if merged else 0} row(s) in {args.output}, "
+          f"{state['failed']} failed chunk(s)")
+    sys.exit(1 if state["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Generated Datablock Registry
+Records every datablock the procedural generators create, tagged with the
+generator that made it, in a collection stored on the scene. Cleanup walks
+only these entries instead of scanning bpy.data by name prefix.
+"""
+
+import bpy
+from typing import Iterable, Optional, Tuple
+
+# Generator ids
+GENERATOR_AIRCRAFT = 'AIRCRAFT'
+GENERATOR_STAIRCASE = 'STAIRCASE'
+GENERATOR_CHARACTER = 'CHARACTER'
+GENERATOR_HELIX = 'HELIX'
+GENERATOR_SHAPE = 'SHAPE'
+GENERATOR_MORPH = 'MORPH'
+
+# Generators that all write the MyShapeObject slot and replace each other
+PRESET_GENERATORS = (GENERATOR_AIRCRAFT, GENERATOR_STAIRCASE, GENERATOR_CHARACTER, GENERATOR_HELIX)
+
+# id_type -> bpy.data collection name
+DATA_COLLECTIONS = {
+    'OBJECT': "objects",
+    'MESH': "meshes",
+    'CURVE': "curves",
+    'MATERIAL': "materials",
+    'TEXTURE': "textures",
+    'NODETREE': "node_groups",
+    'ACTION': "actions",
+}
+
+# Datablocks reused across rebuilds; only removed once nothing uses them
+SHARED_TYPES = ('MATERIAL', 'TEXTURE', 'NODETREE')
+
+# Removal order: users before the data they reference
+_REMOVE_ORDER = ('OBJECT', 'MESH', 'CURVE', 'MATERIAL', 'TEXTURE', 'NODETREE', 'ACTION')
+
+
+def id_type_of(id_data) -> Optional[str]:
+    """Registry type tag for a datablock (None if not tracked by the registry)"""
+    if isinstance(id_data, bpy.types.Object):
+        return 'OBJECT'
+    if isinstance(id_data, bpy.types.Mesh):
+        return 'MESH'
+    if isinstance(id_data, bpy.types.Curve):
+        return 'CURVE'
+    if isinstance(id_data, bpy.types.Material):
+        return 'MATERIAL'
+    if isinstance(id_data, bpy.types.Texture):
+        return 'TEXTURE'
+    if isinstance(id_data, bpy.types.NodeTree):
+        return 'NODETREE'
+    if isinstance(id_data, bpy.types.Action):
+        return 'ACTION'
+    return None
+
+
+def lookup(entry):
+    """Resolve a registry entry to its datablock (None if it no longer exists)"""
+    collection = getattr(bpy.data, DATA_COLLECTIONS.get(entry.id_type, ""), None)
+    if collection is None:
+        return None
+    return collection.get(entry.name)
+
+
+def generator_of(scene, id_data) -> Optional[str]:
+    """Generator that created a tracked datablock (None if untracked)"""
+    id_type = id_type_of(id_data)
+    for entry in scene.my_generated_datablocks:
+        if entry.id_type == id_type and entry.name == id_data.name:
+            return entry.generator
+    return None
+
+
+def track(scene, generator: str, *datablocks):
+    """Record datablocks as output of `generator` (duplicates are ignored)"""
+    registry = scene.my_generated_datablocks
+    for id_data in datablocks:
+        if id_data is None:
+            continue
+        id_type = id_type_of(id_data)
+        if id_type is None:
+            continue
+        if any(e.generator == generator and e.id_type == id_type and e.name == id_data.name
+               for e in registry):
+            continue
+        entry = registry.add()
+        entry.generator = generator
+        entry.id_type = id_type
+        entry.name = id_data.name
+
+
+def track_object(scene, generator: str, obj):
+    """Record an object together with its data, materials and action"""
+    track(scene, generator, obj, obj.data)
+    if obj.animation_data is not None:
+        track(scene, generator, obj.animation_data.action)
+    if obj.data is not None and hasattr(obj.data, "materials"):
+        track(scene, generator, *[mat for mat in obj.data.materials if mat is not None])
+
+
+def estimate_bytes(id_data) -> int:
+    """Rough memory footprint of a datablock's element data"""
+    if isinstance(id_data, bpy.types.Mesh):
+        return (len(id_data.vertices) * 12 + len(id_data.edges) * 8 +
+                len(id_data.loops) * 8 + len(id_data.polygons) * 12)
+    if isinstance(id_data, bpy.types.Curve):
+        total = 0
+        for spline in id_data.splines:
+            total += len(spline.points) * 16 + len(spline.bezier_points) * 36
+        return total
+    return 0
+
+
+def format_bytes(size: int) -> str:
+    """Human readable byte count"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} GB"
+
+
+def _remove(id_type: str, id_data) -> int:
+    """Remove one datablock, returning the bytes it held"""
+    size = estimate_bytes(id_data)
+    collection = getattr(bpy.data, DATA_COLLECTIONS[id_type])
+    if id_type == 'OBJECT':
+        collection.remove(id_data, do_unlink=True)
+    else:
+        collection.remove(id_data)
+    return size
+
+
+def _sweep(scene, entries, include_shared: bool) -> Tuple[int, int]:
+    """Remove the datablocks behind the given entries and drop their registry records"""
+    registry = scene.my_generated_datablocks
+    removed = 0
+    reclaimed = 0
+    done = set()
+
+    for id_type in _REMOVE_ORDER:
+        for index, entry in entries:
+            if entry.id_type != id_type:
+                continue
+            id_data = lookup(entry)
+            if id_data is None:
+                done.add(index)
+                continue
+            if id_type != 'OBJECT':
+                # Data blocks go only once nothing else references them
+                if id_data.users > 0 or (id_type in SHARED_TYPES and not include_shared):
+                    continue
+            reclaimed += _remove(id_type, id_data)
+            removed += 1
+            done.add(index)
+
+    for index in sorted(done, reverse=True):
+        registry.remove(index)
+    return removed, reclaimed
+
+
+def release(scene, generators: Iterable[str], include_shared: bool = False) -> Tuple[int, int]:
+    """
+    Remove everything the given generators created
+
+    Objects are always removed; meshes and curves once no object uses them;
+    shared datablocks (materials, textures, node groups) only when
+    include_shared is set and they are unused.
+
+    Returns:
+        (datablocks removed, approximate bytes reclaimed)
+    """
+    generators = set(generators)
+    entries = [(i, e) for i, e in enumerate(scene.my_generated_datablocks) if e.generator in generators]
+    return _sweep(scene, entries, include_shared)
+
+
+def purge(scene) -> Tuple[int, int]:
+    """
+    Remove every tracked datablock that is no longer used, from any generator
+
+    Returns:
+        (datablocks removed, approximate bytes reclaimed)
+    """
+    entries = []
+    for i, entry in enumerate(scene.my_generated_datablocks):
+        id_data = lookup(entry)
+        # Objects still linked to a scene are live output, not garbage
+        if entry.id_type == 'OBJECT' and id_data is not None and id_data.users_scene:
+            continue
+        entries.append((i, entry))
+    return _sweep(scene, entries, include_shared=True)
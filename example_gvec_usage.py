@@ -206,80 +206,53 @@ def example_json_inspection(gvec_file_path):
 # Example 8: Generate random geometries
 # ============================================================================
 
-def example_generate_random_dataset(count=10):
+def example_generate_random_dataset(count=10, output_dir="random_dataset"):
     """Generate random geometry vectors for testing/training"""
     
-    import numpy as np
+    from blenderUI.core.design_space import DesignSpace, sum_at_most
+    from blenderUI.core.dataset_shards import ShardedDataset
     from blenderUI.geometry_encoder import GeometryVector
+    from blenderUI import api
     
-    for i in range(count):
-        # Generate random vector
-        random_values = np.random.randn(32) * 0.5
-        
-        # Set reasonable defaults
-        random_values[2:5] = np.abs(random_values[2:5]) + 0.5  # Scale > 0
-        random_values[22:25] = random_values[22:25] * np.pi    # Rotation in radians
-        
-        geom_vec = GeometryVector(random_values)
-        
-        # Export
-        success = GeometryFileFormat.export_to_file(
-            filepath=f"random_{i:03d}.gvec",
-            geom_vector=geom_vec,
-            obj=None,
-            metadata={"type": "random", "index": i}
-        )
-        
-        print(f"Generated random_{i:03d}.gvec: {'OK' if success else 'FAIL'}")
+    # Default ranges keep scales positive and rotations in [-pi, pi);
+    # narrow the twist and keep the shape-morph weights exclusive
+    space = DesignSpace()
+    space.set(GeometryVector.IDX_TWIST, "normal", -0.5, 0.5, mean=0.0, std=0.1)
+    space.add_constraint(sum_at_most([GeometryVector.IDX_SPHERICITY,
+                                      GeometryVector.IDX_CUBICITY,
+                                      GeometryVector.IDX_CYLINDRICITY], 1.0))
+    
+    # One vectorized draw, written as .npy shards instead of one file per vector
+    api.generate_dataset(output_dir, count, method="sobol", seed=0, space=space)
     
-    print(f"Generated {count} random geometry vectors")
+    dataset = ShardedDataset(output_dir)
+    print(f"Generated {len(dataset)} random geometry vectors in {dataset.shard_count} shard(s)")
+    return dataset
 
 
 # ============================================================================
 # Example 9: Machine learning dataset preparation
 # ============================================================================
 
-def example_prepare_ml_dataset(output_dir="ml_dataset"):
+def example_prepare_ml_dataset(output_dir="ml_dataset", shard_size=1024):
     """Prepare dataset for machine learning training"""
     
-    import os
-    import numpy as np
-    import json
-    
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-    
-    vectors = []
-    labels = []
-    
-    # Export all objects in scene
-    for obj in bpy.data.objects:
-        if obj.type != 'MESH':
-            continue
-        
-        # Encode object
-        geom_vec = GeometryEncoder.encode_object(obj)
-        
-        # Save individual file
-        filepath = os.path.join(output_dir, f"{obj.name}.gvec")
-        GeometryFileFormat.export_to_file(filepath, geom_vec, obj)
-        
-        # Collect for numpy array
-        vectors.append(geom_vec.vector)
-        labels.append(obj.name)
+    from blenderUI import api
+    from blenderUI.core.dataset_shards import ShardedDataset
     
-    # Save as numpy arrays
-    X = np.array(vectors)
-    np.save(os.path.join(output_dir, "vectors.npy"), X)
+    # Stream every mesh object into .npy shards; rerunning after an
+    # interruption continues after the last completed shard
+    api.export_dataset(output_dir, shard_size=shard_size)
     
-    with open(os.path.join(output_dir, "labels.json"), 'w') as f:
-        json.dump(labels, f, indent=2)
+    # Training side: shards are memory-mapped, nothing is copied until used
+    dataset = ShardedDataset(output_dir)
+    for vectors, label_ids in dataset.iter_shards():
+        print(f"  Shard: {vectors.shape}, labels {[dataset.labels[i] for i in label_ids[:3]]}...")
     
-    print(f"ML Dataset prepared: {len(vectors)} samples")
-    print(f"  Shape: {X.shape}")
+    print(f"ML Dataset prepared: {len(dataset)} samples in {dataset.shard_count} shard(s)")
     print(f"  Output: {output_dir}/")
     
-    return X, labels
+    return dataset
 
 
 # ============================================================================
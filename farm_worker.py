@@ -0,0 +1,150 @@
+"""
+Farm Worker - one chunk of a core.worker_farm job inside headless Blender
+
+Started by the runner as
+    blender -b --factory-startup -t 1 --python farm_worker.py -- chunk_00000.json
+
+Decode jobs turn rows start..stop of a vectors .npy into objects through
+api.decode_and_render; export jobs restore .gvec files through
+api.import_gvec. Either way the objects are written shard by shard with
+api.export_dataset into the chunk's output directory and removed again,
+so memory stays flat. Items are named by their running index, which lets
+a retried chunk skip everything its completed shards already hold.
+Ingest jobs hand each .blend file to api.ingest_blend, which writes that
+file's own dataset, and mark it complete with a source marker.
+Exits with status 1 if any item failed.
+"""
+
+import bpy
+import importlib
+import json
+import os
+import sys
+import traceback
+
+import numpy as np
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(ADDON_DIR))
+addon = importlib.import_module(os.path.basename(ADDON_DIR))
+addon.register()
+api = importlib.import_module(addon.__name__ + ".api")
+dataset_shards = importlib.import_module(addon.__name__ + ".core.dataset_shards")
+worker_farm = importlib.import_module(addon.__name__ + ".core.worker_farm")
+
+
+def quiet(level, message):
+    if 'ERROR' in level:
+        print(f"[Worker] {message}", file=sys.stderr)
+
+
+def item_name(index: int) -> str:
+    return f"item_{index:07d}"
+
+
+def decode_item(context, vectors, index):
+    scene = context.scene
+    scene.vector_source_preset = "NONE"
+    context.view_layer.objects.active = None
+    return api.decode_and_render(api.GeometryVector(np.array(vectors[index])), context, quiet)
+
+
+def export_item(context, files, index, start):
+    context.view_layer.objects.active = None
+    return api.import_gvec(files[index - start], context, quiet)
+
+
+def remove_objects(objects):
+    for obj in objects:
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def clear_startup_scene():
+    """Drop the factory startup objects so appended ones keep their names"""
+    bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes))
+
+
+def ingest(context, job) -> int:
+    failures = 0
+    for done, (path, dataset) in enumerate(zip(job["files"], job["datasets"]), 1):
+        if worker_farm.read_source_marker(dataset) is not None:
+            continue
+        try:
+            # Stat before reading, so a file saved mid-ingest is picked up by the next run
+            stat = worker_farm.source_stat(path)
+            count = api.ingest_blend(path, dataset, shard_size=job["shard_size"],
+                                     include_mesh=job["include_mesh"], apply_modifiers=job["apply_modifiers"],
+                                     context=context, report=quiet, point_count=job["point_count"])
+        except Exception:
+            traceback.print_exc()
+            count = None
+        if count is None:
+            failures += 1
+            continue
+        worker_farm.write_source_marker(dataset, path, stat, count)
+        print(f"[Worker] {done}/{len(job['files'])} file(s), {count} mesh object(s) in {path}", flush=True)
+    return failures
+
+
+def run(job) -> int:
+    context = bpy.context
+    context.scene.decode_cache_enabled = False
+    if job["kind"] == "ingest":
+        clear_startup_scene()
+        return ingest(context, job)
+    start, stop = job["start"], job["stop"]
+    vectors = np.load(job["vectors"], mmap_mode="r") if job["kind"] == "decode" else None
+
+    manifest = dataset_shards.read_manifest(job["output"])
+    done = {name for shard in (manifest or {}).get("shards", ()) for name in shard.get("names", ())}
+    pending = [index for index in range(start, stop) if item_name(index) not in done]
+    failures = 0
+
+    for batch_start in range(0, len(pending), job["shard_size"]):
+        objects = []
+        for index in pending[batch_start:batch_start + job["shard_size"]]:
+            try:
+                if job["kind"] == "decode":
+                    obj = decode_item(context, vectors, index)
+                else:
+                    obj = export_item(context, job["files"], index, start)
+            except Exception:
+                traceback.print_exc()
+                obj = None
+            if obj is None:
+                failures += 1
+                continue
+            # Renaming also keeps the next decode from replacing this object
+            obj.name = item_name(index)
+            objects.append(obj)
+
+        if objects:
+            written = api.export_dataset(job["output"], objects, shard_size=job["shard_size"],
+                                         apply_modifiers=job["apply_modifiers"], resume=True,
+                                         context=context, report=quiet, point_count=job["point_count"])
+            if written is None:
+                failures += len(objects)
+            remove_objects(objects)
+        print(f"[Worker] {min(batch_start + job['shard_size'], len(pending))}/{len(pending)} item(s)", flush=True)
+    return failures
+
+
+def main():
+    job_path = sys.argv[sys.argv.index("--") + 1]
+    with open(job_path, "r", encoding="utf-8") as f:
+        job = json.load(f)
+    try:
+        failures = run(job)
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+    if failures:
+        print(f"[Worker] {failures} item(s) failed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
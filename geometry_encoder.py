@@ -1,6 +1,9 @@
 """
 Geometry Encoder/Decoder System
-Unified representation of geometric objects as high-dimensional vectors
+Unified representation of geometric objects as high-dimensional vectors.
+The vector type, preset table and latent space live in core.vectors; this
+module adds the Blender side: encoding objects and scene parameters,
+decoding into scene properties and per-object vector storage.
 """
 
 import bpy
@@ -9,113 +12,12 @@ import numpy as np
 from mathutils import Vector
 from typing import Dict, List, Tuple, Optional
 
-
-class GeometryVector:
-    """
-    Unified vector representation for all geometric objects
-    Maps any mesh to a standardized N-dimensional parameter space
-    """
-    
-    # Define the unified parameter space dimensions
-    VECTOR_DIM = 32  # Total dimensionality of latent space
-    
-    # Parameter indices in the vector
-    IDX_SHAPE_TYPE = 0          # 0-1: Shape type (continuous encoding)
-    IDX_COMPLEXITY = 1          # Geometric complexity measure
-    IDX_SCALE_X = 2             # Global scale
-    IDX_SCALE_Y = 3
-    IDX_SCALE_Z = 4
-    IDX_SYMMETRY = 5            # Symmetry measure
-    IDX_CURVATURE = 6           # Overall curvature
-    IDX_TOPOLOGY_GENUS = 7      # Topological genus (holes)
-    IDX_ASPECT_RATIO_XY = 8     # Shape ratios
-    IDX_ASPECT_RATIO_XZ = 9
-    IDX_ASPECT_RATIO_YZ = 10
-    IDX_ELONGATION = 11         # Elongation factor
-    IDX_TWIST = 12              # Twist amount
-    IDX_TAPER = 13              # Taper factor
-    IDX_BEND = 14               # Bending
-    IDX_WAVE_FREQ = 15          # Wave parameters
-    IDX_WAVE_AMP = 16
-    IDX_NOISE_SCALE = 17        # Noise parameters
-    IDX_NOISE_STRENGTH = 18
-    IDX_SPHERICITY = 19         # Shape morphing
-    IDX_CUBICITY = 20
-    IDX_CYLINDRICITY = 21
-    IDX_ROT_X = 22              # Rotation angles (radians)
-    IDX_ROT_Y = 23
-    IDX_ROT_Z = 24
-    IDX_LOC_X = 25              # Location (position)
-    IDX_LOC_Y = 26
-    IDX_LOC_Z = 27
-    # Universal appearance parameters (topology-agnostic)
-    IDX_SMOOTHNESS = 28         # Surface smoothness (0-1)
-    IDX_EDGE_SHARPNESS = 29     # Edge sharpness (0-1)
-    IDX_INFLATION = 30          # Inflate/deflate (-1 to 1)
-    IDX_RANDOMNESS = 31         # Random displacement (0-1)
-    
-    def __init__(self, vector: Optional[np.ndarray] = None):
-        """Initialize with vector or create zero vector"""
-        if vector is not None:
-            self.vector = np.array(vector, dtype=np.float32)
-        else:
-            self.vector = np.zeros(self.VECTOR_DIM, dtype=np.float32)
-    
-    def __repr__(self):
-        return f"GeometryVector(dim={self.VECTOR_DIM}, norm={np.linalg.norm(self.vector):.3f})"
-    
-    def to_dict(self) -> Dict[str, float]:
-        """Convert vector to named parameters"""
-        return {
-            'shape_type': float(self.vector[self.IDX_SHAPE_TYPE]),
-            'complexity': float(self.vector[self.IDX_COMPLEXITY]),
-            'scale': [float(self.vector[i]) for i in [self.IDX_SCALE_X, self.IDX_SCALE_Y, self.IDX_SCALE_Z]],
-            'symmetry': float(self.vector[self.IDX_SYMMETRY]),
-            'curvature': float(self.vector[self.IDX_CURVATURE]),
-            'topology_genus': float(self.vector[self.IDX_TOPOLOGY_GENUS]),
-            'aspect_ratios': [float(self.vector[i]) for i in [self.IDX_ASPECT_RATIO_XY, self.IDX_ASPECT_RATIO_XZ, self.IDX_ASPECT_RATIO_YZ]],
-            'deformations': {
-                'elongation': float(self.vector[self.IDX_ELONGATION]),
-                'twist': float(self.vector[self.IDX_TWIST]),
-                'taper': float(self.vector[self.IDX_TAPER]),
-                'bend': float(self.vector[self.IDX_BEND]),
-            },
-            'wave': {
-                'frequency': float(self.vector[self.IDX_WAVE_FREQ]),
-                'amplitude': float(self.vector[self.IDX_WAVE_AMP]),
-            },
-            'noise': {
-                'scale': float(self.vector[self.IDX_NOISE_SCALE]),
-                'strength': float(self.vector[self.IDX_NOISE_STRENGTH]),
-            },
-            'shape_morphing': {
-                'sphericity': float(self.vector[self.IDX_SPHERICITY]),
-                'cubicity': float(self.vector[self.IDX_CUBICITY]),
-                'cylindricity': float(self.vector[self.IDX_CYLINDRICITY]),
-            }
-        }
-    
-    def distance_to(self, other: 'GeometryVector') -> float:
-        """Calculate Euclidean distance to another geometry vector"""
-        return float(np.linalg.norm(self.vector - other.vector))
-    
-    def interpolate(self, other: 'GeometryVector', t: float) -> 'GeometryVector':
-        """Linear interpolation between two geometry vectors"""
-        t = np.clip(t, 0.0, 1.0)
-        new_vector = (1 - t) * self.vector + t * other.vector
-        return GeometryVector(new_vector)
-    
-    def add(self, other: 'GeometryVector', weight: float = 1.0) -> 'GeometryVector':
-        """Vector addition in latent space"""
-        new_vector = self.vector + weight * other.vector
-        return GeometryVector(new_vector)
-    
-    def normalize(self) -> 'GeometryVector':
-        """Normalize the vector"""
-        norm = np.linalg.norm(self.vector)
-        if norm > 1e-6:
-            return GeometryVector(self.vector / norm)
-        return GeometryVector(self.vector)
+from .core.vectors import (
+    GeometryVector, GeometryLatentSpace, get_latent_space,
+    KNOWN_PRESETS, preset_table, match_preset, preset_vector,
+    modifier_tracks, transform_tracks
+)
+from .profiler import profiled
 
 
 class GeometryEncoder:
@@ -126,98 +28,10 @@ class GeometryEncoder:
     @staticmethod
     def encode_preset(preset_name: str, scene) -> GeometryVector:
         """Encode a preset into geometry vector"""
-        vec = GeometryVector()
-        
-        if preset_name == 'NONE':
-            # Default cube
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.0
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.1
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [1.0, 1.0, 1.0]
-            vec.vector[GeometryVector.IDX_CUBICITY] = 1.0
-            
-        elif preset_name == 'SPIRAL_CORRIDOR':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.15
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.7
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.5, 0.5, 20.0]
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.8
-            vec.vector[GeometryVector.IDX_TWIST] = 3.14
-            vec.vector[GeometryVector.IDX_SPHERICITY] = 0.3
-            vec.vector[GeometryVector.IDX_TOPOLOGY_GENUS] = 0.5
-            
-        elif preset_name == 'DNA_HELIX':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.2
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.8
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.2, 0.2, 15.0]
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.9
-            vec.vector[GeometryVector.IDX_TWIST] = 6.28
-            vec.vector[GeometryVector.IDX_SPHERICITY] = 1.0
-            vec.vector[GeometryVector.IDX_SYMMETRY] = 0.9
-            
-        elif preset_name == 'SPRING':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.25
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.6
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.3, 0.3, 12.0]
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.85
-            vec.vector[GeometryVector.IDX_TWIST] = 9.42
-            vec.vector[GeometryVector.IDX_SPHERICITY] = 1.0
-            vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.8
-            
-        elif preset_name == 'TWISTED_TOWER':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.3
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.5
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [1.5, 1.5, 8.0]
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.7
-            vec.vector[GeometryVector.IDX_TWIST] = 1.57
-            vec.vector[GeometryVector.IDX_TAPER] = 0.2
-            vec.vector[GeometryVector.IDX_CUBICITY] = 0.8
-            
-        elif preset_name == 'FIGHTER_JET':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.5
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.75
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [12.0, 10.0, 3.0]
-            vec.vector[GeometryVector.IDX_ASPECT_RATIO_XY] = 1.2
-            vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.9
-            vec.vector[GeometryVector.IDX_TAPER] = 0.6
-            vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.7
-            
-        elif preset_name == 'BOMBER':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.55
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.8
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [20.0, 30.0, 5.0]
-            vec.vector[GeometryVector.IDX_ASPECT_RATIO_XY] = 0.67
-            vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.8
-            vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.9
-            
-        elif preset_name == 'HELICOPTER':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.6
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.85
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [10.0, 12.0, 6.0]
-            vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
-            vec.vector[GeometryVector.IDX_SPHERICITY] = 0.6
-            vec.vector[GeometryVector.IDX_TOPOLOGY_GENUS] = 0.3
-            
-        elif preset_name == 'STAIRCASE':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.7
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.4
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [2.0, 3.0, 2.0]
-            vec.vector[GeometryVector.IDX_SYMMETRY] = 0.5
-            vec.vector[GeometryVector.IDX_CUBICITY] = 0.9
-            vec.vector[GeometryVector.IDX_ELONGATION] = 0.6
-            
-        elif preset_name == 'CHARACTER':
-            vec.vector[GeometryVector.IDX_SHAPE_TYPE] = 0.8
-            vec.vector[GeometryVector.IDX_COMPLEXITY] = 0.9
-            vec.vector[GeometryVector.IDX_SCALE_X:GeometryVector.IDX_SCALE_Z+1] = [0.6, 0.4, 1.75]
-            vec.vector[GeometryVector.IDX_SYMMETRY] = 1.0
-            vec.vector[GeometryVector.IDX_SPHERICITY] = 0.5
-            vec.vector[GeometryVector.IDX_CYLINDRICITY] = 0.6
-            vec.vector[GeometryVector.IDX_TOPOLOGY_GENUS] = 0.7  # Multiple parts
-            
-        return vec
+        return preset_vector(preset_name)
     
     @staticmethod
+    @profiled("encoder.encode_object")
     def encode_object(obj) -> GeometryVector:
         """Encode a Blender object into geometry vector"""
         vec = GeometryVector()
@@ -299,7 +113,37 @@ class GeometryEncoder:
                         vec.vector[GeometryVector.IDX_NOISE_SCALE] = mod.texture.noise_scale
         
         return vec
-    
+
+    @staticmethod
+    @profiled("encoder.encode_objects")
+    def encode_objects(objects, out=None, prefer_stored: bool = True) -> np.ndarray:
+        """
+        Encode many objects into the rows of an (N, 32) float32 array
+
+        Args:
+            objects:       objects to encode, one row each
+            out:           array to fill in place (e.g. a dataset shard memmap)
+            prefer_stored: use the vector an object stores (the one that
+                           generated it) and only encode the others
+
+        Returns:
+            the filled array (`out` when given)
+        """
+        objects = list(objects)
+        if out is None:
+            out = np.zeros((len(objects), 32), dtype=np.float32)
+        elif out.shape != (len(objects), 32):
+            raise ValueError(f"out has shape {out.shape}, expected ({len(objects)}, 32)")
+
+        for row, obj in enumerate(objects):
+            values = obj.get(VECTOR_KEY) if prefer_stored else None
+            if values is None and prefer_stored and _LEGACY_KEYS[0] in obj:
+                values = get_object_vector(obj).vector
+            if values is None:
+                values = GeometryEncoder.encode_object(obj).vector
+            out[row] = values
+        return out
+
     @staticmethod
     def encode_scene_parameters(scene) -> GeometryVector:
         """Encode current scene parameters into vector"""
@@ -370,6 +214,16 @@ class GeometryDecoder:
         
         return params
     
+    @staticmethod
+    def decode_modifier_tracks(vectors: np.ndarray) -> Dict[str, Tuple[np.ndarray, bool]]:
+        """Per-frame modifier inputs for a (F, 32) batch (see core.vectors.modifier_tracks)"""
+        return modifier_tracks(vectors)
+    
+    @staticmethod
+    def decode_transform_tracks(vectors: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-frame scale, location and rotation for a (F, 32) batch"""
+        return transform_tracks(vectors)
+    
     @staticmethod
     def find_nearest_preset(vec: GeometryVector, scene) -> str:
         """Find the closest preset to the given vector"""
@@ -389,65 +243,57 @@ class GeometryDecoder:
         return nearest_preset
 
 
-class GeometryLatentSpace:
-    """
-    Manages the latent space of geometry representations
-    Provides operations like interpolation, arithmetic, and clustering
-    """
-    
-    def __init__(self):
-        self.vectors: Dict[str, GeometryVector] = {}
-    
-    def add_geometry(self, name: str, vec: GeometryVector):
-        """Add a geometry vector to the space"""
-        self.vectors[name] = vec
-    
-    def interpolate_path(self, start_name: str, end_name: str, steps: int = 10) -> List[GeometryVector]:
-        """Generate interpolation path between two geometries"""
-        if start_name not in self.vectors or end_name not in self.vectors:
-            return []
-        
-        start_vec = self.vectors[start_name]
-        end_vec = self.vectors[end_name]
-        
-        path = []
-        for i in range(steps):
-            t = i / (steps - 1) if steps > 1 else 0
-            path.append(start_vec.interpolate(end_vec, t))
-        
-        return path
-    
-    def blend_geometries(self, names: List[str], weights: List[float]) -> Optional[GeometryVector]:
-        """Blend multiple geometries with given weights"""
-        if len(names) != len(weights):
-            return None
-        
-        result = GeometryVector()
-        total_weight = sum(weights)
-        
-        if total_weight < 1e-6:
-            return result
-        
-        for name, weight in zip(names, weights):
-            if name in self.vectors:
-                result = result.add(self.vectors[name], weight / total_weight)
-        
-        return result
-    
-    def get_neighbors(self, vec: GeometryVector, k: int = 5) -> List[Tuple[str, float]]:
-        """Find k nearest neighbors in latent space"""
-        distances = []
-        for name, stored_vec in self.vectors.items():
-            dist = vec.distance_to(stored_vec)
-            distances.append((name, dist))
-        
-        distances.sort(key=lambda x: x[1])
-        return distances[:k]
+# Per-object vector storage: one 32-float ID property array
+VECTOR_KEY = "geom_vector"
+_LEGACY_KEYS = tuple(f"geom_vector_{i}" for i in range(32))
+
+def has_object_vector(obj) -> bool:
+    """True if the object stores a geometry vector (either layout)"""
+    return VECTOR_KEY in obj or _LEGACY_KEYS[0] in obj
+
+def get_object_vector(obj) -> Optional[GeometryVector]:
+    """Stored vector of an object, or None"""
+    values = obj.get(VECTOR_KEY)
+    if values is not None:
+        return GeometryVector(np.asarray(values, dtype=np.float32))
+    if _LEGACY_KEYS[0] in obj:
+        return GeometryVector(np.array([obj.get(key, 0.0) for key in _LEGACY_KEYS], dtype=np.float32))
+    return None
+
+def set_object_vector(obj, vec):
+    """Store a vector (GeometryVector or 32 floats) on an object in one write"""
+    values = vec.vector if isinstance(vec, GeometryVector) else vec
+    obj[VECTOR_KEY] = np.asarray(values, dtype=np.float64).tolist()
+    if _LEGACY_KEYS[0] in obj:
+        for key in _LEGACY_KEYS:
+            if key in obj:
+                del obj[key]
 
+def migrate_object_vector(obj) -> bool:
+    """Move legacy geom_vector_0..31 keys into the array property; True if migrated"""
+    if _LEGACY_KEYS[0] not in obj:
+        return False
+    set_object_vector(obj, get_object_vector(obj))
+    return True
 
-# Singleton instance
-_latent_space = GeometryLatentSpace()
+def migrate_object_vectors(objects=None) -> int:
+    """Migrate every object with legacy keys (all of bpy.data by default)"""
+    if objects is None:
+        objects = bpy.data.objects
+    return sum(1 for obj in objects if obj.library is None and migrate_object_vector(obj))
 
-def get_latent_space() -> GeometryLatentSpace:
-    """Get the global latent space instance"""
-    return _latent_space
+def object_vectors(objects) -> Tuple[List[str], np.ndarray]:
+    """Names and (N, 32) vectors of the objects that store one"""
+    names = []
+    rows = []
+    for obj in objects:
+        values = obj.get(VECTOR_KEY)
+        if values is None:
+            if _LEGACY_KEYS[0] not in obj:
+                continue
+            values = get_object_vector(obj).vector
+        names.append(obj.name)
+        rows.append(values)
+    if not rows:
+        return names, np.zeros((0, 32), dtype=np.float32)
+    return names, np.asarray(rows, dtype=np.float32)
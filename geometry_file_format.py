@@ -2,13 +2,16 @@
 Geometry File Format (.gvec)
 Custom file format for storing geometry vectors and mesh data
 Supports both vector-only and vector+mesh hybrid storage
+The document layout and JSON I/O live in core.gvec_codec; this module
+converts between Blender objects and those documents.
 """
 
 import json
 import bpy
-import numpy as np
 from typing import Dict, List, Optional, Tuple
-from .geometry_encoder import GeometryVector
+from .core import gvec_codec, mesh_builder, point_sampling
+from .geometry_encoder import GeometryVector, set_object_vector
+from .profiler import profiled
 
 
 class GeometryFileFormat:
@@ -37,14 +40,21 @@ class GeometryFileFormat:
             "diffuse_color": [r, g, b, a],
             "metallic": 0.0,
             "roughness": 0.5
+        },
+        "point_cloud": {  # Optional - area-weighted surface samples
+            "count": N,
+            "seed": 0,
+            "points": [[x, y, z], ...],
+            "normals": [[nx, ny, nz], ...]  # Optional
         }
     }
     """
     
-    VERSION = "1.0"
-    EXTENSION = ".gvec"
+    VERSION = gvec_codec.FORMAT_VERSION
+    EXTENSION = gvec_codec.EXTENSION
     
     @staticmethod
+    @profiled("io.serialize_mesh")
     def serialize_mesh(obj: bpy.types.Object) -> Optional[Dict]:
         """
         Convert Blender mesh to JSON-serializable format
@@ -132,6 +142,7 @@ class GeometryFileFormat:
         return mesh_data
     
     @staticmethod
+    @profiled("io.deserialize_mesh")
     def deserialize_mesh(mesh_data: Dict) -> bpy.types.Mesh:
         """
         Convert JSON mesh data back to Blender mesh
@@ -191,11 +202,43 @@ class GeometryFileFormat:
         return material_data
     
     @staticmethod
+    @profiled("io.sample_point_cloud")
+    def sample_point_cloud(obj: bpy.types.Object, count: int, seed: int = 0,
+                           with_normals: bool = True, depsgraph=None) -> Optional[Dict]:
+        """
+        Sample a point_cloud section from an object's surface
+        
+        Args:
+            obj: Blender mesh object
+            count: Number of points
+            seed: RNG seed (same seed and mesh give the same cloud)
+            with_normals: Store the triangle normal of each point
+            depsgraph: Sample the evaluated mesh (modifiers applied) when given
+            
+        Returns:
+            point_cloud dictionary (object space) or None if not a mesh
+        """
+        if obj is None or obj.type != 'MESH':
+            return None
+        if depsgraph is None:
+            buffers = mesh_builder.read_mesh(obj.data)
+        else:
+            eval_obj = obj.evaluated_get(depsgraph)
+            try:
+                buffers = mesh_builder.read_mesh(eval_obj.to_mesh())
+            finally:
+                eval_obj.to_mesh_clear()
+        points, normals = point_sampling.sample_points(buffers, count, seed, with_normals)
+        return gvec_codec.build_point_cloud(points, normals, seed)
+    
+    @staticmethod
+    @profiled("io.export_to_file")
     def export_to_file(
         filepath: str,
         geom_vector: GeometryVector,
         obj: Optional[bpy.types.Object] = None,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        point_cloud: Optional[Dict] = None
     ) -> bool:
         """
         Export geometry vector and optional mesh data to .gvec file
@@ -205,6 +248,7 @@ class GeometryFileFormat:
             geom_vector: GeometryVector instance
             obj: Optional Blender object (for mesh data)
             metadata: Optional metadata dictionary
+            point_cloud: Optional section from sample_point_cloud()
             
         Returns:
             True if successful, False otherwise
@@ -213,44 +257,32 @@ class GeometryFileFormat:
         if not filepath.endswith(GeometryFileFormat.EXTENSION):
             filepath += GeometryFileFormat.EXTENSION
         
-        # Build data structure
-        data = {
-            "version": GeometryFileFormat.VERSION,
-            "type": "geometry_vector",
-            "vector": geom_vector.vector.tolist(),  # Convert numpy to list
-            "metadata": metadata or {}
-        }
+        metadata = metadata or {}
         
         # Add default metadata
-        if "name" not in data["metadata"]:
-            data["metadata"]["name"] = obj.name if obj else "unnamed"
+        if "name" not in metadata:
+            metadata["name"] = obj.name if obj else "unnamed"
         
-        if "source" not in data["metadata"]:
+        if "source" not in metadata:
             # Determine if this is a preset or imported object
             has_cache = obj and obj.get("geometry_vector_source_mesh")
-            data["metadata"]["source"] = "import" if has_cache else "preset"
+            metadata["source"] = "import" if has_cache else "preset"
         
-        # Add mesh data if object provided
-        if obj:
-            mesh_data = GeometryFileFormat.serialize_mesh(obj)
-            if mesh_data:
-                data["mesh"] = mesh_data
-            
-            # Add material data
-            material_data = GeometryFileFormat.serialize_material(obj)
-            if material_data:
-                data["materials"] = material_data
+        # Add mesh and material data if object provided
+        mesh_data = GeometryFileFormat.serialize_mesh(obj) if obj else None
+        material_data = GeometryFileFormat.serialize_material(obj) if obj else None
+        data = gvec_codec.build_document(geom_vector.vector, metadata, mesh_data, material_data, point_cloud)
         
         # Write to file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            gvec_codec.write_document(filepath, data, ensure_ascii=False)
             return True
         except Exception as e:
             print(f"Error exporting to {filepath}: {e}")
             return False
     
     @staticmethod
+    @profiled("io.import_from_file")
     def import_from_file(filepath: str) -> Tuple[Optional[GeometryVector], Optional[Dict]]:
         """
         Import geometry vector and mesh data from .gvec file
@@ -262,17 +294,8 @@ class GeometryFileFormat:
             Tuple of (GeometryVector, full_data_dict) or (None, None) on error
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Validate version
-            if data.get("version") != GeometryFileFormat.VERSION:
-                print(f"Warning: File version {data.get('version')} may not be compatible")
-            
-            # Reconstruct GeometryVector
-            vector_data = np.array(data["vector"], dtype=np.float32)
-            geom_vector = GeometryVector(vector_data)
-            
+            data = gvec_codec.read_document(filepath)
+            geom_vector = GeometryVector(gvec_codec.document_vector(data))
             return geom_vector, data
             
         except Exception as e:
@@ -280,6 +303,7 @@ class GeometryFileFormat:
             return None, None
     
     @staticmethod
+    @profiled("io.restore_object_from_file")
     def restore_object_from_file(filepath: str, context) -> Optional[bpy.types.Object]:
         """
         Restore complete Blender object from .gvec file
@@ -306,8 +330,7 @@ class GeometryFileFormat:
             obj = bpy.data.objects.new(obj_name, mesh)
             
             # Store the vector data
-            for i in range(32):
-                obj[f"geom_vector_{i}"] = float(geom_vector.vector[i])
+            set_object_vector(obj, geom_vector)
             
             # Store metadata
             obj["geometry_vector_source"] = data["metadata"].get("source", "import")
@@ -330,8 +353,7 @@ class GeometryFileFormat:
             obj = bpy.data.objects.new(obj_name, mesh)
             
             # Store vector data (will be used for reconstruction)
-            for i in range(32):
-                obj[f"geom_vector_{i}"] = float(geom_vector.vector[i])
+            set_object_vector(obj, geom_vector)
             
             # Store metadata
             obj["geometry_vector_source"] = data["metadata"].get("source", "preset")
@@ -368,6 +390,7 @@ class GeometryBatchExporter:
     """Export multiple objects to a single batch file"""
     
     @staticmethod
+    @profiled("io.export_batch")
     def export_batch(filepath: str, objects: List[bpy.types.Object]) -> bool:
         """
         Export multiple objects to a single .gvec_batch file
@@ -379,16 +402,10 @@ class GeometryBatchExporter:
         Returns:
             True if successful
         """
-        if not filepath.endswith(".gvec_batch"):
-            filepath += ".gvec_batch"
-        
-        batch_data = {
-            "version": GeometryFileFormat.VERSION,
-            "type": "geometry_batch",
-            "count": len(objects),
-            "objects": []
-        }
+        if not filepath.endswith(gvec_codec.BATCH_EXTENSION):
+            filepath += gvec_codec.BATCH_EXTENSION
         
+        entries = []
         for obj in objects:
             # Encode object
             from .geometry_encoder import GeometryEncoder
@@ -405,17 +422,17 @@ class GeometryBatchExporter:
                 }
             }
             
-            batch_data["objects"].append(obj_data)
+            entries.append(obj_data)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(batch_data, f, indent=2)
+            gvec_codec.write_document(filepath, gvec_codec.build_batch(entries))
             return True
         except Exception as e:
             print(f"Error exporting batch: {e}")
             return False
     
     @staticmethod
+    @profiled("io.import_batch")
     def import_batch(filepath: str, context) -> List[bpy.types.Object]:
         """
         Import multiple objects from .gvec_batch file
@@ -428,8 +445,7 @@ class GeometryBatchExporter:
             List of imported objects
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                batch_data = json.load(f)
+            batch_data = gvec_codec.read_document(filepath)
             
             imported_objects = []
             
@@ -445,9 +461,7 @@ class GeometryBatchExporter:
                 obj.scale = transform["scale"]
                 
                 # Store vector
-                vector = np.array(obj_data["vector"], dtype=np.float32)
-                for i in range(32):
-                    obj[f"geom_vector_{i}"] = float(vector[i])
+                set_object_vector(obj, gvec_codec.document_vector(obj_data))
                 
                 # Mark source as import_batch so Decode & Render can recognize it
                 obj["geometry_vector_source"] = "import_batch"
@@ -1,6 +1,15 @@
 import bpy
 from bpy.app.handlers import persistent
 
+from .lazy_loader import loaded_module
+from .profiler import profiled
+
+# Object keys looked up without importing the NumPy modules
+# (geometry_encoder vector keys and vertex_cache.CACHE_PATH_KEY)
+_VECTOR_KEY = "geom_vector"
+_LEGACY_VECTOR_KEY = "geom_vector_0"
+_VERTEX_CACHE_KEY = "gvec_vertex_cache"
+
 def init_scene_items(scene):
     if scene is None:
         return
@@ -12,88 +21,188 @@ def init_scene_items(scene):
         item2.id = 2
         item2.name = "李四"
 
+def restore_object_state():
+    """
+    Migrate legacy vector keys and rebind vertex cache playback objects.
+    The encoder and vertex cache are only imported if some object needs them.
+    """
+    legacy = any(_LEGACY_VECTOR_KEY in obj for obj in bpy.data.objects)
+    cached = [obj.name for obj in bpy.data.objects if _VERTEX_CACHE_KEY in obj]
+    if legacy:
+        from .geometry_encoder import migrate_object_vectors
+        migrated = migrate_object_vectors()
+        print(f"[VectorEditor] Migrated vector storage of {migrated} objects")
+    if cached:
+        from .core import vertex_cache
+        for name in cached:
+            vertex_cache.bind(name)
+
+def deferred_setup():
+    """One-shot timer after register: seed scenes and restore object state once bpy.data is available"""
+    try:
+        for scene in bpy.data.scenes:
+            init_scene_items(scene)
+        restore_object_state()
+    except Exception as e:
+        print(f"[Addon] Warning: Deferred setup failed: {e}")
+    return None
+
 @persistent
+@profiled("handler.on_load_post")
 def on_load_post(dummy):
+    from . import preview_quality, profiler
+    preview_quality.reset()
+    # State of modules that were never imported needs no reset
+    lod_manager = loaded_module(".lod_manager", __package__)
+    if lod_manager is not None:
+        lod_manager.forget()
+    vertex_cache = loaded_module(".core.vertex_cache", __package__)
+    if vertex_cache is not None:
+        vertex_cache.forget()
+    restore_object_state()
     for scene in bpy.data.scenes:
         init_scene_items(scene)
+        if getattr(scene, "lod_enabled", False):
+            from . import lod_manager
+            lod_manager.start()
+    scene = bpy.context.scene
+    if scene is not None:
+        profiler.enable(getattr(scene, "profiling_enabled", False),
+                        getattr(scene, "profiling_track_allocations", False))
+    subscribe_auto_bind()
 
-# Store last selected object to detect changes
-_last_selected = None
+@persistent
+@profiled("handler.on_save_pre")
+def on_save_pre(dummy):
+    """Save full viewport quality; LOD and preview tiers are re-applied afterwards"""
+    from . import preview_quality
+    lod_manager = loaded_module(".lod_manager", __package__)
+    if lod_manager is not None:
+        lod_manager.restore_all()
+    for scene in bpy.data.scenes:
+        preview_quality.promote_all(scene)
 
 @persistent
+@profiled("handler.on_depsgraph_update_pre")
+def on_depsgraph_update_pre(scene, depsgraph=None):
+    """Start timing the evaluation for the adaptive preview frame-time readout"""
+    from . import preview_quality
+    preview_quality.begin_evaluation()
+
+@persistent
+@profiled("handler.on_frame_change_pre")
+def on_frame_change_pre(scene, depsgraph=None):
+    """Stream baked morph frames from their vertex caches into the meshes"""
+    vertex_cache = loaded_module(".core.vertex_cache", __package__)
+    if vertex_cache is None:
+        return
+    names = vertex_cache.bound_objects()
+    if not names:
+        return
+    import time
+    
+    start = time.perf_counter()
+    streamed = 0
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != 'MESH' or vertex_cache.CACHE_PATH_KEY not in obj:
+            vertex_cache.unbind(name)
+            continue
+        reader = vertex_cache.open_cache(bpy.path.abspath(obj[vertex_cache.CACHE_PATH_KEY]))
+        if reader is None or reader.vertex_count != len(obj.data.vertices):
+            continue
+        positions = reader.frame(scene.frame_current - obj.get(vertex_cache.CACHE_START_KEY, 1))
+        obj.data.vertices.foreach_set("co", positions)
+        obj.data.update()
+        streamed += 1
+    
+    if streamed:
+        vertex_cache.record_playback((time.perf_counter() - start) * 1000.0)
+
+@persistent
+@profiled("handler.on_depsgraph_update")
 def on_depsgraph_update(scene, depsgraph):
+    """Finish timing the evaluation for the adaptive preview frame-time readout"""
+    from . import preview_quality
+    preview_quality.end_evaluation(scene)
+
+# Owner of the msgbus subscription that drives auto-bind
+_msgbus_owner = object()
+
+# Auto-bind cost per notification (ms)
+_auto_bind_last_ms = 0.0
+_auto_bind_max_ms = 0.0
+_auto_bind_calls = 0
+
+def subscribe_auto_bind():
     """
-    Auto-bind vector editor to currently selected object.
-    When user selects a different object with vector data, automatically load its vectors.
+    Subscribe auto-bind to active-object changes.
+    msgbus subscriptions are dropped on file load, so on_load_post calls this again.
     """
-    global _last_selected
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.LayerObjects, "active"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=_on_active_object_changed,
+    )
+
+def unsubscribe_auto_bind():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+
+@profiled("handler.auto_bind")
+def _on_active_object_changed():
+    """msgbus callback: the active object changed in some view layer"""
+    global _auto_bind_last_ms, _auto_bind_max_ms, _auto_bind_calls
+    import time
     
-    context = bpy.context
-    if not context or not context.scene:
+    start = time.perf_counter()
+    try:
+        auto_bind(bpy.context)
+    except Exception as e:
+        print(f"[VectorEditor] Failed to auto-bind: {e}")
+    _auto_bind_last_ms = (time.perf_counter() - start) * 1000.0
+    _auto_bind_max_ms = max(_auto_bind_max_ms, _auto_bind_last_ms)
+    _auto_bind_calls += 1
+
+def auto_bind_stats():
+    """(last ms, max ms, notifications) for the auto-bind callback"""
+    return _auto_bind_last_ms, _auto_bind_max_ms, _auto_bind_calls
+
+def auto_bind(context):
+    """
+    Auto-bind vector editor to the active object.
+    When the active object carries vector data, load its vectors into the editor.
+    """
+    scene = context.scene
+    if scene is None or not getattr(scene, 'vector_editor_auto_bind', True):
         return
     
-    current_scene = context.scene
+    active_obj = context.view_layer.objects.active if context.view_layer else None
     
-    # Only update if vector editor auto-bind is enabled
-    if not getattr(current_scene, 'vector_editor_auto_bind', True):
+    if active_obj is None or active_obj.type != 'MESH':
         return
-    
-    # Get current active object
-    active_obj = context.active_object
-    
-    # Check if selection changed
-    if active_obj == _last_selected:
+    if _VECTOR_KEY not in active_obj and _LEGACY_VECTOR_KEY not in active_obj:
         return
     
-    _last_selected = active_obj
-    
-    # If no object or not a mesh, clear binding
-    if not active_obj or active_obj.type != 'MESH':
+    from .geometry_encoder import get_object_vector
+    vec = get_object_vector(active_obj)
+    if vec is None:
         return
     
-    # Check if this object has vector data
-    has_vector_data = all(f"geom_vector_{i}" in active_obj for i in range(32))
-    
-    if has_vector_data:
-        # Load vector from this object
-        try:
-            for i in range(32):
-                current_scene.geom_vector_current[i] = float(active_obj[f"geom_vector_{i}"])
-            
-            # Update source info
-            source = active_obj.get("geometry_vector_source", "unknown")
-            if source == "preset":
-                # Try to identify which preset
-                preset_name = _identify_preset_from_vector(current_scene)
-                current_scene.vector_source_preset = preset_name if preset_name else "NONE"
-            else:
-                current_scene.vector_source_preset = "NONE"
-            
-            print(f"[VectorEditor] Auto-bound to object: {active_obj.name}")
-        except Exception as e:
-            print(f"[VectorEditor] Failed to auto-bind: {e}")
-
-def _identify_preset_from_vector(scene):
-    """Try to identify which preset the current vector represents"""
-    # This is a simplified check - you could add more sophisticated matching
-    from .geometry_encoder import GeometryEncoder
-    import numpy as np
+    values = vec.vector.tolist()
+    scene.geom_vector_current = values
     
-    current_vec = np.array([scene.geom_vector_current[i] for i in range(32)])
+    # Update source info
+    if active_obj.get("geometry_vector_source", "unknown") == "preset":
+        preset_name = _identify_preset_from_vector(values)
+        scene.vector_source_preset = preset_name if preset_name else "NONE"
+    else:
+        scene.vector_source_preset = "NONE"
     
-    preset_names = [
-        'SPIRAL_CORRIDOR', 'DNA_HELIX', 'SPRING', 'TWISTED_TOWER',
-        'FIGHTER_JET', 'BOMBER', 'HELICOPTER', 'STAIRCASE', 'CHARACTER'
-    ]
-    
-    min_dist = float('inf')
-    closest_preset = None
-    
-    for preset in preset_names:
-        preset_vec = GeometryEncoder.encode_preset(preset, scene)
-        dist = np.linalg.norm(current_vec - preset_vec.vector)
-        if dist < min_dist and dist < 0.1:  # Threshold for "close enough"
-            min_dist = dist
-            closest_preset = preset
-    
-    return closest_preset
+    print(f"[VectorEditor] Auto-bound to object: {active_obj.name}")
+
+def _identify_preset_from_vector(values):
+    """Identify which preset a vector represents (None if no preset is close enough)"""
+    from .geometry_encoder import match_preset
+    return match_preset(values, threshold=0.1)
@@ -0,0 +1,46 @@
+"""
+Lazy Module Loading
+Stand-ins for heavy modules (NumPy, the encoder, file format and
+generators) so that registering the add-on does not import them; the real
+module is imported the first time one of its attributes is used, normally
+on the first operator execution.
+"""
+
+import importlib
+import sys
+
+
+class LazyModule:
+    """Proxy that imports its module on first attribute access"""
+
+    __slots__ = ("_name", "_package", "_module")
+
+    def __init__(self, name: str, package: str = None):
+        self._name = name
+        self._package = package
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name, self._package)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str, package: str = None) -> LazyModule:
+    """Module proxy for `name` (relative names need `package`, as importlib.import_module)"""
+    return LazyModule(name, package)
+
+
+def loaded_module(name: str, package: str = None):
+    """The module if something imported it already, else None (never imports)"""
+    if name.startswith(".") and package:
+        name = package + name
+    return sys.modules.get(name)
@@ -0,0 +1,225 @@
+"""
+Camera-Distance LOD Manager
+Throttled timer that measures the screen-space size of every
+vector-generated object from the active 3D view and lowers its viewport
+cost when it is small on screen: fewer Subdivision viewport levels at
+medium size, expensive modifiers hidden in the viewport at small size.
+
+Only viewport settings are changed. Render levels, show_render and the
+stored geom_vector_* data are never touched, and modifiers the user hid
+themselves are never re-enabled.
+"""
+
+import bpy
+import numpy as np
+
+from . import preview_quality
+from .geometry_encoder import has_object_vector
+
+# LOD tiers
+LOD_HIGH = 0
+LOD_MEDIUM = 1
+LOD_LOW = 2
+
+# Modifiers hidden in the viewport at LOD_LOW
+EXPENSIVE_MODIFIERS = ('SUBSURF', 'DISPLACE', 'WAVE')
+
+# Subdivision viewport levels at LOD_MEDIUM
+MEDIUM_SUBSURF_LEVELS = 1
+
+# Object ID property with the viewport levels LOD_MEDIUM lowered (see preview_quality.cap_viewport_levels)
+_FULL_LEVELS_KEY = "gvec_lod_full_subsurf_levels"
+
+_tiers = {}          # object name -> current LOD tier
+_hidden = {}         # object name -> modifier names hidden by the LOD manager
+_tier_counts = {LOD_HIGH: 0, LOD_MEDIUM: 0, LOD_LOW: 0}
+
+
+def tier_counts():
+    """Objects per LOD tier after the last update"""
+    return dict(_tier_counts)
+
+
+def is_lod_object(obj) -> bool:
+    """Vector-generated mesh objects are managed"""
+    return obj.type == 'MESH' and has_object_vector(obj)
+
+
+def _active_view():
+    """(region, region_3d) of the largest 3D viewport, or (None, None)"""
+    wm = bpy.context.window_manager
+    if wm is None:
+        return None, None
+    best = (None, None)
+    best_area = 0
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for region in area.regions:
+                if region.type == 'WINDOW' and region.width * region.height > best_area:
+                    best = (region, area.spaces.active.region_3d)
+                    best_area = region.width * region.height
+    return best
+
+
+def screen_sizes(objects, region, region_3d) -> np.ndarray:
+    """
+    Largest projected bounding-box extent of each object in pixels
+
+    Objects crossing the view plane count as infinitely large; objects
+    entirely behind it count as zero.
+    """
+    if not objects:
+        return np.zeros(0, dtype=np.float32)
+
+    count = len(objects)
+    corners = np.empty((count, 8, 4), dtype=np.float32)
+    for i, obj in enumerate(objects):
+        local = np.array(obj.bound_box, dtype=np.float32)
+        world = np.array(obj.matrix_world, dtype=np.float32)
+        corners[i, :, :3] = local
+        corners[i, :, 3] = 1.0
+        corners[i] = corners[i] @ world.T
+
+    clip = corners @ np.array(region_3d.perspective_matrix, dtype=np.float32).T
+    w = clip[:, :, 3]
+    in_front = w > 1e-6
+
+    safe_w = np.where(in_front, w, 1.0)
+    px = (clip[:, :, 0] / safe_w) * (region.width / 2.0)
+    py = (clip[:, :, 1] / safe_w) * (region.height / 2.0)
+    extent = np.maximum(px.max(axis=1) - px.min(axis=1), py.max(axis=1) - py.min(axis=1))
+
+    sizes = np.where(in_front.all(axis=1), extent, np.inf)
+    return np.where(in_front.any(axis=1), sizes, 0.0).astype(np.float32)
+
+
+def _target_tier(current: int, size: float, scene) -> int:
+    """Tier for a screen size, with a hysteresis band around each threshold"""
+    margin = scene.lod_hysteresis
+    high_px = scene.lod_high_px
+    low_px = scene.lod_low_px
+
+    # Moving to a finer tier needs the size to clear the threshold by the margin,
+    # moving to a coarser one needs it to drop below by the margin
+    if current == LOD_LOW:
+        if size >= high_px * (1.0 + margin):
+            return LOD_HIGH
+        if size >= low_px * (1.0 + margin):
+            return LOD_MEDIUM
+        return LOD_LOW
+    if current == LOD_MEDIUM:
+        if size >= high_px * (1.0 + margin):
+            return LOD_HIGH
+        if size < low_px * (1.0 - margin):
+            return LOD_LOW
+        return LOD_MEDIUM
+    if size < low_px * (1.0 - margin):
+        return LOD_LOW
+    if size < high_px * (1.0 - margin):
+        return LOD_MEDIUM
+    return LOD_HIGH
+
+
+def _apply_tier(obj, tier: int):
+    """Set viewport-only modifier state for a tier"""
+    hidden = _hidden.setdefault(obj.name, set())
+
+    for mod in obj.modifiers:
+        if mod.type not in EXPENSIVE_MODIFIERS:
+            continue
+
+        if tier == LOD_LOW:
+            if mod.show_viewport:
+                mod.show_viewport = False
+                hidden.add(mod.name)
+            continue
+
+        if mod.name in hidden:
+            mod.show_viewport = True
+            hidden.discard(mod.name)
+
+        if mod.type == 'SUBSURF' and tier == LOD_MEDIUM:
+            preview_quality.cap_viewport_levels(obj, mod, MEDIUM_SUBSURF_LEVELS, _FULL_LEVELS_KEY)
+
+    if tier == LOD_HIGH:
+        # Back to the levels the object had before LOD_MEDIUM, not its render levels
+        preview_quality.restore_viewport_levels(obj, _FULL_LEVELS_KEY)
+
+    if not hidden:
+        _hidden.pop(obj.name, None)
+
+
+def _restore(obj):
+    """Return an object to full viewport quality"""
+    _apply_tier(obj, LOD_HIGH)
+    _tiers.pop(obj.name, None)
+
+
+def update(scene):
+    """Measure all managed objects and move them between tiers"""
+    region, region_3d = _active_view()
+    if region is None:
+        return
+
+    objects = [obj for obj in scene.objects if is_lod_object(obj)
+               and not preview_quality.is_demoted(scene, obj)]
+    sizes = screen_sizes(objects, region, region_3d)
+
+    counts = {LOD_HIGH: 0, LOD_MEDIUM: 0, LOD_LOW: 0}
+    for obj, size in zip(objects, sizes):
+        current = _tiers.get(obj.name, LOD_HIGH)
+        tier = _target_tier(current, float(size), scene)
+        # Re-applied every pass (writes are change-only) so rebuilt modifier
+        # stacks and preview promotions pick up the current tier again
+        if tier != LOD_HIGH or current != LOD_HIGH:
+            _apply_tier(obj, tier)
+            _tiers[obj.name] = tier
+        counts[tier] += 1
+
+    _tier_counts.update(counts)
+
+
+def _lod_timer():
+    """Timer: update every scene with LOD enabled, stop when none is"""
+    interval = None
+    for scene in bpy.data.scenes:
+        if getattr(scene, "lod_enabled", False):
+            update(scene)
+            interval = scene.lod_interval if interval is None else min(interval, scene.lod_interval)
+    if interval is None:
+        restore_all()
+    return interval
+
+
+def start():
+    """Start the throttled LOD timer (no-op if already running)"""
+    if not bpy.app.timers.is_registered(_lod_timer):
+        bpy.app.timers.register(_lod_timer, first_interval=0.0)
+
+
+def restore_all():
+    """Bring every managed object back to full viewport quality"""
+    for name in list(_tiers):
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            _restore(obj)
+        else:
+            _tiers.pop(name, None)
+            _hidden.pop(name, None)
+    _tier_counts.update({LOD_HIGH: 0, LOD_MEDIUM: 0, LOD_LOW: 0})
+
+
+def stop():
+    """Stop the LOD timer and restore full quality"""
+    if bpy.app.timers.is_registered(_lod_timer):
+        bpy.app.timers.unregister(_lod_timer)
+    restore_all()
+
+
+def forget():
+    """Drop all state without touching objects (after loading a new file)"""
+    _tiers.clear()
+    _hidden.clear()
+    _tier_counts.update({LOD_HIGH: 0, LOD_MEDIUM: 0, LOD_LOW: 0})
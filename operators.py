@@ -1,18 +1,19 @@
 import bpy
 import os
 import subprocess
-import urllib.request
 import json
-import math
-import numpy as np
-from mathutils import Vector
-from .geometry_encoder import (
-    GeometryVector, GeometryEncoder, GeometryDecoder,
-    GeometryLatentSpace, get_latent_space
-)
-from .geometry_file_format import (
-    GeometryFileFormat, GeometryBatchExporter
-)
+from . import datablock_registry, preview_quality, profiler, source_mesh_cache
+from .lazy_loader import lazy_import
+
+# Heavy modules load on first operator execution, not at registration
+np = lazy_import("numpy")
+api = lazy_import(".api", __package__)
+geometry_encoder = lazy_import(".geometry_encoder", __package__)
+geometry_file_format = lazy_import(".geometry_file_format", __package__)
+vertex_cache = lazy_import(".core.vertex_cache", __package__)
+worker_farm = lazy_import(".core.worker_farm", __package__)
+library_ingest = lazy_import(".core.library_ingest", __package__)
+
 
 class MYADDON_OT_button(bpy.types.Operator):
     bl_idname = "myaddon.button"
@@ -272,6 +273,7 @@ class MYADDON_OT_fetch_api(bpy.types.Operator):
     bl_description = "Retrieve data from http://www.pcnx.cn/api/hello"
 
     def execute(self, context):
+        import urllib.request
         url = "http://www.pcnx.cn/api/hello"
         try:
             with urllib.request.urlopen(url, timeout=5) as response:
@@ -564,106 +566,7 @@ class MYADDON_OT_apply_preset(bpy.types.Operator):
 
     def execute(self, context):
         scene = context.scene
-        preset = scene.my_shape_preset
-        
-        if preset == 'SPIRAL_CORRIDOR':
-            # Spiral Corridor preset
-            scene.my_shape_dimensions = (0.5, 0.5, 1.0)
-            scene.my_shape_helix_turns = 5
-            scene.my_shape_helix_radius = 3.0
-            scene.my_shape_helix_height = 20.0
-            scene.my_shape_sphericity = 0.3
-            scene.my_shape_taper = 0.0
-            scene.my_shape_twist = 0.0
-            scene.my_shape_bend = 0.0
-            scene.my_shape_inflate = 0.0
-            scene.my_shape_wave_amplitude = 0.0
-            scene.my_shape_noise_strength = 0.0
-            self.report({'INFO'}, "Applied Spiral Corridor preset")
-            
-        elif preset == 'DNA_HELIX':
-            # DNA Double Helix preset
-            scene.my_shape_dimensions = (0.2, 0.2, 0.5)
-            scene.my_shape_helix_turns = 8
-            scene.my_shape_helix_radius = 1.5
-            scene.my_shape_helix_height = 15.0
-            scene.my_shape_sphericity = 1.0
-            scene.my_shape_taper = 0.0
-            scene.my_shape_twist = 0.0
-            scene.my_shape_bend = 0.0
-            scene.my_shape_inflate = 0.0
-            scene.my_shape_wave_amplitude = 0.0
-            scene.my_shape_noise_strength = 0.0
-            self.report({'INFO'}, "Applied DNA Helix preset")
-            
-        elif preset == 'SPRING':
-            # Spring Coil preset
-            scene.my_shape_dimensions = (0.3, 0.3, 0.3)
-            scene.my_shape_helix_turns = 10
-            scene.my_shape_helix_radius = 2.0
-            scene.my_shape_helix_height = 12.0
-            scene.my_shape_sphericity = 1.0
-            scene.my_shape_taper = 0.0
-            scene.my_shape_twist = 0.0
-            scene.my_shape_bend = 0.0
-            scene.my_shape_inflate = 0.0
-            scene.my_shape_wave_amplitude = 0.0
-            scene.my_shape_noise_strength = 0.0
-            self.report({'INFO'}, "Applied Spring Coil preset")
-            
-        elif preset == 'TWISTED_TOWER':
-            # Twisted Tower preset
-            scene.my_shape_dimensions = (1.5, 1.5, 8.0)
-            scene.my_shape_helix_turns = 0
-            scene.my_shape_helix_radius = 2.0
-            scene.my_shape_helix_height = 10.0
-            scene.my_shape_sphericity = 0.0
-            scene.my_shape_taper = 0.2
-            scene.my_shape_twist = 1.57
-            scene.my_shape_bend = 0.0
-            scene.my_shape_inflate = 0.0
-            scene.my_shape_wave_amplitude = 0.0
-            scene.my_shape_noise_strength = 0.0
-            self.report({'INFO'}, "Applied Twisted Tower preset")
-            
-        elif preset == 'FIGHTER_JET':
-            # Fighter Jet preset
-            scene.my_aircraft_fuselage_length = 12.0
-            scene.my_aircraft_wing_span = 10.0
-            scene.my_aircraft_wing_sweep = 0.785  # 45 degrees
-            scene.my_aircraft_tail_size = 3.0
-            scene.my_aircraft_engine_count = 2
-            scene.my_shape_helix_turns = 0
-            self.report({'INFO'}, "Applied Fighter Jet preset")
-            
-        elif preset == 'BOMBER':
-            # Bomber Aircraft preset
-            scene.my_aircraft_fuselage_length = 20.0
-            scene.my_aircraft_wing_span = 30.0
-            scene.my_aircraft_wing_sweep = 0.2  # Slight sweep
-            scene.my_aircraft_tail_size = 5.0
-            scene.my_aircraft_engine_count = 4
-            scene.my_shape_helix_turns = 0
-            self.report({'INFO'}, "Applied Bomber preset")
-            
-        elif preset == 'HELICOPTER':
-            # Helicopter preset
-            scene.my_aircraft_fuselage_length = 10.0
-            scene.my_aircraft_wing_span = 12.0  # Main rotor diameter
-            scene.my_aircraft_wing_sweep = 0.0
-            scene.my_aircraft_tail_size = 6.0  # Tail boom
-            scene.my_aircraft_engine_count = 1
-            scene.my_shape_helix_turns = 0
-            self.report({'INFO'}, "Applied Helicopter preset")
-            
-        elif preset == 'STAIRCASE':
-            # Staircase preset - default values already set
-            self.report({'INFO'}, "Applied Staircase preset")
-            
-        elif preset == 'CHARACTER':
-            # Character preset - default values already set
-            self.report({'INFO'}, "Applied Character preset")
-        
+        api.apply_preset_values(scene, scene.my_shape_preset, self.report)
         return {'FINISHED'}
 
 class MYADDON_OT_update_shape(bpy.types.Operator):
@@ -672,793 +575,102 @@ class MYADDON_OT_update_shape(bpy.types.Operator):
     bl_description = "Create or update the shape with given dimensions and transformations"
 
     def execute(self, context):
-        scene = context.scene
-        
-        # Clear vector editor binding when creating preset from Shape Transformer
-        # This prevents conflict between Shape Transformer workflow and Geometry Vectors workflow
-        scene.vector_source_preset = "NONE"
-        
-        dims = scene.my_shape_dimensions
-        sphericity = scene.my_shape_sphericity
-        taper = scene.my_shape_taper
-        twist = scene.my_shape_twist
-        bend = scene.my_shape_bend
-        inflate = scene.my_shape_inflate
-        wave_amp = scene.my_shape_wave_amplitude
-        wave_freq = scene.my_shape_wave_frequency
-        noise_str = scene.my_shape_noise_strength
-        noise_scale = scene.my_shape_noise_scale
-        helix_turns = scene.my_shape_helix_turns
-        helix_radius = scene.my_shape_helix_radius
-        helix_height = scene.my_shape_helix_height
-        preset = scene.my_shape_preset
-
-        # Check if we need to create aircraft structure
-        if preset in ['FIGHTER_JET', 'BOMBER', 'HELICOPTER']:
-            return self.create_aircraft(context, preset)
-        
-        # Check if we need to create staircase
-        if preset == 'STAIRCASE':
-            return self.create_staircase(context)
-        
-        # Check if we need to create character
-        if preset == 'CHARACTER':
-            return self.create_character(context)
+        api.build_shape(context, self.report)
+        return {'FINISHED'}
 
-        # Check if we need to create helix structure
-        if helix_turns > 0:
-            return self.create_helix_structure(context, dims, helix_turns, helix_radius, 
-                                              helix_height, sphericity)
 
-        # Otherwise create standard transformed shape
-        # Try to use currently selected object if it's a vector-based mesh
-        obj = None
-        active_obj = context.active_object
-        if active_obj and active_obj.type == 'MESH':
-            # Check if this is a vector-based object or the default MyShapeObject
-            has_vector_data = all(f"geom_vector_{i}" in active_obj for i in range(32))
-            if has_vector_data or active_obj.name == "MyShapeObject":
-                obj = active_obj
-                print(f"[UpdateShape] Using selected object: {obj.name}")
+class MYADDON_OT_purge_generator_garbage(bpy.types.Operator):
+    bl_idname = "myaddon.purge_generator_garbage"
+    bl_label = "Purge Generator Garbage"
+    bl_description = "Remove unused meshes, curves, materials and textures left behind by the generators"
+    
+    def execute(self, context):
+        removed, reclaimed = datablock_registry.purge(context.scene)
         
-        # Fallback to MyShapeObject or create new
-        if obj is None:
-            obj = bpy.data.objects.get("MyShapeObject")
-        if obj is None:
-            bpy.ops.mesh.primitive_cube_add(size=2.0)
-            obj = context.active_object
-            obj.name = "MyShapeObject"
+        if removed == 0:
+            self.report({'INFO'}, "No generator garbage to purge")
+        else:
+            self.report({'INFO'}, f"Purged {removed} datablocks "
+                                  f"(~{datablock_registry.format_bytes(reclaimed)} reclaimed)")
+        return {'FINISHED'}
 
-        # Clear all existing modifiers to rebuild from scratch
-        obj.modifiers.clear()
-
-        # Determine if we need subdivision (for smooth deformations)
-        needs_subdivision = (sphericity > 0.0 or inflate != 0.0 or 
-                           wave_amp > 0.0 or noise_str > 0.0)
-
-        if needs_subdivision:
-            subsurf = obj.modifiers.new(name="Subdivision", type='SUBSURF')
-            subsurf.levels = 3
-            subsurf.render_levels = 3
-
-        # 1. Sphericity (Cast to Sphere)
-        if sphericity > 0.0:
-            cast_mod = obj.modifiers.new(name="CastToSphere", type='CAST')
-            cast_mod.cast_type = 'SPHERE'
-            cast_mod.factor = sphericity
-
-        # 2. Taper (Simple Deform)
-        if taper != 0.0:
-            taper_mod = obj.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            taper_mod.deform_method = 'TAPER'
-            taper_mod.factor = taper
-            taper_mod.deform_axis = 'Z'
-
-        # 3. Twist (Simple Deform)
-        if twist != 0.0:
-            twist_mod = obj.modifiers.new(name="Twist", type='SIMPLE_DEFORM')
-            twist_mod.deform_method = 'TWIST'
-            twist_mod.angle = twist
-            twist_mod.deform_axis = 'Z'
-
-        # 4. Bend (Simple Deform)
-        if bend != 0.0:
-            bend_mod = obj.modifiers.new(name="Bend", type='SIMPLE_DEFORM')
-            bend_mod.deform_method = 'BEND'
-            bend_mod.angle = bend
-            bend_mod.deform_axis = 'Z'
-
-        # 5. Inflate/Deflate (Displace with spherical gradient)
-        if inflate != 0.0:
-            displace_mod = obj.modifiers.new(name="Inflate", type='DISPLACE')
-            displace_mod.strength = inflate * 0.5
-            displace_mod.mid_level = 0.5
-            displace_mod.direction = 'NORMAL'
-
-        # 6. Wave deformation
-        if wave_amp > 0.0:
-            wave_mod = obj.modifiers.new(name="Wave", type='WAVE')
-            wave_mod.use_cyclic = False
-            wave_mod.height = wave_amp
-            wave_mod.width = 1.0 / wave_freq if wave_freq > 0 else 1.0
-            wave_mod.time_offset = 0.0
-
-        # 7. Noise displacement
-        if noise_str > 0.0:
-            tex_name = "NoiseTexture_Shape"
-            tex = bpy.data.textures.get(tex_name)
-            if tex is None:
-                tex = bpy.data.textures.new(tex_name, 'CLOUDS')
-                tex.noise_scale = noise_scale
-            else:
-                tex.noise_scale = noise_scale
-            
-            noise_mod = obj.modifiers.new(name="Noise", type='DISPLACE')
-            noise_mod.texture = tex
-            noise_mod.strength = noise_str
-            noise_mod.direction = 'NORMAL'
 
-        # Set dimensions via scale
-        obj.scale = (dims[0] / 2.0, dims[1] / 2.0, dims[2] / 2.0)
-        obj.location = (0, 0, 0)
-        
-        self.report({'INFO'}, f"Shape updated with {len(obj.modifiers)} modifiers")
+class MYADDON_OT_clear_decode_cache(bpy.types.Operator):
+    bl_idname = "myaddon.clear_decode_cache"
+    bl_label = "Clear Decode Cache"
+    bl_description = "Drop cached decode results and reset cache statistics"
+    
+    clear_disk: bpy.props.BoolProperty(
+        name="Include Disk Tier",
+        default=False,
+        description="Also delete cached results stored on disk"
+    )
+    
+    def execute(self, context):
+        cache = api._configure_decode_cache(context.scene)
+        entries = len(cache)
+        cache.clear(disk=self.clear_disk)
+        self.report({'INFO'}, f"Cleared {entries} cached decode results")
         return {'FINISHED'}
 
-    def create_helix_structure(self, context, dims, turns, radius, height, sphericity):
-        """Create helix/spiral structure using curve and array"""
-        import math
-        
-        # Remove old objects if they exist
-        for name in ["MyShapeObject", "HelixCurve", "HelixArray"]:
-            obj = bpy.data.objects.get(name)
-            if obj:
-                bpy.data.objects.remove(obj, do_unlink=True)
-        
-        # 1. Create base object (cylinder or cube based on sphericity)
-        if sphericity > 0.5:
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=dims[0],
-                depth=dims[2],
-                location=(radius, 0, 0)
-            )
-        else:
-            bpy.ops.mesh.primitive_cube_add(size=1.0, location=(radius, 0, 0))
-        
-        base_obj = context.active_object
-        base_obj.name = "MyShapeObject"
-        base_obj.scale = (dims[0], dims[1], dims[2])
-        
-        # 2. Create helix curve path
-        curve_data = bpy.data.curves.new(name="HelixCurvePath", type='CURVE')
-        curve_data.dimensions = '3D'
-        spline = curve_data.splines.new(type='NURBS')
-        
-        # Generate helix points
-        segments = turns * 32  # points per turn
-        spline.points.add(segments - 1)  # Already has 1 point
-        
-        for i in range(segments + 1):
-            t = i / segments
-            angle = t * turns * 2 * math.pi
-            z = t * height - height / 2  # Center vertically
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            
-            if i < len(spline.points):
-                spline.points[i].co = (x, y, z, 1.0)
-        
-        curve_obj = bpy.data.objects.new("HelixCurve", curve_data)
-        context.collection.objects.link(curve_obj)
-        
-        # 3. Add Array modifier to base object
-        array_mod = base_obj.modifiers.new(name="Array", type='ARRAY')
-        array_mod.fit_type = 'FIT_CURVE'
-        array_mod.curve = curve_obj
-        array_mod.count = turns * 8  # instances
-        array_mod.use_merge_vertices = True
-        array_mod.merge_threshold = 0.01
-        
-        # 4. Add Curve modifier to follow path
-        curve_mod = base_obj.modifiers.new(name="Curve", type='CURVE')
-        curve_mod.object = curve_obj
-        curve_mod.deform_axis = 'POS_Z'
-        
-        # 5. Add smooth shading
-        if sphericity > 0.0:
-            subsurf = base_obj.modifiers.new(name="Subdivision", type='SUBSURF')
-            subsurf.levels = 2
-            subsurf.render_levels = 2
-        
-        # Hide curve object
-        curve_obj.hide_set(True)
-        curve_obj.hide_render = True
-        
-        self.report({'INFO'}, f"Helix structure created: {turns} turns, radius {radius}, height {height}")
-        return {'FINISHED'}
 
-    def create_aircraft(self, context, aircraft_type):
-        """Create aircraft structure with fuselage, wings, tail"""
-        import math
-        
-        scene = context.scene
-        fuselage_len = scene.my_aircraft_fuselage_length
-        wing_span = scene.my_aircraft_wing_span
-        wing_sweep = scene.my_aircraft_wing_sweep
-        tail_size = scene.my_aircraft_tail_size
-        engine_count = scene.my_aircraft_engine_count
-        
-        # Clear old aircraft objects
-        for obj in bpy.data.objects:
-            if obj.name.startswith(("Aircraft_", "MyShapeObject")):
-                bpy.data.objects.remove(obj, do_unlink=True)
-        
-        created_objects = []
-        
-        if aircraft_type == 'FIGHTER_JET':
-            # 1. Fuselage - streamlined, tapered
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=0.8,
-                depth=fuselage_len,
-                location=(0, 0, 0),
-                rotation=(0, math.pi/2, 0)
-            )
-            fuselage = context.active_object
-            fuselage.name = "Aircraft_Fuselage"
-            fuselage.scale = (1.0, 1.0, 1.2)  # Elongated
-            
-            # Add taper to fuselage
-            taper_mod = fuselage.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            taper_mod.deform_method = 'TAPER'
-            taper_mod.factor = 0.6
-            taper_mod.deform_axis = 'X'
-            
-            # Smooth fuselage
-            subsurf = fuselage.modifiers.new(name="Subdivision", type='SUBSURF')
-            subsurf.levels = 2
-            created_objects.append(fuselage)
-            
-            # 2. Main Wings - delta wing style
-            wing_chord = fuselage_len * 0.4
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(0, 0, -0.3)
-            )
-            wings = context.active_object
-            wings.name = "Aircraft_Wings"
-            wings.scale = (wing_chord, wing_span/2, 0.1)
-            
-            # Apply wing sweep
-            if wing_sweep != 0:
-                shear_mod = wings.modifiers.new(name="Shear", type='SIMPLE_DEFORM')
-                shear_mod.deform_method = 'TWIST'
-                shear_mod.angle = wing_sweep
-                shear_mod.deform_axis = 'Z'
-            
-            created_objects.append(wings)
-            
-            # 3. Tail stabilizers
-            # Vertical stabilizer
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(-fuselage_len*0.45, 0, tail_size*0.3)
-            )
-            vtail = context.active_object
-            vtail.name = "Aircraft_VTail"
-            vtail.scale = (tail_size*0.5, 0.1, tail_size)
-            created_objects.append(vtail)
-            
-            # Horizontal stabilizers
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(-fuselage_len*0.45, 0, 0.2)
-            )
-            htail = context.active_object
-            htail.name = "Aircraft_HTail"
-            htail.scale = (tail_size*0.6, tail_size*1.5, 0.1)
-            created_objects.append(htail)
-            
-            # 4. Engines (if any)
-            for i in range(engine_count):
-                offset_y = (i - (engine_count-1)/2) * 2.0
-                bpy.ops.mesh.primitive_cylinder_add(
-                    radius=0.4,
-                    depth=fuselage_len*0.3,
-                    location=(-fuselage_len*0.15, offset_y, -0.5),
-                    rotation=(0, math.pi/2, 0)
-                )
-                engine = context.active_object
-                engine.name = f"Aircraft_Engine_{i+1}"
-                created_objects.append(engine)
-            
-            # 5. Nose cone
-            bpy.ops.mesh.primitive_cone_add(
-                radius1=0.8,
-                depth=fuselage_len*0.15,
-                location=(fuselage_len*0.55, 0, 0),
-                rotation=(0, -math.pi/2, 0)
-            )
-            nose = context.active_object
-            nose.name = "Aircraft_Nose"
-            created_objects.append(nose)
-            
-        elif aircraft_type == 'BOMBER':
-            # 1. Fuselage - larger, cylindrical
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=1.5,
-                depth=fuselage_len,
-                location=(0, 0, 0),
-                rotation=(0, math.pi/2, 0)
-            )
-            fuselage = context.active_object
-            fuselage.name = "Aircraft_Fuselage"
-            
-            subsurf = fuselage.modifiers.new(name="Subdivision", type='SUBSURF')
-            subsurf.levels = 2
-            created_objects.append(fuselage)
-            
-            # 2. Large straight wings
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(0, 0, -0.5)
-            )
-            wings = context.active_object
-            wings.name = "Aircraft_Wings"
-            wings.scale = (fuselage_len*0.25, wing_span/2, 0.15)
-            created_objects.append(wings)
-            
-            # 3. Tail
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(-fuselage_len*0.45, 0, tail_size*0.5)
-            )
-            vtail = context.active_object
-            vtail.name = "Aircraft_VTail"
-            vtail.scale = (tail_size*0.6, 0.15, tail_size)
-            created_objects.append(vtail)
-            
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(-fuselage_len*0.45, 0, 0.5)
-            )
-            htail = context.active_object
-            htail.name = "Aircraft_HTail"
-            htail.scale = (tail_size*0.8, tail_size*2.0, 0.15)
-            created_objects.append(htail)
-            
-            # 4. Multiple engines under wings
-            for i in range(engine_count):
-                wing_pos = -wing_span/2 + (i+1) * wing_span/(engine_count+1)
-                bpy.ops.mesh.primitive_cylinder_add(
-                    radius=0.6,
-                    depth=fuselage_len*0.25,
-                    location=(fuselage_len*0.1, wing_pos, -1.2),
-                    rotation=(0, math.pi/2, 0)
-                )
-                engine = context.active_object
-                engine.name = f"Aircraft_Engine_{i+1}"
-                created_objects.append(engine)
-                
-        elif aircraft_type == 'HELICOPTER':
-            # 1. Fuselage - rounded body
-            bpy.ops.mesh.primitive_uv_sphere_add(
-                radius=1.2,
-                location=(0, 0, 0)
-            )
-            fuselage = context.active_object
-            fuselage.name = "Aircraft_Fuselage"
-            fuselage.scale = (fuselage_len*0.08, 1.0, 0.8)
-            created_objects.append(fuselage)
-            
-            # 2. Tail boom
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=0.3,
-                depth=tail_size,
-                location=(-tail_size/2 - fuselage_len*0.04, 0, 0.5),
-                rotation=(0, math.pi/2, 0)
-            )
-            tail_boom = context.active_object
-            tail_boom.name = "Aircraft_TailBoom"
-            created_objects.append(tail_boom)
-            
-            # 3. Main rotor (represented as thin disk)
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=wing_span/2,
-                depth=0.05,
-                location=(0, 0, 2.0)
-            )
-            main_rotor = context.active_object
-            main_rotor.name = "Aircraft_MainRotor"
-            created_objects.append(main_rotor)
-            
-            # 4. Rotor blades (4 blades)
-            for i in range(4):
-                angle = i * math.pi / 2
-                blade_x = (wing_span/2 - 0.5) * math.cos(angle)
-                blade_y = (wing_span/2 - 0.5) * math.sin(angle)
-                
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    location=(blade_x, blade_y, 2.05),
-                    rotation=(0, 0, angle)
-                )
-                blade = context.active_object
-                blade.name = f"Aircraft_Blade_{i+1}"
-                blade.scale = (wing_span/2 - 1, 0.2, 0.02)
-                created_objects.append(blade)
-            
-            # 5. Tail rotor
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=tail_size*0.2,
-                depth=0.05,
-                location=(-tail_size - fuselage_len*0.04, 0, 1.2),
-                rotation=(math.pi/2, 0, 0)
-            )
-            tail_rotor = context.active_object
-            tail_rotor.name = "Aircraft_TailRotor"
-            created_objects.append(tail_rotor)
-            
-            # 6. Landing skids
-            for side in [-1, 1]:
-                bpy.ops.mesh.primitive_cylinder_add(
-                    radius=0.1,
-                    depth=fuselage_len*0.06,
-                    location=(0, side * 1.5, -1.0),
-                    rotation=(0, math.pi/2, 0)
-                )
-                skid = context.active_object
-                skid.name = f"Aircraft_Skid_{side}"
-                created_objects.append(skid)
-        
-        # Join all objects into one
-        if created_objects:
-            context.view_layer.objects.active = created_objects[0]
-            for obj in created_objects:
-                obj.select_set(True)
-            bpy.ops.object.join()
-            
-            final_obj = context.active_object
-            final_obj.name = "MyShapeObject"
-            final_obj.location = (0, 0, 0)
-        
-        self.report({'INFO'}, f"{aircraft_type} created successfully")
+class MYADDON_OT_clear_source_mesh_cache(bpy.types.Operator):
+    bl_idname = "myaddon.clear_source_mesh_cache"
+    bl_label = "Clear Unused Source Meshes"
+    bl_description = ("Remove cached source meshes that no scene or object refers to any more, "
+                      "and offloaded files unused for longer than the keep period")
+    
+    def execute(self, context):
+        removed, reclaimed = source_mesh_cache.clear_unreferenced()
+        files, freed = source_mesh_cache.collect_disk_garbage(context.scene)
+        self.report({'INFO'}, f"Removed {removed} unused source meshes "
+                              f"(~{datablock_registry.format_bytes(reclaimed)} reclaimed), "
+                              f"{files} stale files ({datablock_registry.format_bytes(freed)})")
         return {'FINISHED'}
+
+
+class MYADDON_OT_profiler_reset(bpy.types.Operator):
+    bl_idname = "myaddon.profiler_reset"
+    bl_label = "Reset Profile"
+    bl_description = "Drop recorded timings and trace events"
     
-    def create_staircase(self, context):
-        """Create staircase structure"""
-        import math
-        
-        scene = context.scene
-        steps = scene.my_stair_steps
-        step_width = scene.my_stair_step_width
-        step_height = scene.my_stair_step_height
-        step_depth = scene.my_stair_step_depth
-        stair_type = scene.my_stair_type
-        
-        # Clear old objects
-        for obj in bpy.data.objects:
-            if obj.name.startswith(("Stair_", "MyShapeObject")):
-                bpy.data.objects.remove(obj, do_unlink=True)
-        
-        created_objects = []
-        
-        if stair_type == 'STRAIGHT':
-            # Create straight staircase
-            for i in range(steps):
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    location=(0, i * step_depth, i * step_height)
-                )
-                step = context.active_object
-                step.name = f"Stair_Step_{i+1:03d}"
-                step.scale = (step_width/2, step_depth/2, step_height/2)
-                created_objects.append(step)
-        
-        elif stair_type == 'SPIRAL':
-            # Create spiral staircase
-            center_radius = step_width * 0.5
-            angle_per_step = (2 * math.pi) / (steps * 0.5)  # Half rotation per full height
-            
-            for i in range(steps):
-                angle = i * angle_per_step
-                x = center_radius * math.cos(angle)
-                y = center_radius * math.sin(angle)
-                z = i * step_height
-                
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    location=(x, y, z),
-                    rotation=(0, 0, angle)
-                )
-                step = context.active_object
-                step.name = f"Stair_Step_{i+1:03d}"
-                step.scale = (step_width/2, step_depth/2, step_height/2)
-                created_objects.append(step)
-            
-            # Add center column
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=center_radius * 0.3,
-                depth=steps * step_height,
-                location=(0, 0, steps * step_height / 2)
-            )
-            column = context.active_object
-            column.name = "Stair_Column"
-            created_objects.append(column)
-        
-        elif stair_type == 'L_SHAPED':
-            # Create L-shaped staircase with landing
-            half_steps = steps // 2
-            
-            # First flight (going forward)
-            for i in range(half_steps):
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    location=(0, i * step_depth, i * step_height)
-                )
-                step = context.active_object
-                step.name = f"Stair_Step_{i+1:03d}"
-                step.scale = (step_width/2, step_depth/2, step_height/2)
-                created_objects.append(step)
-            
-            # Landing
-            landing_z = half_steps * step_height
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(step_width/2, (half_steps-1) * step_depth + step_width/2, landing_z)
-            )
-            landing = context.active_object
-            landing.name = "Stair_Landing"
-            landing.scale = (step_width, step_width, step_height/2)
-            created_objects.append(landing)
-            
-            # Second flight (going right)
-            remaining_steps = steps - half_steps
-            for i in range(remaining_steps):
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    location=(step_width + i * step_depth, 
-                             (half_steps-1) * step_depth + step_width/2,
-                             landing_z + (i+1) * step_height)
-                )
-                step = context.active_object
-                step.name = f"Stair_Step_{half_steps+i+1:03d}"
-                step.scale = (step_depth/2, step_width/2, step_height/2)
-                created_objects.append(step)
-        
-        # Join all objects into one
-        if created_objects:
-            context.view_layer.objects.active = created_objects[0]
-            for obj in created_objects:
-                obj.select_set(True)
-            bpy.ops.object.join()
-            
-            final_obj = context.active_object
-            final_obj.name = "MyShapeObject"
-            final_obj.location = (0, 0, 0)
-        
-        self.report({'INFO'}, f"{stair_type} staircase created with {steps} steps")
+    def execute(self, context):
+        profiler.reset()
+        self.report({'INFO'}, "Profiling data cleared")
         return {'FINISHED'}
+
+
+class MYADDON_OT_profiler_export_trace(bpy.types.Operator):
+    """Write recorded calls as a Chrome trace (chrome://tracing, Perfetto)"""
+    bl_idname = "myaddon.profiler_export_trace"
+    bl_label = "Export Chrome Trace"
+    bl_description = "Save recorded operator, handler and I/O calls as a trace_event JSON file"
     
-    def create_character(self, context):
-        """Create basic character model"""
-        import math
-        
-        scene = context.scene
-        gender = scene.my_character_gender
-        age = scene.my_character_age
-        height = scene.my_character_height
-        build = scene.my_character_build
-        
-        # Clear old objects
-        for obj in bpy.data.objects:
-            if obj.name.startswith(("Char_", "MyShapeObject")):
-                bpy.data.objects.remove(obj, do_unlink=True)
-        
-        created_objects = []
-        
-        # Scale factors based on age
-        age_scale = {
-            'CHILD': 0.6,
-            'TEEN': 0.85,
-            'ADULT': 1.0,
-            'ELDER': 0.95
-        }
-        scale_factor = age_scale[age]
-        adjusted_height = height * scale_factor
-        
-        # Body proportions (based on adult proportions)
-        head_size = adjusted_height * 0.12
-        torso_height = adjusted_height * 0.35
-        torso_width = head_size * 1.2 * build
-        torso_depth = head_size * 0.8 * build
-        leg_length = adjusted_height * 0.45
-        leg_thickness = head_size * 0.35 * build
-        arm_length = adjusted_height * 0.35
-        arm_thickness = head_size * 0.25 * build
-        
-        # Gender-specific adjustments
-        if gender == 'FEMALE':
-            torso_width *= 0.85
-            shoulder_width = torso_width * 1.3
-            hip_width = torso_width * 1.2
-            leg_thickness *= 0.9
-            arm_thickness *= 0.85
-        else:
-            shoulder_width = torso_width * 1.5
-            hip_width = torso_width * 0.95
-        
-        # Age-specific adjustments
-        if age == 'CHILD':
-            head_size *= 1.3  # Children have proportionally larger heads
-            leg_thickness *= 1.1
-            arm_thickness *= 1.1
-        elif age == 'ELDER':
-            torso_height *= 0.95  # Slightly shorter torso
-            shoulder_width *= 0.9
-        
-        # 1. Head
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            radius=head_size/2,
-            location=(0, 0, adjusted_height - head_size/2)
-        )
-        head = context.active_object
-        head.name = "Char_Head"
-        head.scale = (1.0, 0.9, 1.1)  # Slightly elongated
-        created_objects.append(head)
-        
-        # 2. Neck
-        neck_height = adjusted_height * 0.05
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=head_size * 0.25,
-            depth=neck_height,
-            location=(0, 0, adjusted_height - head_size - neck_height/2)
-        )
-        neck = context.active_object
-        neck.name = "Char_Neck"
-        created_objects.append(neck)
-        
-        # 3. Upper Torso (chest)
-        chest_z = adjusted_height - head_size - neck_height - torso_height * 0.3
-        bpy.ops.mesh.primitive_cube_add(
-            size=1.0,
-            location=(0, 0, chest_z)
-        )
-        chest = context.active_object
-        chest.name = "Char_Chest"
-        chest.scale = (shoulder_width/2, torso_depth/2, torso_height * 0.3)
-        
-        # Add subdivision for smooth body
-        subsurf = chest.modifiers.new(name="Subdivision", type='SUBSURF')
-        subsurf.levels = 2
-        created_objects.append(chest)
-        
-        # 4. Lower Torso (abdomen and hips)
-        abdomen_z = chest_z - torso_height * 0.35
-        bpy.ops.mesh.primitive_cube_add(
-            size=1.0,
-            location=(0, 0, abdomen_z)
-        )
-        abdomen = context.active_object
-        abdomen.name = "Char_Abdomen"
-        abdomen.scale = ((shoulder_width + hip_width) / 4, torso_depth/2, torso_height * 0.35)
-        
-        subsurf = abdomen.modifiers.new(name="Subdivision", type='SUBSURF')
-        subsurf.levels = 2
-        created_objects.append(abdomen)
-        
-        # 5. Legs
-        leg_z = abdomen_z - torso_height * 0.35 - leg_length/2
-        leg_separation = hip_width * 0.4
-        
-        for side in [-1, 1]:
-            # Upper leg (thigh)
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=leg_thickness,
-                depth=leg_length * 0.55,
-                location=(side * leg_separation, 0, leg_z + leg_length * 0.225)
-            )
-            thigh = context.active_object
-            thigh.name = f"Char_Thigh_{['L', 'R'][side>0]}"
-            
-            # Taper modifier for natural leg shape
-            taper_mod = thigh.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            taper_mod.deform_method = 'TAPER'
-            taper_mod.factor = -0.3
-            taper_mod.deform_axis = 'Z'
-            
-            created_objects.append(thigh)
-            
-            # Lower leg (calf)
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=leg_thickness * 0.7,
-                depth=leg_length * 0.45,
-                location=(side * leg_separation, 0, leg_z - leg_length * 0.275)
-            )
-            calf = context.active_object
-            calf.name = f"Char_Calf_{['L', 'R'][side>0]}"
-            
-            taper_mod = calf.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            taper_mod.deform_method = 'TAPER'
-            taper_mod.factor = -0.2
-            taper_mod.deform_axis = 'Z'
-            
-            created_objects.append(calf)
-            
-            # Foot
-            foot_z = leg_z - leg_length/2 - head_size * 0.15
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(side * leg_separation, head_size * 0.15, foot_z)
-            )
-            foot = context.active_object
-            foot.name = f"Char_Foot_{['L', 'R'][side>0]}"
-            foot.scale = (leg_thickness * 0.8, head_size * 0.4, head_size * 0.2)
-            created_objects.append(foot)
-        
-        # 6. Arms
-        arm_z = chest_z
-        arm_separation = shoulder_width * 0.6
-        
-        for side in [-1, 1]:
-            # Upper arm
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=arm_thickness,
-                depth=arm_length * 0.5,
-                location=(side * arm_separation, 0, arm_z - arm_length * 0.25)
-            )
-            upper_arm = context.active_object
-            upper_arm.name = f"Char_UpperArm_{['L', 'R'][side>0]}"
-            
-            taper_mod = upper_arm.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            taper_mod.deform_method = 'TAPER'
-            taper_mod.factor = -0.25
-            taper_mod.deform_axis = 'Z'
-            
-            created_objects.append(upper_arm)
-            
-            # Lower arm (forearm)
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=arm_thickness * 0.8,
-                depth=arm_length * 0.5,
-                location=(side * arm_separation, 0, arm_z - arm_length * 0.75)
-            )
-            forearm = context.active_object
-            forearm.name = f"Char_Forearm_{['L', 'R'][side>0]}"
-            
-            taper_mod = forearm.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            taper_mod.deform_method = 'TAPER'
-            taper_mod.factor = -0.2
-            taper_mod.deform_axis = 'Z'
-            
-            created_objects.append(forearm)
-            
-            # Hand
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                location=(side * arm_separation, 0, arm_z - arm_length - head_size * 0.1)
-            )
-            hand = context.active_object
-            hand.name = f"Char_Hand_{['L', 'R'][side>0]}"
-            hand.scale = (arm_thickness * 0.6, arm_thickness * 0.8, head_size * 0.15)
-            
-            subsurf = hand.modifiers.new(name="Subdivision", type='SUBSURF')
-            subsurf.levels = 1
-            
-            created_objects.append(hand)
-        
-        # Join all objects into one
-        if created_objects:
-            context.view_layer.objects.active = created_objects[0]
-            for obj in created_objects:
-                obj.select_set(True)
-            bpy.ops.object.join()
-            
-            final_obj = context.active_object
-            final_obj.name = "MyShapeObject"
-            final_obj.location = (0, 0, 0)
-        
-        self.report({'INFO'}, f"{age} {gender} character created (height: {adjusted_height:.2f}m)")
+    filepath: bpy.props.StringProperty(
+        name="File Path",
+        description="Path to save the trace",
+        subtype='FILE_PATH'
+    )
+    
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(
+        default="*.json",
+        options={'HIDDEN'}
+    )
+    
+    def execute(self, context):
+        try:
+            count = profiler.write_chrome_trace(bpy.path.abspath(self.filepath))
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write trace: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {count} trace events to {self.filepath}")
         return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        self.filepath = "gvec_trace.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
 
 class MYADDON_OT_encode_geometry(bpy.types.Operator):
@@ -1473,7 +685,7 @@ class MYADDON_OT_encode_geometry(bpy.types.Operator):
         obj = None
         active_obj = context.active_object
         if active_obj and active_obj.type == 'MESH':
-            has_vector_data = all(f"geom_vector_{i}" in active_obj for i in range(32))
+            has_vector_data = geometry_encoder.has_object_vector(active_obj)
             if has_vector_data or active_obj.name == "MyShapeObject":
                 obj = active_obj
         
@@ -1483,10 +695,10 @@ class MYADDON_OT_encode_geometry(bpy.types.Operator):
         
         # Encode current preset
         preset = scene.my_shape_preset
-        vec = GeometryEncoder.encode_preset(preset, scene)
+        vec = geometry_encoder.GeometryEncoder.encode_preset(preset, scene)
         
         # Store in latent space
-        latent_space = get_latent_space()
+        latent_space = geometry_encoder.get_latent_space()
         latent_space.add_geometry(f"preset_{preset}", vec)
         
         # Display vector info
@@ -1572,21 +784,18 @@ class MYADDON_OT_interpolate_geometry(bpy.types.Operator):
         scene = context.scene
         
         # Encode both presets
-        vec_a = GeometryEncoder.encode_preset(self.preset_a, scene)
-        vec_b = GeometryEncoder.encode_preset(self.preset_b, scene)
+        vec_a = api.encode_preset(self.preset_a, scene)
+        vec_b = api.encode_preset(self.preset_b, scene)
         
         # Interpolate
-        vec_interpolated = vec_a.interpolate(vec_b, self.interpolation_factor)
+        vec_interpolated = api.interpolate(vec_a, vec_b, self.interpolation_factor)
         
-        # Decode back to scene parameters
-        GeometryDecoder.decode_to_scene(vec_interpolated, scene)
-        
-        # Update the shape
-        bpy.ops.myaddon.update_shape()
+        # Decode back to scene parameters and update the shape
+        cached = api.decode(vec_interpolated, context, self.report)
         
         self.report({'INFO'}, 
                    f"Interpolated: {self.preset_a}({1-self.interpolation_factor:.1f}) + "
-                   f"{self.preset_b}({self.interpolation_factor:.1f})")
+                   f"{self.preset_b}({self.interpolation_factor:.1f})" + (" (cached)" if cached else ""))
         
         return {'FINISHED'}
 
@@ -1671,7 +880,7 @@ class MYADDON_OT_blend_geometry(bpy.types.Operator):
     
     def execute(self, context):
         scene = context.scene
-        latent_space = get_latent_space()
+        latent_space = geometry_encoder.get_latent_space()
         
         # Collect presets and weights
         presets = [self.preset_1, self.preset_2]
@@ -1681,25 +890,20 @@ class MYADDON_OT_blend_geometry(bpy.types.Operator):
             presets.append(self.preset_3)
             weights.append(self.weight_3)
         
-        # Encode presets
+        # Encode presets (kept in the latent space for Find Similar)
+        vectors = []
         for preset in presets:
-            vec = GeometryEncoder.encode_preset(preset, scene)
+            vec = api.encode_preset(preset, scene)
             latent_space.add_geometry(preset, vec)
+            vectors.append(vec)
         
         # Blend
-        blended_vec = latent_space.blend_geometries(presets, weights)
-        
-        if blended_vec is None:
-            self.report({'ERROR'}, "Failed to blend geometries")
-            return {'CANCELLED'}
+        blended_vec = api.blend(vectors, weights)
         
-        # Decode
-        GeometryDecoder.decode_to_scene(blended_vec, scene)
+        # Decode and update
+        cached = api.decode(blended_vec, context, self.report)
         
-        # Update
-        bpy.ops.myaddon.update_shape()
-        
-        self.report({'INFO'}, f"Blended {len(presets)} geometries")
+        self.report({'INFO'}, f"Blended {len(presets)} geometries" + (" (cached)" if cached else ""))
         return {'FINISHED'}
 
 
@@ -1715,7 +919,7 @@ class MYADDON_OT_find_similar_geometry(bpy.types.Operator):
         obj = None
         active_obj = context.active_object
         if active_obj and active_obj.type == 'MESH':
-            has_vector_data = all(f"geom_vector_{i}" in active_obj for i in range(32))
+            has_vector_data = geometry_encoder.has_object_vector(active_obj)
             if has_vector_data or active_obj.name == "MyShapeObject":
                 obj = active_obj
         
@@ -1728,15 +932,15 @@ class MYADDON_OT_find_similar_geometry(bpy.types.Operator):
             return {'CANCELLED'}
         
         # Encode current object
-        current_vec = GeometryEncoder.encode_object(obj)
+        current_vec = geometry_encoder.GeometryEncoder.encode_object(obj)
         
         # Initialize latent space with all presets
-        latent_space = get_latent_space()
+        latent_space = geometry_encoder.get_latent_space()
         presets = ['SPIRAL_CORRIDOR', 'DNA_HELIX', 'SPRING', 'TWISTED_TOWER',
                    'FIGHTER_JET', 'BOMBER', 'HELICOPTER', 'STAIRCASE', 'CHARACTER']
         
         for preset in presets:
-            vec = GeometryEncoder.encode_preset(preset, scene)
+            vec = geometry_encoder.GeometryEncoder.encode_preset(preset, scene)
             latent_space.add_geometry(preset, vec)
         
         # Find neighbors
@@ -1979,407 +1183,157 @@ class MYADDON_OT_vector_decode_and_render(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        scene = context.scene
-        
-        # Convert scene properties to GeometryVector
-        import numpy as np
-        vec_array = np.array([scene.geom_vector_current[i] for i in range(32)])
-        geom_vec = GeometryVector(vec_array)
-        
-        # Check if user wants to update an existing object
-        active_obj = context.active_object
-        update_existing = False
-        
-        if active_obj and active_obj.type == 'MESH':
-            # Check if this object has vector data (was created/imported with vectors)
-            has_vector_data = all(f"geom_vector_{i}" in active_obj for i in range(32))
-            source = active_obj.get("geometry_vector_source", "unknown")
-            
-            # Allow updating for all vector-based objects
-            # Only exclude "unknown" source (objects without proper vector metadata)
-            if has_vector_data and source != "unknown":
-                # This is a vector-based object, update it instead of creating new one
-                update_existing = True
-                print(f"[Decode&Render] Updating existing object: {active_obj.name} (source: {source})")
-        
-        if update_existing:
-            # Update existing object with new vector parameters
-            self._update_object_with_vector(context, active_obj, geom_vec, scene)
-            self.report({'INFO'}, f"Updated {active_obj.name} with new vector parameters")
-        else:
-            # Create new object from vector
-            # Decode to scene parameters first
-            GeometryDecoder.decode_to_scene(geom_vec, scene)
-            
-            # Check if this vector came from a preset
-            if scene.vector_source_preset and scene.vector_source_preset != "NONE":
-                # Vector from preset - use preset-based workflow
-                target_preset = scene.vector_source_preset
-                scene.my_shape_preset = target_preset
-                
-                # First decode vector to scene parameters (for parameters-based presets)
-                GeometryDecoder.decode_to_scene(geom_vec, scene)
-                
-                # Apply the preset to set parameters
-                bpy.ops.myaddon.apply_preset()
-                
-                # Create the actual geometry from the preset
-                # This will call create_aircraft/create_staircase/create_character for complex presets
-                # or create standard shape with modifiers for parametric presets
-                bpy.ops.myaddon.update_shape()
-                
-                # Get the created preset object
-                preset_obj = context.active_object
-                
-                if preset_obj:
-                    # Now apply vector modifications on top of preset
-                    self._apply_vector_modifiers(preset_obj, geom_vec)
-                    
-                    # Store vector data
-                    for i in range(32):
-                        preset_obj[f"geom_vector_{i}"] = float(geom_vec.vector[i])
-                    
-                    preset_obj["geometry_vector_source"] = "preset"
-                    preset_obj["geometry_vector_version"] = "1.0"
-                    preset_obj["geometry_vector_preset_name"] = target_preset  # Save preset name!
-                    preset_obj["geometry_vector_mesh_verts"] = len(preset_obj.data.vertices)
-                    preset_obj["geometry_vector_mesh_faces"] = len(preset_obj.data.polygons)
-                
-                self.report({'INFO'}, f"Decoded and rendered as {target_preset} with vector modifications")
-            else:
-                # Vector from external file or custom object - generate directly from parameters
-                # Create a parametric object based on decoded parameters
-                self._create_geometry_from_vector(context, geom_vec, scene)
-                
-                self.report({'INFO'}, "Decoded and rendered from vector parameters")
-        
+        geom_vec = geometry_encoder.GeometryVector(np.array(context.scene.geom_vector_current))
+        api.decode_and_render(geom_vec, context, self.report)
         return {'FINISHED'}
-    
-    def _update_object_with_vector(self, context, obj, vec, scene):
-        """Update existing object with new vector parameters"""
-        # Remove all existing modifiers
-        obj.modifiers.clear()
-        
-        # Get the base mesh (before any modifications)
-        # If object was manually edited, we can't safely update it
-        source = obj.get("geometry_vector_source", "unknown")
-        
-        if source == "manual_edit":
-            # Object was manually edited - warn user
-            self.report({'WARNING'}, 
-                       "Object was manually edited. Creating new object to preserve edits.")
-            # Create new object instead
-            self._create_geometry_from_vector(context, vec, scene)
-            return
-        
-        # Update transformations
-        obj.scale = (
-            vec.vector[GeometryVector.IDX_SCALE_X],
-            vec.vector[GeometryVector.IDX_SCALE_Y],
-            vec.vector[GeometryVector.IDX_SCALE_Z]
-        )
-        obj.location = (
-            vec.vector[GeometryVector.IDX_LOC_X],
-            vec.vector[GeometryVector.IDX_LOC_Y],
-            vec.vector[GeometryVector.IDX_LOC_Z]
-        )
-        obj.rotation_euler = (
-            vec.vector[GeometryVector.IDX_ROT_X],
-            vec.vector[GeometryVector.IDX_ROT_Y],
-            vec.vector[GeometryVector.IDX_ROT_Z]
-        )
-        
-        # Reapply modifiers from vector
-        self._apply_vector_modifiers(obj, vec)
-        
-        # Update stored vector data
-        for i in range(32):
-            obj[f"geom_vector_{i}"] = float(vec.vector[i])
-        
-        # Update mesh fingerprint
-        obj["geometry_vector_mesh_verts"] = len(obj.data.vertices)
-        obj["geometry_vector_mesh_faces"] = len(obj.data.polygons)
+
+
+class _LiveDecodeSession:
+    """
+    Timer-driven live decode of scene.geom_vector_current
+
+    Every tick compares the vector against the last seen state. Edits are
+    coalesced: while changes keep arriving, at most one decode runs per
+    debounce window (or per last decode duration, whichever is longer) and
+    it always uses the newest vector, so intermediate slider states are
+    skipped instead of queued.
+    """
+    
+    TICK_INTERVAL = 1.0 / 60.0
+    RATE_WINDOW = 1.0
+    
+    def __init__(self):
+        self.running = False
+        self.target_name = None
+        self.last_seen = None
+        self.pending = False
+        self.last_decode_time = 0.0
+        self.last_decode_duration = 0.0
+        self.decode_times = []
+    
+    def start(self):
+        self.running = True
+        self.target_name = None
+        self.last_seen = None
+        self.pending = False
+        self.decode_times = []
+        if not bpy.app.timers.is_registered(_live_decode_tick):
+            bpy.app.timers.register(_live_decode_tick, first_interval=self.TICK_INTERVAL)
+    
+    def stop(self):
+        self.running = False
+        if bpy.app.timers.is_registered(_live_decode_tick):
+            bpy.app.timers.unregister(_live_decode_tick)
+        scene = bpy.context.scene
+        if scene is not None:
+            scene.vector_live_decode_rate = 0.0
+    
+    def tick(self):
+        import time
+        
+        if not self.running:
+            return None
         
-        print(f"[Decode&Render] Updated object with new parameters")
+        scene = bpy.context.scene
+        view_layer = bpy.context.view_layer
+        if scene is None or view_layer is None:
+            return self.TICK_INTERVAL
+        
+        obj = view_layer.objects.active
+        if not _is_live_decode_target(obj):
+            self.target_name = None
+            return self.TICK_INTERVAL
+        
+        snapshot = tuple(scene.geom_vector_current)
+        if obj.name != self.target_name:
+            # New target (auto-bind may have just loaded its vector): sync, don't decode
+            self.target_name = obj.name
+            self.last_seen = snapshot
+            self.pending = False
+            return self.TICK_INTERVAL
+        
+        now = time.perf_counter()
+        if snapshot != self.last_seen:
+            self.last_seen = snapshot
+            self.pending = True
+        
+        window = max(scene.vector_live_decode_debounce, self.last_decode_duration)
+        if self.pending and now - self.last_decode_time >= window:
+            self.pending = False
+            start = time.perf_counter()
+            _live_decode_object(obj, geometry_encoder.GeometryVector(np.array(snapshot)))
+            preview_quality.mark_interaction(scene, obj)
+            self.last_decode_time = time.perf_counter()
+            self.last_decode_duration = self.last_decode_time - start
+            self.decode_times.append(self.last_decode_time)
+        
+        # Achieved updates per second over the last rate window
+        cutoff = now - self.RATE_WINDOW
+        while self.decode_times and self.decode_times[0] < cutoff:
+            self.decode_times.pop(0)
+        rate = len(self.decode_times) / self.RATE_WINDOW
+        if abs(scene.vector_live_decode_rate - rate) > 0.01:
+            scene.vector_live_decode_rate = rate
+        
+        return self.TICK_INTERVAL
+
+
+live_decode_session = _LiveDecodeSession()
+
+
+def _live_decode_tick():
+    # Module-level so bpy.app.timers sees the same callable on register and unregister
+    return live_decode_session.tick()
+
+
+def _is_live_decode_target(obj):
+    """Objects live decode can update in place: vector-based meshes not manually edited"""
+    if obj is None or obj.type != 'MESH':
+        return False
+    if obj.get("geometry_vector_source", "unknown") in ("unknown", "manual_edit"):
+        return False
+    return geometry_encoder.has_object_vector(obj)
+
+
+def _live_decode_object(obj, vec):
+    """Rebuild transform and modifiers of a vector-based object from a vector"""
+    obj.modifiers.clear()
+    api.apply_vector_transform(obj, vec)
+    api.apply_vector_modifiers(obj, vec)
+    geometry_encoder.set_object_vector(obj, vec)
+
+
+class MYADDON_OT_vector_live_decode(bpy.types.Operator):
+    bl_idname = "myaddon.vector_live_decode"
+    bl_label = "Live Decode"
+    bl_description = ("Toggle live decoding: edits to the vector are applied to the active "
+                      "vector-based object while you scrub (Esc to stop)")
     
-    def _apply_vector_modifiers(self, obj, vec):
-        """Apply modifiers based on vector parameters"""
-        import math
-        
-        # Apply sphericity
-        sphericity = vec.vector[GeometryVector.IDX_SPHERICITY]
-        if abs(sphericity) > 0.01:
-            mod = obj.modifiers.new(name="Sphericity", type='CAST')
-            mod.factor = sphericity
-            mod.cast_type = 'SPHERE'
-        
-        # Apply taper
-        taper = vec.vector[GeometryVector.IDX_TAPER]
-        if abs(taper) > 0.01:
-            mod = obj.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-            mod.deform_method = 'TAPER'
-            mod.factor = taper
-        
-        # Apply twist
-        twist = vec.vector[GeometryVector.IDX_TWIST] * 2 * 3.14159
-        if abs(twist) > 0.01:
-            mod = obj.modifiers.new(name="Twist", type='SIMPLE_DEFORM')
-            mod.deform_method = 'TWIST'
-            mod.angle = twist
-        
-        # Apply bend
-        bend = vec.vector[GeometryVector.IDX_BEND] * 2 * 3.14159
-        if abs(bend) > 0.01:
-            mod = obj.modifiers.new(name="Bend", type='SIMPLE_DEFORM')
-            mod.deform_method = 'BEND'
-            mod.angle = bend
-        
-        # Apply elongation
-        elongation = vec.vector[GeometryVector.IDX_ELONGATION]
-        if abs(elongation - 0.33) > 0.05:
-            mod = obj.modifiers.new(name="Elongation", type='SIMPLE_DEFORM')
-            mod.deform_method = 'STRETCH'
-            mod.factor = (elongation - 0.33) * 3.0
-        
-        # Apply wave
-        wave_amplitude = vec.vector[GeometryVector.IDX_WAVE_AMP]
-        if abs(wave_amplitude) > 0.01:
-            mod = obj.modifiers.new(name="Wave", type='WAVE')
-            mod.height = wave_amplitude
-            mod.width = vec.vector[GeometryVector.IDX_WAVE_FREQ] * 2.0 if vec.vector[GeometryVector.IDX_WAVE_FREQ] > 0.01 else 1.0
-        
-        # Apply noise
-        noise_strength = vec.vector[GeometryVector.IDX_NOISE_STRENGTH]
-        if abs(noise_strength) > 0.01:
-            mod = obj.modifiers.new(name="Noise", type='DISPLACE')
-            mod.strength = noise_strength
-            tex = bpy.data.textures.new("NoiseTexture", type='CLOUDS')
-            tex.noise_scale = vec.vector[GeometryVector.IDX_NOISE_SCALE] * 2.0 if vec.vector[GeometryVector.IDX_NOISE_SCALE] > 0.01 else 1.0
-            mod.texture = tex
-        
-        # Apply subdivision
-        curvature = vec.vector[GeometryVector.IDX_CURVATURE]
-        if curvature > 0.1:
-            mod = obj.modifiers.new(name="Subdivision", type='SUBSURF')
-            mod.levels = max(1, min(3, int(curvature * 5)))
-            mod.render_levels = mod.levels
-        
-        # Apply smoothness
-        smoothness = vec.vector[GeometryVector.IDX_SMOOTHNESS]
-        if smoothness > 0.1:
-            has_subsurf = any(m.type == 'SUBSURF' for m in obj.modifiers)
-            if not has_subsurf:
-                mod = obj.modifiers.new(name="Smoothness", type='SUBSURF')
-                mod.levels = max(1, min(3, int(smoothness * 3)))
-                mod.render_levels = mod.levels
-        
-        # Apply edge sharpness
-        edge_sharpness = vec.vector[GeometryVector.IDX_EDGE_SHARPNESS]
-        if edge_sharpness > 0.1:
-            mod = obj.modifiers.new(name="EdgeSharp", type='EDGE_SPLIT')
-            mod.split_angle = math.radians(180 * (1 - edge_sharpness))
-            mod.use_edge_angle = True
+    def invoke(self, context, event):
+        if live_decode_session.running:
+            live_decode_session.stop()
+            self.report({'INFO'}, "Live decode stopped")
+            return {'FINISHED'}
         
-        # Apply inflation
-        inflation = vec.vector[GeometryVector.IDX_INFLATION]
-        if abs(inflation) > 0.01:
-            mod = obj.modifiers.new(name="Inflate", type='DISPLACE')
-            mod.strength = inflation * 0.5
-            mod.direction = 'NORMAL'
+        if not _is_live_decode_target(context.active_object):
+            self.report({'WARNING'}, "Select a vector-based object to live decode")
+            return {'CANCELLED'}
         
-        # Apply randomness
-        randomness = vec.vector[GeometryVector.IDX_RANDOMNESS]
-        if randomness > 0.01:
-            mod = obj.modifiers.new(name="Random", type='DISPLACE')
-            mod.strength = randomness * 0.1
-            tex_name = f"RandomTex_{obj.name}"
-            tex = bpy.data.textures.get(tex_name)
-            if not tex:
-                tex = bpy.data.textures.new(tex_name, type='CLOUDS')
-                tex.noise_scale = 5.0
-            mod.texture = tex
+        live_decode_session.start()
+        context.window_manager.modal_handler_add(self)
+        self.report({'INFO'}, "Live decode started (Esc to stop)")
+        return {'RUNNING_MODAL'}
     
-    def _create_geometry_from_vector(self, context, vec, scene):
-        """Create geometry directly from vector parameters without using presets"""
-        import bmesh
-        from mathutils import Vector, Matrix
-        
-        # Check if we have a cached source mesh from file import
-        has_source_mesh = scene.vector_source_mesh and scene.vector_source_mesh in bpy.data.meshes
-        
-        if has_source_mesh:
-            # Use the original imported mesh as base - this is already a complete geometry
-            source_mesh = bpy.data.meshes[scene.vector_source_mesh]
-            mesh = source_mesh.copy()
-            mesh.name = "DecodedGeometry"
-        else:
-            # No source mesh - create parametric geometry from scratch
-            # Create base mesh - start with a subdivided cube for flexibility
-            bm = bmesh.new()
-            bmesh.ops.create_cube(bm, size=1.0)
-            
-            # Subdivide for more detail
-            bmesh.ops.subdivide_edges(bm, edges=bm.edges, cuts=2, use_grid_fill=True)
-            
-            # Create mesh
-            mesh = bpy.data.meshes.new("DecodedGeometry")
-            bm.to_mesh(mesh)
-            bm.free()
-        
-        # Remove old decoded object if exists
-        old_obj = bpy.data.objects.get("DecodedGeometry")
-        if old_obj:
-            bpy.data.objects.remove(old_obj, do_unlink=True)
-        
-        # Create new object
-        obj = bpy.data.objects.new("DecodedGeometry", mesh)
-        context.scene.collection.objects.link(obj)
-        
-        # Get scale from vector
-        scale_x = vec.vector[GeometryVector.IDX_SCALE_X]
-        scale_y = vec.vector[GeometryVector.IDX_SCALE_Y]
-        scale_z = vec.vector[GeometryVector.IDX_SCALE_Z]
-        
-        # Apply scale
-        obj.scale = (scale_x, scale_y, scale_z)
-        
-        # Get location from vector
-        loc_x = vec.vector[GeometryVector.IDX_LOC_X]
-        loc_y = vec.vector[GeometryVector.IDX_LOC_Y]
-        loc_z = vec.vector[GeometryVector.IDX_LOC_Z]
-        
-        # Apply location
-        obj.location = (loc_x, loc_y, loc_z)
-        
-        # Get rotation from vector
-        rot_x = vec.vector[GeometryVector.IDX_ROT_X]
-        rot_y = vec.vector[GeometryVector.IDX_ROT_Y]
-        rot_z = vec.vector[GeometryVector.IDX_ROT_Z]
-        
-        # Apply rotation (rotation is stored in radians in the vector)
-        obj.rotation_euler = (rot_x, rot_y, rot_z)
-        
-        # If this is from a cached source mesh (imported file), 
-        # DO NOT apply parametric modifiers - the geometry is already complete
-        # Only apply basic transforms (scale, rotation) that were encoded
-        if not has_source_mesh:
-            # Only apply parametric modifiers for generated geometry (not imported)
-            # Apply topology transforms through modifiers
-            sphericity = vec.vector[GeometryVector.IDX_SPHERICITY]
-            if abs(sphericity) > 0.01:
-                mod = obj.modifiers.new(name="Sphericity", type='CAST')
-                mod.factor = sphericity
-                mod.cast_type = 'SPHERE'
-            
-            taper = vec.vector[GeometryVector.IDX_TAPER]
-            if abs(taper) > 0.01:
-                mod = obj.modifiers.new(name="Taper", type='SIMPLE_DEFORM')
-                mod.deform_method = 'TAPER'
-                mod.factor = taper
-            
-            twist = vec.vector[GeometryVector.IDX_TWIST] * 2 * 3.14159
-            if abs(twist) > 0.01:
-                mod = obj.modifiers.new(name="Twist", type='SIMPLE_DEFORM')
-                mod.deform_method = 'TWIST'
-                mod.angle = twist
-            
-            bend = vec.vector[GeometryVector.IDX_BEND] * 2 * 3.14159
-            if abs(bend) > 0.01:
-                mod = obj.modifiers.new(name="Bend", type='SIMPLE_DEFORM')
-                mod.deform_method = 'BEND'
-                mod.angle = bend
-            
-            # Apply elongation as stretch deformation
-            elongation = vec.vector[GeometryVector.IDX_ELONGATION]
-            if abs(elongation - 0.33) > 0.05:  # 0.33 is neutral elongation
-                mod = obj.modifiers.new(name="Elongation", type='SIMPLE_DEFORM')
-                mod.deform_method = 'STRETCH'
-                mod.factor = (elongation - 0.33) * 3.0
-            
-            # Apply wave deformation
-            wave_amplitude = vec.vector[GeometryVector.IDX_WAVE_AMP]
-            if abs(wave_amplitude) > 0.01:
-                mod = obj.modifiers.new(name="Wave", type='WAVE')
-                mod.height = wave_amplitude
-                mod.width = vec.vector[GeometryVector.IDX_WAVE_FREQ] * 2.0 if vec.vector[GeometryVector.IDX_WAVE_FREQ] > 0.01 else 1.0
-            
-            # Apply noise displacement
-            noise_strength = vec.vector[GeometryVector.IDX_NOISE_STRENGTH]
-            if abs(noise_strength) > 0.01:
-                mod = obj.modifiers.new(name="Noise", type='DISPLACE')
-                mod.strength = noise_strength
-                # Create texture for noise
-                tex = bpy.data.textures.new("NoiseTexture", type='CLOUDS')
-                tex.noise_scale = vec.vector[GeometryVector.IDX_NOISE_SCALE] * 2.0 if vec.vector[GeometryVector.IDX_NOISE_SCALE] > 0.01 else 1.0
-                mod.texture = tex
-            
-            # Add subdivision surface for smoothness (from old curvature)
-            curvature = vec.vector[GeometryVector.IDX_CURVATURE]
-            if curvature > 0.1:
-                mod = obj.modifiers.new(name="Subdivision", type='SUBSURF')
-                mod.levels = max(1, min(3, int(curvature * 5)))
-                mod.render_levels = mod.levels
-        
-        # ========== Universal Appearance Parameters ==========
-        # These apply to BOTH Preset and Import modes
-        
-        # 1. Smoothness (Subdivision Surface)
-        smoothness = vec.vector[GeometryVector.IDX_SMOOTHNESS]
-        if smoothness > 0.1:
-            # Check if already has subdivision from curvature
-            has_subsurf = any(m.type == 'SUBSURF' for m in obj.modifiers)
-            if not has_subsurf:
-                mod = obj.modifiers.new(name="Smoothness", type='SUBSURF')
-                mod.levels = max(1, min(3, int(smoothness * 3)))
-                mod.render_levels = mod.levels
-        
-        # 2. Edge Sharpness
-        edge_sharpness = vec.vector[GeometryVector.IDX_EDGE_SHARPNESS]
-        if edge_sharpness > 0.1:
-            mod = obj.modifiers.new(name="EdgeSharp", type='EDGE_SPLIT')
-            mod.split_angle = math.radians(180 * (1 - edge_sharpness))
-            mod.use_edge_angle = True
-        
-        # 3. Inflation (along normals)
-        inflation = vec.vector[GeometryVector.IDX_INFLATION]
-        if abs(inflation) > 0.01:
-            mod = obj.modifiers.new(name="Inflate", type='DISPLACE')
-            mod.strength = inflation * 0.5
-            mod.direction = 'NORMAL'
-        
-        # 4. Randomness (surface perturbation)
-        randomness = vec.vector[GeometryVector.IDX_RANDOMNESS]
-        if randomness > 0.01:
-            mod = obj.modifiers.new(name="Random", type='DISPLACE')
-            mod.strength = randomness * 0.1
-            # Create unique texture for this object
-            tex_name = f"RandomTex_{obj.name}"
-            tex = bpy.data.textures.get(tex_name)
-            if not tex:
-                tex = bpy.data.textures.new(tex_name, type='CLOUDS')
-                tex.noise_scale = 5.0
-            mod.texture = tex
-        
-        # ========== CRITICAL: Save vector data to object ==========
-        # Store the vector that was used to create this geometry
-        # This ensures Export will save the correct vector, not re-encoded one
-        for i in range(32):
-            obj[f"geom_vector_{i}"] = float(vec.vector[i])
-        
-        # Store metadata
-        obj["geometry_vector_source"] = "decode_render"
-        obj["geometry_vector_version"] = "1.0"
-        
-        # Store mesh "fingerprint" to detect manual edits later
-        # This allows us to determine if object is still "pure vector"
-        obj["geometry_vector_mesh_verts"] = len(obj.data.vertices)
-        obj["geometry_vector_mesh_faces"] = len(obj.data.polygons)
+    def modal(self, context, event):
+        if not live_decode_session.running:
+            return {'FINISHED'}
         
-        # Set as active and select
-        context.view_layer.objects.active = obj
-        obj.select_set(True)
+        if event.type == 'ESC' and event.value == 'PRESS':
+            live_decode_session.stop()
+            self.report({'INFO'}, "Live decode stopped")
+            return {'CANCELLED'}
         
-        return obj
+        return {'PASS_THROUGH'}
 
 
 class MYADDON_OT_vector_load_from_preset(bpy.types.Operator):
@@ -2414,7 +1368,7 @@ class MYADDON_OT_vector_load_from_preset(bpy.types.Operator):
         scene = context.scene
         
         # Encode preset to vector
-        geom_vec = GeometryEncoder.encode_preset(self.preset_name, scene)
+        geom_vec = geometry_encoder.GeometryEncoder.encode_preset(self.preset_name, scene)
         
         # Load into current vector
         for i in range(32):
@@ -2444,24 +1398,11 @@ class MYADDON_OT_vector_load_from_object(bpy.types.Operator):
         
         target_obj = context.active_object
         
-        # Create a backup copy of the mesh data for later decoding
-        original_mesh = target_obj.data
-        backup_mesh_name = f"__vector_source_{original_mesh.name}"
-        
-        # Remove old backup if exists
-        old_backup = bpy.data.meshes.get(backup_mesh_name)
-        if old_backup:
-            bpy.data.meshes.remove(old_backup)
-        
-        # Create new backup by copying the mesh
-        backup_mesh = original_mesh.copy()
-        backup_mesh.name = backup_mesh_name
-        
-        # Store reference to backup mesh
-        scene.vector_source_mesh = backup_mesh_name
+        # Back up the mesh for later decoding (shared with identical earlier backups)
+        source_mesh_cache.acquire(scene, target_obj.data)
         
         # Encode object to vector
-        geom_vec = GeometryEncoder.encode_object(target_obj)
+        geom_vec = geometry_encoder.GeometryEncoder.encode_object(target_obj)
         
         # Load into current vector
         for i in range(32):
@@ -2477,10 +1418,30 @@ class MYADDON_OT_vector_load_from_object(bpy.types.Operator):
         return {'FINISHED'}
 
 
+# (filepath, mtime, size) -> object names, so the file browser sidebar lists each file once
+_blend_listing_cache = {}
+
+
+def _blend_object_names(filepath):
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    key = (filepath, stat.st_mtime, stat.st_size)
+    if key not in _blend_listing_cache:
+        try:
+            names = api.list_blend_objects(filepath)
+        except (OSError, RuntimeError):
+            names = None
+        _blend_listing_cache.clear()
+        _blend_listing_cache[key] = names
+    return _blend_listing_cache[key]
+
+
 class MYADDON_OT_vector_load_from_file(bpy.types.Operator):
     bl_idname = "myaddon.vector_load_from_file"
     bl_label = "Load from Blender File"
-    bl_description = "Import object from .blend file and encode to vector"
+    bl_description = "Append selected objects from a .blend file and encode the first mesh to a vector"
     bl_options = {'REGISTER', 'UNDO'}
     
     filepath: bpy.props.StringProperty(
@@ -2494,87 +1455,54 @@ class MYADDON_OT_vector_load_from_file(bpy.types.Operator):
         options={'HIDDEN'}
     )
     
-    def execute(self, context):
-        scene = context.scene
+    object_filter: bpy.props.StringProperty(
+        name="Objects",
+        description="Comma-separated object names or wildcard patterns (e.g. Chair*, Table); empty for all",
+        default=""
+    )
+    
+    link_to_scene: bpy.props.BoolProperty(
+        name="Link to Scene",
+        description="Link the appended objects into the scene; off encodes the first mesh "
+                    "and unloads everything but its mesh",
+        default=True
+    )
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "object_filter")
+        layout.prop(self, "link_to_scene")
         
-        if not self.filepath or not self.filepath.endswith('.blend'):
+        # Names come from the file's ID directory; no data is loaded for the preview
+        filepath = bpy.path.abspath(self.filepath)
+        names = _blend_object_names(filepath) if filepath.endswith('.blend') else None
+        if names is None:
+            return
+        matched = api.match_object_names(names, self.object_filter)
+        box = layout.box()
+        box.label(text=f"{len(matched)} of {len(names)} objects", icon='OBJECT_DATA')
+        for name in matched[:12]:
+            box.label(text=name)
+        if len(matched) > 12:
+            box.label(text=f"... and {len(matched) - 12} more")
+    
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        if not filepath or not filepath.endswith('.blend'):
             self.report({'ERROR'}, "Please select a valid .blend file")
             return {'CANCELLED'}
         
         try:
-            # Store current objects to identify new ones
-            existing_objects = set(bpy.data.objects[:])
-            
-            # Append all mesh objects from the file
-            with bpy.data.libraries.load(self.filepath, link=False) as (data_from, data_to):
-                data_to.objects = [name for name in data_from.objects]
-            
-            # Link imported objects to scene and find mesh objects
-            imported_meshes = []
-            for obj in data_to.objects:
-                if obj and obj not in existing_objects:
-                    if obj.type == 'MESH':
-                        # Link to current scene
-                        if obj.name not in scene.collection.objects:
-                            scene.collection.objects.link(obj)
-                        imported_meshes.append(obj)
-                    elif obj.type in ['EMPTY', 'CURVE', 'LIGHT', 'CAMERA']:
-                        # Link non-mesh objects but don't encode them
-                        if obj.name not in scene.collection.objects:
-                            scene.collection.objects.link(obj)
-            
-            if not imported_meshes:
-                self.report({'WARNING'}, "No mesh objects found in the file")
+            names = api.match_object_names(api.list_blend_objects(filepath), self.object_filter)
+            if not names:
+                self.report({'WARNING'}, f"No objects match '{self.object_filter}'")
                 return {'CANCELLED'}
             
-            # Use the first mesh object for encoding
-            target_obj = imported_meshes[0]
-            
-            # Create a backup copy of the mesh data for later decoding
-            original_mesh = target_obj.data
-            backup_mesh_name = f"__vector_source_{original_mesh.name}"
-            
-            # Remove old backup if exists
-            old_backup = bpy.data.meshes.get(backup_mesh_name)
-            if old_backup:
-                bpy.data.meshes.remove(old_backup)
-            
-            # Create new backup by copying the mesh
-            backup_mesh = original_mesh.copy()
-            backup_mesh.name = backup_mesh_name
-            
-            # Store reference to backup mesh
-            scene.vector_source_mesh = backup_mesh_name
-            
-            # Set as active object
-            bpy.context.view_layer.objects.active = target_obj
-            target_obj.select_set(True)
-            
-            # Encode object to vector
-            geom_vec = GeometryEncoder.encode_object(target_obj)
-            
-            # Load into current vector
-            for i in range(32):
-                scene.geom_vector_current[i] = float(geom_vec.vector[i])
-            
-            # Store source info
-            scene.vector_source_preset = "NONE"  # Not from preset
-            
-            # Auto-expand vector editor
-            scene.show_vector_editor = True
-            
-            import os
-            filename = os.path.basename(self.filepath)
-            self.report({'INFO'}, f"Loaded vector from {target_obj.name} ({filename})")
-            
-            if len(imported_meshes) > 1:
-                self.report({'INFO'}, f"Imported {len(imported_meshes)} mesh objects, encoded first: {target_obj.name}")
-            
-            return {'FINISHED'}
-            
+            geom_vec = api.load_from_blend(filepath, names, self.link_to_scene, context, self.report)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to import file: {str(e)}")
             return {'CANCELLED'}
+        return {'FINISHED'} if geom_vec is not None else {'CANCELLED'}
     
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
@@ -2605,207 +1533,29 @@ class MYADDON_OT_export_gvec(bpy.types.Operator):
         default=True
     )
     
+    point_count: bpy.props.IntProperty(
+        name="Point Cloud",
+        description="Surface points (with normals) to sample into the file, 0 for none",
+        default=0,
+        min=0
+    )
+    
+    point_seed: bpy.props.IntProperty(
+        name="Seed",
+        description="Random seed of the point cloud",
+        default=0,
+        min=0
+    )
+    
     def execute(self, context):
-        scene = context.scene
-        
-        # Get active object
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "No active mesh object selected")
-            return {'CANCELLED'}
-        
         try:
-            # Try to get stored vector first (from Decode&Render or Import)
-            geom_vec = None
-            has_stored_vector = all(f"geom_vector_{i}" in obj for i in range(32))
-            
-            if has_stored_vector:
-                # Use stored vector (modified vector that created this object)
-                vector_array = np.array([obj[f"geom_vector_{i}"] for i in range(32)], dtype=np.float32)
-                geom_vec = GeometryVector(vector_array)
-                self.report({'INFO'}, "Using stored vector from object")
-            else:
-                # Re-encode from geometry (fallback)
-                geom_vec = GeometryEncoder.encode_object(obj)
-                self.report({'INFO'}, "Re-encoding vector from geometry")
-            
-            # Prepare metadata
-            metadata = {
-                "name": obj.name,
-                "source": obj.get("geometry_vector_source", "unknown"),
-                "version": obj.get("geometry_vector_version", "1.0")
-            }
-            
-            # For preset objects, try to identify and save the preset name
-            # This allows correct reconstruction on import
-            if metadata["source"] == "preset":
-                # Try to get preset name from various sources
-                preset_name = None
-                
-                # Method 1: Check if stored as custom property
-                if "geometry_vector_preset_name" in obj:
-                    preset_name = obj["geometry_vector_preset_name"]
-                    
-                # Method 2: Try to identify from current vector in scene
-                elif context.scene.vector_source_preset and context.scene.vector_source_preset != "NONE":
-                    preset_name = context.scene.vector_source_preset
-                    
-                # Method 3: Try to match vector to known presets
-                if not preset_name:
-                    preset_name = self._identify_preset_from_object(obj, context.scene)
-                
-                if preset_name:
-                    metadata["preset_name"] = preset_name
-                    print(f"[Export] Identified preset: {preset_name}")
-            
-            
-            # Determine if we should include mesh
-            # Strategy with comprehensive edit detection:
-            # 1. If user disabled mesh (include_mesh=False), respect that
-            # 2. Check if decode_render object has been manually edited (topology change)
-            # 3. Check if object has multiple mesh data users (merged/joined objects)
-            # 4. If object was IMPORTED with mesh data, preserve mesh+vector mode
-            # 5. Only use vector-only if object is unmodified decode_render with modifiers
-            
-            source = obj.get("geometry_vector_source", "unknown")
-            has_source_mesh = obj.get("geometry_vector_source_mesh") is not None
-            include_mesh_data = self.include_mesh
-            
-            # === Detection 1: Check mesh topology changes ===
-            mesh_manually_edited = False
-            if source == "decode_render":
-                original_verts = obj.get("geometry_vector_mesh_verts", -1)
-                original_faces = obj.get("geometry_vector_mesh_faces", -1)
-                current_verts = len(obj.data.vertices)
-                current_faces = len(obj.data.polygons)
-                
-                # If mesh topology changed, it's been manually edited
-                if original_verts != -1 and (current_verts != original_verts or current_faces != original_faces):
-                    mesh_manually_edited = True
-                    print(f"[Export] Mesh topology changed: verts {original_verts}->{current_verts}, faces {original_faces}->{current_faces}")
-            
-            # === Detection 2: Check if mesh data is shared (joined objects) ===
-            # If mesh data has multiple users, it might be a result of join operation
-            # OR if the object has been duplicated and the mesh is linked
-            mesh_is_shared = obj.data.users > 1
-            if mesh_is_shared and source == "decode_render":
-                print(f"[Export] Mesh data has {obj.data.users} users, may be joined/linked")
-            
-            # === Detection 3: Check for vertex groups (often added in manual editing) ===
-            has_vertex_groups = len(obj.vertex_groups) > 0
-            if has_vertex_groups and source == "decode_render":
-                print(f"[Export] Object has {len(obj.vertex_groups)} vertex groups (manual edit indicator)")
-                mesh_manually_edited = True
-            
-            # === Detection 4: Check for shape keys (animation/morphing) ===
-            has_shape_keys = obj.data.shape_keys is not None and len(obj.data.shape_keys.key_blocks) > 1
-            if has_shape_keys and source == "decode_render":
-                print(f"[Export] Object has shape keys (manual edit indicator)")
-                mesh_manually_edited = True
-            
-            # === Determine export mode ===
-            obj_to_export = None  # Will hold the object/mesh to export
-            needs_modifier_apply = False
-            
-            if mesh_manually_edited:
-                # Mesh has been manually edited - MUST include mesh data
-                include_mesh_data = True
-                needs_modifier_apply = True  # Apply modifiers to get complete geometry
-                self.report({'INFO'}, "Mesh manually edited, using mesh+vector mode with modifiers applied")
-                # Update source flag to reflect manual editing
-                obj["geometry_vector_source"] = "manual_edit"
-            elif source in ["decode_render", "preset"] and len(obj.modifiers) > 0 and not has_source_mesh and not mesh_is_shared:
-                # Pure vector object (from decode_render or preset) with modifiers - use vector only
-                # (base mesh + modifiers can be fully reconstructed from vector)
-                include_mesh_data = False
-                self.report({'INFO'}, f"Pure vector object detected ({source}), using vector-only mode")
-            elif has_source_mesh:
-                # Imported object with original mesh - preserve mesh+vector mode
-                include_mesh_data = True
-                self.report({'INFO'}, "Using mesh+vector mode (preserving imported mesh)")
-            else:
-                # Fallback: include mesh if in doubt
-                include_mesh_data = True
-                self.report({'INFO'}, "Using mesh+vector mode (safety fallback)")
-            
-            # === Apply modifiers if needed ===
-            if include_mesh_data and needs_modifier_apply and len(obj.modifiers) > 0:
-                # Create a temporary evaluated mesh with all modifiers applied
-                print(f"[Export] Applying {len(obj.modifiers)} modifiers to get final geometry...")
-                
-                # Use depsgraph to get evaluated object with modifiers applied
-                depsgraph = context.evaluated_depsgraph_get()
-                obj_eval = obj.evaluated_get(depsgraph)
-                
-                # Create a new mesh from the evaluated object
-                temp_mesh = bpy.data.meshes.new_from_object(obj_eval)
-                temp_obj = bpy.data.objects.new("TempExport", temp_mesh)
-                
-                # Copy custom properties to temp object
-                for key in obj.keys():
-                    temp_obj[key] = obj[key]
-                
-                obj_to_export = temp_obj
-                print(f"[Export] Modifiers applied: {len(temp_mesh.vertices)} vertices (was {len(obj.data.vertices)})")
-            else:
-                obj_to_export = obj
-            
-            # Export to file
-            success = GeometryFileFormat.export_to_file(
-                self.filepath,
-                geom_vec,
-                obj_to_export if include_mesh_data else None,
-                metadata
-            )
-            
-            # Clean up temporary object if created
-            if obj_to_export != obj:
-                bpy.data.meshes.remove(obj_to_export.data)
-                # temp_obj will be removed automatically when mesh is removed
-            
-            if success:
-                mode = "vector+mesh" if include_mesh_data else "vector-only"
-                self.report({'INFO'}, f"Exported to {self.filepath} ({mode})")
-                return {'FINISHED'}
-            else:
-                self.report({'ERROR'}, "Export failed")
-                return {'CANCELLED'}
-                
+            success = api.export_gvec(self.filepath, context.active_object, self.include_mesh,
+                                      context, self.report,
+                                      point_count=self.point_count, point_seed=self.point_seed)
         except Exception as e:
             self.report({'ERROR'}, f"Export error: {str(e)}")
             return {'CANCELLED'}
-    
-    def _identify_preset_from_object(self, obj, scene):
-        """Try to identify which preset the object was created from"""
-        try:
-            from .geometry_encoder import GeometryEncoder, GeometryVector
-            import numpy as np
-            
-            # Get object's vector
-            if not all(f"geom_vector_{i}" in obj for i in range(32)):
-                return None
-            
-            obj_vec = np.array([obj[f"geom_vector_{i}"] for i in range(32)])
-            
-            preset_names = [
-                'SPIRAL_CORRIDOR', 'DNA_HELIX', 'SPRING', 'TWISTED_TOWER',
-                'FIGHTER_JET', 'BOMBER', 'HELICOPTER', 'STAIRCASE', 'CHARACTER'
-            ]
-            
-            min_dist = float('inf')
-            closest_preset = None
-            
-            for preset in preset_names:
-                preset_vec = GeometryEncoder.encode_preset(preset, scene)
-                dist = np.linalg.norm(obj_vec - preset_vec.vector)
-                if dist < min_dist and dist < 0.5:  # Threshold
-                    min_dist = dist
-                    closest_preset = preset
-            
-            return closest_preset
-        except Exception as e:
-            print(f"[Export] Failed to identify preset: {e}")
-            return None
+        return {'FINISHED'} if success else {'CANCELLED'}
     
     def invoke(self, context, event):
         if context.active_object:
@@ -2833,87 +1583,13 @@ class MYADDON_OT_import_gvec(bpy.types.Operator):
     
     def execute(self, context):
         try:
-            # Import the file
-            obj = GeometryFileFormat.restore_object_from_file(self.filepath, context)
-            
-            if obj:
-                # Determine if object needs reconstruction from vector
-                # Cases:
-                # 1. Empty mesh (no vertices) - always reconstruct
-                # 2. Pure vector sources (decode_render, preset) WITHOUT source_mesh - reconstruct
-                #    (this is a pure-vector export that needs reconstruction)
-                # 3. Objects WITH source_mesh marker - DON'T reconstruct
-                #    (this is an imported object with original mesh, use as-is)
-                
-                source = obj.get("geometry_vector_source", "unknown")
-                has_source_mesh = obj.get("geometry_vector_source_mesh") is not None
-                
-                needs_reconstruction = (
-                    len(obj.data.vertices) == 0 or 
-                    (source in ["decode_render", "preset"] and not has_source_mesh)
-                )
-                
-                if needs_reconstruction:
-                    print(f"[Import] Object needs reconstruction from vector (source: {source}, has_mesh: {has_source_mesh})...")
-                    
-                    # Get the vector data and load to editor
-                    scene = context.scene
-                    for i in range(32):
-                        val = obj.get(f"geom_vector_{i}")
-                        if val is not None:
-                            scene.geom_vector_current[i] = float(val)
-                    
-                    # Restore preset name if this was a preset object
-                    if source == "preset":
-                        preset_name = obj.get("geometry_vector_preset_name", "NONE")
-                        scene.vector_source_preset = preset_name
-                        print(f"[Import] Restored preset source: {preset_name}")
-                    else:
-                        scene.vector_source_preset = "NONE"
-                    
-                    # Delete the imported object
-                    old_name = obj.name
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                    
-                    # Reconstruct using Decode & Render operator
-                    bpy.ops.myaddon.vector_decode_and_render()
-                    
-                    # Get the newly created object
-                    obj = context.active_object
-                    if obj:
-                        obj.name = old_name
-                        print(f"[Import] Successfully reconstructed {obj.name} from vector")
-                    else:
-                        self.report({'ERROR'}, "Failed to reconstruct geometry from vector")
-                        return {'CANCELLED'}
-                else:
-                    print(f"[Import] Using imported mesh as-is (source: {source}, vertices: {len(obj.data.vertices)})")
-                
-                # Select the new object
-                bpy.ops.object.select_all(action='DESELECT')
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                
-                # Load vector into editor
-                scene = context.scene
-                for i in range(32):
-                    val = obj.get(f"geom_vector_{i}")
-                    if val is not None:
-                        scene.geom_vector_current[i] = float(val)
-                
-                scene.show_vector_editor = True
-                
-                self.report({'INFO'}, f"Imported {obj.name} from .gvec file")
-                return {'FINISHED'}
-            else:
-                self.report({'ERROR'}, "Failed to restore object")
-                return {'CANCELLED'}
-                
+            obj = api.import_gvec(self.filepath, context, self.report)
         except Exception as e:
             self.report({'ERROR'}, f"Import error: {str(e)}")
             import traceback
             traceback.print_exc()
             return {'CANCELLED'}
+        return {'FINISHED'} if obj else {'CANCELLED'}
     
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
@@ -2946,7 +1622,7 @@ class MYADDON_OT_export_gvec_batch(bpy.types.Operator):
             return {'CANCELLED'}
         
         try:
-            success = GeometryBatchExporter.export_batch(self.filepath, selected_objects)
+            success = geometry_file_format.GeometryBatchExporter.export_batch(self.filepath, selected_objects)
             
             if success:
                 self.report({'INFO'}, f"Exported {len(selected_objects)} objects to {self.filepath}")
@@ -2984,7 +1660,7 @@ class MYADDON_OT_import_gvec_batch(bpy.types.Operator):
     
     def execute(self, context):
         try:
-            imported_objects = GeometryBatchExporter.import_batch(self.filepath, context)
+            imported_objects = geometry_file_format.GeometryBatchExporter.import_batch(self.filepath, context)
             
             if imported_objects:
                 # Select imported objects
@@ -3009,6 +1685,310 @@ class MYADDON_OT_import_gvec_batch(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
 
+class MYADDON_OT_export_dataset(bpy.types.Operator):
+    """Export mesh objects as a sharded, memory-mappable ML dataset"""
+    bl_idname = "myaddon.export_dataset"
+    bl_label = "Export ML Dataset"
+    bl_description = "Stream objects into fixed-size .npy shards with a manifest (resumes an interrupted export)"
+    
+    directory: bpy.props.StringProperty(
+        name="Directory",
+        description="Dataset directory",
+        subtype='DIR_PATH'
+    )
+    shard_size: bpy.props.IntProperty(
+        name="Shard Size",
+        description="Objects per shard",
+        default=1024,
+        min=1
+    )
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Export only the selected objects instead of every mesh in the scene",
+        default=False
+    )
+    include_mesh: bpy.props.BoolProperty(
+        name="Mesh Buffers",
+        description="Also write vertices, loops and face sizes per object",
+        default=True
+    )
+    apply_modifiers: bpy.props.BoolProperty(
+        name="Apply Modifiers",
+        description="Write the evaluated mesh instead of the base mesh",
+        default=True
+    )
+    point_count: bpy.props.IntProperty(
+        name="Point Cloud",
+        description="Surface points (with normals) to sample per object, 0 for none",
+        default=0,
+        min=0
+    )
+    resume: bpy.props.BoolProperty(
+        name="Resume",
+        description="Continue an existing export in the directory; otherwise its shards are replaced",
+        default=True
+    )
+    
+    def execute(self, context):
+        objects = context.selected_objects if self.selected_only else context.scene.objects
+        if not any(obj.type == 'MESH' for obj in objects):
+            self.report({'ERROR'}, "No mesh objects to export")
+            return {'CANCELLED'}
+        
+        written = api.export_dataset(bpy.path.abspath(self.directory), objects,
+                                     shard_size=self.shard_size, include_mesh=self.include_mesh,
+                                     apply_modifiers=self.apply_modifiers, resume=self.resume,
+                                     context=context, report=self.report, point_count=self.point_count)
+        return {'FINISHED'} if written is not None else {'CANCELLED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MYADDON_OT_generate_design_dataset(bpy.types.Operator):
+    """Sample random design vectors into a sharded dataset"""
+    bl_idname = "myaddon.generate_design_dataset"
+    bl_label = "Generate Design Dataset"
+    bl_description = "Draw random geometry vectors in one vectorized pass and write them as .npy shards"
+    
+    directory: bpy.props.StringProperty(
+        name="Directory",
+        description="Dataset directory",
+        subtype='DIR_PATH'
+    )
+    count: bpy.props.IntProperty(
+        name="Samples",
+        description="Number of vectors to generate",
+        default=100000,
+        min=1
+    )
+    method: bpy.props.EnumProperty(
+        name="Design",
+        items=[
+            ('random', "Random", "Independent uniform draws"),
+            ('latin_hypercube', "Latin Hypercube", "One sample per stratum in every dimension"),
+            ('sobol', "Sobol", "Low-discrepancy Sobol sequence"),
+        ],
+        default='sobol'
+    )
+    seed: bpy.props.IntProperty(
+        name="Seed",
+        description="Random seed; the same seed reproduces the same dataset",
+        default=0,
+        min=0
+    )
+    shard_size: bpy.props.IntProperty(
+        name="Shard Size",
+        description="Vectors per shard",
+        default=65536,
+        min=1
+    )
+    resume: bpy.props.BoolProperty(
+        name="Resume",
+        description="Continue an existing dataset in the directory; otherwise its shards are replaced",
+        default=True
+    )
+    
+    def execute(self, context):
+        wm = context.window_manager
+        wm.progress_begin(0, self.count)
+        try:
+            written = api.generate_dataset(bpy.path.abspath(self.directory), self.count, self.method,
+                                           self.seed, shard_size=self.shard_size, resume=self.resume,
+                                           report=self.report,
+                                           progress=lambda done, total: wm.progress_update(done))
+        finally:
+            wm.progress_end()
+        return {'FINISHED'} if written is not None else {'CANCELLED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MYADDON_OT_farm_decode_dataset(bpy.types.Operator):
+    """Decode a vector dataset to meshes in parallel headless Blender workers"""
+    bl_idname = "myaddon.farm_decode_dataset"
+    bl_label = "Decode Dataset in Workers"
+    bl_description = ("Split a vector dataset into chunks and decode them in background Blender "
+                      "processes, one per core (Esc to stop; finished shards are kept)")
+    
+    source: bpy.props.StringProperty(
+        name="Vectors",
+        description="Sharded vector dataset directory or (N, 32) .npy file",
+        subtype='FILE_PATH'
+    )
+    directory: bpy.props.StringProperty(
+        name="Output",
+        description="Directory for the decoded mesh dataset",
+        subtype='DIR_PATH'
+    )
+    workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Parallel Blender processes (0 = one per core)",
+        default=0,
+        min=0
+    )
+    shard_size: bpy.props.IntProperty(
+        name="Shard Size",
+        description="Objects per output shard",
+        default=256,
+        min=1
+    )
+    point_count: bpy.props.IntProperty(
+        name="Point Cloud",
+        description="Surface points to sample per object, 0 for none",
+        default=0,
+        min=0
+    )
+    
+    _farm = None
+    _timer = None
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=420)
+    
+    def execute(self, context):
+        try:
+            vectors = worker_farm.load_vectors(bpy.path.abspath(self.source))
+            self._farm = worker_farm.WorkerFarm(
+                "decode", bpy.path.abspath(self.directory), vectors=vectors,
+                workers=self.workers or None, shard_size=self.shard_size,
+                point_count=self.point_count, blender=bpy.app.binary_path)
+            self._farm.start()
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not start workers: {e}")
+            return {'CANCELLED'}
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(1.0, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self._farm.cancel()
+            self._finish(context)
+            self.report({'WARNING'}, "Workers stopped; run again to resume")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        finished = self._farm.poll()
+        state = self._farm.progress()
+        context.workspace.status_text_set(
+            f"Decoding {state['done']}/{state['items']} in {state['running']} worker(s), "
+            f"{state['failed']} failed chunk(s) (Esc to stop)")
+        if not finished:
+            return {'PASS_THROUGH'}
+        
+        self._finish(context)
+        level = {'WARNING'} if state['failed'] else {'INFO'}
+        merged = self._farm.merged
+        self.report(level, f"Decoded {merged['count'] if merged else 0} of {state['items']} vectors "
+                           f"into {self.directory}")
+        return {'FINISHED'}
+    
+    def _finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
+
+class MYADDON_OT_ingest_blend_library(bpy.types.Operator):
+    """Encode every mesh object of a directory of .blend files in headless workers"""
+    bl_idname = "myaddon.ingest_blend_library"
+    bl_label = "Ingest .blend Library"
+    bl_description = ("Encode the mesh objects of every .blend file in a directory into a library store, "
+                      "in background Blender processes; unchanged files are skipped (Esc to stop)")
+    
+    source: bpy.props.StringProperty(
+        name="Blend Files",
+        description="Directory searched for .blend files",
+        subtype='DIR_PATH'
+    )
+    directory: bpy.props.StringProperty(
+        name="Store",
+        description="Library store directory (one dataset per .blend file plus a merged manifest)",
+        subtype='DIR_PATH'
+    )
+    recursive: bpy.props.BoolProperty(
+        name="Include Subdirectories",
+        default=True
+    )
+    include_mesh: bpy.props.BoolProperty(
+        name="Store Meshes",
+        description="Also store the mesh buffers, not only the vectors",
+        default=True
+    )
+    workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Parallel Blender processes (0 = one per core)",
+        default=0,
+        min=0
+    )
+    point_count: bpy.props.IntProperty(
+        name="Point Cloud",
+        description="Surface points to sample per object, 0 for none",
+        default=0,
+        min=0
+    )
+    
+    _ingest = None
+    _timer = None
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=420)
+    
+    def execute(self, context):
+        try:
+            self._ingest = library_ingest.LibraryIngest(
+                bpy.path.abspath(self.source), bpy.path.abspath(self.directory),
+                workers=self.workers or None, include_mesh=self.include_mesh,
+                point_count=self.point_count, recursive=self.recursive, blender=bpy.app.binary_path)
+            self._ingest.start()
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not start ingestion: {e}")
+            return {'CANCELLED'}
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(1.0, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self._ingest.cancel()
+            self._finish(context)
+            self.report({'WARNING'}, "Ingestion stopped; finished files are skipped next time")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        finished = self._ingest.poll()
+        state = self._ingest.progress()
+        context.workspace.status_text_set(
+            f"Ingesting {state['done']}/{state['items']} file(s) in {state['running']} worker(s), "
+            f"{state['failed']} failed (Esc to stop)")
+        if not finished:
+            return {'PASS_THROUGH'}
+        
+        self._finish(context)
+        failed = self._ingest.failed_files()
+        merged = self._ingest.merged
+        self.report({'WARNING'} if failed else {'INFO'},
+                    f"Ingested {len(self._ingest.changed) - len(failed)} file(s) "
+                    f"({len(self._ingest.current) - len(self._ingest.changed)} unchanged, {len(failed)} failed); "
+                    f"store holds {merged['count'] if merged else 0} object(s)")
+        return {'FINISHED'}
+    
+    def _finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
+
 class MYADDON_OT_morph_animation(bpy.types.Operator):
     bl_idname = "myaddon.morph_animation"
     bl_label = "Create Morph Animation"
@@ -3040,10 +2020,42 @@ class MYADDON_OT_morph_animation(bpy.types.Operator):
         name="Frames",
         default=120,
         min=10,
-        max=500,
+        max=10000,
+        soft_max=500,
         description="Number of frames for the morphing animation"
     )
     
+    bake_mode: bpy.props.EnumProperty(
+        name="Bake",
+        items=[
+            ('MODIFIERS', "Modifier Keyframes", "Key the decoded modifier and transform values on every frame"),
+            ('SHAPE_KEYS', "Shape Keys", "Bake the evaluated vertex positions of every frame into shape keys"),
+            ('VERTEX_CACHE', "Vertex Cache", "Write the evaluated vertex positions of every frame to a "
+                                             "memory-mapped cache file streamed during playback"),
+        ],
+        default='MODIFIERS'
+    )
+    
+    cache_filepath: bpy.props.StringProperty(
+        name="Cache File",
+        description="Vertex cache file written by the Vertex Cache bake",
+        default="//morph_cache.gvac",
+        subtype='FILE_PATH'
+    )
+    
+    cache_half_precision: bpy.props.BoolProperty(
+        name="Half Precision",
+        description="Store positions as 16-bit floats (half the file size)",
+        default=False
+    )
+    
+    cache_delta: bpy.props.BoolProperty(
+        name="Delta Frames",
+        description="Store frame-to-frame differences with periodic keyframes "
+                    "(keeps half precision accurate on large coordinates)",
+        default=True
+    )
+    
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self, width=300)
     
@@ -3054,33 +2066,348 @@ class MYADDON_OT_morph_animation(bpy.types.Operator):
         layout.prop(self, "start_preset")
         layout.prop(self, "end_preset")
         layout.prop(self, "num_frames")
+        layout.prop(self, "bake_mode")
+        if self.bake_mode == 'VERTEX_CACHE':
+            col = layout.column(align=True)
+            col.prop(self, "cache_filepath", text="")
+            col.prop(self, "cache_half_precision")
+            col.prop(self, "cache_delta")
     
     def execute(self, context):
+        import time
+        
         scene = context.scene
+        start_time = time.perf_counter()
         
         # Encode presets
-        vec_start = GeometryEncoder.encode_preset(self.start_preset, scene)
-        vec_end = GeometryEncoder.encode_preset(self.end_preset, scene)
+        vec_start = geometry_encoder.GeometryEncoder.encode_preset(self.start_preset, scene)
+        vec_end = geometry_encoder.GeometryEncoder.encode_preset(self.end_preset, scene)
         
-        # Generate interpolation path
-        latent_space = get_latent_space()
+        # Generate the whole interpolation path as one (F, 32) batch
+        latent_space = geometry_encoder.get_latent_space()
         latent_space.add_geometry("start", vec_start)
         latent_space.add_geometry("end", vec_end)
         
-        path = latent_space.interpolate_path("start", "end", self.num_frames)
+        vectors = latent_space.interpolate_path_array("start", "end", self.num_frames)
+        frames = np.arange(1, self.num_frames + 1, dtype=np.float32)
+        
+        # Replace the previous morph
+        datablock_registry.release(scene, (datablock_registry.GENERATOR_MORPH,))
+        
+        obj = self._create_morph_object(context, vectors)
+        
+        # One channel per animated property: (data_path, array index or None, values per frame)
+        channels = []
+        for path, (values, active) in geometry_encoder.GeometryDecoder.decode_modifier_tracks(vectors).items():
+            if active:
+                mod_name, prop = path.split(".")
+                channels.append((f'modifiers["{mod_name}"].{prop}', None, values))
+        deform_channels = list(channels)
+        for path, values in geometry_encoder.GeometryDecoder.decode_transform_tracks(vectors).items():
+            for axis in range(3):
+                channels.append((path, axis, values[:, axis]))
+        
+        cache_info = ""
+        if self.bake_mode in ('SHAPE_KEYS', 'VERTEX_CACHE'):
+            if self.bake_mode == 'SHAPE_KEYS':
+                baked = self._bake_shape_keys(context, obj, deform_channels, frames)
+            else:
+                baked = self._bake_vertex_cache(context, obj, deform_channels, frames)
+            if baked is None:
+                return {'CANCELLED'}
+            obj = baked
+            # Deformation now lives in the baked positions; only transforms stay as F-curves
+            channels = channels[len(deform_channels):]
+            if self.bake_mode == 'VERTEX_CACHE':
+                cache_size = os.path.getsize(obj[vertex_cache.CACHE_PATH_KEY])
+                cache_info = f", cache {datablock_registry.format_bytes(cache_size)}"
+        
+        keyed = _bake_fcurves(obj, channels, frames)
+        datablock_registry.track_object(scene, datablock_registry.GENERATOR_MORPH, obj)
         
         # Set up animation
         scene.frame_start = 1
         scene.frame_end = self.num_frames
+        scene.frame_set(1)
         
+        elapsed_ms = (time.perf_counter() - start_time) * 1000.0
         self.report({'INFO'}, 
                    f"Created morph animation: {self.start_preset} → {self.end_preset} "
-                   f"({self.num_frames} frames)")
-        
-        # Note: Actual keyframe creation would require more complex implementation
-        # This demonstrates the concept
+                   f"({self.num_frames} frames, {keyed} F-curves{cache_info}, {elapsed_ms:.0f} ms)")
         
         return {'FINISHED'}
+    
+    # Modifier stack order used by Decode & Render
+    MORPH_MODIFIER_ORDER = ("Sphericity", "Taper", "Twist", "Bend", "Elongation", "Wave", "Noise",
+                            "Subdivision", "EdgeSharp", "Inflate", "Random")
+    
+    def _create_morph_object(self, context, vectors):
+        """Base mesh carrying every modifier the morph animates (values are set by the bake)"""
+        import bmesh
+        
+        bm = bmesh.new()
+        bmesh.ops.create_cube(bm, size=1.0)
+        bmesh.ops.subdivide_edges(bm, edges=bm.edges, cuts=2, use_grid_fill=True)
+        mesh = bpy.data.meshes.new("MorphObject")
+        bm.to_mesh(mesh)
+        bm.free()
+        
+        obj = api._link_generated_object(context, "MorphObject", mesh)
+        
+        active = {path.split(".")[0] for path, (values, is_active)
+                  in geometry_encoder.GeometryDecoder.decode_modifier_tracks(vectors).items() if is_active}
+        
+        # Subdivision level is fixed for the whole morph so topology never changes
+        curvature = vectors[:, geometry_encoder.GeometryVector.IDX_CURVATURE]
+        smoothness = vectors[:, geometry_encoder.GeometryVector.IDX_SMOOTHNESS]
+        levels = 0
+        if (curvature > 0.1).any():
+            levels = max(1, min(3, int(curvature.max() * 5)))
+        elif (smoothness > 0.1).any():
+            levels = max(1, min(3, int(smoothness.max() * 3)))
+        
+        for mod_name in self.MORPH_MODIFIER_ORDER:
+            if mod_name == "Subdivision":
+                if levels:
+                    mod = obj.modifiers.new(name="Subdivision", type='SUBSURF')
+                    mod.levels = levels
+                    mod.render_levels = levels
+            elif mod_name in active:
+                self._add_morph_modifier(context, obj, mod_name, vectors[0])
+        
+        geometry_encoder.set_object_vector(obj, vectors[0])
+        obj["geometry_vector_source"] = "morph"
+        return obj
+    
+    @staticmethod
+    def _add_morph_modifier(context, obj, mod_name, first_vector):
+        """Create one morph modifier with the static settings Decode & Render uses"""
+        if mod_name == "Sphericity":
+            mod = obj.modifiers.new(name=mod_name, type='CAST')
+            mod.cast_type = 'SPHERE'
+        elif mod_name in ("Taper", "Twist", "Bend", "Elongation"):
+            mod = obj.modifiers.new(name=mod_name, type='SIMPLE_DEFORM')
+            mod.deform_method = {"Taper": 'TAPER', "Twist": 'TWIST',
+                                 "Bend": 'BEND', "Elongation": 'STRETCH'}[mod_name]
+        elif mod_name == "Wave":
+            obj.modifiers.new(name=mod_name, type='WAVE')
+        elif mod_name == "EdgeSharp":
+            mod = obj.modifiers.new(name=mod_name, type='EDGE_SPLIT')
+            mod.use_edge_angle = True
+        elif mod_name == "Inflate":
+            mod = obj.modifiers.new(name=mod_name, type='DISPLACE')
+            mod.direction = 'NORMAL'
+        elif mod_name in ("Noise", "Random"):
+            mod = obj.modifiers.new(name=mod_name, type='DISPLACE')
+            tex_name = f"{'NoiseTex' if mod_name == 'Noise' else 'RandomTex'}_{obj.name}"
+            tex = bpy.data.textures.get(tex_name)
+            if not tex:
+                tex = bpy.data.textures.new(tex_name, type='CLOUDS')
+            if mod_name == "Noise":
+                noise_scale = first_vector[geometry_encoder.GeometryVector.IDX_NOISE_SCALE]
+                tex.noise_scale = noise_scale * 2.0 if noise_scale > 0.01 else 1.0
+            else:
+                tex.noise_scale = 5.0
+            mod.texture = tex
+            datablock_registry.track(context.scene, datablock_registry.GENERATOR_MORPH, tex)
+    
+    def _bake_shape_keys(self, context, obj, deform_channels, frames):
+        """
+        Evaluate the modifier stack once per frame and store the vertex
+        positions as absolute shape keys on a new baked object, driven by
+        a single eval_time F-curve
+        """
+        evaluated = _evaluate_morph_frames(context, obj, deform_channels, len(frames))
+        baked = self._new_baked_object(context, obj, next(evaluated), "MorphBake")
+        baked_mesh = baked.data
+        vertex_count = len(baked_mesh.vertices)
+        
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        key_blocks = [baked.shape_key_add(name="Basis", from_mix=False)]
+        baked_mesh.shape_keys.use_relative = False
+        
+        for frame_index, eval_obj in enumerate(evaluated, start=1):
+            if not _read_evaluated_coords(eval_obj, coords):
+                self.report({'ERROR'}, "Morph changes topology between frames; use Modifier Keyframes instead")
+                bpy.data.objects.remove(baked, do_unlink=True)
+                bpy.data.meshes.remove(baked_mesh)
+                return None
+            
+            block = baked.shape_key_add(name=f"Frame_{int(frames[frame_index]):04d}", from_mix=False)
+            block.data.foreach_set("co", coords)
+            block.interpolation = 'KEY_LINEAR'
+            key_blocks.append(block)
+        
+        self._remove_morph_source(obj)
+        
+        # eval_time walks linearly through the absolute keys
+        key = baked_mesh.shape_keys
+        _bake_fcurves(key, [("eval_time", None, np.array([key_blocks[0].frame, key_blocks[-1].frame]))],
+                      np.array([frames[0], frames[-1]], dtype=np.float32))
+        if key.animation_data is not None:
+            datablock_registry.track(context.scene, datablock_registry.GENERATOR_MORPH, key.animation_data.action)
+        
+        context.view_layer.objects.active = baked
+        return baked
+    
+    def _bake_vertex_cache(self, context, obj, deform_channels, frames):
+        """
+        Evaluate the modifier stack once per frame and stream the vertex
+        positions into a memory-mapped cache file; the baked object plays
+        it back through the frame_change_pre handler
+        """
+        filepath = bpy.path.abspath(self.cache_filepath)
+        if not self.cache_filepath or os.path.isdir(filepath):
+            self.report({'ERROR'}, "Choose a vertex cache file")
+            return None
+        if self.cache_filepath.startswith("//") and not bpy.data.filepath:
+            self.report({'ERROR'}, "Save the .blend file first or use an absolute cache path")
+            return None
+        
+        evaluated = _evaluate_morph_frames(context, obj, deform_channels, len(frames))
+        baked = self._new_baked_object(context, obj, next(evaluated), "MorphCache")
+        baked_mesh = baked.data
+        vertex_count = len(baked_mesh.vertices)
+        
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        baked_mesh.vertices.foreach_get("co", coords)
+        try:
+            writer = vertex_cache.VertexCacheWriter(filepath, len(frames), vertex_count,
+                                                    half=self.cache_half_precision, delta=self.cache_delta)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not create vertex cache: {e}")
+            bpy.data.objects.remove(baked, do_unlink=True)
+            bpy.data.meshes.remove(baked_mesh)
+            return None
+        
+        writer.write(coords)
+        for eval_obj in evaluated:
+            if not _read_evaluated_coords(eval_obj, coords):
+                writer.abort()
+                self.report({'ERROR'}, "Morph changes topology between frames; use Modifier Keyframes instead")
+                bpy.data.objects.remove(baked, do_unlink=True)
+                bpy.data.meshes.remove(baked_mesh)
+                return None
+            writer.write(coords)
+        writer.close()
+        
+        self._remove_morph_source(obj)
+        
+        baked[vertex_cache.CACHE_PATH_KEY] = filepath
+        baked[vertex_cache.CACHE_START_KEY] = int(frames[0])
+        vertex_cache.bind(baked.name)
+        
+        context.view_layer.objects.active = baked
+        return baked
+    
+    @staticmethod
+    def _new_baked_object(context, obj, eval_obj, name):
+        """Object holding a real copy of the evaluated morph mesh, carrying the source's ID props"""
+        baked_mesh = bpy.data.meshes.new_from_object(eval_obj)
+        baked_mesh.name = name
+        baked = api._link_generated_object(context, name, baked_mesh)
+        baked.matrix_world = obj.matrix_world
+        for key in obj.keys():
+            baked[key] = obj[key]
+        return baked
+    
+    @staticmethod
+    def _remove_morph_source(obj):
+        """The modifier-driven source object is no longer needed once baked"""
+        source_mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(source_mesh)
+
+
+def _evaluate_morph_frames(context, obj, deform_channels, frame_count):
+    """Yield the evaluated morph object for each frame, setting the deform channels first"""
+    depsgraph = context.evaluated_depsgraph_get()
+    for frame_index in range(frame_count):
+        for data_path, index, values in deform_channels:
+            _set_path_value(obj, data_path, index, float(values[frame_index]))
+        depsgraph.update()
+        yield obj.evaluated_get(depsgraph)
+
+
+def _read_evaluated_coords(eval_obj, coords):
+    """Copy evaluated vertex positions into `coords` (False if the vertex count differs)"""
+    eval_mesh = eval_obj.to_mesh()
+    try:
+        if len(eval_mesh.vertices) * 3 != len(coords):
+            return False
+        eval_mesh.vertices.foreach_get("co", coords)
+        return True
+    finally:
+        eval_obj.to_mesh_clear()
+
+
+def _set_path_value(id_data, data_path, index, value):
+    """Set a property addressed by an RNA data path (and optional array index)"""
+    owner_path, _, prop = data_path.rpartition(".")
+    owner = id_data.path_resolve(owner_path) if owner_path else id_data
+    if index is None:
+        setattr(owner, prop, value)
+    else:
+        getattr(owner, prop)[index] = value
+
+
+def _ensure_fcurve(action, id_data, data_path, index):
+    """F-curve for a data path, on legacy and slotted (Blender 4.4+) actions"""
+    fcurves = getattr(action, "fcurves", None)
+    if fcurves is not None:
+        fcurve = fcurves.find(data_path, index=index)
+        return fcurve if fcurve is not None else fcurves.new(data_path, index=index)
+    return action.fcurve_ensure_for_datablock(id_data, data_path, index=index)
+
+
+def _bake_fcurves(id_data, channels, frames):
+    """
+    Key every channel at every frame in bulk
+
+    Channels whose values never change are set once instead of keyed.
+    Keyframes are added with keyframe_points.add(count) and filled with a
+    single foreach_set, avoiding per-frame keyframe_insert calls.
+
+    Returns:
+        number of F-curves written
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    count = len(frames)
+    
+    animated = []
+    for data_path, index, values in channels:
+        values = np.asarray(values, dtype=np.float32)
+        if count > 1 and np.ptp(values) > 1e-6:
+            animated.append((data_path, index, values))
+        else:
+            _set_path_value(id_data, data_path, index, float(values[0]))
+    
+    if not animated:
+        return 0
+    
+    anim_data = id_data.animation_data or id_data.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(name=f"{id_data.name}_Morph")
+    action = anim_data.action
+    
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    linear = [1] * count  # BEZT_IPO_LIN
+    
+    for data_path, index, values in animated:
+        fcurve = _ensure_fcurve(action, id_data, data_path, 0 if index is None else index)
+        fcurve.keyframe_points.clear()
+        fcurve.keyframe_points.add(count)
+        co[1::2] = values
+        fcurve.keyframe_points.foreach_set("co", co)
+        try:
+            fcurve.keyframe_points.foreach_set("interpolation", linear)
+        except (TypeError, RuntimeError):
+            for point in fcurve.keyframe_points:
+                point.interpolation = 'LINEAR'
+        fcurve.update()
+    
+    return len(animated)
 
 
 classes = (
@@ -3104,6 +2431,11 @@ classes = (
     MYADDON_OT_edit_part_material,
     MYADDON_OT_apply_preset,
     MYADDON_OT_update_shape,
+    MYADDON_OT_purge_generator_garbage,
+    MYADDON_OT_clear_decode_cache,
+    MYADDON_OT_clear_source_mesh_cache,
+    MYADDON_OT_profiler_reset,
+    MYADDON_OT_profiler_export_trace,
     MYADDON_OT_encode_geometry,
     MYADDON_OT_interpolate_geometry,
     MYADDON_OT_blend_geometry,
@@ -3115,6 +2447,7 @@ classes = (
     MYADDON_OT_vector_normalize,
     MYADDON_OT_apply_source_modifiers,
     MYADDON_OT_vector_decode_and_render,
+    MYADDON_OT_vector_live_decode,
     MYADDON_OT_vector_load_from_preset,
     MYADDON_OT_vector_load_from_object,
     MYADDON_OT_vector_load_from_file,
@@ -3124,13 +2457,20 @@ classes = (
     MYADDON_OT_import_gvec,
     MYADDON_OT_export_gvec_batch,
     MYADDON_OT_import_gvec_batch,
+    MYADDON_OT_export_dataset,
+    MYADDON_OT_generate_design_dataset,
+    MYADDON_OT_farm_decode_dataset,
+    MYADDON_OT_ingest_blend_library,
 )
 
 def register():
     for cls in classes:
+        profiler.instrument_operator(cls)
         bpy.utils.register_class(cls)
 
 def unregister():
+    if live_decode_session.running:
+        live_decode_session.stop()
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
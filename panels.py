@@ -1,6 +1,8 @@
 import bpy
 import os
 
+from .lazy_loader import loaded_module
+
 class VIEW3D_PT_my_panel(bpy.types.Panel):
     bl_label = "Simple Panel"
     bl_idname = "VIEW3D_PT_my_panel"
@@ -144,6 +146,7 @@ class VIEW3D_PT_shape_transformer(bpy.types.Panel):
                 box.prop(scene, "my_aircraft_wing_sweep")
                 box.prop(scene, "my_aircraft_tail_size")
                 box.prop(scene, "my_aircraft_engine_count")
+                box.prop(scene, "my_generator_part_materials")
         
         # Staircase parameters (collapsible)
         if scene.my_shape_preset == 'STAIRCASE':
@@ -156,6 +159,7 @@ class VIEW3D_PT_shape_transformer(bpy.types.Panel):
             
             if scene.show_stair_params:
                 box.prop(scene, "my_stair_type")
+                box.prop(scene, "my_stair_build_mode")
                 box.prop(scene, "my_stair_steps")
                 box.prop(scene, "my_stair_step_width")
                 box.prop(scene, "my_stair_step_height")
@@ -175,6 +179,7 @@ class VIEW3D_PT_shape_transformer(bpy.types.Panel):
                 box.prop(scene, "my_character_age")
                 box.prop(scene, "my_character_height")
                 box.prop(scene, "my_character_build", slider=True)
+                box.prop(scene, "my_generator_part_materials")
 
         # Basic dimensions (collapsible)
         box = layout.box()
@@ -199,6 +204,8 @@ class VIEW3D_PT_shape_transformer(bpy.types.Panel):
             box.prop(scene, "my_shape_helix_turns")
             box.prop(scene, "my_shape_helix_radius")
             box.prop(scene, "my_shape_helix_height")
+            box.prop(scene, "my_shape_helix_segments")
+            box.prop(scene, "my_shape_helix_curve")
         
         # Topology transformations (collapsible)
         box = layout.box()
@@ -243,6 +250,34 @@ class VIEW3D_PT_shape_transformer(bpy.types.Panel):
         layout.separator()
         layout.operator("myaddon.update_shape", icon='FILE_REFRESH', text="Update Shape")
         layout.operator("myaddon.split_shape", icon='MOD_EXPLODE', text="Split Shape")
+        layout.operator("myaddon.purge_generator_garbage", icon='TRASH', text="Purge Generator Garbage")
+        
+        # Adaptive preview quality
+        from . import preview_quality
+        box = layout.box()
+        row = box.row()
+        row.prop(scene, "preview_adaptive")
+        if scene.preview_adaptive:
+            col = box.column(align=True)
+            col.prop(scene, "preview_idle_delay")
+            col.prop(scene, "preview_quality_budget")
+            state = "Preview" if preview_quality.is_previewing(scene) else "Full"
+            box.label(text=f"{state} quality - last frame {preview_quality.frame_time_ms(scene):.1f} ms "
+                           f"(preview level {preview_quality.preview_cap(scene)})", icon='TIME')
+        
+        # Distance LOD for decoded objects
+        box = layout.box()
+        box.prop(scene, "lod_enabled")
+        if scene.lod_enabled:
+            from . import lod_manager
+            col = box.column(align=True)
+            col.prop(scene, "lod_interval")
+            col.prop(scene, "lod_high_px")
+            col.prop(scene, "lod_low_px")
+            col.prop(scene, "lod_hysteresis", slider=True)
+            counts = lod_manager.tier_counts()
+            box.label(text=f"Full {counts[lod_manager.LOD_HIGH]} / Medium {counts[lod_manager.LOD_MEDIUM]} "
+                           f"/ Low {counts[lod_manager.LOD_LOW]}", icon='MOD_DECIM')
         
         # Shape parts list
         if scene.my_shape_parts:
@@ -291,6 +326,11 @@ class VIEW3D_PT_geometry_vectors(bpy.types.Panel):
             # Auto-bind toggle
             col = box.column(align=True)
             col.prop(scene, "vector_editor_auto_bind", text="Auto-Bind to Selected Object", icon='LINKED')
+            if scene.vector_editor_auto_bind:
+                from . import handlers
+                last_ms, max_ms, calls = handlers.auto_bind_stats()
+                if calls:
+                    col.label(text=f"Bind cost: {last_ms:.2f} ms (max {max_ms:.2f} ms)", icon='TIME')
             col.separator()
             
             # Load vector buttons
@@ -311,6 +351,11 @@ class VIEW3D_PT_geometry_vectors(bpy.types.Panel):
             row = col.row(align=True)
             row.operator("myaddon.import_gvec_batch", text="Import Batch", icon='LINENUMBERS_ON')
             row.operator("myaddon.export_gvec_batch", text="Export Batch", icon='LINENUMBERS_OFF')
+            row = col.row(align=True)
+            row.operator("myaddon.export_dataset", text="Export ML Dataset", icon='OUTLINER_COLLECTION')
+            row.operator("myaddon.generate_design_dataset", text="Generate", icon='PARTICLES')
+            col.operator("myaddon.farm_decode_dataset", text="Decode Dataset in Workers", icon='SYSTEM')
+            col.operator("myaddon.ingest_blend_library", text="Ingest .blend Library", icon='FILE_BLEND')
             
             # Show source preset if available
             if scene.vector_source_preset and scene.vector_source_preset != "NONE":
@@ -391,6 +436,18 @@ class VIEW3D_PT_geometry_vectors(bpy.types.Panel):
             col.scale_y = 1.5
             col.operator("myaddon.vector_decode_and_render", icon='MESH_DATA')
             
+            # Live decode toggle
+            from .operators import live_decode_session
+            col = box.column(align=True)
+            row = col.row(align=True)
+            row.operator("myaddon.vector_live_decode",
+                         text="Stop Live Decode" if live_decode_session.running else "Live Decode",
+                         icon='PAUSE' if live_decode_session.running else 'PLAY',
+                         depress=live_decode_session.running)
+            row.prop(scene, "vector_live_decode_debounce", text="Debounce")
+            if live_decode_session.running:
+                col.label(text=f"Live: {scene.vector_live_decode_rate:.1f} updates/s", icon='TIME')
+            
             # Apply source modifiers button
             col = box.column(align=True)
             col.scale_y = 1.2
@@ -452,6 +509,55 @@ class VIEW3D_PT_geometry_vectors(bpy.types.Panel):
         col = box.column(align=True)
         col.label(text="Animated interpolation")
         col.label(text="between geometries")
+        vertex_cache = loaded_module(".core.vertex_cache", __package__)
+        if vertex_cache is not None and vertex_cache.bound_objects():
+            col = box.column(align=True)
+            col.label(text=f"Vertex cache: {len(vertex_cache.bound_objects())} object(s)", icon='FILE_CACHE')
+            col.label(text=f"Playback {vertex_cache.playback_fps():.0f} fps, "
+                           f"{vertex_cache.stream_ms():.2f} ms/frame")
+        
+        layout.separator()
+        
+        # Decode cache
+        from .datablock_registry import format_bytes
+        box = layout.box()
+        box.label(text="Decode Cache", icon='FILE_CACHE')
+        box.prop(scene, "decode_cache_enabled")
+        if scene.decode_cache_enabled:
+            col = box.column(align=True)
+            col.prop(scene, "decode_cache_budget_mb")
+            col.prop(scene, "decode_cache_use_disk")
+            if scene.decode_cache_use_disk:
+                col.prop(scene, "decode_cache_dir", text="")
+            # No decode has run yet if the cache module was never imported
+            decode_cache = loaded_module(".core.decode_cache", __package__)
+            col = box.column(align=True)
+            if decode_cache is None:
+                col.label(text="No decode results cached yet")
+            else:
+                stats = decode_cache.get_cache().stats()
+                col.label(text=f"Hit rate {stats['hit_rate'] * 100:.0f}% "
+                               f"({stats['hits']} mem / {stats['disk_hits']} disk / {stats['misses']} miss)")
+                col.label(text=f"{stats['entries']} entries, {format_bytes(stats['bytes'])}, "
+                               f"{stats['evictions']} evictions")
+            box.operator("myaddon.clear_decode_cache", icon='TRASH')
+        
+        # Source meshes kept for decoding imported objects
+        from . import source_mesh_cache
+        box = layout.box()
+        box.label(text="Source Mesh Cache", icon='MESH_DATA')
+        col = box.column(align=True)
+        col.prop(scene, "source_mesh_cache_budget_mb")
+        stats = source_mesh_cache.stats()
+        col.label(text=f"{stats['entries']} entries, {format_bytes(stats['bytes'])}")
+        col = box.column(align=True)
+        col.prop(scene, "source_mesh_cache_offload")
+        if scene.source_mesh_cache_offload:
+            col.prop(scene, "source_mesh_cache_dir", text="")
+            col.prop(scene, "source_mesh_cache_max_age_days")
+            disk = source_mesh_cache.disk_stats(scene)
+            col.label(text=f"On disk: {disk['entries']} files, {format_bytes(disk['bytes'])}")
+        box.operator("myaddon.clear_source_mesh_cache", icon='TRASH')
         
         layout.separator()
         
@@ -465,11 +571,58 @@ class VIEW3D_PT_geometry_vectors(bpy.types.Panel):
         col.label(text="• Dimension: 32D latent space")
 
 
+class VIEW3D_PT_profiling(bpy.types.Panel):
+    bl_label = "Profiling"
+    bl_idname = "VIEW3D_PT_profiling"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'My Addon'
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    # Rows shown, slowest total time first
+    MAX_ROWS = 12
+    
+    def draw(self, context):
+        from . import profiler
+        from .datablock_registry import format_bytes
+        layout = self.layout
+        scene = context.scene
+        
+        row = layout.row(align=True)
+        row.prop(scene, "profiling_enabled", icon='TIME')
+        row.prop(scene, "profiling_track_allocations", text="", icon='MEMORY')
+        row = layout.row(align=True)
+        row.operator("myaddon.profiler_export_trace", text="Chrome Trace", icon='EXPORT')
+        row.operator("myaddon.profiler_reset", text="", icon='TRASH')
+        
+        rows = profiler.summary()
+        if not rows:
+            layout.label(text="No calls recorded", icon='INFO')
+            return
+        
+        box = layout.box()
+        col = box.column(align=True)
+        header = col.row()
+        header.label(text="Call")
+        header.label(text="n")
+        header.label(text="p50 / p95 ms")
+        for entry in rows[:self.MAX_ROWS]:
+            line = col.row()
+            line.label(text=entry["name"])
+            line.label(text=str(entry["count"]))
+            line.label(text=f"{entry['p50_ms']:.2f} / {entry['p95_ms']:.2f}")
+            if scene.profiling_track_allocations and entry["alloc_bytes"] > 0:
+                col.label(text=f"    allocated {format_bytes(entry['alloc_bytes'])}")
+        if len(rows) > self.MAX_ROWS:
+            col.label(text=f"... {len(rows) - self.MAX_ROWS} more (see the Chrome trace)")
+
+
 classes = (
     VIEW3D_PT_my_panel,
     VIEW3D_PT_my_second_panel,
     VIEW3D_PT_shape_transformer,
     VIEW3D_PT_geometry_vectors,
+    VIEW3D_PT_profiling,
 )
 
 def register():
@@ -0,0 +1,199 @@
+"""
+Adaptive Preview Quality
+Two-tier viewport resolution for interactive editing. While the vector
+editor, shape sliders or live decode are changing an object, its
+Subdivision viewport levels and noise octaves are capped; once edits stop
+for the scene's idle delay the object is promoted back to full quality.
+The viewport levels and noise depth an object had are kept in ID
+properties while it is demoted and are what promotion restores, so levels
+chosen by the user or a .gvec import survive; render levels are never
+touched.
+"""
+
+import bpy
+import time
+
+# Preview cap bounds (Subdivision viewport levels)
+MIN_PREVIEW_LEVEL = 0
+MAX_PREVIEW_LEVEL = 3
+
+# Cloud texture octaves used while previewing
+PREVIEW_NOISE_DEPTH = 0
+
+# Texture ID property holding the full-quality noise depth while demoted
+_FULL_NOISE_DEPTH_KEY = "gvec_full_noise_depth"
+
+# Object ID property: Subdivision modifier name -> [full levels, capped levels]
+_FULL_LEVELS_KEY = "gvec_full_subsurf_levels"
+
+# Per-scene state
+_preview_cap = {}          # scene name -> current subdivision cap
+_demoted = {}              # scene name -> set of object names at preview quality
+_last_interaction = {}     # scene name -> perf_counter of last edit
+_frame_time_ms = {}        # scene name -> last measured depsgraph evaluation time
+
+_eval_start = None
+
+
+def frame_time_ms(scene) -> float:
+    """Last measured depsgraph evaluation time for the scene (ms)"""
+    return _frame_time_ms.get(scene.name, 0.0)
+
+
+def preview_cap(scene) -> int:
+    """Current Subdivision viewport cap used while previewing"""
+    return _preview_cap.get(scene.name, 1)
+
+
+def is_previewing(scene) -> bool:
+    """True while any object of the scene is held at preview quality"""
+    return bool(_demoted.get(scene.name))
+
+
+def is_demoted(scene, obj) -> bool:
+    """True if `obj` is currently held at preview quality"""
+    return obj.name in _demoted.get(scene.name, ())
+
+
+def cap_viewport_levels(obj, mod, cap: int, key: str = _FULL_LEVELS_KEY):
+    """
+    Lower a Subdivision modifier's viewport levels to at most `cap`
+
+    The levels it had are remembered under the object's `key` property for
+    restore_viewport_levels(). If the levels changed since the last cap
+    (rebuilt modifier stack, import, user edit), the current value is taken
+    as the new full-quality one.
+    """
+    saved = obj.get(key)
+    if saved is None:
+        obj[key] = {}
+        saved = obj[key]
+    entry = saved.get(mod.name)
+    full = entry[0] if entry is not None and mod.levels == entry[1] else mod.levels
+    levels = min(full, cap)
+    if entry is None or tuple(entry) != (full, levels):
+        saved[mod.name] = [full, levels]
+    # Only write on change: every write triggers a depsgraph update
+    if mod.levels != levels:
+        mod.levels = levels
+
+
+def restore_viewport_levels(obj, key: str = _FULL_LEVELS_KEY):
+    """Undo cap_viewport_levels() for every Subdivision modifier still at its capped value"""
+    saved = obj.get(key)
+    if saved is None:
+        return
+    for mod in obj.modifiers:
+        entry = saved.get(mod.name) if mod.type == 'SUBSURF' else None
+        if entry is not None and mod.levels == entry[1] and mod.levels != entry[0]:
+            mod.levels = entry[0]
+    del obj[key]
+
+
+def _demote(scene, obj):
+    """Drop an object's viewport resolution to the preview tier"""
+    cap = preview_cap(scene)
+    for mod in obj.modifiers:
+        if mod.type == 'SUBSURF':
+            cap_viewport_levels(obj, mod, cap)
+        elif mod.type == 'DISPLACE' and mod.texture is not None and hasattr(mod.texture, "noise_depth"):
+            tex = mod.texture
+            if _FULL_NOISE_DEPTH_KEY not in tex:
+                tex[_FULL_NOISE_DEPTH_KEY] = tex.noise_depth
+            tex.noise_depth = min(tex[_FULL_NOISE_DEPTH_KEY], PREVIEW_NOISE_DEPTH)
+
+
+def _promote(obj):
+    """Restore an object's full viewport resolution"""
+    restore_viewport_levels(obj)
+    for mod in obj.modifiers:
+        if mod.type == 'DISPLACE' and mod.texture is not None:
+            tex = mod.texture
+            if _FULL_NOISE_DEPTH_KEY in tex:
+                tex.noise_depth = tex[_FULL_NOISE_DEPTH_KEY]
+                del tex[_FULL_NOISE_DEPTH_KEY]
+
+
+def mark_interaction(scene, obj):
+    """
+    Record an interactive edit of `obj`
+
+    The object is held at preview quality until no further edits arrive
+    for scene.preview_idle_delay seconds.
+    """
+    if obj is None or obj.type != 'MESH' or not scene.preview_adaptive:
+        return
+
+    _demote(scene, obj)
+    _demoted.setdefault(scene.name, set()).add(obj.name)
+    _last_interaction[scene.name] = time.perf_counter()
+
+    if not bpy.app.timers.is_registered(_promote_when_idle):
+        bpy.app.timers.register(_promote_when_idle, first_interval=scene.preview_idle_delay)
+
+
+def promote_all(scene):
+    """Bring every demoted object of the scene back to full quality"""
+    for name in _demoted.pop(scene.name, set()):
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            _promote(obj)
+
+
+def _promote_when_idle():
+    """Timer: promote scenes whose last edit is older than their idle delay"""
+    now = time.perf_counter()
+    next_check = None
+
+    for scene in bpy.data.scenes:
+        if not _demoted.get(scene.name):
+            continue
+        idle = now - _last_interaction.get(scene.name, 0.0)
+        if idle >= scene.preview_idle_delay:
+            promote_all(scene)
+        else:
+            remaining = scene.preview_idle_delay - idle
+            next_check = remaining if next_check is None else min(next_check, remaining)
+
+    return next_check
+
+
+def begin_evaluation():
+    """Depsgraph pre-update hook: start timing an evaluation"""
+    global _eval_start
+    _eval_start = time.perf_counter()
+
+
+def end_evaluation(scene):
+    """
+    Depsgraph post-update hook: record the evaluation time and, while
+    previewing, adapt the subdivision cap to the scene's frame budget
+    """
+    global _eval_start
+    if _eval_start is None or scene is None:
+        return
+    elapsed_ms = (time.perf_counter() - _eval_start) * 1000.0
+    _eval_start = None
+    _frame_time_ms[scene.name] = elapsed_ms
+
+    if not is_previewing(scene):
+        return
+
+    budget = scene.preview_quality_budget
+    cap = preview_cap(scene)
+    if elapsed_ms > budget and cap > MIN_PREVIEW_LEVEL:
+        _preview_cap[scene.name] = cap - 1
+    elif elapsed_ms < budget * 0.5 and cap < MAX_PREVIEW_LEVEL:
+        _preview_cap[scene.name] = cap + 1
+
+
+def reset():
+    """Promote everything and forget all state (addon unregister / file load)"""
+    for scene in bpy.data.scenes:
+        promote_all(scene)
+    _demoted.clear()
+    _preview_cap.clear()
+    _last_interaction.clear()
+    _frame_time_ms.clear()
+    if bpy.app.timers.is_registered(_promote_when_idle):
+        bpy.app.timers.unregister(_promote_when_idle)
@@ -3,6 +3,32 @@ import bpy
 def update_dropdown(self, context):
     print(f"Dropdown selected: {self.my_dropdown}")
 
+def update_lod_enabled(self, context):
+    from . import lod_manager
+    if self.lod_enabled:
+        lod_manager.start()
+    # Disabling is picked up by the timer, which restores full quality and stops
+
+def update_profiling(self, context):
+    from . import profiler
+    profiler.enable(self.profiling_enabled, self.profiling_track_allocations)
+
+def update_source_mesh_offload(self, context):
+    """Move the scene's source mesh to disk, or back into the file when offloading is turned off"""
+    from . import source_mesh_cache
+    if self.source_mesh_cache_offload:
+        source_mesh_cache.offload(self)
+    else:
+        source_mesh_cache.restore(self)
+
+def update_preview_interaction(self, context):
+    """Hold the edited object at preview quality while sliders are moving"""
+    from . import preview_quality
+    obj = context.active_object
+    if obj is None or obj.type != 'MESH':
+        obj = bpy.data.objects.get("MyShapeObject")
+    preview_quality.mark_interaction(self, obj)
+
 # Icons for the preview popup
 icon_preview_items = [
     ('QUESTION', "Question", "", 'QUESTION', 0),
@@ -30,7 +56,13 @@ class ShapePartItem(bpy.types.PropertyGroup):
     name: bpy.props.StringProperty(name="Part Name")
     object_ref: bpy.props.StringProperty(name="Object Reference")
 
-classes = (FilePathItem, ListItem, PanelItem, ShapePartItem)
+class GeneratedDatablockItem(bpy.types.PropertyGroup):
+    """Registry entry for a datablock created by a procedural generator"""
+    name: bpy.props.StringProperty(name="Datablock Name")
+    id_type: bpy.props.StringProperty(name="Datablock Type")
+    generator: bpy.props.StringProperty(name="Generator")
+
+classes = (FilePathItem, ListItem, PanelItem, ShapePartItem, GeneratedDatablockItem)
 
 def register():
     for cls in classes:
@@ -59,7 +91,8 @@ def register():
         name="Dimensions",
         default=(2.0, 2.0, 2.0),
         min=0.001,
-        subtype='XYZ'
+        subtype='XYZ',
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_sphericity = bpy.props.FloatProperty(
         name="Sphericity",
@@ -67,7 +100,8 @@ def register():
         min=0.0,
         max=1.0,
         subtype='FACTOR',
-        description="Transform cube to sphere"
+        description="Transform cube to sphere",
+        update=update_preview_interaction
     )
     # Additional topology transformation parameters
     bpy.types.Scene.my_shape_taper = bpy.props.FloatProperty(
@@ -76,7 +110,8 @@ def register():
         min=-1.0,
         max=1.0,
         subtype='FACTOR',
-        description="Taper the shape (cone-like)"
+        description="Taper the shape (cone-like)",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_twist = bpy.props.FloatProperty(
         name="Twist",
@@ -84,7 +119,8 @@ def register():
         min=-3.14159,
         max=3.14159,
         subtype='ANGLE',
-        description="Twist the shape along Z axis"
+        description="Twist the shape along Z axis",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_bend = bpy.props.FloatProperty(
         name="Bend",
@@ -92,7 +128,8 @@ def register():
         min=-3.14159,
         max=3.14159,
         subtype='ANGLE',
-        description="Bend the shape"
+        description="Bend the shape",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_inflate = bpy.props.FloatProperty(
         name="Inflate",
@@ -100,42 +137,48 @@ def register():
         min=-1.0,
         max=1.0,
         subtype='FACTOR',
-        description="Inflate/deflate the shape"
+        description="Inflate/deflate the shape",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_wave_amplitude = bpy.props.FloatProperty(
         name="Wave Amplitude",
         default=0.0,
         min=0.0,
         max=2.0,
-        description="Wave deformation amplitude"
+        description="Wave deformation amplitude",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_wave_frequency = bpy.props.FloatProperty(
         name="Wave Frequency",
         default=1.0,
         min=0.1,
         max=10.0,
-        description="Wave deformation frequency"
+        description="Wave deformation frequency",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_noise_strength = bpy.props.FloatProperty(
         name="Noise Strength",
         default=0.0,
         min=0.0,
         max=2.0,
-        description="Random noise displacement"
+        description="Random noise displacement",
+        update=update_preview_interaction
     )
     bpy.types.Scene.my_shape_noise_scale = bpy.props.FloatProperty(
         name="Noise Scale",
         default=0.5,
         min=0.01,
         max=5.0,
-        description="Scale of noise pattern"
+        description="Scale of noise pattern",
+        update=update_preview_interaction
     )
     # Advanced helix/spiral parameters
     bpy.types.Scene.my_shape_helix_turns = bpy.props.IntProperty(
         name="Helix Turns",
         default=3,
         min=1,
-        max=20,
+        max=100,
+        soft_max=20,
         description="Number of spiral turns"
     )
     bpy.types.Scene.my_shape_helix_radius = bpy.props.FloatProperty(
@@ -152,6 +195,18 @@ def register():
         max=50.0,
         description="Total height of helix"
     )
+    bpy.types.Scene.my_shape_helix_segments = bpy.props.IntProperty(
+        name="Segments per Turn",
+        default=0,
+        min=0,
+        max=128,
+        description="Path resolution of the helix sweep (0 = adapt to helix radius)"
+    )
+    bpy.types.Scene.my_shape_helix_curve = bpy.props.BoolProperty(
+        name="Keep Path Curve",
+        default=False,
+        description="Also create a hidden HelixCurve object following the helix path"
+    )
     bpy.types.Scene.my_shape_preset = bpy.props.EnumProperty(
         name="Preset",
         items=[
@@ -208,6 +263,7 @@ def register():
     )
     # Shape parts collection
     bpy.types.Scene.my_shape_parts = bpy.props.CollectionProperty(type=ShapePartItem)
+    bpy.types.Scene.my_generated_datablocks = bpy.props.CollectionProperty(type=GeneratedDatablockItem)
     bpy.types.Scene.my_shape_parts_index = bpy.props.IntProperty()
     
     # Staircase parameters
@@ -215,7 +271,8 @@ def register():
         name="Number of Steps",
         default=10,
         min=1,
-        max=50,
+        max=1000,
+        soft_max=200,
         description="Number of stair steps"
     )
     bpy.types.Scene.my_stair_step_width = bpy.props.FloatProperty(
@@ -249,6 +306,15 @@ def register():
         default='STRAIGHT',
         description="Type of staircase"
     )
+    bpy.types.Scene.my_stair_build_mode = bpy.props.EnumProperty(
+        name="Build Mode",
+        items=[
+            ('SINGLE_MESH', "Single Mesh", "Generate all steps into one mesh"),
+            ('INSTANCES', "Instances", "Instance one step mesh per step with Geometry Nodes"),
+        ],
+        default='SINGLE_MESH',
+        description="How staircase steps are generated"
+    )
     # Character parameters
     bpy.types.Scene.my_character_gender = bpy.props.EnumProperty(
         name="Gender",
@@ -285,6 +351,11 @@ def register():
         subtype='FACTOR',
         description="Character build (thin to heavy)"
     )
+    bpy.types.Scene.my_generator_part_materials = bpy.props.BoolProperty(
+        name="Part Materials",
+        default=False,
+        description="Assign one material slot per part group (body, wings, limbs, ...) to generated presets"
+    )
     # Collapse/expand states for parameter sections
     bpy.types.Scene.show_aircraft_params = bpy.props.BoolProperty(name="Show Aircraft Parameters", default=True)
     bpy.types.Scene.show_basic_props = bpy.props.BoolProperty(name="Show Basic Properties", default=True)
@@ -300,7 +371,8 @@ def register():
         name="Geometry Vector",
         size=32,
         default=[0.0] * 32,
-        description="Current 32D geometry vector for editing"
+        description="Current 32D geometry vector for editing",
+        update=update_preview_interaction
     )
     bpy.types.Scene.geom_vector_clipboard = bpy.props.FloatVectorProperty(
         name="Vector Clipboard",
@@ -351,18 +423,238 @@ def register():
         description="Name of the original mesh data for imported objects"
     )
     
+    # Live decode (modal vector scrubbing)
+    bpy.types.Scene.vector_live_decode_debounce = bpy.props.FloatProperty(
+        name="Debounce",
+        default=0.05,
+        min=0.0,
+        max=1.0,
+        precision=3,
+        description="Minimum seconds between live decodes; edits within the window are coalesced"
+    )
+    bpy.types.Scene.vector_live_decode_rate = bpy.props.FloatProperty(
+        name="Updates/s",
+        default=0.0,
+        description="Achieved live decode updates per second"
+    )
+    
+    # Adaptive preview resolution
+    bpy.types.Scene.preview_adaptive = bpy.props.BoolProperty(
+        name="Adaptive Preview",
+        default=True,
+        description="Lower viewport subdivision and noise detail while editing, restore it when idle"
+    )
+    bpy.types.Scene.preview_idle_delay = bpy.props.FloatProperty(
+        name="Idle Delay",
+        default=0.4,
+        min=0.05,
+        max=5.0,
+        description="Seconds without edits before objects are promoted back to full quality"
+    )
+    bpy.types.Scene.preview_quality_budget = bpy.props.FloatProperty(
+        name="Frame Budget (ms)",
+        default=33.0,
+        min=1.0,
+        max=1000.0,
+        description="Target evaluation time while previewing; the preview subdivision level adapts to stay under it"
+    )
+    
+    # Camera-distance LOD for vector-generated objects
+    bpy.types.Scene.lod_enabled = bpy.props.BoolProperty(
+        name="Distance LOD",
+        default=False,
+        description="Lower viewport detail of vector-generated objects that are small on screen",
+        update=update_lod_enabled
+    )
+    bpy.types.Scene.lod_interval = bpy.props.FloatProperty(
+        name="Update Interval",
+        default=0.25,
+        min=0.05,
+        max=5.0,
+        description="Seconds between LOD updates"
+    )
+    bpy.types.Scene.lod_high_px = bpy.props.FloatProperty(
+        name="Full Detail Size (px)",
+        default=300.0,
+        min=1.0,
+        description="Objects larger than this on screen keep full viewport detail"
+    )
+    bpy.types.Scene.lod_low_px = bpy.props.FloatProperty(
+        name="Low Detail Size (px)",
+        default=80.0,
+        min=1.0,
+        description="Objects smaller than this on screen have expensive modifiers hidden in the viewport"
+    )
+    bpy.types.Scene.lod_hysteresis = bpy.props.FloatProperty(
+        name="Hysteresis",
+        default=0.15,
+        min=0.0,
+        max=0.9,
+        subtype='FACTOR',
+        description="Relative margin around each size threshold to prevent flickering between levels"
+    )
+    
+    # Decode result cache
+    bpy.types.Scene.decode_cache_enabled = bpy.props.BoolProperty(
+        name="Decode Cache",
+        default=True,
+        description="Reuse evaluated results when interpolating or blending to a vector seen before "
+                    "(the result is applied as plain mesh data)"
+    )
+    bpy.types.Scene.decode_cache_budget_mb = bpy.props.FloatProperty(
+        name="Memory Budget (MB)",
+        default=256.0,
+        min=1.0,
+        max=16384.0,
+        description="Memory the decode cache may hold before evicting least recently used results"
+    )
+    bpy.types.Scene.decode_cache_use_disk = bpy.props.BoolProperty(
+        name="Disk Tier",
+        default=False,
+        description="Also keep decode results on disk so they survive eviction and restarts"
+    )
+    bpy.types.Scene.decode_cache_dir = bpy.props.StringProperty(
+        name="Cache Directory",
+        default="",
+        subtype='DIR_PATH',
+        description="Directory for the disk tier (empty = Blender temp directory)"
+    )
+    
     # Auto-bind vector editor to selected object
     bpy.types.Scene.vector_editor_auto_bind = bpy.props.BoolProperty(
         name="Auto-Bind to Selection",
         default=True,
         description="Automatically load vectors from selected object"
     )
+    
+    # Profiling
+    bpy.types.Scene.profiling_enabled = bpy.props.BoolProperty(
+        name="Profile",
+        default=False,
+        description="Record timings of operators, handlers and file I/O (near-zero cost when off)",
+        update=update_profiling
+    )
+    bpy.types.Scene.profiling_track_allocations = bpy.props.BoolProperty(
+        name="Track Allocations",
+        default=False,
+        description="Also record Python allocation deltas with tracemalloc (slows everything down)",
+        update=update_profiling
+    )
+    
+    # Source mesh cache (deduplicated __vector_source_ backups)
+    bpy.types.Scene.source_mesh_cache_budget_mb = bpy.props.FloatProperty(
+        name="Memory Budget (MB)",
+        default=128.0,
+        min=0.0,
+        max=16384.0,
+        description="Memory cached source meshes may hold before unreferenced ones are evicted, "
+                    "least recently used first"
+    )
+    bpy.types.Scene.source_mesh_cache_offload = bpy.props.BoolProperty(
+        name="Offload to Disk",
+        default=False,
+        description="Keep source meshes in a local cache directory instead of the .blend file; "
+                    "only a handle is stored and the mesh is reloaded when decoding needs it",
+        update=update_source_mesh_offload
+    )
+    bpy.types.Scene.source_mesh_cache_dir = bpy.props.StringProperty(
+        name="Cache Directory",
+        default="",
+        subtype='DIR_PATH',
+        description="Directory for offloaded source meshes (empty = per-user Blender data directory)"
+    )
+    bpy.types.Scene.source_mesh_cache_max_age_days = bpy.props.IntProperty(
+        name="Keep Unused (days)",
+        default=30,
+        min=0,
+        description="Offloaded meshes no open scene refers to are deleted once unused for this long"
+    )
 
 def unregister():
+    try:
+        del bpy.types.Scene.source_mesh_cache_max_age_days
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.source_mesh_cache_dir
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.source_mesh_cache_offload
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.source_mesh_cache_budget_mb
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.profiling_track_allocations
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.profiling_enabled
+    except AttributeError:
+        pass
     try:
         del bpy.types.Scene.vector_editor_auto_bind
     except AttributeError:
         pass
+    try:
+        del bpy.types.Scene.decode_cache_dir
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.decode_cache_use_disk
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.decode_cache_budget_mb
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.decode_cache_enabled
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.lod_hysteresis
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.lod_low_px
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.lod_high_px
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.lod_interval
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.lod_enabled
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.preview_quality_budget
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.preview_idle_delay
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.preview_adaptive
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.vector_live_decode_rate
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.vector_live_decode_debounce
+    except AttributeError:
+        pass
     try:
         del bpy.types.Scene.vector_source_preset
     except AttributeError:
@@ -423,6 +715,10 @@ def unregister():
         del bpy.types.Scene.show_basic_props
     except AttributeError:
         pass
+    try:
+        del bpy.types.Scene.my_generator_part_materials
+    except AttributeError:
+        pass
     try:
         del bpy.types.Scene.show_aircraft_params
     except AttributeError:
@@ -443,6 +739,10 @@ def unregister():
         del bpy.types.Scene.my_character_gender
     except AttributeError:
         pass
+    try:
+        del bpy.types.Scene.my_stair_build_mode
+    except AttributeError:
+        pass
     try:
         del bpy.types.Scene.my_stair_type
     except AttributeError:
@@ -467,6 +767,10 @@ def unregister():
         del bpy.types.Scene.my_shape_parts_index
     except AttributeError:
         pass
+    try:
+        del bpy.types.Scene.my_generated_datablocks
+    except AttributeError:
+        pass
     try:
         del bpy.types.Scene.my_shape_parts
     except AttributeError:
@@ -495,6 +799,14 @@ def unregister():
         del bpy.types.Scene.my_shape_preset
     except AttributeError:
         pass
+    try:
+        del bpy.types.Scene.my_shape_helix_curve
+    except AttributeError:
+        pass
+    try:
+        del bpy.types.Scene.my_shape_helix_segments
+    except AttributeError:
+        pass
     try:
         del bpy.types.Scene.my_shape_helix_height
     except AttributeError:
@@ -0,0 +1,291 @@
+"""
+Source Mesh Cache
+Manages the hidden `__vector_source_*` mesh copies that decoding starts
+from. Entries are named after a content hash of the mesh, so loading the
+same geometry twice reuses one copy instead of stacking duplicates.
+References are counted from the scenes' vector_source_mesh and the
+objects' geometry_vector_source_mesh markers on demand, so deleted
+objects and reloaded files never leave stale counts behind. Entries
+nothing references are evicted least recently used first once the cache
+outgrows the scene's memory budget.
+
+With Scene.source_mesh_cache_offload the mesh goes to a content-addressed
+directory instead (core.mesh_store) and the scene keeps only a
+"disk:<hash>" handle in vector_source_mesh; build_source_mesh() reads it
+back with foreach_set when a decode needs it. Offloaded meshes cost no
+RAM and do not grow saved .blend files.
+"""
+
+import bpy
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from .datablock_registry import estimate_bytes
+from .lazy_loader import lazy_import
+
+# Only hashing needs these; the panel reads stats without loading them
+np = lazy_import("numpy")
+mesh_builder = lazy_import(".core.mesh_builder", __package__)
+mesh_store = lazy_import(".core.mesh_store", __package__)
+
+PREFIX = "__vector_source_"
+HANDLE_PREFIX = "disk:"
+
+# Custom properties on cache entries
+HASH_KEY = "gvec_source_hash"
+USED_KEY = "gvec_source_used"
+
+# Object marker written by .gvec imports (see GeometryFileFormat.restore_object_from_file)
+OBJECT_REF_KEY = "geometry_vector_source_mesh"
+
+
+_disk_gc_done = False
+
+
+def _mesh_payload(mesh):
+    """(MeshBuffers, active UVs or None, material slot names) of a mesh"""
+    uvs = None
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+    names = [mat.name if mat else "" for mat in mesh.materials]
+    return mesh_builder.read_mesh(mesh), uvs, names
+
+
+def content_hash(mesh) -> str:
+    """SHA-1 over the geometry, active UVs and material slots of a mesh"""
+    return mesh_store.buffers_hash(*_mesh_payload(mesh))
+
+
+def is_handle(value: str) -> bool:
+    return value.startswith(HANDLE_PREFIX)
+
+
+def store_directory(scene) -> str:
+    """Offload directory: the scene's setting, else a per-user data directory shared by all files"""
+    if scene.source_mesh_cache_dir:
+        return bpy.path.abspath(scene.source_mesh_cache_dir)
+    return bpy.utils.user_resource('DATAFILES', path="gvec_source_meshes", create=True)
+
+
+def get_store(scene):
+    return mesh_store.MeshStore(store_directory(scene))
+
+
+def entries() -> List[bpy.types.Mesh]:
+    """Every cached source mesh, including untagged copies from older versions"""
+    return [mesh for mesh in bpy.data.meshes if mesh.name.startswith(PREFIX)]
+
+
+def disk_references() -> Set[str]:
+    """Store keys that any scene's vector_source_mesh handle refers to"""
+    return {scene.vector_source_mesh[len(HANDLE_PREFIX):] for scene in bpy.data.scenes
+            if is_handle(getattr(scene, "vector_source_mesh", ""))}
+
+
+def references() -> Dict[str, int]:
+    """Entry name -> number of scenes and objects referring to it"""
+    counts = {mesh.name: 0 for mesh in entries()}
+    for scene in bpy.data.scenes:
+        name = getattr(scene, "vector_source_mesh", "")
+        if name in counts:
+            counts[name] += 1
+    for obj in bpy.data.objects:
+        name = obj.get(OBJECT_REF_KEY)
+        if name in counts:
+            counts[name] += 1
+    return counts
+
+
+def touch(mesh):
+    """Mark an entry as just used"""
+    mesh[USED_KEY] = time.time()
+
+
+def stats() -> Dict:
+    """Entry count and estimated bytes (cheap enough for panel redraws)"""
+    meshes = entries()
+    return {"entries": len(meshes), "bytes": sum(estimate_bytes(mesh) for mesh in meshes)}
+
+
+def acquire(scene, mesh, copy: bool = True) -> str:
+    """
+    Make `mesh` the scene's source mesh through the cache
+
+    Identical geometry maps to the entry that already holds it; otherwise
+    the mesh (a copy of it unless `copy` is False, in which case the cache
+    takes it over) becomes a new entry. Unreferenced entries beyond the
+    scene's budget are evicted afterwards. With offloading on, the mesh is
+    written to the store instead and only its handle is kept.
+
+    Returns:
+        the entry name or handle now in scene.vector_source_mesh
+    """
+    if scene.source_mesh_cache_offload:
+        return _acquire_on_disk(scene, mesh, copy)
+
+    key = content_hash(mesh)
+    name = PREFIX + key[:16]
+    entry = bpy.data.meshes.get(name)
+    if entry is not None and entry.get(HASH_KEY) != key:
+        # Same prefix, different content: a renamed or edited entry; rebuild it
+        bpy.data.meshes.remove(entry)
+        entry = None
+
+    if entry is None:
+        entry = mesh.copy() if copy else mesh
+        entry.name = name
+        entry[HASH_KEY] = key
+    elif not copy and mesh != entry:
+        bpy.data.meshes.remove(mesh)
+
+    touch(entry)
+    scene.vector_source_mesh = entry.name
+    enforce_budget(int(scene.source_mesh_cache_budget_mb * 1024 * 1024))
+    return entry.name
+
+
+def _acquire_on_disk(scene, mesh, copy: bool) -> str:
+    global _disk_gc_done
+    store = get_store(scene)
+    key = store.save(*_mesh_payload(mesh))
+    if not copy and mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+    scene.vector_source_mesh = HANDLE_PREFIX + key
+    # The previous entry of this scene may be unreferenced now
+    enforce_budget(int(scene.source_mesh_cache_budget_mb * 1024 * 1024))
+    if not _disk_gc_done:
+        _disk_gc_done = True
+        collect_disk_garbage(scene)
+    return scene.vector_source_mesh
+
+
+def build_source_mesh(scene, name: str) -> Optional[bpy.types.Mesh]:
+    """
+    New mesh `name` holding the scene's source mesh, or None if it has none
+
+    In-memory entries are copied; offloaded ones are read from the store
+    and written with foreach_set. A missing or damaged file clears the
+    scene's handle (decoding then falls back to parametric geometry).
+    """
+    value = scene.vector_source_mesh
+    if not value:
+        return None
+
+    if not is_handle(value):
+        entry = bpy.data.meshes.get(value)
+        if entry is None:
+            return None
+        touch(entry)
+        mesh = entry.copy()
+        mesh.name = name
+        for key in (HASH_KEY, USED_KEY):
+            if key in mesh:
+                del mesh[key]
+        return mesh
+
+    try:
+        buffers, uvs, material_names = get_store(scene).load(value[len(HANDLE_PREFIX):])
+    except (OSError, ValueError) as e:
+        print(f"[GVEC] Source mesh {value} unavailable ({e}); decoding without it")
+        scene.vector_source_mesh = ""
+        return None
+    mesh = bpy.data.meshes.new(name)
+    mesh_builder.write_mesh(mesh, buffers)
+    if uvs is not None:
+        mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs.ravel())
+    for material_name in material_names:
+        mesh.materials.append(bpy.data.materials.get(material_name) if material_name else None)
+    return mesh
+
+
+def offload(scene) -> bool:
+    """Move the scene's in-memory source mesh to the store; True if one was moved"""
+    entry = bpy.data.meshes.get(scene.vector_source_mesh) if scene.vector_source_mesh else None
+    if entry is None or is_handle(scene.vector_source_mesh):
+        return False
+    scene.vector_source_mesh = HANDLE_PREFIX + get_store(scene).save(*_mesh_payload(entry))
+    if references().get(entry.name, 0) == 0:
+        bpy.data.meshes.remove(entry)
+    return True
+
+
+def restore(scene) -> bool:
+    """Bring the scene's offloaded source mesh back into bpy.data; True if one was restored"""
+    if not is_handle(scene.vector_source_mesh):
+        return False
+    mesh = build_source_mesh(scene, "__vector_source_restore")
+    if mesh is None:
+        return False
+    key = content_hash(mesh)
+    name = PREFIX + key[:16]
+    existing = bpy.data.meshes.get(name)
+    if existing is not None and existing.get(HASH_KEY) == key:
+        bpy.data.meshes.remove(mesh)
+        mesh = existing
+    else:
+        if existing is not None:
+            bpy.data.meshes.remove(existing)
+        mesh.name = name
+        mesh[HASH_KEY] = key
+    touch(mesh)
+    scene.vector_source_mesh = mesh.name
+    return True
+
+
+def collect_disk_garbage(scene) -> Tuple[int, int]:
+    """
+    Delete store files no scene in this session refers to and that have not
+    been used for Scene.source_mesh_cache_max_age_days
+
+    Returns:
+        (files removed, bytes freed)
+    """
+    return get_store(scene).gc(disk_references(), scene.source_mesh_cache_max_age_days * 86400.0)
+
+
+def disk_stats(scene) -> Dict:
+    """Entry count and bytes of the scene's offload directory"""
+    directory = store_directory(scene)
+    if not os.path.isdir(directory):
+        return {"entries": 0, "bytes": 0}
+    return get_store(scene).stats()
+
+
+def enforce_budget(budget_bytes: int) -> Tuple[int, int]:
+    """
+    Evict unreferenced entries, least recently used first, until the cache fits
+
+    Referenced entries are never evicted, so the cache can stay above budget
+    while every entry is in use.
+
+    Returns:
+        (entries removed, approximate bytes reclaimed)
+    """
+    meshes = entries()
+    sizes = {mesh.name: estimate_bytes(mesh) for mesh in meshes}
+    total = sum(sizes.values())
+    if total <= budget_bytes:
+        return 0, 0
+
+    counts = references()
+    candidates = sorted((mesh for mesh in meshes if counts.get(mesh.name, 0) == 0 and mesh.users == 0),
+                        key=lambda mesh: mesh.get(USED_KEY, 0.0))
+    removed = 0
+    reclaimed = 0
+    for mesh in candidates:
+        if total <= budget_bytes:
+            break
+        size = sizes[mesh.name]
+        bpy.data.meshes.remove(mesh)
+        total -= size
+        reclaimed += size
+        removed += 1
+    return removed, reclaimed
+
+
+def clear_unreferenced() -> Tuple[int, int]:
+    """Remove every entry nothing references"""
+    return enforce_budget(-1)
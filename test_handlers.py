@@ -1,14 +1,17 @@
 """Test script to verify handlers module can be imported in Blender"""
+import importlib
 import sys
 import os
 
-# Add addon path
+# Add the directory containing the addon, so it imports as a package
 addon_path = r"d:\Users\PC\PycharmProjects\blenderUI"
-if addon_path not in sys.path:
-    sys.path.insert(0, addon_path)
+parent_path, package_name = os.path.split(addon_path)
+if parent_path not in sys.path:
+    sys.path.insert(0, parent_path)
 
 try:
-    import handlers
+    # handlers uses relative imports (profiler, lazy_loader), so load it through the package
+    handlers = importlib.import_module(f"{package_name}.handlers")
     print("✓ handlers module imported successfully")
     print(f"✓ Available functions: {[x for x in dir(handlers) if not x.startswith('_')]}")
     
@@ -59,11 +59,11 @@ def test_vector_decode_export_import():
     obj_b.name = "Modified"
     
     # Verify vector was saved to object
-    has_vector = all(f"geom_vector_{i}" in obj_b for i in range(32))
+    has_vector = "geom_vector" in obj_b
     print(f"   ✓ Vector saved to object: {has_vector}")
     
     if has_vector:
-        saved_value = obj_b["geom_vector_0"]
+        saved_value = obj_b["geom_vector"][0]
         print(f"   ✓ Saved vector[0]: {saved_value:.4f}")
         print(f"   ✓ Source: {obj_b.get('geometry_vector_source', 'unknown')}")
     
@@ -82,7 +82,7 @@ def test_vector_decode_export_import():
     obj_c.name = "Restored"
     
     # Verify restored vector matches modified vector
-    restored_value = obj_c.get("geom_vector_0")
+    restored_value = obj_c["geom_vector"][0] if "geom_vector" in obj_c else None
     
     print("\n" + "=" * 60)
     print("TEST RESULTS")
@@ -145,7 +145,7 @@ def test_batch_export():
         obj.select_set(True)
         objects.append(obj)
         
-        print(f"   Created {obj.name} with vector[0] = {obj['geom_vector_0']:.4f}")
+        print(f"   Created {obj.name} with vector[0] = {obj['geom_vector'][0]:.4f}")
     
     # Batch export
     print("\n[2/4] Batch exporting...")
@@ -153,7 +153,7 @@ def test_batch_export():
     bpy.ops.myaddon.export_gvec_batch(filepath=filepath_batch)
     
     # Store original values
-    original_vectors = [[obj[f"geom_vector_{i}"] for i in range(32)] for obj in objects]
+    original_vectors = [list(obj["geom_vector"]) for obj in objects]
     
     # Delete all
     print("[3/4] Deleting all objects...")
@@ -174,7 +174,7 @@ def test_batch_export():
     for i, obj in enumerate(imported_objects):
         if i < len(original_vectors):
             original = original_vectors[i][0]
-            restored = obj.get("geom_vector_0", 0.0)
+            restored = obj["geom_vector"][0] if "geom_vector" in obj else 0.0
             
             match = abs(restored - original) < 0.001
             status = "✅" if match else "❌"
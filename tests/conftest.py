@@ -0,0 +1,23 @@
+"""
+Plain pytest setup for the bpy-free core subpackage
+
+The add-on directory is a package whose other modules need Blender, so the
+tests import the core modules through it (<addon>.core.<module>) with its
+parent directory on sys.path. Run from the add-on directory:
+
+    python -m pytest -q tests
+"""
+
+import importlib
+import os
+import sys
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if os.path.dirname(ADDON_DIR) not in sys.path:
+    sys.path.insert(0, os.path.dirname(ADDON_DIR))
+ADDON_PACKAGE = os.path.basename(ADDON_DIR)
+
+
+def core_module(name: str):
+    """Import <addon>.core.<name>"""
+    return importlib.import_module(f"{ADDON_PACKAGE}.core.{name}")
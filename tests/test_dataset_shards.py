@@ -0,0 +1,105 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import core_module
+
+dataset_shards = core_module("dataset_shards")
+mesh_builder = core_module("mesh_builder")
+worker_farm = core_module("worker_farm")
+
+
+def write_chunk(directory, names, labels, shard_size=2, offset=0.0):
+    """Dataset of one box per name; vector row i is filled with offset + i"""
+    writer = dataset_shards.ShardWriter(str(directory), shard_size=shard_size)
+    meshes = []
+    for start in range(0, len(names), shard_size):
+        rows = names[start:start + shard_size]
+        shard = writer.begin_shard(len(rows))
+        for row in range(len(rows)):
+            shard.vectors[row] = offset + start + row
+            buffers = mesh_builder.box_buffers([(offset + start + row, 0.0, 0.0)], 1.0)
+            buffers.material_ids = np.full(buffers.face_count, row, dtype=np.int32)
+            shard.add_mesh(buffers)
+            meshes.append(buffers)
+        writer.commit_shard(shard, rows, labels[start:start + shard_size])
+    return meshes
+
+
+def test_write_read_round_trip(tmp_path):
+    names = ["a", "b", "c"]
+    meshes = write_chunk(tmp_path, names, ["box", "crate", "box"])
+
+    data = dataset_shards.ShardedDataset(str(tmp_path))
+    assert len(data) == 3 and data.shard_count == 2
+    assert data.labels == ["box", "crate"]
+    assert data.names(0) == ["a", "b"] and data.names(1) == ["c"]
+    vectors = np.concatenate([v for v, _ in data.iter_shards()])
+    label_ids = np.concatenate([ids for _, ids in data.iter_shards()])
+    assert np.array_equal(vectors[:, 0], [0.0, 1.0, 2.0])
+    assert label_ids.tolist() == [0, 1, 0]
+
+    for index, (shard, row) in enumerate([(0, 0), (0, 1), (1, 0)]):
+        mesh = data.mesh(shard, row)
+        assert np.array_equal(mesh.vertices, meshes[index].vertices)
+        assert np.array_equal(mesh.loops, meshes[index].loops)
+        assert np.array_equal(mesh.material_ids, meshes[index].material_ids)
+    data.close()
+
+
+def test_resume_keeps_shards_and_checks_settings(tmp_path):
+    write_chunk(tmp_path, ["a", "b"], ["box", "box"])
+    writer = dataset_shards.ShardWriter(str(tmp_path), shard_size=2)
+    assert writer.count == 2 and writer.completed_names() == {"a", "b"}
+    with pytest.raises(ValueError):
+        dataset_shards.ShardWriter(str(tmp_path), shard_size=4)
+
+    writer = dataset_shards.ShardWriter(str(tmp_path), shard_size=4, resume=False)
+    assert writer.count == 0
+    assert not os.path.exists(tmp_path / dataset_shards.shard_name(0))
+
+
+def test_aborted_shard_is_not_listed(tmp_path):
+    writer = dataset_shards.ShardWriter(str(tmp_path), shard_size=2, include_mesh=False)
+    shard = writer.begin_shard(2)
+    writer.abort_shard(shard)
+    assert writer.count == 0
+    assert dataset_shards.read_manifest(str(tmp_path))["shards"] == []
+    assert os.listdir(tmp_path) == [dataset_shards.MANIFEST_NAME]
+
+
+def test_merge_manifests_remaps_labels(tmp_path):
+    first = tmp_path / "chunk_0"
+    second = tmp_path / "chunk_1"
+    write_chunk(first, ["a", "b", "c"], ["box", "crate", "box"])
+    second_meshes = write_chunk(second, ["d", "e"], ["barrel", "box"], offset=10.0)
+
+    merged = worker_farm.merge_manifests(str(tmp_path), [str(first), str(second), str(tmp_path / "missing")],
+                                         info={"run": 1})
+    assert merged["count"] == 5
+    assert merged["labels"] == ["box", "crate", "barrel"]
+    assert merged["info"]["run"] == 1
+    assert [entry["start"] for entry in merged["shards"]] == [0, 2, 3]
+    assert [entry["index"] for entry in merged["shards"]] == [0, 1, 2]
+    assert merged["shards"][2]["path"] == "chunk_1/" + dataset_shards.shard_name(0)
+
+    data = dataset_shards.ShardedDataset(str(tmp_path))
+    assert len(data) == 5
+    label_ids = np.concatenate([ids for _, ids in data.iter_shards()])
+    assert [data.labels[i] for i in label_ids] == ["box", "crate", "box", "barrel", "box"]
+    vectors = np.concatenate([v for v, _ in data.iter_shards()])
+    assert np.array_equal(vectors[:, 0], [0.0, 1.0, 2.0, 10.0, 11.0])
+    assert [name for shard in range(data.shard_count) for name in data.names(shard)] == list("abcde")
+    assert np.array_equal(data.mesh(2, 1).vertices, second_meshes[1].vertices)
+    data.close()
+
+    # The rewritten chunk stays readable on its own
+    chunk = dataset_shards.ShardedDataset(str(second))
+    assert [chunk.labels[i] for i in chunk.label_ids(0)] == ["barrel", "box"]
+    chunk.close()
+
+
+def test_merge_manifests_without_datasets(tmp_path):
+    assert worker_farm.merge_manifests(str(tmp_path), [str(tmp_path / "missing")]) is None
+    assert not os.path.exists(tmp_path / dataset_shards.MANIFEST_NAME)
@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+
+from conftest import core_module
+
+decode_cache = core_module("decode_cache")
+mesh_builder = core_module("mesh_builder")
+DecodeCache = decode_cache.DecodeCache
+DecodedResult = decode_cache.DecodedResult
+
+
+def result(x=0.0, materials=()):
+    buffers = mesh_builder.box_buffers([(x, 0.0, 0.0)], 1.0)
+    if materials:
+        buffers.material_ids = np.arange(buffers.face_count, dtype=np.int32) % len(materials)
+    matrix = np.eye(4)
+    matrix[0, 3] = x
+    return DecodedResult(buffers, matrix, materials)
+
+
+def assert_same(a, b):
+    assert np.array_equal(a.buffers.vertices, b.buffers.vertices)
+    assert np.array_equal(a.buffers.loops, b.buffers.loops)
+    assert np.array_equal(a.buffers.face_sizes, b.buffers.face_sizes)
+    assert np.array_equal(a.matrix, b.matrix)
+    assert a.material_names == b.material_names
+
+
+def test_cache_key_quantizes_and_separates_context():
+    vector = np.linspace(0.0, 1.0, 32)
+    key = decode_cache.cache_key(vector)
+    assert decode_cache.cache_key(vector + 1e-6) == key
+    assert decode_cache.cache_key(vector + 1e-3) != key
+    assert decode_cache.cache_key(vector, source_id="mesh") != key
+    assert decode_cache.cache_key(vector, context="inflate=1") != key
+
+
+def test_memory_lru_evicts_least_recently_used():
+    size = result().nbytes
+    cache = DecodeCache(max_bytes=2 * size)
+    cache.put("a", result(0.0))
+    cache.put("b", result(1.0))
+    assert cache.get("a") is not None
+    cache.put("c", result(2.0))
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.current_bytes == 2 * size
+    assert cache.stats()["evictions"] == 1
+
+
+def test_newest_entry_is_kept_over_budget():
+    cache = DecodeCache(max_bytes=1)
+    cache.put("a", result())
+    cache.put("b", result())
+    assert len(cache) == 1 and "b" in cache
+
+
+def test_shrinking_budget_evicts():
+    size = result().nbytes
+    cache = DecodeCache(max_bytes=4 * size)
+    for key in "abcd":
+        cache.put(key, result())
+    cache.configure(2 * size)
+    assert len(cache) == 2 and "c" in cache and "d" in cache
+
+
+def test_hit_rate():
+    cache = DecodeCache()
+    cache.put("a", result())
+    cache.get("a")
+    cache.get("missing")
+    assert cache.hits == 1 and cache.misses == 1 and cache.hit_rate == 0.5
+
+
+def test_evicted_entries_come_back_from_disk(tmp_path):
+    size = result().nbytes
+    cache = DecodeCache(max_bytes=size, disk_dir=str(tmp_path))
+    stored = result(1.0, ("Steel", "Glass"))
+    cache.put("a", stored)
+    cache.put("b", result(2.0))
+    assert len(cache) == 1
+    assert sorted(os.listdir(tmp_path)) == ["a.npz", "b.npz"]
+
+    assert "a" in cache
+    loaded = cache.get("a")
+    assert_same(loaded, stored)
+    assert np.array_equal(loaded.buffers.material_ids, stored.buffers.material_ids)
+    assert cache.disk_hits == 1
+    # The disk hit went back into memory and pushed the other entry out
+    assert cache.get("a") is loaded and cache.hits == 1
+    assert cache.evictions == 2
+
+
+def test_unreadable_disk_entry_is_dropped(tmp_path):
+    cache = DecodeCache(disk_dir=str(tmp_path))
+    path = tmp_path / "broken.npz"
+    path.write_bytes(b"not an npz file")
+    assert cache.get("broken") is None
+    assert not path.exists()
+    assert cache.misses == 1
+
+
+def test_clear_with_disk(tmp_path):
+    cache = DecodeCache(disk_dir=str(tmp_path))
+    cache.put("a", result())
+    cache.clear()
+    assert len(cache) == 0 and "a" in cache
+    cache.clear(disk=True)
+    assert "a" not in cache and os.listdir(tmp_path) == []
+
+
+def test_result_save_load_without_materials(tmp_path):
+    stored = result(0.5)
+    path = str(tmp_path / "entry.npz")
+    stored.save(path)
+    loaded = DecodedResult.load(path)
+    assert_same(loaded, stored)
+    assert loaded.buffers.material_ids is None
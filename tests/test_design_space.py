@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from conftest import core_module
+
+design_space = core_module("design_space")
+dataset_shards = core_module("dataset_shards")
+GeometryVector = core_module("vectors").GeometryVector
+DesignSpace = design_space.DesignSpace
+
+V = GeometryVector
+
+
+@pytest.mark.parametrize("method", design_space.METHODS)
+def test_same_seed_same_vectors(method):
+    space = DesignSpace()
+    first = space.sample(500, method, seed=3)
+    assert first.shape == (500, V.VECTOR_DIM) and first.dtype == np.float32
+    assert np.array_equal(first, space.sample(500, method, seed=3))
+    assert not np.array_equal(first, space.sample(500, method, seed=4))
+
+
+@pytest.mark.parametrize("method", design_space.METHODS)
+def test_samples_respect_dimensions(method):
+    space = DesignSpace()
+    space.set(V.IDX_TWIST, design_space.NORMAL, -0.2, 0.2, mean=0.1, std=0.05)
+    values = space.sample(2000, method, seed=0)
+    for index, dim in space.dimensions.items():
+        column = values[:, index]
+        if dim.kind == design_space.CONSTANT:
+            assert np.all(column == dim.low)
+        else:
+            assert column.min() >= np.float32(dim.low) and column.max() <= np.float32(dim.high)
+    assert abs(values[:, V.IDX_TWIST].mean() - 0.1) < 0.01
+
+
+@pytest.mark.parametrize("method", design_space.METHODS)
+def test_constraints_hold_for_every_sample(method):
+    space = DesignSpace()
+    space.add_constraint(design_space.max_ratio(V.IDX_SCALE_X, V.IDX_SCALE_Y, 1.5))
+    space.add_constraint(design_space.within(V.IDX_TAPER, -0.2, 0.2))
+    space.add_constraint(design_space.positive([V.IDX_BEND]))
+    space.add_constraint(design_space.sum_at_most([V.IDX_WAVE_AMP, V.IDX_NOISE_STRENGTH], 0.3))
+    values = space.sample(1000, method, seed=9)
+    assert len(values) == 1000
+    assert np.all(space.accept(values))
+    x, y = values[:, V.IDX_SCALE_X], values[:, V.IDX_SCALE_Y]
+    assert np.all(np.maximum(x, y) <= 1.5 * np.minimum(x, y))
+
+
+def test_unsatisfiable_constraints_raise():
+    space = DesignSpace().add_constraint(design_space.within(V.IDX_TAPER, 5.0, 6.0))
+    with pytest.raises(ValueError):
+        space.sample(10, seed=0)
+
+
+def test_dimension_validation():
+    with pytest.raises(ValueError):
+        design_space.Dimension("triangular")
+    with pytest.raises(ValueError):
+        design_space.Dimension(design_space.UNIFORM, 1.0, 1.0)
+    with pytest.raises(ValueError):
+        design_space.Dimension(design_space.LOG_UNIFORM, 0.0, 1.0)
+
+
+def test_unit_designs_are_stratified():
+    count = 64
+    rng = np.random.default_rng(0)
+    for unit in (design_space.latin_hypercube(count, 8, rng),
+                 design_space.sobol(count, design_space.SOBOL_MAX_DIM),
+                 design_space.sobol(count, 8, rng=rng)):
+        assert unit.min() >= 0.0 and unit.max() < 1.0
+        strata = np.sort(np.floor(unit * count).astype(int), axis=0)
+        assert np.all(strata == np.arange(count)[:, None])
+
+
+def test_sobol_skip_continues_the_sequence():
+    whole = design_space.sobol(32, 4)
+    assert np.array_equal(np.concatenate([design_space.sobol(20, 4), design_space.sobol(12, 4, skip=20)]), whole)
+
+
+def test_to_dict_round_trip():
+    space = DesignSpace().set(V.IDX_TWIST, design_space.LOG_UNIFORM, 0.5, 2.0)
+    restored = DesignSpace.from_dict(space.to_dict())
+    assert np.array_equal(restored.sample(50, seed=1), space.sample(50, seed=1))
+
+
+def test_write_dataset_is_resumable(tmp_path):
+    directory = str(tmp_path)
+    assert design_space.write_dataset(directory, 250, method="sobol", seed=5, shard_size=100) == 250
+    assert design_space.write_dataset(directory, 250, method="sobol", seed=5, shard_size=100) == 0
+
+    data = dataset_shards.ShardedDataset(directory)
+    assert len(data) == 250 and data.shard_count == 3
+    assert data.labels == ["sobol"]
+    vectors = np.concatenate([v for v, _ in data.iter_shards()])
+    assert np.array_equal(vectors, DesignSpace().sample(250, "sobol", seed=5))
+    data.close()
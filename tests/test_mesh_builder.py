@@ -0,0 +1,116 @@
+import numpy as np
+
+from conftest import core_module
+
+mesh_builder = core_module("mesh_builder")
+MeshBuffers = mesh_builder.MeshBuffers
+
+
+def face_normals(buffers):
+    """Newell normal of every face"""
+    normals = np.zeros((buffers.face_count, 3))
+    for face, (start, size) in enumerate(zip(buffers.loop_starts(), buffers.face_sizes)):
+        corners = buffers.vertices[buffers.loops[start:start + size]].astype(np.float64)
+        following = np.roll(corners, -1, axis=0)
+        normals[face] = np.cross(corners, following).sum(axis=0)
+    return normals
+
+
+def face_centers(buffers):
+    return np.array([buffers.vertices[buffers.loops[start:start + size]].mean(axis=0)
+                     for start, size in zip(buffers.loop_starts(), buffers.face_sizes)])
+
+
+def signed_volume(buffers):
+    volume = 0.0
+    for start, size in zip(buffers.loop_starts(), buffers.face_sizes):
+        corners = buffers.vertices[buffers.loops[start:start + size]].astype(np.float64)
+        for k in range(1, size - 1):
+            volume += np.dot(corners[0], np.cross(corners[k], corners[k + 1])) / 6.0
+    return volume
+
+
+def assert_outward(buffers, center):
+    dots = np.einsum("ij,ij->i", face_normals(buffers), face_centers(buffers) - center)
+    assert np.all(dots > 0.0)
+
+
+def test_buffers_normalize_dtypes_and_shapes():
+    buffers = MeshBuffers([0, 0, 0, 1, 0, 0, 0, 1, 0], [[0, 1, 2]], [3], [2])
+    assert buffers.vertices.shape == (3, 3) and buffers.vertices.dtype == np.float32
+    assert buffers.loops.dtype == np.int32 and buffers.loops.shape == (3,)
+    assert buffers.material_ids.tolist() == [2]
+    assert buffers.vertex_count == 3 and buffers.face_count == 1
+
+
+def test_loop_starts():
+    buffers = MeshBuffers(np.zeros((5, 3)), np.arange(10) % 5, [3, 4, 3])
+    assert buffers.loop_starts().tolist() == [0, 3, 7]
+
+
+def test_box_winding_is_outward():
+    buffers = mesh_builder.box_buffers([(0.0, 0.0, 0.0)], (2.0, 1.0, 0.5))
+    assert buffers.vertex_count == 8 and buffers.face_count == 6
+    assert_outward(buffers, np.zeros(3))
+    assert np.isclose(signed_volume(buffers), 1.0)
+
+
+def test_primitives_enclose_positive_volume():
+    for buffers in (mesh_builder.uv_sphere_buffers(1.0, 16, 8),
+                    mesh_builder.cylinder_buffers(1.0, 2.0, 16),
+                    mesh_builder.cone_buffers(1.0, 2.0, 16)):
+        assert signed_volume(buffers) > 0.0
+
+
+def test_mirror_keeps_winding_outward():
+    box = mesh_builder.box_buffers([(3.0, 1.0, 0.0)], 1.0)
+    for axis in range(3):
+        mirrored = mesh_builder.mirror(box, axis)
+        center = np.array([3.0, 1.0, 0.0])
+        center[axis] *= -1.0
+        assert np.allclose(mirrored.vertices[:, axis], -box.vertices[:, axis])
+        assert_outward(mirrored, center)
+        assert np.isclose(signed_volume(mirrored), signed_volume(box))
+
+
+def test_mirror_round_trip():
+    sphere = mesh_builder.uv_sphere_buffers(1.0, 12, 6)
+    twice = mesh_builder.mirror(mesh_builder.mirror(sphere, 1), 1)
+    assert np.array_equal(twice.vertices, sphere.vertices)
+    assert np.array_equal(twice.loops, sphere.loops)
+    assert np.array_equal(twice.face_sizes, sphere.face_sizes)
+
+
+def test_transform_round_trip():
+    box = mesh_builder.box_buffers([(0.5, -1.0, 2.0)], (1.0, 2.0, 3.0))
+    rotation = (0.3, -0.7, 1.1)
+    moved = mesh_builder.transform(box, location=(1.0, 2.0, 3.0), rotation=rotation, scale=(2.0, 2.0, 2.0))
+    # Undo in reverse order: translate, rotate back (inverse = transpose), scale
+    back = (moved.vertices - np.array([1.0, 2.0, 3.0])) @ mesh_builder.euler_matrix(rotation) / 2.0
+    assert np.allclose(back, box.vertices, atol=1e-5)
+    assert np.array_equal(moved.loops, box.loops)
+
+
+def test_euler_matrix_is_a_rotation():
+    matrix = mesh_builder.euler_matrix((0.4, 1.2, -2.0))
+    assert np.allclose(matrix @ matrix.T, np.eye(3), atol=1e-6)
+    assert np.isclose(np.linalg.det(matrix), 1.0, atol=1e-6)
+
+
+def test_concatenate_offsets_loops_and_fills_material_ids():
+    box = mesh_builder.box_buffers([(0.0, 0.0, 0.0)], 1.0)
+    sphere = mesh_builder.uv_sphere_buffers(1.0, 8, 4)
+    sphere.material_ids = np.full(sphere.face_count, 3, dtype=np.int32)
+    merged = mesh_builder.concatenate([box, sphere])
+
+    assert merged.vertex_count == box.vertex_count + sphere.vertex_count
+    assert np.array_equal(merged.loops[:len(box.loops)], box.loops)
+    assert np.array_equal(merged.loops[len(box.loops):], sphere.loops + box.vertex_count)
+    assert merged.material_ids.tolist() == [0] * box.face_count + [3] * sphere.face_count
+    # Every part keeps its own geometry and winding
+    assert np.isclose(signed_volume(merged), signed_volume(box) + signed_volume(sphere))
+
+
+def test_concatenate_empty():
+    merged = mesh_builder.concatenate([])
+    assert merged.vertex_count == 0 and merged.face_count == 0 and merged.material_ids is None
@@ -0,0 +1,72 @@
+import numpy as np
+
+from conftest import core_module
+
+point_sampling = core_module("point_sampling")
+mesh_builder = core_module("mesh_builder")
+MeshBuffers = mesh_builder.MeshBuffers
+
+
+def two_squares():
+    """Unit square at z=0 and a 1 x 3 rectangle at z=1, both facing +Z"""
+    vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+                (0, 0, 1), (1, 0, 1), (1, 3, 1), (0, 3, 1)]
+    return MeshBuffers(vertices, [0, 1, 2, 3, 4, 5, 6, 7], [4, 4])
+
+
+def test_fan_triangles():
+    buffers = MeshBuffers(np.zeros((7, 3)), [0, 1, 2, 3, 4, 5, 6, 0, 1], [5, 2, 2])
+    triangles = point_sampling.fan_triangles(buffers)
+    # The two-corner faces are skipped
+    assert triangles.tolist() == [[0, 1, 2], [0, 2, 3], [0, 3, 4]]
+
+
+def test_points_spread_by_area():
+    points, _ = point_sampling.sample_points(two_squares(), 40000, seed=0)
+    on_large = np.mean(points[:, 2] > 0.5)
+    assert abs(on_large - 0.75) < 0.01
+
+
+def test_points_are_uniform_within_a_face():
+    square = MeshBuffers([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [0, 1, 2, 3], [4])
+    count = 40000
+    points, _ = point_sampling.sample_points(square, count, seed=1)
+    assert np.all((points[:, :2] >= 0.0) & (points[:, :2] <= 1.0)) and np.all(points[:, 2] == 0.0)
+    # 4 x 4 grid: every cell within 5 standard deviations of count / 16
+    cells = np.minimum((points[:, :2] * 4).astype(int), 3)
+    histogram = np.bincount(cells[:, 0] * 4 + cells[:, 1], minlength=16)
+    expected = count / 16
+    assert np.all(np.abs(histogram - expected) < 5 * np.sqrt(expected))
+
+
+def test_points_lie_on_the_surface_with_outward_normals():
+    sizes = np.array([2.0, 1.0, 0.5])
+    box = mesh_builder.box_buffers([(0.0, 0.0, 0.0)], sizes)
+    points, normals = point_sampling.sample_points(box, 5000, seed=2, with_normals=True)
+
+    # Every point touches one of the box's faces
+    on_face = np.isclose(np.abs(points), sizes / 2, atol=1e-5)
+    assert np.all(on_face.any(axis=1))
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1.0, atol=1e-5)
+    # Normals are axis-aligned, point away from the centre and match the face the point is on
+    axis = np.argmax(np.abs(normals), axis=1)
+    assert np.allclose(np.abs(normals).max(axis=1), 1.0, atol=1e-5)
+    assert np.all(np.sign(normals[np.arange(len(axis)), axis]) == np.sign(points[np.arange(len(axis)), axis]))
+    assert np.all(on_face[np.arange(len(axis)), axis])
+
+
+def test_same_seed_same_points():
+    sphere = mesh_builder.uv_sphere_buffers(1.0, 16, 8)
+    first = point_sampling.sample_points(sphere, 256, seed=(4, 2), with_normals=True)
+    second = point_sampling.sample_points(sphere, 256, seed=(4, 2), with_normals=True)
+    assert np.array_equal(first[0], second[0]) and np.array_equal(first[1], second[1])
+    assert not np.array_equal(first[0], point_sampling.sample_points(sphere, 256, seed=5)[0])
+    assert first[0].dtype == np.float32 and first[1].dtype == np.float32
+
+
+def test_meshes_without_area_give_zeros():
+    flat = MeshBuffers([(0, 0, 0), (1, 0, 0), (2, 0, 0)], [0, 1, 2], [3])
+    points, normals = point_sampling.sample_points(flat, 10, seed=0, with_normals=True)
+    assert not points.any() and not normals.any()
+    points, normals = point_sampling.sample_points(MeshBuffers(np.zeros((0, 3)), [], []), 4)
+    assert points.shape == (4, 3) and not points.any() and normals is None
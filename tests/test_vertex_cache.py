@@ -0,0 +1,96 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import core_module
+
+vertex_cache = core_module("vertex_cache")
+
+FRAMES = 40
+VERTICES = 50
+
+
+def animation(seed=0):
+    """(FRAMES, VERTICES * 3) smooth random walk around a unit-scale mesh"""
+    rng = np.random.default_rng(seed)
+    rest = rng.uniform(-1.0, 1.0, VERTICES * 3)
+    steps = rng.normal(0.0, 0.01, (FRAMES, VERTICES * 3))
+    return (rest + np.cumsum(steps, axis=0)).astype(np.float32)
+
+
+def bake(path, frames, **layout):
+    writer = vertex_cache.VertexCacheWriter(str(path), len(frames), VERTICES, **layout)
+    for positions in frames:
+        writer.write(positions)
+    writer.close()
+    return writer
+
+
+@pytest.mark.parametrize("half, delta, tolerance", [
+    (False, False, 0.0),
+    (True, False, 2e-3),
+    (False, True, 1e-6),
+    (True, True, 1e-4),
+])
+def test_round_trip(tmp_path, half, delta, tolerance):
+    frames = animation()
+    path = tmp_path / "anim.gvac"
+    writer = bake(path, frames, half=half, delta=delta, keyframe_interval=8)
+    assert os.path.getsize(path) == writer.nbytes == vertex_cache.cache_bytes(
+        FRAMES, VERTICES, half, delta, keyframe_interval=8)
+    assert not os.path.exists(str(path) + ".tmp")
+
+    reader = vertex_cache.VertexCacheReader(str(path))
+    try:
+        assert (reader.frame_count, reader.vertex_count, reader.half, reader.delta) == \
+            (FRAMES, VERTICES, half, delta)
+        # Sequential playback
+        for index in range(FRAMES):
+            assert np.allclose(reader.frame(index), frames[index], rtol=0.0, atol=tolerance)
+        # Seeking backwards and across keyframes gives the same frames
+        for index in (33, 2, 17, 16, 39, 0):
+            assert np.allclose(reader.frame(index), frames[index], rtol=0.0, atol=tolerance)
+    finally:
+        reader.close()
+
+
+def test_delta_half_beats_absolute_half(tmp_path):
+    """Half-precision deltas keep more accuracy than half-precision positions"""
+    frames = animation(1) * 50.0
+    errors = {}
+    for delta in (False, True):
+        path = tmp_path / f"anim_{delta}.gvac"
+        bake(path, frames, half=True, delta=delta)
+        reader = vertex_cache.VertexCacheReader(str(path))
+        errors[delta] = max(np.abs(reader.frame(i) - frames[i]).max() for i in range(FRAMES))
+        reader.close()
+    assert errors[True] < errors[False]
+
+
+def test_frame_index_is_clamped(tmp_path):
+    frames = animation()
+    path = tmp_path / "anim.gvac"
+    bake(path, frames)
+    reader = vertex_cache.VertexCacheReader(str(path))
+    assert np.array_equal(reader.frame(-5), frames[0])
+    assert np.array_equal(reader.frame(FRAMES + 10), frames[-1])
+    reader.close()
+
+
+def test_writer_rejects_wrong_sizes(tmp_path):
+    writer = vertex_cache.VertexCacheWriter(str(tmp_path / "anim.gvac"), 1, VERTICES)
+    with pytest.raises(ValueError):
+        writer.write(np.zeros(VERTICES * 3 - 3))
+    writer.write(np.zeros(VERTICES * 3))
+    with pytest.raises(ValueError):
+        writer.write(np.zeros(VERTICES * 3))
+    writer.abort()
+    assert os.listdir(tmp_path) == []
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_cache.gvac"
+    path.write_bytes(b"\0" * vertex_cache.HEADER_SIZE)
+    with pytest.raises(ValueError):
+        vertex_cache.VertexCacheReader(str(path))